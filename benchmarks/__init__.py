@@ -0,0 +1 @@
+""" benchmarks of st_minecraft, see benchmarks/README.md """
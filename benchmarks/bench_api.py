@@ -0,0 +1,202 @@
+"""
+Benchmarks every public call of st_minecraft.en and st_minecraft.de against the mock server.
+
+The mock server (and the shaping proxy, if a delay or bandwidth is given) runs in another process,
+so it doesn't compete with the client for the GIL and doesn't show up in the allocations.
+
+Usage (from the root of the repository):
+    python -m benchmarks.bench_api
+    python -m benchmarks.bench_api -k get_block --delay 0.002
+    python -m benchmarks.bench_api --output new.json --compare old.json
+"""
+
+import argparse
+import contextlib
+import multiprocessing
+import os
+import sys
+from typing import Any
+from typing import Callable
+
+import st_minecraft.de as de
+import st_minecraft.en as en
+from benchmarks.harness import load_results
+from benchmarks.harness import measure
+from benchmarks.harness import print_results
+from benchmarks.harness import regressions
+from benchmarks.harness import save_results
+
+CASES: dict[str, Callable[["Context"], Any]] = {}
+"""name -> function that makes one call, in the order they are run"""
+
+
+def case(name: str) -> Callable:
+    """Registers a benchmark case"""
+
+    def register(func: Callable[["Context"], Any]) -> Callable[["Context"], Any]:
+        CASES[name] = func
+        return func
+
+    return register
+
+
+class Context:
+    """Objects the cases work with, created once before the first case runs"""
+
+    def __init__(self):
+        self.player = en.get_player()
+        self.entity = en.spawn_entity(0, 64, 0, en.EntityCollection.Cow)
+        self.bar = en.create_bar("benchmark", "benchmark")
+        self.blocks = [(x, 70, 0, en.MaterialCollection.Stone) for x in range(100)]
+        self.coordinates = [(x, 70, 0) for x in range(100)]
+
+        self.spieler = de.hole_spieler()
+        self.de_entity = de.erzeuge_entity(0, 64, 0, de.EntitySammlung.Kuh)
+        self.leiste = de.erzeuge_leiste("benchmark_de", "benchmark")
+        self.bloecke = [(x, 70, 0, de.MaterialSammlung.Stein) for x in range(100)]
+
+
+# fmt: off
+# --- st_minecraft.en ---
+case("en.set_block")(lambda c: en.set_block(0, 70, 0, en.MaterialCollection.Stone))
+case("en.set_blocks[100]")(lambda c: en.set_blocks(c.blocks))
+case("en.get_block")(lambda c: en.get_block(0, 70, 0))
+case("en.get_blocks[100]")(lambda c: en.get_blocks(c.coordinates))
+case("en.get_entity")(lambda c: en.get_entity(c.entity))
+case("en.get_entities[10]")(lambda c: en.get_entities([c.entity] * 10))
+case("en.get_player_by_name")(lambda c: en.get_player_by_name("player0"))
+case("en.get_player_by_index")(lambda c: en.get_player_by_index(0))
+case("en.get_player")(lambda c: en.get_player())
+case("en.get_players[2]")(lambda c: en.get_players(indices=[0, 1]))
+case("en.send_to_chat")(lambda c: en.send_to_chat("benchmark"))
+case("en.get_chat")(lambda c: en.get_chat())
+case("en.seconds_to_ticks")(lambda c: en.seconds_to_ticks(1.5))
+case("en.show_title")(lambda c: en.show_title("benchmark"))
+case("en.send_command")(lambda c: en.send_command("time set day"))
+case("en.spawn_entity")(lambda c: en.spawn_entity(0, 64, 0, en.EntityCollection.Cow))
+case("en.give_item")(lambda c: en.give_item(c.player, en.MaterialCollection.Diamond, 1))
+case("en.get_inventory")(lambda c: en.get_inventory(c.player))
+case("en.get_inventories[10]")(lambda c: en.get_inventories([c.player] * 10))
+case("en.set_player_position")(lambda c: en.set_player_position(c.player, 0, 64, 0, rotation=90))
+case("en.set_player_velocity")(lambda c: en.set_player_velocity(c.player, en.DirectionCollection.Up, 1))
+case("en.set_player_max_health")(lambda c: en.set_player_max_health(c.player, 20))
+case("en.set_player_health")(lambda c: en.set_player_health(c.player, 20))
+case("en.set_player_hunger")(lambda c: en.set_player_hunger(c.player, 20, 5))
+case("en.set_player_xp_level")(lambda c: en.set_player_xp_level(c.player, 1))
+case("en.set_player_xp_progress")(lambda c: en.set_player_xp_progress(c.player, 0.5))
+case("en.set_entity_name")(lambda c: en.set_entity_name(c.entity, "benchmark"))
+case("en.set_entity_position")(lambda c: en.set_entity_position(c.entity, 0, 64, 0))
+case("en.set_entity_ai")(lambda c: en.set_entity_ai(c.entity, True))
+case("en.set_entity_health")(lambda c: en.set_entity_health(c.entity, 20))
+case("en.create_bar")(lambda c: en.create_bar("benchmark", "benchmark"))
+case("en.set_text")(lambda c: en.set_text(c.bar, "benchmark"))
+case("en.set_color")(lambda c: en.set_color(c.bar, en.BossBarColor.RED))
+case("en.set_value")(lambda c: en.set_value(c.bar, 0.5))
+case("en.set_style")(lambda c: en.set_style(c.bar, en.BossBarStyle.SOLID))
+case("en.delete_bar")(lambda c: en.delete_bar(c.bar))
+
+# --- st_minecraft.de, the difference to en is the overhead of the wrappers ---
+case("de.setze_block")(lambda c: de.setze_block(0, 70, 0, de.MaterialSammlung.Stein))
+case("de.setze_bloecke[100]")(lambda c: de.setze_bloecke(c.bloecke))
+case("de.hole_block")(lambda c: de.hole_block(0, 70, 0))
+case("de.hole_bloecke[100]")(lambda c: de.hole_bloecke(c.coordinates))
+case("de.hole_entity")(lambda c: de.hole_entity(c.de_entity))
+case("de.hole_entities[10]")(lambda c: de.hole_entities([c.de_entity] * 10))
+case("de.hole_spieler_durch_name")(lambda c: de.hole_spieler_durch_name("player0"))
+case("de.hole_spieler_durch_index")(lambda c: de.hole_spieler_durch_index(0))
+case("de.hole_spieler")(lambda c: de.hole_spieler())
+case("de.hole_mehrere_spieler[2]")(lambda c: de.hole_mehrere_spieler(indizes=[0, 1]))
+case("de.sende_an_chat")(lambda c: de.sende_an_chat("benchmark"))
+case("de.hole_chat")(lambda c: de.hole_chat())
+case("de.sende_befehl")(lambda c: de.sende_befehl("time set day"))
+case("de.zeige_titel")(lambda c: de.zeige_titel("benchmark"))
+case("de.erzeuge_entity")(lambda c: de.erzeuge_entity(0, 64, 0, de.EntitySammlung.Kuh))
+case("de.gebe_item")(lambda c: de.gebe_item(c.spieler, de.MaterialSammlung.Diamant, 1))
+case("de.hole_inventar")(lambda c: de.hole_inventar(c.spieler))
+case("de.hole_inventare[10]")(lambda c: de.hole_inventare([c.spieler] * 10))
+case("de.spieler_position_setzen")(lambda c: de.spieler_position_setzen(c.spieler, 0, 64, 0, rotation=90))
+case("de.spieler_geschwindigkeit_setzen")(lambda c: de.spieler_geschwindigkeit_setzen(c.spieler, de.RichtungSammlung.Hoch, 1))
+case("de.spieler_max_leben_setzten")(lambda c: de.spieler_max_leben_setzten(c.spieler, 20))
+case("de.spieler_leben_setzen")(lambda c: de.spieler_leben_setzen(c.spieler, 20))
+case("de.spieler_hunger_setzen")(lambda c: de.spieler_hunger_setzen(c.spieler, 20, 5))
+case("de.spieler_xp_level_setzen")(lambda c: de.spieler_xp_level_setzen(c.spieler, 1))
+case("de.spieler_xp_fortschritt_setzen")(lambda c: de.spieler_xp_fortschritt_setzen(c.spieler, 0.5))
+case("de.entity_name_setzen")(lambda c: de.entity_name_setzen(c.de_entity, "benchmark"))
+case("de.entity_position_setzen")(lambda c: de.entity_position_setzen(c.de_entity, 0, 64, 0))
+case("de.entity_ai_setzen")(lambda c: de.entity_ai_setzen(c.de_entity, True))
+case("de.entity_leben_setzen")(lambda c: de.entity_leben_setzen(c.de_entity, 20))
+case("de.erzeuge_leiste")(lambda c: de.erzeuge_leiste("benchmark_de", "benchmark"))
+case("de.setze_text")(lambda c: de.setze_text(c.leiste, "benchmark"))
+case("de.setze_farbe")(lambda c: de.setze_farbe(c.leiste, de.BossLeisteFarben.ROT))
+case("de.setze_wert")(lambda c: de.setze_wert(c.leiste, 0.5))
+case("de.setze_stil")(lambda c: de.setze_stil(c.leiste, de.BossLeisteStil.DURCHGEZOGEN))
+case("de.loesche_leiste")(lambda c: de.loesche_leiste(c.leiste))
+# fmt: on
+
+
+def _serve(ports: multiprocessing.Queue, delay: float, jitter: float, bandwidth: float | None) -> None:
+    # needed internally
+    # runs in the server process until the benchmark process terminates it
+    import threading
+
+    from st_minecraft.testing import MockServer
+    from st_minecraft.testing import ShapingProxy
+
+    server = MockServer(players=2).start()
+    port = server.port
+    if delay or jitter or bandwidth:
+        port = ShapingProxy(server.port, delay=delay, jitter=jitter, bandwidth=bandwidth, seed=0).start().port
+
+    ports.put(port)
+    threading.Event().wait()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds each case runs at least (default: 0.5)")
+    parser.add_argument("--delay", type=float, default=0.0, help="one way delay in seconds added by a proxy")
+    parser.add_argument("--jitter", type=float, default=0.0, help="jitter in seconds added by the proxy")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes per second per direction")
+    parser.add_argument("--output", help="save the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown that counts as regression (0.1=10%%)")
+    args = parser.parse_args(argv)
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(ports, args.delay, args.jitter, args.bandwidth), daemon=True)
+    server.start()
+    try:
+        port = ports.get(timeout=30)
+        en.connect("127.0.0.1", port)
+
+        results = []
+        # some calls print (e.g. spawn_entity()), that would bury the table
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            context = Context()
+            for name, func in CASES.items():
+                if args.filter not in name:
+                    continue
+                results.append(measure(name, lambda: func(context), min_time=args.min_time))
+                # commands without a reply only measure sending, don't let them pile up for the next case
+                en.get_player()
+    finally:
+        server.terminate()
+
+    baseline = load_results(args.compare) if args.compare else None
+    print_results(results, baseline)
+
+    if args.output:
+        save_results(args.output, results, vars(args))
+
+    if baseline is not None:
+        slower = regressions(results, baseline, args.threshold)
+        if slower:
+            print(f"\n{len(slower)} case(s) slower by more than {args.threshold:.0%}: {', '.join(slower)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
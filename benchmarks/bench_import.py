@@ -0,0 +1,122 @@
+"""
+Benchmarks how long importing st_minecraft.en and st_minecraft.de takes, every import in a fresh interpreter.
+Runs with pydantic (the default) and with SK_PYDANTIC=lazy (see st_minecraft.core.models).
+
+Usage (from the root of the repository):
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 50 --output new.json --compare old.json
+    python -m benchmarks.bench_import --modules st_minecraft.de --mode lazy
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.harness import Result
+from benchmarks.harness import load_results
+from benchmarks.harness import print_results
+from benchmarks.harness import regressions
+from benchmarks.harness import save_results
+from st_minecraft.core.models import PYDANTIC_ENV
+
+MODULES = ["st_minecraft.en", "st_minecraft.de"]
+
+MODES: dict[str, dict[str, str]] = {
+    "pydantic": {},
+    "lazy": {PYDANTIC_ENV: "lazy"},
+}
+"""mode -> environment variables set for the import"""
+
+_MEASURE = """
+import time
+start = time.perf_counter_ns()
+import {module}
+print(time.perf_counter_ns() - start)
+"""
+
+_MEASURE_ALLOCATIONS = """
+import tracemalloc
+tracemalloc.start()
+import {module}
+print(tracemalloc.get_traced_memory()[1])
+"""
+
+
+def _run(code: str, env: dict[str, str], *args: str) -> subprocess.CompletedProcess:
+    # needed internally
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], env={**os.environ, **env}, capture_output=True, text=True, check=True
+    )
+
+
+def measure_import(module: str, mode: str, runs: int) -> Result:
+    """Imports module in runs fresh interpreters, the interpreter start itself is not part of the time"""
+    env = MODES[mode]
+    # the first run fills the bytecode cache, like on any machine where the library was used before
+    _run(_MEASURE.format(module=module), env)
+    times_ns = sorted(int(_run(_MEASURE.format(module=module), env).stdout) for _ in range(runs))
+    allocated = int(_run(_MEASURE_ALLOCATIONS.format(module=module), env).stdout)
+
+    return Result(
+        name=f"{mode}.import {module}",
+        calls=runs,
+        ops_per_sec=runs / (sum(times_ns) / 1e9),
+        p50_us=times_ns[len(times_ns) // 2] / 1e3,
+        p99_us=times_ns[min(len(times_ns) - 1, int(0.99 * len(times_ns)))] / 1e3,
+        alloc_bytes_per_call=allocated,
+    )
+
+
+def print_slowest_modules(module: str, mode: str, count: int = 15) -> None:
+    """Prints the modules that took longest to import (on their own, without their imports), from -X importtime"""
+    lines = _run(f"import {module}", MODES[mode], "-X", "importtime").stderr.splitlines()
+    timings = []
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings.append((int(own_us), int(cumulative_us), name.strip()))
+
+    print(f"\nslowest modules when importing {module} ({mode}):")
+    print(f"{'module':<50} {'self us':>10} {'cumulative us':>14}")
+    for own_us, cumulative_us, name in sorted(timings, reverse=True)[:count]:
+        print(f"{name:<50} {own_us:>10} {cumulative_us:>14}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="fresh interpreters per module and mode (default: 20)")
+    parser.add_argument("--modules", nargs="+", default=MODULES, help="modules to import")
+    parser.add_argument("--mode", choices=list(MODES), help="only run this mode")
+    parser.add_argument("--slowest", action="store_true", help="also show which modules take longest to import")
+    parser.add_argument("--output", help="save the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown that counts as regression (0.1=10%%)")
+    args = parser.parse_args(argv)
+
+    modes = [args.mode] if args.mode else list(MODES)
+    results = [measure_import(module, mode, args.runs) for module in args.modules for mode in modes]
+
+    baseline = load_results(args.compare) if args.compare else None
+    print_results(results, baseline)
+
+    if args.slowest:
+        for module in args.modules:
+            for mode in modes:
+                print_slowest_modules(module, mode)
+
+    if args.output:
+        save_results(args.output, results, vars(args))
+
+    if baseline is not None:
+        slower = regressions(results, baseline, args.threshold)
+        if slower:
+            print(f"\n{len(slower)} case(s) slower by more than {args.threshold:.0%}: {', '.join(slower)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Benchmarks parsing the replies of the server into models: the pydantic models against the fast models
+(see st_minecraft.en.use_fast_models()), and the German models decoded directly against the old way over the English ones.
+No connection is needed, the replies come from the mock server.
+
+Usage (from the root of the repository):
+    python -m benchmarks.bench_models
+    python -m benchmarks.bench_models -k player --output new.json --compare old.json
+"""
+
+import argparse
+import sys
+from typing import Any
+from typing import Callable
+
+import st_minecraft.de as de
+from benchmarks.harness import load_results
+from benchmarks.harness import measure
+from benchmarks.harness import print_results
+from benchmarks.harness import regressions
+from benchmarks.harness import save_results
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import _bytes_to_text
+from st_minecraft.de.daten_modelle import _DEUTSCHE_MODELLE
+from st_minecraft.en.data_models import _FAST_MODELS
+from st_minecraft.en.data_models import _LAZY_MODELS
+from st_minecraft.en.data_models import _VALIDATED_MODELS
+from st_minecraft.en.data_models import Entity
+from st_minecraft.en.data_models import InventoryField
+from st_minecraft.en.data_models import Material
+from st_minecraft.en.data_models import Message
+from st_minecraft.en.data_models import Player
+from st_minecraft.en.data_models import _call_with_models
+from st_minecraft.en.data_models import _ModelSet
+from st_minecraft.en.main import _parse_chat
+from st_minecraft.en.main import _parse_inventory
+from st_minecraft.testing import MockServer
+
+
+class Replies:
+    """Replies as they arrive from the server, created once"""
+
+    def __init__(self):
+        server = MockServer(players=1)
+        entity = server.handle(
+            f"spawnEntity{ARG_SEPARATOR}0{ARG_SEPARATOR}64{ARG_SEPARATOR}0{ARG_SEPARATOR}world{ARG_SEPARATOR}COW"
+        )
+        for item in ("DIAMOND_SWORD", "STONE", "OAK_LOG", "TORCH", "BREAD"):
+            server.handle(f"addInv{ARG_SEPARATOR}0{ARG_SEPARATOR}{item}{ARG_SEPARATOR}10")
+        server.chat = [(f"player{i}", f"message {i}") for i in range(5)]
+
+        self.player = f"{server.handle(f'getPlayer{ARG_SEPARATOR}0')}\n".encode("utf-8")
+        self.entity = f"{entity}\n".encode("utf-8")
+        self.inventory = f"{server.handle(f'getInv{ARG_SEPARATOR}0')}\n".encode("utf-8")
+        self.chat = f"{server.handle('pollChat')}\n".encode("utf-8")
+        self.block = b"stone\n"
+
+
+def _position(player) -> tuple:
+    # needed internally
+    return player.x, player.y, player.z
+
+
+CASES: dict[str, Callable[[_ModelSet, Replies], Any]] = {
+    "player": lambda m, r: m.player(r.player),
+    # polling loops often only look at the position
+    "player.position": lambda m, r: _position(m.player(r.player)),
+    "entity": lambda m, r: m.entity(_bytes_to_text(r.entity)),
+    "material": lambda m, r: m.material(_bytes_to_text(r.block).upper(), 0, 64, 0, "world"),
+    "_parse_inventory[5]": lambda m, r: _parse_inventory(r.inventory),
+    "_parse_chat[5]": lambda m, r: _parse_chat(r.chat),
+    # what a typical polling loop parses per iteration: a player, 10 entities and 10 blocks
+    "poll": lambda m, r: (
+        m.player(r.player),
+        [m.entity(_bytes_to_text(r.entity)) for _ in range(10)],
+        [m.material(_bytes_to_text(r.block).upper(), x, 64, 0, "world") for x in range(10)],
+    ),
+}
+"""name -> function that parses one reply with the given models"""
+
+_VIA_ENGLISH = _ModelSet(
+    lambda *args: de.Material.von_englisch(Material.from_string(*args)),
+    lambda data: de.Spieler.von_englisch(Player.from_raw_data(data)),
+    lambda s: de.Entity.von_englisch(Entity.from_api_format(s)),
+    lambda s: de.InventarFeld.von_englisch(InventoryField.from_api_format(s)),
+    lambda **fields: de.Nachricht.von_englisch(Message(**fields)),
+    de.Inventar,
+)
+""" how st_minecraft.de used to parse: into the English models first, then converted with von_englisch() """
+
+MODES = {
+    "pydantic": _VALIDATED_MODELS,
+    "fast": _FAST_MODELS,
+    "lazy": _LAZY_MODELS,
+    "de": _DEUTSCHE_MODELLE,
+    "de_via_en": _VIA_ENGLISH,
+}
+COMPARISONS = [("fast", "pydantic"), ("lazy", "pydantic"), ("lazy", "fast"), ("de", "de_via_en")]
+""" (mode, baseline): the speedup of mode over baseline is printed for every case """
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds each case runs at least (default: 0.5)")
+    parser.add_argument("--output", help="save the results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown that counts as regression (0.1=10%%)")
+    args = parser.parse_args(argv)
+
+    replies = Replies()
+    results = []
+    speedups = []
+    for name, func in CASES.items():
+        if args.filter not in name:
+            continue
+        by_mode = {}
+        for mode, models in MODES.items():
+            # the _parse_* helpers pick the models the same way the public functions do
+            by_mode[mode] = measure(
+                f"{mode}.{name}", lambda: _call_with_models(models, func, models, replies), min_time=args.min_time
+            )
+        results.extend(by_mode.values())
+        for mode, baseline in COMPARISONS:
+            speedups.append((f"{mode}.{name}", baseline, by_mode[baseline].p50_us / by_mode[mode].p50_us))
+
+    baseline = load_results(args.compare) if args.compare else None
+    print_results(results, baseline)
+    print()
+    for name, baseline, speedup in speedups:
+        print(f"{name:<40} {speedup:.1f}x as fast as {baseline}")
+
+    if args.output:
+        save_results(args.output, results, vars(args))
+
+    if baseline is not None:
+        slower = regressions(results, baseline, args.threshold)
+        if slower:
+            print(f"\n{len(slower)} case(s) slower by more than {args.threshold:.0%}: {', '.join(slower)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Measures single calls: throughput, latency percentiles and allocations.
+Results can be saved as JSON and compared against an earlier run.
+"""
+
+import json
+import multiprocessing
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+
+import st_minecraft
+
+
+@dataclass
+class Result:
+    """Numbers of one benchmark case"""
+
+    name: str
+    calls: int
+    ops_per_sec: float
+    p50_us: float
+    """ median latency of a call in microseconds """
+    p99_us: float
+    alloc_bytes_per_call: float
+    """ average peak of memory allocated during a call (tracemalloc), temporary objects included """
+
+
+def measure(
+    name: str, call: Callable[[], Any], *, min_time: float = 0.5, max_calls: int = 100_000, alloc_calls: int = 50
+) -> Result:
+    """
+    Runs call until min_time passed (or max_calls were made) and measures every call on its own.
+    Allocations are measured in a separate, shorter pass, tracemalloc slows down everything it traces.
+    """
+    # warm up caches, lazy imports, ...
+    for _ in range(5):
+        call()
+
+    latencies = []
+    start = time.perf_counter_ns()
+    deadline = start + int(min_time * 1e9)
+    now = start
+    while now < deadline and len(latencies) < max_calls:
+        call()
+        after = time.perf_counter_ns()
+        latencies.append(after - now)
+        now = after
+    total = now - start
+
+    latencies.sort()
+    return Result(
+        name=name,
+        calls=len(latencies),
+        ops_per_sec=len(latencies) / (total / 1e9),
+        p50_us=_percentile(latencies, 0.50) / 1e3,
+        p99_us=_percentile(latencies, 0.99) / 1e3,
+        alloc_bytes_per_call=_allocations(call, alloc_calls),
+    )
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    # needed internally
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _allocations(call: Callable[[], Any], calls: int) -> float:
+    # needed internally
+    # the server runs in another process, so only the client's allocations are traced
+    tracemalloc.start()
+    try:
+        allocated = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - before
+    finally:
+        tracemalloc.stop()
+    return allocated / calls
+
+
+def print_results(results: list[Result], baseline: dict[str, dict] | None = None) -> None:
+    """Prints a table, with a baseline the change of the throughput as well"""
+    header = f"{'case':<40} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10} {'alloc B':>10}"
+    if baseline is not None:
+        header += f" {'change':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for r in results:
+        line = (
+            f"{r.name:<40} {r.ops_per_sec:>12.0f} {r.p50_us:>10.1f} {r.p99_us:>10.1f} {r.alloc_bytes_per_call:>10.0f}"
+        )
+        if baseline is not None:
+            old = baseline.get(r.name)
+            line += f" {_change(old, r):>8}" if old else f" {'new':>8}"
+        print(line)
+
+
+def _change(old: dict, new: Result) -> str:
+    # needed internally
+    return f"{(new.ops_per_sec / old['ops_per_sec'] - 1) * 100:+.1f}%"
+
+
+def regressions(results: list[Result], baseline: dict[str, dict], threshold: float) -> list[str]:
+    """Names of the cases whose throughput dropped by more than threshold (0.1 = 10%)"""
+    return [
+        r.name
+        for r in results
+        if r.name in baseline and r.ops_per_sec < baseline[r.name]["ops_per_sec"] * (1 - threshold)
+    ]
+
+
+def save_results(path: str, results: list[Result], settings: dict[str, Any]) -> None:
+    """Saves the results with enough context to judge if two runs are comparable"""
+    data = {
+        "meta": {
+            "st_minecraft": st_minecraft.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": multiprocessing.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "settings": settings,
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> dict[str, dict]:
+    """Loads the results saved by save_results(), by case name"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
@@ -9,7 +9,8 @@ while True:
 
     if not spieler.sneaked and sneaked:
         block_unter_spieler = st_minecraft.hole_block(spieler.x, spieler.y - 1, spieler.z)
-        if jetpack or block_unter_spieler.typ != st_minecraft.MaterialSammlung.Luft:
+        # unbekannte Blöcke (typ None) zählen als Boden
+        if jetpack or block_unter_spieler.typ is None or st_minecraft.ist_fest(block_unter_spieler.typ):
             st_minecraft.spieler_geschwindigkeit_setzen(spieler, st_minecraft.RichtungSammlung.Vorwärts, 3)
 
     sneaked = spieler.sneaked
@@ -1,48 +1,42 @@
 """
-This module generates the Enums for Material and Entity from a CSV
+This module generates the collections for Material and Entity from a CSV
 For it to work as intended, it should be executed from the directory in which it currently resides
+
+The collections are written in a compact format: instead of a class body with a line per member, the module holds
+a table of names (and for the German collections the ordinals of the matching English members), the members are
+created from these tables by st_minecraft.core.compact_enum.CompactEnum. That is a lot faster to import than an Enum.
+Next to every module a stub (.pyi) with all members is written, so IDEs and type checkers still know them.
+
+The ordinal of an English member is its position in the table. So that ordinals stay the same between versions,
+new lines must be appended to the end of a CSV file and existing lines must not be removed or reordered;
+the generator refuses to write a module that changes existing ordinals. Run as script it checks all collections
+(see build_all()) before it writes any of them, so a refused run leaves all modules as they were.
+
+build_material_properties() writes the properties of the materials (solid, liquid, ...) from material_properties.csv
+as byte tables indexed by the ordinal, see st_minecraft.en.material_properties.
 """
 
+import ast
 from pathlib import Path
 
+_LINE_LENGTH = 100
+""" length of the lines of the tables in the generated modules """
+
 
 def build_german_material_enum(
     block_source_file: Path = Path("blocks_items_validated.csv"),
     target_file: Path = Path("../st_minecraft/de/material.py"),
 ):
     """
-    Auto-generates an Enum for all blocks in a .csv file
+    Auto-generates a collection for all blocks in a .csv file
     The file must contain: DesiredName,minecraft_name
     Args:
         block_source_file: Path to the CSV file containing block data
-        target_file: Path where the generated enum file should be written
+        target_file: Path where the generated module should be written (the stub is written next to it)
     """
-
-    code = '''"""Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
-
-from enum import Enum
-from typing import Optional
-
-from st_minecraft.en.material import MaterialCollection as _Collection
-
-
-class MaterialSammlung(Enum):
-
-    @staticmethod
-    def von_englisch(e: _Collection) -> Optional["MaterialSammlung"]:
-        try:
-            return MaterialSammlung._value2member_map_[e.value]
-        except (KeyError, AttributeError):
-            return None
-
-    def zu_englisch(self) -> Optional[_Collection]:
-        try:
-            return _Collection._value2member_map_[self.value]
-        except (KeyError, AttributeError):
-            return None
-
-'''
-    _write_german_enum(code, block_source_file, target_file)
+    _write_german_enum(
+        "MaterialSammlung", "material", "st_minecraft.en.material", "MaterialCollection", block_source_file, target_file
+    )
 
 
 def build_material_enum_english(
@@ -50,122 +44,391 @@ def build_material_enum_english(
     target_file: Path = Path("../st_minecraft/en/material.py"),
 ):
     """
-    Auto-generates an English Enum for all blocks in a .csv file
+    Auto-generates an English collection for all blocks in a .csv file
     The file must contain: DesiredName,minecraft_name
     Args:
         block_source_file: Path to the CSV file containing block data
-        target_file: Path where the generated enum file should be written
+        target_file: Path where the generated module should be written (the stub is written next to it)
     """
-
-    code = '''"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
-
-from enum import Enum
-
-
-class MaterialCollection(Enum):
-'''
-    _write_enum_english(code, block_source_file, target_file)
+    _write_enum_english("MaterialCollection", "material", block_source_file, target_file)
 
 
 def build_german_entity_enum(
     entity_source_file: Path = Path("entities_validated.csv"),
     target_file: Path = Path("../st_minecraft/de/entity.py"),
 ):
-    """Analogous to build_material_enum() but for Entities"""
-    code = '''"""Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
-
-from enum import Enum
-from typing import Optional
+    """Analogous to build_german_material_enum() but for Entities"""
+    _write_german_enum(
+        "EntitySammlung", "entity", "st_minecraft.en.entity", "EntityCollection", entity_source_file, target_file
+    )
 
-from st_minecraft.en.entity import EntityCollection as _Collection
 
+def build_entity_enum_english(
+    entity_source_file: Path = Path("entities_validated.csv"),
+    target_file: Path = Path("../st_minecraft/en/entity.py"),
+):
+    """Analogous to build_material_enum_english() but for Entities"""
+    _write_enum_english("EntityCollection", "entity", entity_source_file, target_file)
 
-class EntitySammlung(Enum):
 
-    @staticmethod
-    def von_englisch(e: _Collection) -> Optional["EntitySammlung"]:
-        try:
-            return EntitySammlung._value2member_map_[e.value]
-        except KeyError:
-            return None
+def build_material_properties(
+    properties_file: Path = Path("material_properties.csv"),
+    block_source_file: Path = Path("blocks_items_validated.csv"),
+    target_file: Path = Path("../st_minecraft/core/material_table.py"),
+):
+    """
+    Auto-generates the tables of material properties, indexed by the ordinal of the material
+    The properties file starts with a header and must contain a line for every material of the block source file:
+    minecraft_name,block,solid,liquid,transparent,gravity,light,red,green,blue
+    (block to gravity are 0 or 1, light is the light level 0 to 15, red to blue the average color 0 to 255)
+    Args:
+        properties_file: Path to the CSV file containing the properties
+        block_source_file: Path to the CSV file the materials are generated from
+        target_file: Path where the generated module should be written
+    """
+    lines = [line.split(",") for line in properties_file.read_text().split("\n")[1:] if line != ""]
+    properties = {minecraft_id.upper(): [int(value) for value in values] for minecraft_id, *values in lines}
+
+    flags = []
+    light = []
+    colors = []
+    for name in _english_names(block_source_file):
+        if name.upper() not in properties:
+            raise ValueError(f"{properties_file} has no line for {name.lower()}")
+        block, solid, liquid, transparent, gravity, light_level, red, green, blue = properties[name.upper()]
+
+        flag = 0
+        for bit, is_set in enumerate((block, solid, liquid, transparent, gravity, light_level > 0)):
+            flag |= is_set << bit
+        flags.append(f"{flag:02x}")
+        light.append(f"{light_level:02x}")
+        colors.append(f"{red:02x}{green:02x}{blue:02x}")
+
+    code = f'''"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
+
+BLOCK = 1
+""" can be placed as block """
+SOLID = 2
+""" entities can't move through it """
+LIQUID = 4
+TRANSPARENT = 8
+""" light shines through it """
+GRAVITY = 16
+""" falls down if there is nothing below it """
+LIGHT_EMITTING = 32
+
+FLAGS = bytes.fromhex(
+{_table(flags)}
+)
+""" the flags above of every material, indexed by ordinal """
+
+LIGHT = bytes.fromhex(
+{_table(light)}
+)
+""" light level (0 to 15) every material emits, indexed by ordinal """
+
+COLORS = bytes.fromhex(
+{_table(colors)}
+)
+""" average color of every material, 3 bytes (red, green, blue) per ordinal """
+'''
+    target_file.write_text(code)
 
-    def zu_englisch(self) -> Optional[_Collection]:
-        try:
-            return EntitySammlung._value2member_map_[self.value]
-        except KeyError:
-            return None
 
-'''
-    _write_german_enum(code, entity_source_file, target_file)
+def build_all(
+    block_source_file: Path = Path("blocks_items_validated.csv"),
+    entity_source_file: Path = Path("entities_validated.csv"),
+    english_dir: Path = Path("../st_minecraft/en"),
+    german_dir: Path = Path("../st_minecraft/de"),
+    core_dir: Path = Path("../st_minecraft/core"),
+):
+    """
+    Generates all collections and the material properties, but only if no existing ordinal changes
+    Args:
+        block_source_file: CSV file of the materials
+        entity_source_file: CSV file of the entities
+        english_dir: directory of the English collections
+        german_dir: directory of the German collections
+        core_dir: directory of the material properties table
+    """
+    # all checks before anything is written, a refused run leaves all modules as they were
+    check_ordinals(block_source_file, entity_source_file, english_dir, german_dir)
+    # English first, the German collections are built from their members
+    build_material_enum_english(block_source_file, english_dir / "material.py")
+    build_entity_enum_english(entity_source_file, english_dir / "entity.py")
+    build_german_material_enum(block_source_file, german_dir / "material.py")
+    build_german_entity_enum(entity_source_file, german_dir / "entity.py")
+    build_material_properties(block_source_file=block_source_file, target_file=core_dir / "material_table.py")
 
 
-def build_entity_enum_english(
+def check_ordinals(
+    block_source_file: Path = Path("blocks_items_validated.csv"),
     entity_source_file: Path = Path("entities_validated.csv"),
-    target_file: Path = Path("../st_minecraft/en/entity.py"),
+    english_dir: Path = Path("../st_minecraft/en"),
+    german_dir: Path = Path("../st_minecraft/de"),
 ):
-    """Analogous to build_material_enum_english() but for Entities"""
-    code = '''""" This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
+    """
+    Raises a ValueError if regenerating any of the collections would change an existing ordinal
+    Args:
+        block_source_file: CSV file of the materials
+        entity_source_file: CSV file of the entities
+        english_dir: directory with material.py and entity.py of the English collections
+        german_dir: directory with material.py and entity.py of the German collections
+    """
+    for source_file, module in ((block_source_file, "material.py"), (entity_source_file, "entity.py")):
+        _check_ordinals_stable(_english_names(source_file), english_dir / module, "_NAMES")
+        _check_german_ordinals_stable(*_german_table(source_file), german_dir / module)
 
-from enum import Enum
 
+def _read_rows(source_file: Path) -> list[tuple[str, str]]:
+    """(DesiredName, minecraft_name) of every line of the CSV file"""
+    return [tuple(line.split(",")) for line in source_file.read_text().split("\n") if line != ""]
 
-class EntityCollection(Enum):
-'''
-    _write_enum_english(code, entity_source_file, target_file)
 
+def _snake_to_title_case(snake_str: str) -> str:
+    """Convert snake_case to Title_Case"""
+    return "_".join(word.capitalize() for word in snake_str.split("_"))
 
-def _write_german_enum(enum_source_code: str, source_file: Path, target_file: Path):
+
+def _english_names(source_file: Path) -> list[str]:
     """
-    Fills the body of the enum by simply appending new lines
-    Enum then has the style BlockName = "MINECRAFT_ID_ALL_CAPS"
+    English names in Title_Case format, in the order of the CSV file
+    The value of a member is always its name in capitals (English_Name = "ENGLISH_NAME")
     """
-    lines = source_file.read_text().split("\n")
+    names = []
     already_seen_names = set()
-    for line in lines:
-        if line == "":
+    for _, minecraft_id in _read_rows(source_file):
+        english_name = _snake_to_title_case(minecraft_id)
+        if english_name.upper() != minecraft_id.upper():
+            raise ValueError(f"{minecraft_id} can't be written as English name")
+
+        if english_name in already_seen_names:
             continue
 
-        name, _id = line.split(",")
+        names.append(english_name)
+        already_seen_names.add(english_name)
+    return names
+
+
+def _table(words: list[str], indent: int = 4) -> str:
+    """The words as indented string literals of at most _LINE_LENGTH characters, separated by spaces"""
+    lines = [""]
+    for word in words:
+        if lines[-1] and len(lines[-1]) + len(word) + 1 > _LINE_LENGTH:
+            lines.append("")
+        lines[-1] += f"{word} "
+    return "\n".join(f'{" " * indent}"{line}"' for line in lines)
+
 
+def _check_ordinals_stable(names: list[str], target_file: Path, table_name: str):
+    """
+    Raises a ValueError if the already generated module has members that would get another ordinal
+    Args:
+        names: the names of the new table, the ordinal of a member is its position
+        target_file: the module generated before
+        table_name: the variable that holds the names in the module
+    """
+    old_names = _old_table(target_file, table_name)
+    # the old format had no tables, any order was fine
+    if old_names is None:
+        return
+
+    if names[: len(old_names)] != old_names:
+        changed = next(i for i, name in enumerate(old_names) if i >= len(names) or names[i] != name)
+        raise ValueError(
+            f"{target_file}: {old_names[changed]} would lose its ordinal {changed}, "
+            "new lines must be appended to the end of the CSV file"
+        )
+
+
+def _check_german_ordinals_stable(names: list[str], ordinals: list[str], target_file: Path):
+    """
+    Raises a ValueError if a member of the already generated German module would be removed or get another ordinal
+    Args:
+        names: the names of the new table
+        ordinals: the ordinal of every name, as text
+        target_file: the module generated before
+    """
+    old_names = _old_table(target_file, "_NAMEN")
+    old_ordinals = _old_table(target_file, "_ORDINALE")
+    if old_names is None or old_ordinals is None:
+        return
+
+    new_ordinals = dict(zip(names, ordinals))
+    for name, ordinal in zip(old_names, old_ordinals):
+        if new_ordinals.get(name) != ordinal:
+            raise ValueError(
+                f"{target_file}: {name} would lose its ordinal {ordinal}, "
+                "new lines must be appended to the end of the CSV file"
+            )
+
+
+def _old_table(target_file: Path, table_name: str) -> list[str] | None:
+    """The words of a table in a module generated before, None if there is no such module or table"""
+    if not target_file.exists():
+        return None
+
+    for statement in ast.parse(target_file.read_text()).body:
+        if isinstance(statement, ast.Assign) and statement.targets[0].id == table_name:
+            value = statement.value
+            # _ORDINALE is a list comprehension over the table
+            if isinstance(value, ast.ListComp):
+                value = value.generators[0].iter
+            return value.func.value.value.split()
+    return None
+
+
+def _german_table(source_file: Path) -> tuple[list[str], list[str]]:
+    """The German names and the ordinal of the English member with the same value (as text) for every name"""
+    english_ordinals = {name.upper(): ordinal for ordinal, name in enumerate(_english_names(source_file))}
+
+    names = []
+    ordinals = []
+    already_seen_names = set()
+    for name, _id in _read_rows(source_file):
         if name in already_seen_names:
             continue
 
-        enum_source_code += f'    {name} = "{_id.upper()}"\n'
+        names.append(name)
+        ordinals.append(str(english_ordinals[_id.upper()]))
         already_seen_names.add(name)
+    return names, ordinals
 
-    target_file.write_text(enum_source_code)
 
+def _write_enum_english(class_name: str, kind: str, source_file: Path, target_file: Path):
+    """
+    Writes the English collection as table of names, the values are the names in capitals
+    The collection then behaves like an Enum with the style EnglishName = "ENGLISH_NAME"
+    Args:
+        kind: material or entity, used in the name of the lookup function (e.g. material_from_ordinal())
+    """
+    names = _english_names(source_file)
+    _check_ordinals_stable(names, target_file, "_NAMES")
 
-def _snake_to_title_case(snake_str: str) -> str:
-    """Convert snake_case to Title_Case"""
-    return "_".join(word.capitalize() for word in snake_str.split("_"))
+    header = '''"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
 
+from st_minecraft.core.compact_enum import CompactEnum
+'''
+    to_ordinal = "from st_minecraft.core.compact_enum import to_ordinal  # noqa: unused-import\n"
+    if kind != "material":
+        # to_ordinal() works for all collections, it is only exported once
+        to_ordinal = ""
+
+    code = f'''{header}{to_ordinal}
+_NAMES = (
+{_table(names)}
+).split()
+""" the ordinal of a member is its position in this table """
+
+
+class {class_name}(CompactEnum, names=_NAMES, values=[name.upper() for name in _NAMES]):
+    pass
 
-def _write_enum_english(enum_source_code: str, source_file: Path, target_file: Path):
+
+def {kind}_from_ordinal(ordinal: int) -> {class_name}:
     """
-    Fills the body of the enum with English names in Title_Case format
-    Enum then has the style EnglishName = "English_Name"
+    The {kind} with the given ordinal (see to_ordinal())
+    Args:
+        ordinal (int): e.g. {class_name}.{names[0]}.ordinal
+    Returns:
+        the {kind}, raises a ValueError if no {kind} has that ordinal
     """
-    lines = source_file.read_text().split("\n")
-    already_seen_names = set()
-    for line in lines:
-        if line == "":
-            continue
+    return {class_name}.from_ordinal(ordinal)
+'''
+    target_file.write_text(code)
 
-        _, minecraft_id = line.split(",")
-        english_name = _snake_to_title_case(minecraft_id)
+    stub = f"{header}{to_ordinal}\nclass {class_name}(CompactEnum):\n"
+    stub += "".join(f"    {name}: {class_name}\n" for name in names)
+    stub += f"\ndef {kind}_from_ordinal(ordinal: int) -> {class_name}: ...\n"
+    target_file.with_suffix(".pyi").write_text(stub)
 
-        if english_name in already_seen_names:
-            continue
 
-        enum_source_code += f'    {english_name} = "{minecraft_id.upper()}"\n'
-        already_seen_names.add(english_name)
+def _write_german_enum(
+    class_name: str, kind: str, english_module: str, english_class_name: str, source_file: Path, target_file: Path
+):
+    """
+    Writes the German collection as table of names plus the ordinal of the English member with the same value
+    The collection then behaves like an Enum with the style BlockName = "MINECRAFT_ID_ALL_CAPS"
+    The English collection must be generated from the same CSV file
+    Args:
+        kind: material or entity, used in the name of the lookup function (e.g. material_aus_ordinal())
+    """
+    names, ordinals = _german_table(source_file)
+    _check_german_ordinals_stable(names, ordinals, target_file)
+
+    header = f'''"""Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
+
+from typing import Optional
+
+from st_minecraft.core.compact_enum import CompactEnum
+'''
+    to_ordinal = "from st_minecraft.core.compact_enum import to_ordinal as zu_ordinal  # noqa: unused-import\n"
+    if kind != "material":
+        # to_ordinal() works for all collections, it is only exported once
+        to_ordinal = ""
+    collection_import = f"from {english_module} import {english_class_name} as _Collection\n"
+
+    article, german_kind, no_kind = (
+        ("das", "Material", "kein Material") if kind == "material" else ("die", "Entity", "keine Entity")
+    )
+    code = f'''{header}{to_ordinal}from st_minecraft.de._exceptions import WertFehler
+{collection_import}
+_NAMEN = (
+{_table(names)}
+).split()
+
+_ORDINALE = [
+    int(ordinal)
+    for ordinal in (
+{_table(ordinals, indent=8)}
+    ).split()
+]
+""" Ordinalzahl des englischen Members mit demselben Wert, für jeden Namen """
+
+
+class {class_name}(
+    CompactEnum,
+    names=_NAMEN,
+    values=[_Collection.from_ordinal(ordinal).value for ordinal in _ORDINALE],
+    ordinals=_ORDINALE,
+):
+
+    @staticmethod
+    def von_englisch(e: _Collection) -> Optional["{class_name}"]:
+        try:
+            return {class_name}._by_ordinal_[e.ordinal]
+        except (IndexError, AttributeError):
+            return None
+
+    def zu_englisch(self) -> Optional[_Collection]:
+        return _Collection._by_ordinal_[self._ordinal_]
+
 
-    target_file.write_text(enum_source_code)
+def {kind}_aus_ordinal(ordinal: int) -> {class_name}:
+    """
+    {article.capitalize()} {german_kind} mit der angegebenen Ordinalzahl (siehe zu_ordinal())
+    Args:
+        ordinal (int): z.B. {class_name}.{names[0]}.ordinal
+    Returns:
+        {article} {german_kind}, ein WertFehler, wenn es {no_kind} mit dieser Ordinalzahl gibt
+    """
+    try:
+        return {class_name}.from_ordinal(ordinal)
+    except ValueError:
+        raise WertFehler(f"Es gibt {no_kind} mit der Ordinalzahl {{ordinal}}.") from None
+'''
+    target_file.write_text(code)
+
+    stub = f"""{header}{to_ordinal}{collection_import}
+class {class_name}(CompactEnum):
+    @staticmethod
+    def von_englisch(e: _Collection) -> Optional[{class_name}]: ...
+    def zu_englisch(self) -> Optional[_Collection]: ...
+"""
+    stub += "".join(f"    {name}: {class_name}\n" for name in names)
+    stub += f"\ndef {kind}_aus_ordinal(ordinal: int) -> {class_name}: ...\n"
+    target_file.with_suffix(".pyi").write_text(stub)
 
 
 if __name__ == "__main__":
-    build_german_material_enum()
-    build_german_entity_enum()
-    build_material_enum_english()
-    build_entity_enum_english()
+    build_all()
@@ -0,0 +1,8 @@
+from st_minecraft.aio.boss_bar import *  # noqa: unused-import
+from st_minecraft.aio.core import close  # noqa: unused-import
+from st_minecraft.aio.core import connect  # noqa: unused-import
+from st_minecraft.aio.main import *  # noqa: unused-import
+from st_minecraft.en.data_models import *  # noqa: unused-import
+from st_minecraft.en.entity import *  # noqa: unused-import
+from st_minecraft.en.material import *  # noqa: unused-import
+from st_minecraft.en.material_properties import *  # noqa: unused-import
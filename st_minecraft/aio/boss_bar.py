@@ -0,0 +1,78 @@
+"""Enables creating and configuring boss bars, as coroutines"""
+
+from st_minecraft.aio.core import _send_command
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import _build_command
+from st_minecraft.en.boss_bar import BossBar
+from st_minecraft.en.boss_bar import BossBarColor
+from st_minecraft.en.boss_bar import BossBarStyle
+
+
+async def _send_boss_bar_command(sub_command: str):
+    # needed internally
+    command = f"editBossBar{ARG_SEPARATOR}{sub_command}"
+    await _send_command(command)
+
+
+async def create_bar(name: str, display_text: str) -> BossBar:
+    """
+    Create a boss bar
+    Args:
+        name: A name you choose, what the boss bar should be called for you
+        display_text: Text that should be displayed on the bar
+
+    Returns:
+        A BossBar object with which you can further configure the bar
+    """
+    command = _build_command("spawnBossBar", name, display_text)
+    await _send_command(command)
+
+    # some of the values are set when creating.
+    return BossBar(
+        name=name,
+        display_text=display_text,
+        value=0.0,
+        style=BossBarStyle.SOLID,
+        color=BossBarColor.PURPLE,
+    )
+
+
+async def set_text(boss_bar: BossBar, display_text: str) -> BossBar:
+    """Set the text of the bar"""
+    sub_command = _build_command("text", boss_bar.name, f"text:{display_text}")
+    await _send_boss_bar_command(sub_command)
+    boss_bar.display_text = display_text
+    return boss_bar
+
+
+async def set_color(boss_bar: BossBar, color: BossBarColor) -> BossBar:
+    """Set the color of the bar"""
+    sub_command = _build_command("color", boss_bar.name, f"color:{color.value}")
+    await _send_boss_bar_command(sub_command)
+    boss_bar.color = color
+    return boss_bar
+
+
+async def set_value(boss_bar: BossBar, value: float) -> BossBar:
+    """Set to what proportion the bar should be filled (between 0 and 1)"""
+    if not 0 <= value <= 1:
+        raise ValueError(f"The value of the boss bar must be between 0 and 1. You specified '{value}'.")
+
+    sub_command = _build_command("value", boss_bar.name, f"value:{value}")
+    await _send_boss_bar_command(sub_command)
+    boss_bar.value = value
+    return boss_bar
+
+
+async def set_style(boss_bar: BossBar, style: BossBarStyle) -> BossBar:
+    """Set the style of the bar"""
+    sub_command = _build_command("style", boss_bar.name, f"style:{style.value}")
+    await _send_boss_bar_command(sub_command)
+    boss_bar.style = style
+    return boss_bar
+
+
+async def delete_bar(boss_bar: BossBar):
+    """Delete a bar"""
+    command = _build_command("deleteBossBar", boss_bar.name)
+    await _send_command(command)
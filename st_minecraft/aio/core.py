@@ -0,0 +1,162 @@
+"""
+asyncio counterpart of st_minecraft.core, here communication with the server happens without blocking the event loop.
+Commands are built and replies are parsed exactly like in the synchronous library.
+
+There is one connection per process, opened by connect() and used by all tasks (they take turns for their queries).
+Sessions, SessionPool and request IDs of the synchronous library are not available here.
+A query that times out closes the connection: its reply could still arrive and would be taken as the reply
+to the next query. Call connect() again afterward.
+"""
+
+import asyncio
+
+from st_minecraft.core.core import _DISCOVERY_TIMEOUT
+from st_minecraft.core.core import DEFAULT_PORT
+from st_minecraft.core.core import NoDataError
+from st_minecraft.core.core import TimeoutPolicy
+from st_minecraft.core.core import _cant_connect_error
+from st_minecraft.core.core import _command_name
+from st_minecraft.core.core import _default_ip_options
+from st_minecraft.core.core import _overwrite_ip
+
+_STREAM_LIMIT = 1024 * 1024
+"""Maximum size of a single reply, asyncio's default (64 KiB) is too small for big inventories"""
+
+
+class _Connection:
+    """Reader and writer of an open connection, plus a lock that keeps request and reply together"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, timeouts: TimeoutPolicy):
+        self.reader = reader
+        self.writer = writer
+        self.timeouts = timeouts
+        """ resolved once when connecting, like in the synchronous library """
+        self.lock = asyncio.Lock()
+        """ held from sending a query until its reply was read, so concurrent tasks can't swap replies """
+
+
+_connection: _Connection | None = None
+
+
+async def connect(ip: str | None = None, port: int = DEFAULT_PORT, timeout_policy: TimeoutPolicy | None = None) -> None:
+    """
+    Establishes a connection to the Minecraft server.
+
+    Args:
+        ip (str): IP address of the minecraft server, attempts to connect to localhost if left empty (or None is passed)
+        port (int): The port the plugin is listening on
+        timeout_policy (TimeoutPolicy): How long to wait for replies, per command (default: TimeoutPolicy())
+    """
+    global _connection
+    if _connection is not None:
+        await close()
+
+    ip = _overwrite_ip(ip)
+    if ip:
+        reader, writer = await asyncio.open_connection(ip, port, limit=_STREAM_LIMIT)
+    else:
+        reader, writer = await _race_open_connection(port)
+
+    _connection = _Connection(reader, writer, (timeout_policy or TimeoutPolicy()).resolved())
+
+
+async def _race_open_connection(port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    # needed internally
+    # like in the synchronous connect(), all options are tried at the same time and the first one to answer wins
+    tasks = [
+        asyncio.ensure_future(
+            asyncio.wait_for(asyncio.open_connection(option, port, limit=_STREAM_LIMIT), _DISCOVERY_TIMEOUT)
+        )
+        for option in _default_ip_options
+    ]
+    winner = None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                winner = await next_done
+                return winner
+            except Exception:
+                pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        # options that connected as well are closed again
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, tuple) and result is not winner:
+                result[1].close()
+
+    raise _cant_connect_error(port)
+
+
+async def close() -> None:
+    """Closes the connection to the server"""
+    if _connection is None:
+        return
+
+    connection = _connection
+    _discard(connection)
+    try:
+        await connection.writer.wait_closed()
+    # the connection is gone either way
+    except ConnectionError:
+        pass
+
+
+def _discard(connection: _Connection) -> None:
+    # needed internally
+    # closes the connection, it is forgotten unless connect() opened a new one meanwhile
+    global _connection
+    if _connection is connection:
+        _connection = None
+    connection.writer.close()
+
+
+def _get_connection() -> _Connection:
+    # needed internally
+    if _connection is None:
+        raise RuntimeError("No connection to server. Please connect first.")
+    return _connection
+
+
+async def _send_command(command: str) -> None:
+    """
+    Sends a command that expects no reply.
+
+    Args:
+        command (str): The command to send.
+    """
+    # needed internally
+    connection = _get_connection()
+    connection.writer.write(f"{command}\n".encode("utf-8"))
+    await connection.writer.drain()
+
+
+async def _query(command: str, timeout: float | None = None) -> bytes:
+    """
+    Sends a command and waits for its reply.
+    Other tasks can keep running while we wait, their queries are answered after ours.
+
+    Args:
+        command (str): The command to send.
+        timeout (float): Seconds to wait for the reply (default: from the TimeoutPolicy of the connection)
+    """
+    # needed internally
+    connection = _get_connection()
+    if timeout is None:
+        timeout = connection.timeouts.for_command(_command_name(command))
+
+    async with connection.lock:
+        connection.writer.write(f"{command}\n".encode("utf-8"))
+        await connection.writer.drain()
+
+        try:
+            return await asyncio.wait_for(connection.reader.readuntil(b"\n"), timeout or None)
+        except asyncio.TimeoutError:
+            _discard(connection)
+            raise NoDataError(
+                f"Timeout: After {timeout} seconds no response was received from the server. "
+                f"The connection was closed, please connect again."
+            )
+        except asyncio.IncompleteReadError:
+            _discard(connection)
+            raise ConnectionError("The server closed the connection.")
@@ -0,0 +1,99 @@
+"""main functionalities of the library, as coroutines"""
+
+from typing import cast
+
+from st_minecraft.aio.core import _query
+from st_minecraft.aio.core import _send_command
+from st_minecraft.core.core import _build_command
+from st_minecraft.core.core import _bytes_to_text
+from st_minecraft.en.data_models import Dimension
+from st_minecraft.en.data_models import Material
+from st_minecraft.en.data_models import Player
+from st_minecraft.en.data_models import _get_models
+from st_minecraft.en.data_models import dimensionT
+from st_minecraft.en.main import _set_block_command
+from st_minecraft.en.material import MaterialCollection
+
+
+async def set_block(
+    x: int, y: int, z: int, block_type: MaterialCollection, dimension: Dimension = Dimension.World
+) -> None:
+    """
+    Places a block in the Minecraft game.
+    See st_minecraft.en.set_block() for details.
+
+    Args:
+        x (int): X coordinate for the block
+        y (int): Y coordinate for the block
+        z (int): Z coordinate for the block
+        block_type (MaterialCollection): Block as an element from MaterialCollection, e.g. MaterialCollection.Melone
+        dimension (Dimension): dimension to look for the block (default.: Dimension.World)
+    """
+    await _send_command(_set_block_command(x, y, z, block_type, dimension))
+
+
+async def get_block(x: int, y: int, z: int, dimension: Dimension = Dimension.World) -> Material:
+    """
+    Query what type of block is at the coordinate.
+    See st_minecraft.en.get_block() for details.
+
+    Args:
+        x (int): X coordinate of the block
+        y (int): Y coordinate of the block
+        z (int): Z coordinate of the block
+        dimension (Dimension): dimension to look for the block (default.: Dimension.World)
+    Returns:
+        The block at the coordinate as data type `Material`
+    """
+    command = _build_command("getBlock", x, y, z, dimension.value)
+    data = await _query(command)
+    block = _get_models().material(_bytes_to_text(data).upper(), x, y, z, cast(dimensionT, dimension.value))
+    return block
+
+
+async def get_player_by_name(name: str) -> Player:
+    """
+    Query the state of a player by providing their username
+    Args:
+        name: Name of the player to query
+    Returns:
+        You get a player object back that contains a lot of information about the player
+    """
+    return await get_player(name=name)
+
+
+async def get_player_by_index(index: int = 0) -> Player:
+    """
+    Query the state of a player by providing their id
+    Args:
+        index: Index of the player to query is optional (if you don't specify an id, id=0 is used)
+    Returns:
+        You get a player object back that contains a lot of information about the player
+    """
+    return await get_player(index=index)
+
+
+async def get_player(*, index: int | None = None, name: str | None = None) -> Player:
+    """
+    Query the state of a player by index or name.
+    See st_minecraft.en.get_player() for details.
+
+    Args:
+        index: Index of the player to query is optional (if you don't specify an index, index=0 is used)
+        name: Name of the player to query is optional (if you don't specify a name, index=0 is used)
+    Returns:
+        You get a player object back that contains a lot of information about the player
+    """
+    if index is not None and name is not None:
+        raise ValueError(
+            f"You can't provide name and index at the same time to get_player(), please choose what to set"
+        )
+
+    if name is not None:
+        command = _build_command("getPlayerByName", name)
+    else:
+        command = _build_command("getPlayer", index if index is not None else 0)
+
+    data = await _query(command)
+    player = _get_models().player(data)
+    return player
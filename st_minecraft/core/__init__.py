@@ -1,3 +1,5 @@
 """ st_minecraft package """
 
 from st_minecraft.core.core import *  # noqa: unused-import
+from st_minecraft.core.recording import start_recording  # noqa: unused-import
+from st_minecraft.core.recording import stop_recording  # noqa: unused-import
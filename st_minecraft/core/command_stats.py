@@ -0,0 +1,167 @@
+"""
+Counters per command name: calls, bytes sent and received and a latency histogram of the queries.
+Switched on with st_minecraft.core.enable_stats(), read with st_minecraft.core.stats().
+The numbers are collected by hooks (see st_minecraft.core.add_hook()), while switched off they cost nothing.
+"""
+
+import threading
+
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+"""Buckets per power of two, the relative error of a bucket is at most 1 / _SUB_BUCKETS (about 3%)"""
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies in microseconds.
+
+    Values below 32 get a bucket each, above that every power of two is split into 32 buckets.
+    So it stays small and precise from microseconds to minutes, and recording is a few integer operations.
+    """
+
+    def __init__(self):
+        self.counts: list[int] = []
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us: int | None = None
+
+    def record(self, value_us: int) -> None:
+        index = _bucket_index(value_us)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if self.max_us is None or value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, fraction: float) -> int | None:
+        """Upper end of the bucket that contains the percentile, e.g. fraction=0.99, None if nothing was recorded"""
+        if not self.count:
+            return None
+
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_upper_end(index), self.max_us)
+        return self.max_us
+
+    def copy(self) -> "LatencyHistogram":
+        """A copy that doesn't change when more values are recorded"""
+        copied = LatencyHistogram()
+        copied.counts = list(self.counts)
+        copied.count = self.count
+        copied.total_us = self.total_us
+        copied.min_us = self.min_us
+        copied.max_us = self.max_us
+        return copied
+
+    @property
+    def mean_us(self) -> float | None:
+        return self.total_us / self.count if self.count else None
+
+    def __repr__(self):
+        if not self.count:
+            return "LatencyHistogram(count=0)"
+        return (
+            f"LatencyHistogram("
+            f"count={self.count}, "
+            f"min_us={self.min_us}, "
+            f"p50_us={self.percentile(0.5)}, "
+            f"p99_us={self.percentile(0.99)}, "
+            f"max_us={self.max_us}"
+            f")"
+        )
+
+
+def _bucket_index(value_us: int) -> int:
+    # needed internally
+    if value_us < _SUB_BUCKETS:
+        return max(0, value_us)
+    shift = value_us.bit_length() - _SUB_BUCKET_BITS - 1
+    return _SUB_BUCKETS * (shift + 1) + (value_us >> shift) - _SUB_BUCKETS
+
+
+def _bucket_upper_end(index: int) -> int:
+    # needed internally
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    return ((index % _SUB_BUCKETS + _SUB_BUCKETS + 1) << shift) - 1
+
+
+class CommandStats:
+    """What was counted for one command name"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        """ How often the command was sent """
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+        """ Time from sending a query until its reply arrived. Queries sent together as batch share their time """
+
+    def copy(self) -> "CommandStats":
+        """A copy that doesn't change when more calls are counted"""
+        copied = CommandStats(self.name)
+        copied.calls = self.calls
+        copied.bytes_sent = self.bytes_sent
+        copied.bytes_received = self.bytes_received
+        copied.latency = self.latency.copy()
+        return copied
+
+    def __repr__(self):
+        return (
+            f"CommandStats("
+            f"name={self.name}, "
+            f"calls={self.calls}, "
+            f"bytes_sent={self.bytes_sent}, "
+            f"bytes_received={self.bytes_received}, "
+            f"latency={self.latency}"
+            f")"
+        )
+
+
+class StatsCollector:
+    """Collects the stats of all sessions from the pre_send and post_receive hooks, thread safe"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commands: dict[str, CommandStats] = {}
+
+    def on_send(self, event) -> None:
+        """pre_send hook"""
+        with self._lock:
+            stats = self._get(event.name)
+            stats.calls += 1
+            stats.bytes_sent += len(event.raw)
+
+    def on_receive(self, event) -> None:
+        """post_receive hook"""
+        with self._lock:
+            stats = self._get(event.name)
+            stats.bytes_received += len(event.raw)
+            stats.latency.record(event.elapsed_ns // 1000)
+
+    def snapshot(self) -> dict[str, CommandStats]:
+        """Copies of the stats, they stay as they are while the hooks keep counting"""
+        with self._lock:
+            return {name: stats.copy() for name, stats in self.commands.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.commands = {}
+
+    def _get(self, name: str) -> CommandStats:
+        # needed internally
+        stats = self.commands.get(name)
+        if stats is None:
+            stats = self.commands[name] = CommandStats(name)
+        return stats
@@ -0,0 +1,179 @@
+"""
+Enum-like base class of the generated collections (MaterialCollection, MaterialSammlung, EntityCollection, ...).
+
+Building an Enum with more than a thousand members takes a noticeable part of the import time of the library.
+A CompactEnum is built from a table of names and values instead, which is about ten times faster.
+Members are used just like Enum members: MaterialCollection.Stone, .name, .value, MaterialCollection("STONE"),
+MaterialCollection["Stone"], iterating, pickling and as field type of the data models.
+"""
+
+import itertools
+from types import MappingProxyType
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+
+class _CompactEnumMeta(type):
+    """Gives the collection classes the class level behaviour of an Enum"""
+
+    def __call__(cls, value: Any) -> "CompactEnum":
+        # like Enum, calling the class looks up a member by value
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__qualname__}") from None
+
+    def __getitem__(cls, name: str) -> "CompactEnum":
+        return cls._member_map_[name]
+
+    def __iter__(cls) -> Iterator["CompactEnum"]:
+        return iter(cls._members_)
+
+    def __len__(cls) -> int:
+        return len(cls._members_)
+
+    def __contains__(cls, value: Any) -> bool:
+        return isinstance(value, cls) or value in cls._value2member_map_
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name in cls.__dict__.get("_member_map_", {}):
+            raise AttributeError(f"cannot reassign member {name!r}")
+        super().__setattr__(name, value)
+
+    def __repr__(cls) -> str:
+        return f"<enum {cls.__name__!r}>"
+
+    @property
+    def __members__(cls) -> MappingProxyType:
+        """name -> member, aliases included"""
+        return MappingProxyType(cls._member_map_)
+
+
+class CompactEnum(metaclass=_CompactEnumMeta):
+    """
+    Base class of the generated collections, the members are created from the tables given to the class:
+
+        class MaterialCollection(CompactEnum, names=["Stone", "Dirt"], values=["STONE", "DIRT"]):
+            pass
+
+    Like in an Enum, a name whose value already belongs to another member is an alias of that member.
+    Every member has an ordinal, a small int that identifies it (see ordinal).
+    """
+
+    __slots__ = ("_name_", "_value_", "_ordinal_")
+
+    _members_: list["CompactEnum"] = []
+    """ all members without aliases, in the order of the table """
+    _member_map_: dict[str, "CompactEnum"] = {}
+    _value2member_map_: dict[Any, "CompactEnum"] = {}
+    _by_ordinal_: tuple[Optional["CompactEnum"], ...] = ()
+    """ ordinal -> member, None for ordinals without member """
+
+    def __init_subclass__(
+        cls, names: Iterable[str] = (), values: Iterable[Any] = (), ordinals: Iterable[int] | None = None, **kwargs
+    ):
+        super().__init_subclass__(**kwargs)
+        members = []
+        member_map = {}
+        value_map = {}
+        for name, value, ordinal in zip(names, values, itertools.count() if ordinals is None else ordinals):
+            member = value_map.get(value)
+            if member is None:
+                member = object.__new__(cls)
+                member._name_ = name
+                member._value_ = value
+                member._ordinal_ = ordinal
+                members.append(member)
+                value_map[value] = member
+            member_map[name] = member
+            # type.__setattr__ skips the check against reassigning members
+            type.__setattr__(cls, name, member)
+
+        by_ordinal = [None] * (max((member._ordinal_ for member in members), default=-1) + 1)
+        for member in members:
+            by_ordinal[member._ordinal_] = member
+
+        type.__setattr__(cls, "_members_", members)
+        type.__setattr__(cls, "_member_map_", member_map)
+        type.__setattr__(cls, "_value2member_map_", value_map)
+        type.__setattr__(cls, "_member_names_", [member._name_ for member in members])
+        type.__setattr__(cls, "_by_ordinal_", tuple(by_ordinal))
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> "CompactEnum":
+        """
+        The member with the given ordinal
+        Args:
+            ordinal (int): see CompactEnum.ordinal
+        Returns:
+            the member, raises a ValueError if there is none with that ordinal
+        """
+        member = cls._by_ordinal_[ordinal] if 0 <= ordinal < len(cls._by_ordinal_) else None
+        if member is None:
+            raise ValueError(f"{ordinal!r} is not an ordinal of {cls.__qualname__}")
+        return member
+
+    @property
+    def name(self) -> str:
+        return self._name_
+
+    @property
+    def value(self) -> Any:
+        return self._value_
+
+    @property
+    def ordinal(self) -> int:
+        """
+        Number of the member, it doesn't change between versions of the library (new members get new numbers).
+        A German member has the ordinal of the English member with the same value,
+        e.g. MaterialSammlung.Stein.ordinal == MaterialCollection.Stone.ordinal.
+        Useful as index into arrays or to store many members compactly.
+        """
+        return self._ordinal_
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}.{self._name_}: {self._value_!r}>"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}.{self._name_}"
+
+    def __reduce_ex__(self, protocol: int):
+        # pickled by name, like Enum members
+        return getattr, (type(self), self._name_)
+
+    def __copy__(self) -> "CompactEnum":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "CompactEnum":
+        return self
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        # lets pydantic validate fields of this type like Enum fields: a member or its value is accepted
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda member: member.value, when_used="json"
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: Any, handler: Any) -> dict[str, Any]:
+        return {"title": cls.__name__, "enum": [member.value for member in cls], "type": "string"}
+
+
+def to_ordinal(member: CompactEnum) -> int:
+    """
+    The ordinal of a material or entity (see CompactEnum.ordinal)
+    Args:
+        member: e.g. MaterialCollection.Stone or MaterialSammlung.Stein
+    Returns:
+        the ordinal, the matching member is returned by material_from_ordinal() or entity_from_ordinal()
+    """
+    return member._ordinal_
@@ -3,22 +3,60 @@ Core of the library, here communication with the server happens
 this file also provides some helper functions
 """
 
+import errno
+import itertools
 import os
+import selectors
 import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from enum import Enum
 from typing import Any
+from typing import Callable
+from typing import Iterable
 from typing import Literal
+from typing import NamedTuple
 from typing import Optional
 from typing import Type
 from typing import TypeVar
+from typing import Union
+
+from st_minecraft.core.command_stats import CommandStats
+from st_minecraft.core.command_stats import StatsCollector
+from st_minecraft.core.compact_enum import CompactEnum
 
 # Global variable for the connection
+# (the socket of the default session, kept for code that accesses it directly)
 connection: Optional[socket.socket] = None
 
 ARG_SEPARATOR = "𝇉"
 
 DEFAULT_PORT = 25595
 
+REQUEST_ID_MARKER = "#"
+"""
+Marks the optional request ID field, which is put in front of a command and echoed in front of its reply.
+e.g. `#17𝇉getBlock𝇉0𝇉64𝇉0𝇉world` is answered with `#17𝇉STONE`
+It is only used when a Session is created with request_ids=True (the server has to support it).
+"""
+
+QUERY_COMMANDS = frozenset(
+    ("getBlock", "getPlayer", "getPlayerByName", "getInv", "pollChat", "spawnEntity", "getEntity", "validate")
+)
+"""Commands the server answers with a reply, all other commands get none"""
+
+_RECEIVE_BUFFER_SIZE = 64 * 1024
+"""Initial size of the receive buffer, it grows if a single reply doesn't fit"""
+
+_SEND_CHUNK_SIZE = 64 * 1024
+"""Size of the buffer that collects commands sent in bulk, it is flushed to the socket each time it is full"""
+
+_DEFAULT_MAX_QUEUED = 10_000
+"""How many commands the background writer holds at most, before the caller has to wait"""
+
 _default_ip_options = ("0.0.0.0", "127.0.0.1", "localhost")
 """Options we try, to find a running server (with plugin) on the local device"""
 
@@ -31,6 +69,806 @@ it is determined when connect() is called the first time without passing an IP
 # 127.0.0.1 and localhost worked tho
 # -> we try all  options stored in _default_ip_options (below) and see if one sticks before potentially raising
 # the default_ip variable exists to save a successful find (so we don't try each time)
+# if the environment variable SK_ENDPOINT_CACHE points to a file, the find is also saved there for the next run
+
+_DISCOVERY_TIMEOUT = 2.0
+"""Seconds to wait for one of the _default_ip_options to answer"""
+
+_CONNECT_ATTEMPT_DELAY = 0.25
+"""Seconds an option gets to connect before the next one is tried as well (the delay RFC 8305 recommends)"""
+
+
+class _FrameReader:
+    """
+    Reads the newline terminated replies of the server from a socket.
+
+    The server may split one reply into several TCP segments or put several replies into one segment.
+    Therefore, we read into a reusable buffer and only hand out complete frames (one reply each).
+    Bytes that belong to the next reply stay in the buffer until they are requested.
+    """
+
+    def __init__(self, size: int = _RECEIVE_BUFFER_SIZE):
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        """ index of the first byte that was not handed out yet """
+        self._end = 0
+        """ index after the last byte that was received """
+
+    def clear(self) -> None:
+        """Throws away everything that was received but not read yet"""
+        self._start = 0
+        self._end = 0
+
+    def read_frame(self, sock: socket.socket) -> bytes:
+        """
+        Returns exactly one reply (including the trailing newline).
+        Blocks until the reply is complete, timeouts of the socket are passed on to the caller.
+        """
+        scan_from = self._start
+        while True:
+            newline = self._buffer.find(b"\n", scan_from, self._end)
+            if newline != -1:
+                frame = bytes(self._view[self._start : newline + 1])
+                self._start = newline + 1
+                if self._start == self._end:
+                    self._start = self._end = 0
+                return frame
+
+            self._make_room()
+            # everything up to here was already searched, no need to do it again after the next recv
+            scan_from = self._end
+
+            received = sock.recv_into(self._view[self._end :])
+            if received == 0:
+                raise ConnectionError("The server closed the connection.")
+            self._end += received
+
+    def _make_room(self) -> None:
+        # needed internally
+        if self._end < len(self._buffer):
+            return
+
+        # move the incomplete frame to the front, so we can append to it
+        if self._start > 0:
+            pending = self._end - self._start
+            self._view[:pending] = self._view[self._start : self._end]
+            self._start = 0
+            self._end = pending
+            return
+
+        # a single reply is bigger than the buffer -> grow it
+        self._view.release()
+        self._buffer.extend(bytes(len(self._buffer)))
+        self._view = memoryview(self._buffer)
+
+
+class _CommandWriter:
+    """
+    Encodes commands into a preallocated buffer and sends the buffer whenever it is full.
+    This way sending many commands only costs a few syscalls.
+    """
+
+    def __init__(self, size: int = _SEND_CHUNK_SIZE):
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+
+    def write(self, sock: socket.socket, commands: Iterable[str]) -> int:
+        """Sends all commands, returns how many were sent"""
+        size = len(self._buffer)
+        end = 0
+        count = 0
+        for command in commands:
+            data = f"{command}\n".encode("utf-8")
+            if end + len(data) > size:
+                sock.sendall(self._view[:end])
+                end = 0
+
+                # doesn't fit, even into an empty buffer
+                if len(data) > size:
+                    sock.sendall(data)
+                    count += 1
+                    continue
+
+            self._view[end : end + len(data)] = data
+            end += len(data)
+            count += 1
+
+        if end:
+            sock.sendall(self._view[:end])
+
+        return count
+
+
+class _Demultiplexer:
+    """
+    Routes the replies of a connection with request IDs to the queries waiting for them.
+
+    A background thread reads all replies and resolves the future registered for the request ID of each reply.
+    Because replies are matched by ID, the server may answer in any order
+    and one slow query doesn't hold up the others.
+    """
+
+    def __init__(self, sock: socket.socket, frame_reader: _FrameReader, received: Callable[[bytes], None]):
+        self._socket = sock
+        self._frame_reader = frame_reader
+        self._received = received
+        """ called with every reply as it was read, before it is matched """
+        self._pending: dict[int, Future] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._error: Exception | None = None
+        """ set once the connection is gone, no further queries are accepted """
+        self._thread = threading.Thread(target=self._read_replies, name="st_minecraft-demultiplexer", daemon=True)
+        self._thread.start()
+
+    def register(self) -> tuple[int, Future]:
+        """Reserves a request ID, the returned future receives the reply for it"""
+        future = Future()
+        with self._lock:
+            if self._error is not None:
+                raise ConnectionError(f"The connection to the server was lost: {self._error}")
+
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+        return request_id, future
+
+    def forget(self, request_ids: Iterable[int]) -> None:
+        """Stop waiting for these IDs (e.g. after a timeout), their replies are dropped if they still arrive"""
+        with self._lock:
+            for request_id in request_ids:
+                self._pending.pop(request_id, None)
+
+    def join(self, timeout: float | None = None) -> None:
+        """Waits for the reader thread, it ends once the socket is shut down"""
+        self._thread.join(timeout)
+
+    def _read_replies(self) -> None:
+        # needed internally
+        marker = REQUEST_ID_MARKER.encode("utf-8")
+        separator = ARG_SEPARATOR.encode("utf-8")
+        try:
+            while True:
+                frame = self._frame_reader.read_frame(self._socket)
+                self._received(frame)
+
+                # replies without (valid) ID can't be matched to a query, we drop them
+                end_of_id = frame.find(separator)
+                if not frame.startswith(marker) or end_of_id == -1:
+                    continue
+                try:
+                    request_id = int(frame[len(marker) : end_of_id])
+                except ValueError:
+                    continue
+
+                with self._lock:
+                    future = self._pending.pop(request_id, None)
+                if future is not None:
+                    future.set_result(frame[end_of_id + len(separator) :])
+
+        # the socket was closed (by us or by the server), nobody will answer the pending queries anymore
+        except Exception as e:
+            with self._lock:
+                self._error = e
+                pending = list(self._pending.values())
+                self._pending.clear()
+
+            for future in pending:
+                future.set_exception(ConnectionError("The connection to the server was lost before the reply arrived."))
+
+
+class _BackgroundWriter:
+    """
+    Sends the commands that expect no reply (setBlock, postChat, ...) from a background thread,
+    so the caller doesn't have to wait in sendall.
+
+    Everything that queued up while the last batch was sent goes out together with the next sendall.
+    The queue is bounded: if the server can't keep up, callers wait until there is room again.
+    """
+
+    def __init__(self, write_commands: Callable[[list[str]], int], max_queued: int = _DEFAULT_MAX_QUEUED):
+        if max_queued < 1:
+            raise ValueError(
+                f"The background writer must be able to queue at least one command. You said '{max_queued}'."
+            )
+
+        self._write_commands = write_commands
+        self._max_queued = max_queued
+        self._low_water = max_queued // 2
+        """ drain() waits until no more than this many commands are queued """
+        self._commands: deque[str] = deque()
+        self._in_flight = 0
+        """ commands taken from the queue that are being sent right now """
+        self._error: Exception | None = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="st_minecraft-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, command: str) -> None:
+        """Queues a command, waits if the queue is full"""
+        with self._condition:
+            while len(self._commands) >= self._max_queued and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+
+            self._commands.append(command)
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Waits until every queued command was written to the socket"""
+        with self._condition:
+            while (self._commands or self._in_flight) and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+
+    def drain(self) -> None:
+        """Waits until the queue is at most half full, cheap enough to call once per loop iteration"""
+        with self._condition:
+            while len(self._commands) + self._in_flight > self._low_water and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+
+    def close(self) -> None:
+        """Sends what is still queued and stops the thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _raise_error(self) -> None:
+        # needed internally
+        if self._error is not None:
+            raise ConnectionError(f"Sending commands in the background failed: {self._error}") from self._error
+
+    def _run(self) -> None:
+        # needed internally
+        while True:
+            with self._condition:
+                while not self._commands and not self._closed:
+                    self._condition.wait()
+                if not self._commands:
+                    return
+
+                batch = list(self._commands)
+                self._commands.clear()
+                self._in_flight = len(batch)
+                # there is room in the queue again
+                self._condition.notify_all()
+
+            try:
+                self._write_commands(batch)
+            # the connection is broken, the commands are lost. callers learn about it on their next command
+            except Exception as e:
+                with self._condition:
+                    self._error = e
+                    self._commands.clear()
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+
+DEFAULT_COMMAND_TIMEOUTS: dict[str, float | None] = {
+    "getInv": 5.0,
+    "spawnEntity": 5.0,
+}
+"""Seconds to wait at least for the reply, for commands that need more time than the default of the session"""
+
+
+class TimeoutPolicy:
+    """
+    How long to wait for the replies of the server, per command name.
+
+    Slow queries (getInv, spawnEntity) get more time, but never less than the default timeout.
+    A batch of queries (e.g. get_blocks()) gets one deadline for all replies:
+    the timeout of its slowest command plus per_extra_reply for every further reply.
+
+    A session resolves its policy once when it connects, the environment variable SK_TIMEOUT_OVERWRITE
+    (seconds, or 'None' to wait forever) then replaces all timeouts.
+    None or 0 as timeout means waiting forever.
+    """
+
+    def __init__(
+        self,
+        default: float | None = 2.0,
+        per_command: dict[str, float | None] | None = None,
+        per_extra_reply: float = 0.05,
+    ):
+        """
+        Args:
+            default (float): Seconds to wait for commands not in per_command
+            per_command (dict): Seconds to wait by command name (default: DEFAULT_COMMAND_TIMEOUTS,
+                as far as they are longer than default)
+            per_extra_reply (float): Seconds a batch gets for every reply after the first
+        """
+        if per_command is None:
+            # the defaults only give slow commands more time, so a longer default timeout applies to them as well
+            per_command = {name: t for name, t in DEFAULT_COMMAND_TIMEOUTS.items() if default and t and t > default}
+        self.default = default
+        self.per_command = dict(per_command)
+        self.per_extra_reply = per_extra_reply
+
+    def for_command(self, name: str) -> float | None:
+        """Seconds to wait for the reply to a command with this name, None to wait forever"""
+        return self.per_command.get(name, self.default) or None
+
+    def for_batch(self, commands: list[str]) -> float | None:
+        """Seconds to wait for all replies to these commands together, None to wait forever"""
+        if len(commands) == 1:
+            return self.for_command(_command_name(commands[0]))
+
+        timeouts = {self.for_command(name) for name in {_command_name(command) for command in commands}}
+        if not timeouts or None in timeouts:
+            return None
+        return max(timeouts) + self.per_extra_reply * (len(commands) - 1)
+
+    def resolved(self) -> "TimeoutPolicy":
+        """A copy with SK_TIMEOUT_OVERWRITE applied, the environment is read here and nowhere else"""
+        if os.getenv("SK_TIMEOUT_OVERWRITE") is None:
+            return TimeoutPolicy(self.default, self.per_command, self.per_extra_reply)
+
+        timeout = _overwrite_timeout(self.default)
+        return TimeoutPolicy(timeout, {}, self.per_extra_reply if timeout else 0.0)
+
+    def __repr__(self):
+        return (
+            f"TimeoutPolicy("
+            f"default={self.default}, "
+            f"per_command={self.per_command}, "
+            f"per_extra_reply={self.per_extra_reply}"
+            f")"
+        )
+
+
+def _command_name(command: str) -> str:
+    # needed internally
+    end = command.find(ARG_SEPARATOR)
+    return command if end == -1 else command[:end]
+
+
+class Session:
+    """
+    A connection to a Minecraft server, with its own buffers and timeouts.
+
+    Usually you don't need this: connect() opens the default session, which is used by all functions.
+    Open your own sessions to talk to several servers at once,
+    or to spread a lot of work over several connections to the same server.
+    All functions accept the session to use as keyword argument.
+
+    A session can be used from several threads, a query and its reply are never split up.
+    The threads have to take turns though, see SessionPool if they should talk to the server in parallel.
+
+    If the server supports request IDs, create the session with request_ids=True.
+    Then every query is tagged with an ID and the replies are matched by it,
+    so many threads can wait for replies over the same connection at the same time.
+
+    With background_writes=True commands that expect no reply (e.g. set_block()) are handed to a
+    background thread instead of being sent right away, so loops don't wait for the network.
+    Queries wait until everything queued before them was sent, see also flush() and drain().
+
+    Example:
+        session = Session().connect("192.168.1.10")
+        set_block(0, 64, 0, MaterialCollection.Stone, session=session)
+    """
+
+    def __init__(
+        self,
+        timeout: float = 2.0,
+        request_ids: bool = False,
+        background_writes: bool = False,
+        max_queued: int = _DEFAULT_MAX_QUEUED,
+        timeout_policy: TimeoutPolicy | None = None,
+    ):
+        """
+        Args:
+            timeout (float): Seconds to wait for a reply of the server (slow commands in DEFAULT_COMMAND_TIMEOUTS
+                get more time if their timeout there is longer)
+            request_ids (bool): Tag queries with request IDs (see REQUEST_ID_MARKER), the server has to support it
+            background_writes (bool): Send commands that expect no reply from a background thread
+            max_queued (int): How many commands the background thread holds at most before callers have to wait
+            timeout_policy (TimeoutPolicy): Timeouts per command, replaces timeout if given
+        """
+        self.socket: socket.socket | None = None
+        """ The socket of the connection, None until connect() was called """
+        self.timeout = timeout
+        """ Seconds to wait for a reply of the server, changes take effect with the next connect() """
+        self.timeout_policy = timeout_policy
+        """ Timeouts per command, changes take effect with the next connect() """
+        self._timeouts: TimeoutPolicy | None = None
+        """ the policy resolved by connect() """
+        self._socket_timeout: float | None = None
+        """ what settimeout() was last called with, so it's only called again if the value changes """
+        self.request_ids = request_ids
+        """ True if queries are tagged with request IDs """
+        self.background_writes = background_writes
+        """ True if commands that expect no reply are sent from a background thread """
+        self.max_queued = max_queued
+        """ How many commands the background thread holds at most """
+        self._frame_reader = _FrameReader()
+        self._command_writer = _CommandWriter()
+        self._demultiplexer: _Demultiplexer | None = None
+        self._background_writer: _BackgroundWriter | None = None
+        self.recorder = None
+        """ WireRecorder that logs the traffic of this session, see st_minecraft.core.recording.start_recording() """
+        self._lock = threading.RLock()
+        """ held while the socket is used, so threads can't mix up their commands and replies """
+
+    def connect(self, ip: str | None = None, port: int = DEFAULT_PORT) -> "Session":
+        """
+        Establishes the connection to the Minecraft server, an already open connection is closed before.
+
+        Args:
+            ip (str): IP address of the minecraft server, attempts to connect to localhost if left empty
+            port (int): The port the plugin is listening on
+
+        Returns:
+            The session itself, so you can write `session = Session().connect()`
+        """
+        ip = _overwrite_ip(ip)
+        self.close()
+
+        with self._lock:
+            self.socket = _open_socket(ip, port)
+            self._socket_timeout = self.socket.gettimeout()
+            self._timeouts = (self.timeout_policy or TimeoutPolicy(self.timeout)).resolved()
+
+            if self.request_ids:
+                # the reader thread waits for replies as long as the connection is open
+                self.socket.settimeout(None)
+                self._demultiplexer = _Demultiplexer(self.socket, self._frame_reader, self._record_received)
+
+            if self.background_writes:
+                self._background_writer = _BackgroundWriter(self._write_reporting_errors, self.max_queued)
+        return self
+
+    def close(self) -> None:
+        """Closes the connection, commands that are still queued for the background thread are sent before"""
+        # has to happen before taking the lock, the background thread needs it to send the rest
+        self._stop_background_writer()
+
+        with self._lock:
+            if self.socket is not None:
+                # wakes up the reader thread of the demultiplexer (closing alone doesn't on every OS)
+                try:
+                    self.socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                self.socket.close()
+                self.socket = None
+
+            if self._demultiplexer is not None:
+                self._demultiplexer.join(timeout=1.0)
+                self._demultiplexer = None
+
+            # bytes left over from the old connection must not be read as replies of a new one
+            self._frame_reader.clear()
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start_background_writer(self, max_queued: int | None = None) -> None:
+        """
+        Switches on background_writes, see the docs of the class.
+
+        Args:
+            max_queued (int): How many commands the background thread holds at most (default: self.max_queued)
+        """
+        if max_queued is not None:
+            self.max_queued = max_queued
+
+        self._stop_background_writer()
+        self.background_writes = True
+        if self.socket is not None:
+            self._background_writer = _BackgroundWriter(self._write_reporting_errors, self.max_queued)
+
+    def stop_background_writer(self) -> None:
+        """Sends what is still queued and switches background_writes off again"""
+        self.background_writes = False
+        self._stop_background_writer()
+
+    def flush(self) -> None:
+        """
+        Waits until all commands handed to the background thread were sent.
+        Queries do this on their own, so you only need it for timing, e.g. before a sleep.
+        Does nothing if background_writes is off.
+        """
+        background_writer = self._background_writer
+        if background_writer is not None:
+            background_writer.flush()
+
+    def drain(self) -> None:
+        """
+        Waits until the background thread caught up to half of max_queued.
+        Call it once per loop iteration, so a fast loop can't run far ahead of the server.
+        Does nothing if background_writes is off.
+        """
+        background_writer = self._background_writer
+        if background_writer is not None:
+            background_writer.drain()
+
+    def _stop_background_writer(self) -> None:
+        # needed internally
+        background_writer, self._background_writer = self._background_writer, None
+        if background_writer is not None:
+            background_writer.close()
+
+    def _send_command(self, command: str) -> None:
+        # needed internally
+        background_writer = self._background_writer
+        if background_writer is not None:
+            background_writer.put(command)
+            return
+
+        self._write_reporting_errors([command])
+
+    def _send_commands(self, commands: Iterable[str]) -> int:
+        # needed internally
+        background_writer = self._background_writer
+        if background_writer is None:
+            return self._write_reporting_errors(commands)
+
+        count = 0
+        for command in commands:
+            background_writer.put(command)
+            count += 1
+        return count
+
+    def _write_commands(self, commands: Iterable[str]) -> int:
+        # needed internally
+        # writes directly to the socket, even if background_writes is on
+        with self._lock:
+            recorder = self.recorder
+            hooks = _hooks[HOOK_PRE_SEND]
+            if recorder is not None or hooks:
+                commands = list(commands)
+                if recorder is not None:
+                    recorder.record_sent(commands)
+                if hooks:
+                    now = time.perf_counter_ns()
+                    for command in commands:
+                        _run_hooks(hooks, _command_event(self, command, f"{command}\n".encode("utf-8"), now, 0))
+            return self._command_writer.write(self._get_socket(), commands)
+
+    def _write_reporting_errors(self, commands: Iterable[str]) -> int:
+        # needed internally
+        # for commands without reply, queries report their errors in _query_many()
+        if not _hooks[HOOK_ON_ERROR]:
+            return self._write_commands(commands)
+
+        commands = list(commands)
+        started = time.perf_counter_ns()
+        try:
+            return self._write_commands(commands)
+        except Exception as e:
+            _report_error(self, commands, started, e)
+            raise
+
+    def _record_received(self, frame: bytes) -> None:
+        # needed internally
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.record_received(frame)
+
+    def _receive(self, timeout: float | None = None) -> bytes:
+        # needed internally
+        if self._demultiplexer is not None:
+            raise RuntimeError("With request IDs replies can only be received through _query() or _query_many().")
+
+        with self._lock:
+            sock = self._get_socket()
+            if timeout is None:
+                timeout = self._get_timeouts().default
+            timeout = timeout or None
+            # settimeout() is a syscall on some systems, the value rarely changes between replies
+            if timeout != self._socket_timeout:
+                sock.settimeout(timeout)  # Timeout in seconds
+                self._socket_timeout = timeout
+
+            try:
+                data = self._frame_reader.read_frame(sock)
+            except socket.timeout:
+                raise NoDataError(f"Timeout: After {timeout} seconds no response was received from the server.")
+            self._record_received(data)
+
+        return data
+
+    def _query(self, command: str, timeout: float | None = None) -> bytes:
+        # needed internally
+        return self._query_many([command], timeout)[0]
+
+    def _query_many(self, commands: Iterable[str], timeout: float | None = None) -> list[bytes]:
+        # needed internally
+        # commands queued before this query have to reach the server first (and without holding the lock,
+        # the background thread needs it)
+        self.flush()
+
+        if not isinstance(commands, list):
+            commands = list(commands)
+        # one deadline for the whole batch
+        if timeout is None:
+            timeout = self._get_timeouts().for_batch(commands)
+
+        post_receive_hooks = _hooks[HOOK_POST_RECEIVE]
+        error_hooks = _hooks[HOOK_ON_ERROR]
+        if post_receive_hooks or error_hooks:
+            started = time.perf_counter_ns()
+
+        try:
+            if self._demultiplexer is not None:
+                replies = self._query_tagged(commands, timeout)
+            else:
+                replies = self._query_in_order(commands, timeout)
+        except Exception as e:
+            if error_hooks:
+                _report_error(self, commands, started, e)
+            raise
+
+        if post_receive_hooks:
+            elapsed = time.perf_counter_ns() - started
+            for command, reply in zip(commands, replies):
+                _run_hooks(post_receive_hooks, _command_event(self, command, reply, started, elapsed))
+        return replies
+
+    def _query_in_order(self, commands: list[str], timeout: float | None) -> list[bytes]:
+        # needed internally
+        # the lock is held from sending until the replies arrived, so no other thread can steal our replies
+        with self._lock:
+            count = self._write_commands(commands)
+            # a timeout of 0 makes _receive() wait forever, None would mean the default timeout
+            if count == 1:
+                return [self._receive(timeout or 0)]
+
+            # every reply only waits for what is left until the deadline of the whole batch
+            deadline = None if timeout is None else time.monotonic() + timeout
+            replies = []
+            try:
+                for _ in range(count):
+                    remaining = 0 if deadline is None else deadline - time.monotonic()
+                    if deadline is not None and remaining <= 0:
+                        break
+                    replies.append(self._receive(remaining))
+            except NoDataError:
+                pass
+
+            if len(replies) < count:
+                raise NoDataError(
+                    f"Timeout: After {timeout} seconds only {len(replies)} of {count} responses were received "
+                    f"from the server."
+                )
+            return replies
+
+    def _query_tagged(self, commands: list[str], timeout: float | None = None) -> list[bytes]:
+        # needed internally
+        # only sending needs the lock, the replies are delivered by the demultiplexer
+        # so other threads can send their queries while we wait
+        demultiplexer = self._demultiplexer
+        request_ids = []
+        futures = []
+        tagged_commands = []
+        for command in commands:
+            request_id, future = demultiplexer.register()
+            request_ids.append(request_id)
+            futures.append(future)
+            tagged_commands.append(f"{REQUEST_ID_MARKER}{request_id}{ARG_SEPARATOR}{command}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._write_commands(tagged_commands)
+            return [
+                future.result(None if deadline is None else max(0.0, deadline - time.monotonic())) for future in futures
+            ]
+        except FutureTimeoutError:
+            raise NoDataError(f"Timeout: After {timeout} seconds no response was received from the server.")
+        finally:
+            demultiplexer.forget(request_ids)
+
+    def _get_timeouts(self) -> TimeoutPolicy:
+        # needed internally
+        if self._timeouts is None:
+            raise RuntimeError("No connection to server. Please connect first.")
+        return self._timeouts
+
+    def _get_socket(self) -> socket.socket:
+        # needed internally
+        if self.socket is None:
+            raise RuntimeError("No connection to server. Please connect first.")
+        return self.socket
+
+
+class SessionPool:
+    """
+    Hands each thread its own Session, so several threads can talk to the server in parallel.
+
+    At most `size` connections are opened, threads beyond that share the existing sessions
+    (that is safe, they just have to take turns).
+
+    Example:
+        pool = SessionPool("192.168.1.10", size=8)
+
+        def worker(x):
+            return get_block(x, 64, 0, session=pool.session())
+
+        with ThreadPoolExecutor(8) as executor:
+            blocks = list(executor.map(worker, range(100)))
+    """
+
+    def __init__(
+        self,
+        ip: str | None = None,
+        port: int = DEFAULT_PORT,
+        size: int = 4,
+        timeout: float = 2.0,
+        timeout_policy: TimeoutPolicy | None = None,
+    ):
+        """
+        Args:
+            ip (str): IP address of the minecraft server, attempts to connect to localhost if left empty
+            port (int): The port the plugin is listening on
+            size (int): Maximum number of connections that are opened
+            timeout (float): Seconds to wait for a reply of the server
+            timeout_policy (TimeoutPolicy): Timeouts per command, replaces timeout if given
+        """
+        if size < 1:
+            raise ValueError(f"A SessionPool needs at least one connection. You said '{size}'.")
+
+        self.ip = ip
+        self.port = port
+        self.size = size
+        self.timeout = timeout
+        self.timeout_policy = timeout_policy
+        self._sessions: list[Session] = []
+        self._next_shared = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def session(self) -> Session:
+        """Returns the session of the calling thread, it is connected on first use"""
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            return session
+
+        with self._lock:
+            if len(self._sessions) < self.size:
+                session = Session(self.timeout, timeout_policy=self.timeout_policy).connect(self.ip, self.port)
+                self._sessions.append(session)
+            else:
+                session = self._sessions[self._next_shared % self.size]
+                self._next_shared += 1
+
+        self._local.session = session
+        return session
+
+    def close(self) -> None:
+        """Closes all connections of the pool"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+            self._next_shared = 0
+            # forget the sessions the threads remembered
+            self._local = threading.local()
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default_session = Session()
+"""The session opened by connect() and used whenever no session is passed"""
+
+_stats_collector = StatsCollector()
+"""Collects the numbers for stats(), it is registered as hook while stats are switched on"""
+
+
+def _get_session(session: Session | None) -> Session:
+    # needed internally
+    return _default_session if session is None else session
 
 
 def connect(ip: str | None = None, port: int = DEFAULT_PORT) -> None:
@@ -43,20 +881,16 @@ def connect(ip: str | None = None, port: int = DEFAULT_PORT) -> None:
     """
     # needed internally
     global connection
-    if connection is not None:
-        connection.close()
+    connection = None
+    _default_session.connect(ip, port)
+    connection = _default_session.socket
 
-    # this allows us to develop more easily without having to adjust everything temporarily each time
-    _ip = os.getenv("SK_SERVER_OVERWRITE")
-    if _ip is not None:
-        spacer = "#" * 100
-        print(
-            f"{spacer}\n"
-            f"IP was overwritten by environment variable from '{ip}' to '{_ip}', "
-            f"(env var name: 'SK_SERVER_OVERWRITE')\n"
-            f"{spacer}"
-        )
-        ip = _ip
+
+def _open_socket(ip: str | None, port: int) -> socket.socket:
+    # needed internally
+    # we don't know where the server is, so we look for it (or reuse what we found before)
+    if not ip:
+        return _discover_server(port)
 
     connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     # this should not happen. but pycharm said this was an issue, so we add this case.
@@ -65,57 +899,197 @@ def connect(ip: str | None = None, port: int = DEFAULT_PORT) -> None:
             f"Can't open a socket. Please find out why `socket.socket(socket.AF_INET, socket.SOCK_STREAM)` failed"
         )
 
+    # our commands are tiny and often directly followed by a query.
+    # with Nagle's algorithm the query would wait for the ACK of the command (up to 40ms on some systems)
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     # we got an explicit IP passed (or the env overwrite was set)
-    if ip:
-        connection.connect((ip, port))
-        return
+    connection.connect((ip, port))
+    return connection
 
-    # we previously found a successful connection in our defaults
-    # -> this case can only happen when connect() was already called once
-    global _default_ip
-    if _default_ip is not None:
-        connection.connect((ip, port))
-        return
 
-    # we're here for the first time.
-    # we don't know where the server is so we try out a few options
-    # if one sticks we save the result (globally)
-    # if none sticks, we raise
-    for option in _default_ip_options:
+def _discover_server(port: int) -> socket.socket:
+    # needed internally
+    global _default_ip
 
-        # attempt connection
+    # we previously found the server in our defaults (in this process or, with the cache, in an earlier run)
+    # -> try it alone first, that's one connect instead of several
+    known_ip = _default_ip or _read_endpoint_cache(port)
+    if known_ip is not None:
         try:
-            connection.connect((option, port))
+            connection = _connect_nodelay(known_ip, port)
+            _default_ip = known_ip
+            return connection
+        # the server moved (or isn't running), look for it again
+        except OSError:
+            pass
+
+    # we race the options with a short head start each and take the first one that answers.
+    # strictly one after another, every option that doesn't answer could cost a full connect timeout
+    connection, _default_ip = _race_connect(_default_ip_options, port)
+    _write_endpoint_cache(port, _default_ip)
+    return connection
+
 
-            # save globally
-            _default_ip = option
-            # we can exit the loop
-            break
+def _connect_nodelay(ip: str, port: int) -> socket.socket:
+    # needed internally
+    connection = socket.create_connection((ip, port), timeout=_DISCOVERY_TIMEOUT)
+    connection.settimeout(None)
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection
+
+
+_CONNECT_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+"""What a non-blocking connect returns if it didn't fail (yet), EWOULDBLOCK is what Windows says"""
+
+
+def _race_connect(options: Iterable[str], port: int) -> tuple[socket.socket, str]:
+    # needed internally
+    # non-blocking connects, each option gets a head start before the next one joins (like Happy Eyeballs).
+    # a local server answers the first option long before that, so usually only one connection is opened
+    waiting = _resolve_options(options, port)
+    selector = selectors.DefaultSelector()
+    pending: dict[socket.socket, str] = {}
+    try:
+        deadline = time.monotonic() + _DISCOVERY_TIMEOUT
+        next_start = time.monotonic()
+        while waiting or pending:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            # the next option joins once the last one had its head start, or right away if all others failed
+            if waiting and (now >= next_start or not pending):
+                option, address = waiting.pop(0)
+                candidate = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                candidate.setblocking(False)
+                # most of the time the connect is still in progress, but it can also fail right away
+                if candidate.connect_ex(address) not in _CONNECT_IN_PROGRESS:
+                    candidate.close()
+                    continue
+                # a failed connect is reported differently per OS: readable and writable on Linux and macOS,
+                # through exceptfds on Windows (SelectSelector hands those out as writable). we watch both directions
+                # and check SO_ERROR whenever a candidate wakes us, so a refused option drops out right away
+                selector.register(candidate, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                pending[candidate] = option
+                next_start = now + _CONNECT_ATTEMPT_DELAY
+                continue
+
+            timeout = deadline - now
+            if waiting:
+                timeout = min(timeout, next_start - now)
+            for key, _ in selector.select(timeout):
+                candidate = key.fileobj
+                option = pending.pop(candidate)
+                selector.unregister(candidate)
+
+                # the connect finished, SO_ERROR tells us if it worked
+                if candidate.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                    candidate.close()
+                    continue
+
+                candidate.setblocking(True)
+                candidate.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                return candidate, option
 
+    finally:
+        for candidate in pending:
+            candidate.close()
+        selector.close()
+
+    # nothing answered. we now fail. and give the user helpful information.
+    raise _cant_connect_error(port)
+
+
+def _resolve_options(options: Iterable[str], port: int) -> list[tuple[str, tuple]]:
+    # needed internally
+    # names for the same address (127.0.0.1 and localhost) would race against themselves, we keep the first name
+    resolved: dict[tuple, str] = {}
+    for option in options:
         # socket errors come in so many names and shapes, depending on OS and what exactly failed
         # so we deliberately use the broad 'catch all' here (:
-        except Exception as e:
-            pass  # silently eat it
-
-    # break wasn't hit. we now fail. and give the user helpful information.
-    else:
-        ips = ", ".join(f"'{i}:{port}'" for i in _default_ip_options)
-        msg = (
-            f"Can't connect to server!\n"
-            f"**Please check if the server is running and the plugin is located in the plugins folder**.\n"
-            f"Tried to connect to {ips}.\n"
-            f"If you're trying to connect to a server on another device, "
-            f"please pass the IP of it to the connect() function (e.g. `connect(ip='192.168.1.10')`.\n"
-            f"If the port the plugin listens to was changed, "
-            f"you have to pass the port to the function (e.g. `connect(port='31415')`. "
-            f"IP and port changes can be passed at the same time.\n"
-            f"If you're unsure how to run a server with the (matching) plugin, please refer to our backend repository: "
-            f"https://github.com/stjume/minecraft-python-backend"
+        try:
+            address = socket.getaddrinfo(option, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+        except Exception:
+            continue
+        resolved.setdefault(address, option)
+    return [(option, address) for address, option in resolved.items()]
+
+
+def _read_endpoint_cache(port: int) -> str | None:
+    # needed internally
+    path = os.getenv("SK_ENDPOINT_CACHE")
+    if not path:
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached_ip, _, cached_port = f.read().strip().rpartition(":")
+    except OSError:
+        return None
+
+    # only trust the file for what we would have tried anyways
+    if cached_port != str(port) or cached_ip not in _default_ip_options:
+        return None
+    return cached_ip
+
+
+def _write_endpoint_cache(port: int, ip: str) -> None:
+    # needed internally
+    path = os.getenv("SK_ENDPOINT_CACHE")
+    if not path:
+        return
+
+    # the cache only saves time, not being able to write it is no reason to fail
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"{ip}:{port}\n")
+    except OSError:
+        pass
+
+
+def _overwrite_ip(ip: str | None) -> str | None:
+    # needed internally
+
+    # this allows us to develop more easily without having to adjust everything temporarily each time
+    _ip = os.getenv("SK_SERVER_OVERWRITE")
+    if _ip is not None:
+        spacer = "#" * 100
+        print(
+            f"{spacer}\n"
+            f"IP was overwritten by environment variable from '{ip}' to '{_ip}', "
+            f"(env var name: 'SK_SERVER_OVERWRITE')\n"
+            f"{spacer}"
         )
-        raise ConnectionError(msg)
+        ip = _ip
+
+    return ip
+
+
+def _cant_connect_error(port: int) -> ConnectionError:
+    # needed internally
+    ips = ", ".join(f"'{i}:{port}'" for i in _default_ip_options)
+    msg = (
+        f"Can't connect to server!\n"
+        f"**Please check if the server is running and the plugin is located in the plugins folder**.\n"
+        f"Tried to connect to {ips}.\n"
+        f"If you're trying to connect to a server on another device, "
+        f"please pass the IP of it to the connect() function (e.g. `connect(ip='192.168.1.10')`.\n"
+        f"If the port the plugin listens to was changed, "
+        f"you have to pass the port to the function (e.g. `connect(port='31415')`. "
+        f"IP and port changes can be passed at the same time.\n"
+        f"If you're unsure how to run a server with the (matching) plugin, please refer to our backend repository: "
+        f"https://github.com/stjume/minecraft-python-backend"
+    )
+    return ConnectionError(msg)
 
 
-def _receive(timeout: float = 2.0) -> bytes | None:
+def _receive(timeout: float | None = None, session: Session | None = None) -> bytes | None:
+    # needed internally
+    return _get_session(session)._receive(timeout)
+
+
+def _overwrite_timeout(timeout: float | None) -> float | None:
     # needed internally
 
     # this allows us to develop more easily without having to adjust everything temporarily each time
@@ -135,15 +1109,7 @@ def _receive(timeout: float = 2.0) -> bytes | None:
         )
         timeout = _timeout
 
-    if timeout:
-        connection.settimeout(timeout)  # Timeout in seconds
-
-    try:
-        data = connection.recv(1024)
-    except socket.timeout:
-        raise NoDataError(f"Timeout: After {timeout} seconds no response was received from the server.")
-
-    return data
+    return timeout
 
 
 def _build_command(*args: Any) -> str:
@@ -159,22 +1125,248 @@ def _bytes_to_text(b: bytes) -> str:
     return b.decode("utf-8").strip()
 
 
-def _send_command(command: str) -> None:
+def _send_command(command: str, session: Session | None = None) -> None:
     """
-    Sends a command over the global connection.
+    Sends a command over the connection of the session.
 
     Args:
         command (str): The command to send.
+        session (Session): The session to use, the default session (see connect()) if None
     """
     # needed internally
-    if connection is None:
-        raise RuntimeError("No connection to server. Please connect first.")
+    _get_session(session)._send_command(command)
+
+
+def _query(command: str, session: Session | None = None) -> bytes:
+    """
+    Sends a command and waits for its reply.
+    No other thread can use the connection in between, so the reply always belongs to this command.
+
+    Args:
+        command (str): The command to send.
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    # needed internally
+    return _get_session(session)._query(command)
 
-    command = f"{command}\n"
-    connection.sendall(command.encode("utf-8"))
+
+def _query_many(commands: Iterable[str], session: Session | None = None) -> list[bytes]:
+    """
+    Sends several commands at once (see _send_commands()) and collects their replies.
+
+    Args:
+        commands (Iterable[str]): The commands to send.
+        session (Session): The session to use, the default session (see connect()) if None
+
+    Returns:
+        The replies in the same order as the commands
+    """
+    # needed internally
+    return _get_session(session)._query_many(commands)
+
+
+def _send_commands(commands: Iterable[str], session: Session | None = None) -> int:
+    """
+    Sends several commands over the connection of the session at once.
+    The commands are collected in a buffer that is sent in large chunks instead of one sendall per command.
+    The server answers them in the same order, so replies can be collected afterward with _receive().
+
+    Args:
+        commands (Iterable[str]): The commands to send.
+        session (Session): The session to use, the default session (see connect()) if None
+
+    Returns:
+        The number of commands that were sent
+    """
+    # needed internally
+    return _get_session(session)._send_commands(commands)
+
+
+HOOK_PRE_SEND = "pre_send"
+"""Hooks of this kind are called right before a command is written to the socket"""
+HOOK_POST_RECEIVE = "post_receive"
+"""Hooks of this kind are called for every reply, once it arrived"""
+HOOK_ON_ERROR = "on_error"
+"""Hooks of this kind are called for every command of a send or query that failed (e.g. timeout, lost connection)"""
+
+_hooks: dict[str, tuple[Callable[["CommandEvent"], None], ...]] = {
+    HOOK_PRE_SEND: (),
+    HOOK_POST_RECEIVE: (),
+    HOOK_ON_ERROR: (),
+}
+"""Registered hooks by kind. The tuples are replaced instead of changed, so they can be iterated without lock"""
+
+_hooks_lock = threading.Lock()
+
+
+class CommandEvent(NamedTuple):
+    """What a hook gets to know about a command"""
+
+    name: str
+    """ Name of the command, e.g. 'getBlock' """
+    args: tuple[str, ...]
+    """ Arguments of the command as they were sent, e.g. ('0', '64', '0', 'world') """
+    raw: bytes
+    """ pre_send: the command as written to the socket. post_receive: the reply. on_error: empty """
+    started_ns: int
+    """ time.perf_counter_ns() when the command (or the batch it was part of) was sent """
+    elapsed_ns: int
+    """ Nanoseconds from sending until the reply arrived (or the error happened), 0 for pre_send """
+    session: "Session"
+    """ The session the command was sent with """
+    error: Exception | None = None
+    """ on_error: what went wrong """
+
+
+def add_hook(
+    kind: Literal["pre_send", "post_receive", "on_error"], hook: Callable[[CommandEvent], None]
+) -> Callable[[CommandEvent], None]:
+    """
+    Registers a function that is called for every command of every session, e.g. for tracing or profiling.
+    Hooks are called in the thread that sends the command (or waits for its reply), keep them fast.
+    Errors raised by a hook are not caught.
+
+    Example (which lines of your script wait for the server the most):
+        round_trips = collections.Counter()
+
+        def count_caller(event):
+            # the innermost frame is count_caller itself, then come the frames of the library
+            frames = traceback.extract_stack()[:-1]
+            caller = next(frame for frame in reversed(frames) if "st_minecraft" not in frame.filename)
+            round_trips[caller.lineno] += 1
+
+        add_hook(HOOK_POST_RECEIVE, count_caller)
+
+    Args:
+        kind: HOOK_PRE_SEND, HOOK_POST_RECEIVE or HOOK_ON_ERROR
+        hook: Function that gets a CommandEvent
+
+    Returns:
+        The hook, so it can be passed to remove_hook() later
+    """
+    _check_hook_kind(kind)
+    with _hooks_lock:
+        _hooks[kind] = (*_hooks[kind], hook)
+    return hook
+
+
+def remove_hook(kind: Literal["pre_send", "post_receive", "on_error"], hook: Callable[[CommandEvent], None]) -> None:
+    """Unregisters a hook added with add_hook(), does nothing if it isn't registered"""
+    _check_hook_kind(kind)
+    with _hooks_lock:
+        _hooks[kind] = tuple(h for h in _hooks[kind] if h != hook)
+
+
+def _check_hook_kind(kind: str) -> None:
+    # needed internally
+    if kind not in _hooks:
+        raise ValueError(f"Unknown kind of hook '{kind}', use one of: {', '.join(_hooks)}")
+
+
+def _command_event(session: Session, command: str, raw: bytes, started_ns: int, elapsed_ns: int) -> CommandEvent:
+    # needed internally
+    name, *args = command.split(ARG_SEPARATOR)
+    # tagged commands start with the request ID
+    if name.startswith(REQUEST_ID_MARKER) and args:
+        name, *args = args
+    return CommandEvent(name, tuple(args), raw, started_ns, elapsed_ns, session)
+
+
+def _run_hooks(hooks: tuple[Callable[[CommandEvent], None], ...], event: CommandEvent) -> None:
+    # needed internally
+    for hook in hooks:
+        hook(event)
+
+
+def _report_error(session: Session, commands: list[str], started_ns: int, error: Exception) -> None:
+    # needed internally
+    hooks = _hooks[HOOK_ON_ERROR]
+    elapsed = time.perf_counter_ns() - started_ns
+    for command in commands:
+        event = _command_event(session, command, b"", started_ns, elapsed)._replace(error=error)
+        _run_hooks(hooks, event)
+
+
+def enable_stats(enabled: bool = True) -> None:
+    """
+    Counts per command (e.g. getBlock): how often it was sent, the bytes sent and received
+    and how long the server took to answer. Read the numbers with stats().
+    While switched off (the default) nothing is counted and it costs nothing.
+
+    Args:
+        enabled (bool): True to switch counting on, False to switch it off (the numbers are kept)
+    """
+    # removing first, so calling enable_stats() twice doesn't count everything twice
+    remove_hook(HOOK_PRE_SEND, _stats_collector.on_send)
+    remove_hook(HOOK_POST_RECEIVE, _stats_collector.on_receive)
+    if enabled:
+        add_hook(HOOK_PRE_SEND, _stats_collector.on_send)
+        add_hook(HOOK_POST_RECEIVE, _stats_collector.on_receive)
+
+
+def stats() -> dict[str, CommandStats]:
+    """
+    The numbers counted since enable_stats() (or the last reset_stats()), by command name.
+
+    Example:
+        enable_stats()
+        ...
+        for name, command_stats in stats().items():
+            print(name, command_stats.calls, command_stats.latency.percentile(0.99))
+    """
+    return _stats_collector.snapshot()
+
+
+def reset_stats() -> None:
+    """Sets all numbers of stats() back to zero"""
+    _stats_collector.reset()
+
+
+def start_background_writer(max_queued: int | None = None, session: Session | None = None) -> None:
+    """
+    Commands that expect no reply (e.g. set_block(), send_to_chat(), boss bar changes) are sent
+    from a background thread from now on, so your loop doesn't have to wait for the network.
+    Queries (e.g. get_player()) still wait until everything before them was sent.
+
+    Args:
+        max_queued (int): How many commands may wait to be sent before your program has to wait (default: 10000)
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    _get_session(session).start_background_writer(max_queued)
+
+
+def stop_background_writer(session: Session | None = None) -> None:
+    """
+    Sends everything still waiting and sends commands right away again.
+
+    Args:
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    _get_session(session).stop_background_writer()
+
+
+def flush(session: Session | None = None) -> None:
+    """
+    Waits until all commands that wait in the background were sent.
+
+    Args:
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    _get_session(session).flush()
+
+
+def drain(session: Session | None = None) -> None:
+    """
+    Waits until the background thread caught up, if many commands are waiting to be sent.
+    Call it once in each iteration of a fast loop, so it can't run far ahead of the server.
+
+    Args:
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    _get_session(session).drain()
 
 
-E = TypeVar("E", bound=Enum)
+E = TypeVar("E", bound=Union[Enum, CompactEnum])
 
 
 def _to_enum(enum: Type[E], value: Any) -> Optional[E]:
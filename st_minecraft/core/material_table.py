@@ -0,0 +1,202 @@
+"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
+
+BLOCK = 1
+""" can be placed as block """
+SOLID = 2
+""" entities can't move through it """
+LIQUID = 4
+TRANSPARENT = 8
+""" light shines through it """
+GRAVITY = 16
+""" falls down if there is nothing below it """
+LIGHT_EMITTING = 32
+
+FLAGS = bytes.fromhex(
+    "09 0b 03 03 09 0b 03 03 09 09 09 03 03 0b 09 09 03 09 09 09 03 2b 03 03 03 03 03 13 09 09 0b 0b 09 "
+    "0b 03 09 0b 03 03 09 03 03 03 03 09 09 09 03 03 0b 09 09 03 0b 03 2b 03 03 03 09 03 03 09 09 0b 03 "
+    "03 09 0b 03 03 09 09 09 03 03 0b 09 09 03 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 03 03 03 03 03 09 "
+    "0b 0b 03 03 03 13 03 03 09 0b 0b 0b 03 03 03 03 09 03 09 09 2b 03 03 03 03 09 0b 0b 03 03 03 13 03 "
+    "29 03 0b 0b 0b 03 03 0d 09 03 09 09 03 03 03 03 2b 0b 03 09 03 03 0b 09 09 09 0b 03 09 0b 03 03 09 "
+    "0b 03 03 09 09 09 03 03 0b 09 09 03 03 13 03 03 03 03 03 03 03 03 0b 0b 03 03 03 03 03 03 03 03 03 "
+    "03 03 03 09 0b 03 03 03 2b 03 03 09 03 03 03 03 03 03 03 03 09 0b 03 03 09 09 03 03 03 09 09 09 03 "
+    "03 03 0b 09 09 23 03 03 03 03 03 03 03 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 13 09 09 0b 03 03 09 "
+    "0b 03 03 09 09 09 03 03 0b 09 09 03 03 03 03 03 09 03 09 09 09 03 09 09 09 09 03 09 09 09 03 09 09 "
+    "09 03 09 09 0b 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 09 03 03 03 03 03 03 03 03 03 3b "
+    "03 03 03 03 03 03 03 23 29 29 23 2b 03 03 03 03 03 23 03 03 03 03 03 09 29 09 03 09 09 03 0b 0b 0b "
+    "09 0b 03 03 0b 0b 09 23 03 03 03 03 03 03 03 13 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 09 0b 0b 03 "
+    "03 03 13 03 0b 0b 0b 03 03 03 09 03 09 0b 03 0b 09 03 09 09 0b 03 03 03 03 03 03 03 0b 03 0b 03 0b "
+    "23 03 03 09 0b 03 03 09 0b 03 03 09 09 09 03 03 0b 09 09 03 09 09 0b 2b 03 03 2b 09 2d 2b 03 09 29 "
+    "09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 09 0b 09 09 0b 09 0b "
+    "0b 03 03 03 13 03 0b 0b 0b 03 03 03 03 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 23 09 0b 03 03 09 0b "
+    "03 03 09 09 0b 09 03 03 0b 09 09 03 2b 03 09 03 03 03 03 03 03 03 03 03 03 09 03 03 03 03 03 03 03 "
+    "03 03 03 03 03 03 03 29 03 09 09 03 03 03 03 09 0b 03 03 09 0b 03 03 09 09 09 03 03 0b 09 09 03 03 "
+    "03 23 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 09 03 09 03 03 03 03 03 03 23 09 03 03 03 09 0b 0b 03 03 "
+    "03 13 03 09 0b 0b 0b 03 09 03 03 03 03 03 03 1b 03 03 03 03 03 03 03 03 03 09 09 03 03 03 03 03 03 "
+    "03 03 03 03 03 03 03 09 09 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 0b "
+    "0b 0b 0b 0b 0b 0b 0b 0b 0b 0b 01 0b 09 03 03 03 03 03 03 03 03 09 09 0b 0b 03 03 03 13 03 0b 0b 0b "
+    "03 03 03 03 03 03 03 03 03 03 03 09 03 03 03 09 0b 0b 03 03 03 13 03 09 03 03 03 03 03 13 03 03 03 "
+    "03 0b 0b 0b 03 09 03 03 03 03 29 29 09 03 03 03 03 03 09 13 03 03 03 03 1b 03 23 23 03 09 23 2b 09 "
+    "23 0b 03 03 0b 2b 09 03 03 03 03 03 03 03 03 03 03 03 03 03 03 01 03 2b 29 2b 03 03 29 29 0b 03 09 "
+    "09 0b 03 03 09 0b 03 03 09 09 09 03 03 0b 09 09 03 03 03 03 03 03 03 09 09 03 03 03 03 03 03 03 03 "
+    "03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 09 09 09 13 09 09 09 03 03 0b 03 29 09 09 03 09 "
+    "09 09 03 09 09 03 0b 09 09 23 09 09 29 09 0b 03 03 09 09 03 03 03 09 09 09 03 03 03 0b 09 09 03 0d "
+    "0b 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 03 09 09 03 09 09 0b 0b 03 03 03 13 03 "
+    "0b 0b 0b 03 09 03 09 03 03 09 0b 0b 03 03 03 13 03 0b 0b 0b 03 03 03 03 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+)
+""" the flags above of every material, indexed by ordinal """
+
+LIGHT = bytes.fromhex(
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 05 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 0f 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 01 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "01 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 0f 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 0f 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 0a 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 01 "
+    "00 00 00 00 00 00 00 07 0f 0f 01 0e 00 00 00 00 00 07 00 00 00 00 00 00 0f 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 0f 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "0f 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 0f 00 00 04 00 0f 0f 00 00 0f "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 03 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 02 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 0b 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 0f 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 0f 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 07 07 00 00 00 00 00 00 00 00 00 00 00 00 00 00 06 01 00 00 0f 06 00 "
+    "0f 00 00 00 00 01 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 0a 0a 0a 00 00 0a 0a 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 0e 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 0f 00 00 0e 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+    "00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 "
+)
+""" light level (0 to 15) every material emits, indexed by ordinal """
+
+COLORS = bytes.fromhex(
+    "a85a32 a85a32 a85a32 a85a32 a85a32 3c7828 a85a32 a85a32 a85a32 a85a32 a85a32 a85a32 a85a32 a85a32 "
+    "a85a32 a85a32 a85a32 7d6c56 000000 aa6ed2 8662bf 8662bf 604038 888889 888889 888889 888889 444444 "
+    "6f911f c67618 647d30 3c7828 c8d2dc c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 beaa4e beaa4e "
+    "beaa4e c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 c2ad50 87673c c80000 515156 76ddd7 "
+    "555555 c8a03c b4915a a02828 fad250 648c32 648c32 c0af79 c0af79 c0af79 c0af79 c0af79 3c7828 c0af79 "
+    "c0af79 c0af79 c0af79 c0af79 c0af79 c0af79 c0af79 c0af79 c0af79 c0af79 15151a 15151a 15151a 15151a "
+    "15151a 15151a 15151a 5d3d31 15151a 15151a 15151a 5d3d31 15151a 2a2429 2a2429 2a2429 2a2429 6e6e6e "
+    "35399d 35399d 35399d 35399d 35399d 35399d 35399d 6b4d6c 35399d 35399d 35399d 35399d 35399d 6b4d6c "
+    "35399d d2ceb4 755e3b a05aa0 a05aa0 a05aa0 a05aa0 786450 976253 976253 976253 976253 724829 724829 "
+    "724829 724829 724829 724829 724829 875438 724829 724829 724829 724829 724829 875438 724829 3f76e4 "
+    "3f76e4 3f76e4 3f76e4 3f76e4 8662bf 567f2b e6dcd2 dfe0dd 785a3c eaeced eaeced f08c1e 5a4637 c67618 "
+    "4a494a 000000 646e28 646e28 373c46 373c46 e2b2ac e2b2ac e2b2ac e2b2ac e2b2ac e5acc2 e2b2ac e2b2ac "
+    "e2b2ac e2b2ac e2b2ac e2b2ac e2b2ac e2b2ac e2b2ac e2b2ac e2b2ac a2834f 444444 755e3b 505053 2c161a "
+    "2a2429 ece6df b6621f d8cb9c 7e7e7e 5d395d 5d395d a1a6b3 101010 101010 866043 505053 505053 505053 "
+    "505053 807f80 807f80 807f80 807f80 e4e9ea 965a28 b4876e a09696 6e4b28 a08c6e c16c50 c16c50 506edc "
+    "505053 505053 2c161a 2a2429 7e7e7e 784b2d 787878 787878 653147 653147 653147 653147 653147 653147 "
+    "653147 653147 653147 653147 653147 653147 653147 653147 653147 653147 653147 653147 210a3c c16c50 "
+    "c16c50 c16c50 b6621f b6621f d8cb9c d8cb9c 158a91 158a91 158a91 158a91 158a91 158a91 158a91 5d7267 "
+    "158a91 158a91 158a91 5d7267 158a91 444444 f0dc28 432b14 432b14 432b14 432b14 432b14 3c7828 432b14 "
+    "432b14 432b14 432b14 432b14 432b14 432b14 432b14 432b14 432b14 432b14 345c4c 345c4c 345c4c 82735a "
+    "a05aa0 a05aa0 a05aa0 a05aa0 3f76e4 3f76e4 3f76e4 3f76e4 6e5028 dc8c28 dc8c28 dc8c28 dc8c28 a05aa0 "
+    "a05aa0 a05aa0 a05aa0 a05aa0 a05aa0 a05aa0 a05aa0 784132 505053 505053 505053 505053 505053 505053 "
+    "505053 505053 505053 505053 505053 505053 505053 505053 505053 505053 505053 7d6c56 62ede4 62ede4 "
+    "bdbcbd bdbcbd bdbcbd bdbcbd 866043 866043 737373 0c090f 0c090f 0c090f 588e2d 866c5d 737373 2acb58 "
+    "2acb58 462832 dcdf9e dcdf9e dcdf9e dcdf9e dcdf9e dcdf9e dcdf9e dcdf9e dcdf9e 28645a a17e68 a17e68 "
+    "a17e68 a17e68 503219 5a823c dc8c28 dc8c28 dc8c28 dc8c28 dc8c28 afa078 c85050 647d30 3c7828 645a5a "
+    "92b8fe 6e6e6e 2a2429 b0d6db b0d6db 78c8c8 ac8455 f6d03e f6d03e 956756 956756 956756 956756 60a036 "
+    "847f7f 3f4448 3f4448 3f4448 3f4448 3f4448 3f4448 3f4448 705246 3f4448 3f4448 3f4448 705246 3f4448 "
+    "556e1c 556e1c 556e1c 556e1c 556e1c 556e1c 556e1c 7a6532 556e1c 556e1c 556e1c 7a6532 556e1c 8c8c8c "
+    "783c50 a68826 808080 fbba35 e5941e 4b4a4b a05aa0 a05aa0 a05aa0 a05aa0 92b8fe 7e7e7e 807f80 7e7e7e "
+    "505053 6e765f 7e7e7e 7e7e7e dcdcdc dcdcdc dcdcdc dcdcdc dcdcdc 6a5b53 504650 5a3c2d a07351 a07351 "
+    "a07351 a07351 a07351 3c7828 a07351 a07351 a07351 a07351 a07351 a07351 a07351 a07351 a07351 a07351 "
+    "a07351 588e2d 588e2d 785f37 6a5b53 1f438c 1f438c 8662bf 5a823c cf5c14 cf5c14 ae8955 6e5f4b ffffb4 "
+    "3aafd9 3aafd9 3aafd9 3aafd9 3aafd9 3aafd9 3aafd9 6e8287 3aafd9 3aafd9 3aafd9 6e8287 3aafd9 8e8e87 "
+    "8e8e87 8e8e87 8e8e87 8e8e87 8e8e87 8e8e87 947462 8e8e87 8e8e87 8e8e87 947462 8e8e87 ffffb4 c16c50 "
+    "be8cbe 508c28 508c28 70b91a 70b91a 70b91a 70b91a 70b91a 70b91a 70b91a 868731 70b91a 70b91a 70b91a "
+    "868731 70b91a 919196 8e775c be45b4 be45b4 be45b4 be45b4 be45b4 be45b4 be45b4 a95376 be45b4 be45b4 "
+    "be45b4 a95376 be45b4 8f3f20 763631 763631 763631 763631 763631 3c7828 763631 763631 763631 763631 "
+    "763631 763631 763631 763631 763631 763631 763631 763631 8662bf 6f911f 6f911f 596e2d 596e2d 6e765f "
+    "6e765f 6e765f 6e765f 6e765f 6e765f 6e765f 6e765f 6e6860 3c393d 89684f 89684f 89684f 89684f 763631 "
+    "966e5a 706369 2c161a 2c161a 2c161a 2c161a 2c161a f6d03e 5a0abe ece6df 149682 730303 730303 433d40 "
+    "622626 5a3c2d a2834f a2834f a2834f a2834f a2834f 3c7828 a2834f a2834f a2834f a2834f a2834f a2834f "
+    "a2834f a2834f a2834f a2834f a2834f 626262 0f0b19 f0e1b4 f17614 f17614 f17614 f17614 f17614 f17614 "
+    "f17614 c0692e f17614 f17614 f17614 c0692e f17614 f17614 dcdcc8 53a385 53a385 53a385 53a385 8eb4fa "
+    "8e6b50 f0e1b4 e6b4dc a2834f 787878 787878 ee8dac ee8dac ee8dac ee8dac ee8dac ee8dac ee8dac bf7373 "
+    "ee8dac ee8dac ee8dac ee8dac bf7373 ee8dac ee8dac 6e6860 6e6860 787878 787878 5c4017 866c5d 888889 "
+    "888889 888889 515156 2a2429 2a2429 2a2429 2a2429 2a2429 2a2429 2a2429 2a2429 2a2429 2a2429 505053 "
+    "505053 505053 505053 bdbcbd bdbcbd bdbcbd 956756 956756 956756 c81e1e c8aa5a a85a32 aa6ed2 647d30 "
+    "c8d2dc c2ad50 c0af79 28a0c8 957051 567f2b e2b2ac 506edc 653147 653147 f0dc28 432b14 6e5028 5a823c "
+    "647d30 a07351 508c28 763631 a2834f dc503c dcdcc8 dc503c c81e1e c82e2d dc503c 735531 e67828 2b6963 "
+    "2b6963 dc503c c81e1e f9fefe f9fefe 7d6c56 639d98 639d98 639d98 639d98 639d98 639d98 639d98 c67618 "
+    "c67618 7a2aad 7a2aad 7a2aad 7a2aad 7a2aad 7a2aad 7a2aad 8a4773 7a2aad 7a2aad 7a2aad 8a4773 7a2aad "
+    "aa7eaa aa7eaa aa7eaa aa7eaa ece6df ece6df ece6df ece6df ece6df 7d6c56 c16c50 f6d03e dcdcdc a12723 "
+    "a12723 a12723 a12723 a12723 a12723 a12723 9c4535 a12723 a12723 a12723 a12723 a12723 a12723 a12723 "
+    "a12723 a12723 a12723 a12723 a12723 a12723 a12723 9c4535 a12723 a12723 af1905 af1905 af1905 af1905 "
+    "af1905 af1905 505053 a09696 b4876e 1e1432 866043 c81e1e dbcfa3 d8cb9c d8cb9c d8cb9c d8cb9c aa874b "
+    "0d1e24 0d1e24 08505a c8c8aa 0d1e24 acc8be 5a6428 3c6e28 f19347 976797 c8c8c8 c8c8c8 70c05c 8662bf "
+    "648c32 373741 565452 515156 ece6df ece6df ece6df b6621f b6621f b6621f d8cb9c d8cb9c d8cb9c 7e7e7e "
+    "7e7e7e f9fefe f9fefe 513e33 513e33 513e33 513e33 513e33 513e33 513e33 242e3e c4c04b c86478 735531 "
+    "735531 735531 735531 735531 3c7828 735531 735531 735531 735531 735531 735531 735531 735531 735531 "
+    "735531 735531 6e6860 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7d736e a85a32 "
+    "a85a32 c2ad50 c0af79 c0af79 e2b2ac e2b2ac 653147 653147 432b14 432b14 a07351 a07351 763631 763631 "
+    "a2834f a2834f 735531 735531 2b6963 2b6963 5a4b5a 5a4b5a 94c065 f0c828 dbcfa3 3c5a28 60a036 3c6e28 "
+    "e1afa0 985e44 b0d6db db4434 ffc85a e67828 e67828 a2834f 808080 808080 a05aa0 a05aa0 a05aa0 a05aa0 "
+    "6c6d67 c8c8aa 148c78 148c78 f0e1b4 3c7828 000000 ffc85a 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 "
+    "2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 2b6963 3f76e4 "
+    "3f76e4 c16c50 c16c50 c16c50 c16c50 a17e68 a17e68 a17e68 a17e68 53a385 53a385 53a385 53a385 6d996e "
+    "6d996e 6d996e 6d996e 6d996e 6d996e 6d996e 6d996e 780a0a 780a0a c4c04b c8aa3c eaeced eaeced eaeced "
+    "eaeced eaeced eaeced eaeced bd9e90 eaeced eaeced eaeced bd9e90 eaeced eaeced c81e1e c8c8c8 c8c8c8 "
+    "f9c628 f9c628 f9c628 f9c628 f9c628 f9c628 f9c628 c48d37 f9c628 f9c628 f9c628 c48d37 f9c628 787878 "
+    "787878 a85a32 a85a32 826e5a 8662bf d22828 808080 8c8278 c8c8c8 826e5a c8aa5a c2ad50 c2ad50 826e5a "
+    "826e5a c83c32 a02828 a02828 a02828 c0af79 c0af79 15151a fab428 fab428 826e5a 35399d d2ceb4 d2ceb4 "
+    "6e4628 785a32 785a32 be8c3c 976253 724829 808080 c8c8c8 808080 826e5a f08c1e f08c1e 826e5a 826e5a "
+    "808080 808080 808080 808080 28231e e2b2ac e2b2ac a2834f e6b4a0 826e5a 5d395d a1a6b3 dcb43c 101010 "
+    "965a28 bea082 bea082 826e5a b4876e 82828c c83c32 e6b4a0 bea082 c8463c e68c82 dca082 be5a46 be783c "
+    "c16c50 826e5a eaeced 826e5a 808080 158a91 432b14 432b14 785a32 62ede4 62ede4 62ede4 62ede4 62ede4 "
+    "62ede4 62ede4 62ede4 62ede4 62ede4 62ede4 282828 826e5a 826e5a 0c090f 588e2d 826e5a 143c46 c8c8aa "
+    "826e5a 786e8c 2acb58 6e4628 f6d03e dcdf9e 826e5a 28645a 28645a 826e5a 826e5a 826e5a 808080 e6e6e6 "
+    "808080 d2c8a0 dc8c28 808080 808080 808080 3c3c3c 3c3c3c c85050 826e5a 826e5a 6e6e6e 826e5a dcdcdc "
+    "b0d6db 6f911f eaeced 78c8c8 78c8c8 78c8c8 826e5a ac8455 808080 826e5a f6d03e f6d03e f6d03e f6d03e "
+    "f6d03e f6d03e f6d03e f6d03e f6d03e f6d03e f6d03e f6d03e f6d03e f6d03e 3f4448 556e1c 826e5a 808080 "
+    "326ea0 826e5a fbba35 e5941e 4b4a4b 826e5a 826e5a 282832 dcdcdc dcdcdc dcdcdc 826e5a dcdcdc dcdcdc "
+    "dcdcdc dcdcdc dcdcdc dcdcdc dcdcdc dcdcdc dcdcdc 808080 a07351 a07351 6e4628 1f438c cf5c14 808080 "
+    "965532 965532 965532 965532 965532 965532 3aafd9 8e8e87 70b91a 808080 826e5a be45b4 8f3f20 826e5a "
+    "763631 763631 d2c8a0 6f911f 6f911f c8c8c8 6e6e6e eaeced 826e5a 826e5a 966e5a 282828 282828 282828 "
+    "282828 282828 282828 282828 282828 282828 282828 282828 282828 282828 282828 282828 c8463c 808080 "
+    "c8b4a0 2c161a 808080 433d40 433d40 433d40 433d40 433d40 433d40 433d40 433d40 433d40 433d40 433d40 "
+    "a2834f a2834f 826e5a f17614 808080 826e5a e6e6e6 826e5a c8beaa 826e5a 826e5a eaeced 826e5a 826e5a "
+    "826e5a ee8dac c8aa5a 826e5a 5d395d e68c82 c8aa5a 808080 f9fefe 639d98 639d98 808080 c8c8c8 826e5a "
+    "c67618 c67618 7a2aad ece6df dca082 dca082 dca082 826e5a dca082 826e5a c16c50 f6d03e dcdcdc 82828c "
+    "a12723 af1905 808080 8c5028 be5a46 be5a46 826e5a c8c8c8 826e5a 808080 976797 826e5a 826e5a 826e5a "
+    "826e5a c8c8c8 70c05c 826e5a 826e5a 826e5a 808080 8c8278 808080 826e5a 808080 735531 735531 b47850 "
+    "826e5a 785a32 7e7e7e 7e7e7e 7e7e7e 7e7e7e 7e7e7e 826e5a 826e5a e6e6e6 94c065 808080 3c5a28 c8c8c8 "
+    "826e5a 8c8278 db4434 e67828 dcbe5a 826e5a 78a08c 808080 c8c8c8 826e5a 808080 826e5a 826e5a 826e5a "
+    "826e5a 826e5a 826e5a 2b6963 3f76e4 c8aa3c eaeced 826e5a 826e5a 826e5a 826e5a a2834f a2834f a2834f "
+    "a2834f a2834f 6e4628 6e4628 f9c628 826e5a 826e5a 826e5a 826e5a 826e5a "
+)
+""" average color of every material, 3 bytes (red, green, blue) per ordinal """
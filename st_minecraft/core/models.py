@@ -0,0 +1,167 @@
+"""
+Base class of the data models (Player, Spieler, BossBar, ...).
+
+Normally this is pydantic's BaseModel. Importing pydantic takes a good part of the import time of the library though,
+so with the environment variable SK_PYDANTIC=lazy (or if pydantic isn't installed) the models are built on LazyModel:
+same fields, repr and equality, but the values are stored as they are.
+pydantic is only imported once a model is validated (model_validate()) or its JSON schema is needed (model_json_schema()).
+"""
+
+import os
+import types
+from typing import Any
+from typing import ClassVar
+from typing import NamedTuple
+from typing import Union
+from typing import get_args
+from typing import get_origin
+
+PYDANTIC_ENV = "SK_PYDANTIC"
+""" set this environment variable to lazy, to import pydantic only when a model is validated """
+
+
+class _Field(NamedTuple):
+    annotation: Any
+    default: Any
+    """ _REQUIRED if the field has no default """
+
+
+_REQUIRED = object()
+
+_lazy_models_by_pydantic: dict[type, type["LazyModel"]] = {}
+""" pydantic model created for validation -> the LazyModel it was created for """
+
+
+class LazyValidationError(ValueError):
+    """Raised when a LazyModel is missing a field or model_validate() fails (like pydantic's ValidationError)"""
+
+
+class LazyModel:
+    """
+    Stand-in for pydantic's BaseModel, that doesn't import pydantic.
+    Fields are declared the same way (annotation, optionally a default), but the values are not validated or converted.
+    """
+
+    model_fields: ClassVar[dict[str, _Field]] = {}
+    _pydantic_model: ClassVar[type | None] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = dict(cls.model_fields)
+        for name, annotation in cls.__dict__.get("__annotations__", {}).items():
+            if get_origin(annotation) is ClassVar:
+                continue
+            fields[name] = _Field(annotation, cls.__dict__.get(name, _REQUIRED))
+        cls.model_fields = fields
+        cls._pydantic_model = None
+
+    def __init__(self, **data: Any):
+        values = self.__dict__
+        for name, field in self.model_fields.items():
+            if name in data:
+                values[name] = data[name]
+            elif field.default is not _REQUIRED:
+                values[name] = field.default
+            else:
+                raise LazyValidationError(f"{type(self).__name__}: the field '{name}' is required")
+        # like pydantic, unknown fields are ignored
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._repr_args(', ')})"
+
+    def __str__(self):
+        return self._repr_args(" ")
+
+    def _repr_args(self, separator: str) -> str:
+        return separator.join(f"{name}={getattr(self, name)!r}" for name in self.model_fields)
+
+    def model_dump(self) -> dict[str, Any]:
+        """The fields as a dict, nested models are dumped as well"""
+        return {
+            name: value.model_dump() if isinstance(value, LazyModel) else value
+            for name, value in ((name, getattr(self, name)) for name in self.model_fields)
+        }
+
+    @classmethod
+    def model_validate(cls, obj: Any) -> "LazyModel":
+        """Validates obj (a dict or a model) with pydantic, just like pydantic's model_validate()"""
+        # imported here, the whole point of this class is not to import pydantic earlier
+        import pydantic
+
+        try:
+            validated = cls._pydantic().model_validate(_dump_models(obj))
+        except pydantic.ValidationError as e:
+            raise LazyValidationError(str(e)) from e
+        return _from_pydantic(validated)
+
+    @classmethod
+    def model_json_schema(cls, **kwargs: Any) -> dict[str, Any]:
+        """The JSON schema of the model, see pydantic's model_json_schema()"""
+        return cls._pydantic().model_json_schema(**kwargs)
+
+    @classmethod
+    def _pydantic(cls) -> type:
+        # needed internally
+        # a pydantic model with the same fields, created on first use
+        if cls._pydantic_model is None:
+            import pydantic
+
+            cls._pydantic_model = pydantic.create_model(
+                cls.__name__,
+                __doc__=cls.__doc__,
+                __module__=cls.__module__,
+                **{
+                    name: (_pydantic_annotation(field.annotation), ... if field.default is _REQUIRED else field.default)
+                    for name, field in cls.model_fields.items()
+                },
+            )
+            _lazy_models_by_pydantic[cls._pydantic_model] = cls
+        return cls._pydantic_model
+
+
+def _pydantic_annotation(annotation: Any) -> Any:
+    # needed internally
+    # nested models (e.g. Material | None) are validated with their pydantic twin
+    if isinstance(annotation, type) and issubclass(annotation, LazyModel):
+        return annotation._pydantic()
+    if get_origin(annotation) in (Union, types.UnionType):
+        return Union[tuple(_pydantic_annotation(arg) for arg in get_args(annotation))]
+    return annotation
+
+
+def _dump_models(value: Any) -> Any:
+    # needed internally
+    # pydantic only accepts its twins of the models, so models (also nested in dicts and lists) are passed as dicts
+    if isinstance(value, LazyModel):
+        return value.model_dump()
+    if isinstance(value, dict):
+        return {key: _dump_models(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_dump_models(item) for item in value)
+    return value
+
+
+def _from_pydantic(value: Any) -> Any:
+    # needed internally
+    lazy_model = _lazy_models_by_pydantic.get(type(value))
+    if lazy_model is None:
+        return value
+    return lazy_model(**{name: _from_pydantic(getattr(value, name)) for name in lazy_model.model_fields})
+
+
+if os.getenv(PYDANTIC_ENV) == "lazy":
+    BaseModel = LazyModel
+    ValidationError = LazyValidationError
+else:
+    try:
+        from pydantic import BaseModel  # noqa: unused-import
+        from pydantic import ValidationError  # noqa: unused-import
+    # without pydantic the models still work, they just aren't validated
+    except ModuleNotFoundError:
+        BaseModel = LazyModel
+        ValidationError = LazyValidationError
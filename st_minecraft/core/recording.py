@@ -0,0 +1,262 @@
+"""
+Records the traffic of a session into a compact log and plays such logs back.
+
+Every line of a log is one command or reply: microseconds since the recording started,
+'>' for sent or '<' for received, then the line as it went over the wire.
+
+    # st_minecraft wire log 1
+    0 > getPlayer𝇉0
+    412 < 0𝇉steve𝇉1𝇉64𝇉2𝇉world𝇉90𝇉STONE𝇉false𝇉20.0𝇉20.0𝇉20.0𝇉5.0𝇉0.0𝇉0.0
+    530 > setBlock𝇉1𝇉63𝇉2𝇉world𝇉DIAMOND_BLOCK
+
+Logs ending in .gz are compressed.
+Record a slow session, then replay() it against the mock server or measure_parse_cost() without any server.
+"""
+
+import gzip
+import threading
+import time
+from typing import IO
+from typing import Iterable
+from typing import NamedTuple
+
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import QUERY_COMMANDS
+from st_minecraft.core.core import REQUEST_ID_MARKER
+from st_minecraft.core.core import Session
+from st_minecraft.core.core import _get_session
+
+_HEADER = "# st_minecraft wire log 1\n"
+
+SENT = ">"
+RECEIVED = "<"
+
+
+class WireEvent(NamedTuple):
+    """One line of a log"""
+
+    time_us: int
+    """ Microseconds since the recording started """
+    direction: str
+    """ SENT or RECEIVED """
+    line: str
+    """ The command or reply without the trailing newline """
+
+
+class ParseCost(NamedTuple):
+    """How long parsing the replies to one kind of query took"""
+
+    calls: int
+    seconds: float
+
+
+class ReplayResult(NamedTuple):
+    commands: int
+    """ Commands sent """
+    queries: int
+    """ Commands that got a reply """
+    seconds: float
+    different_replies: int
+    """ Replies that differ from the recorded ones (e.g. a block changed or another entity ID) """
+
+
+class WireRecorder:
+    """Writes the log, thread safe. Use start_recording() instead of creating it yourself."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: IO[str] = (
+            gzip.open(path, "wt", encoding="utf-8") if path.endswith(".gz") else open(path, "w", encoding="utf-8")
+        )
+        self._file.write(_HEADER)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record_sent(self, commands: Iterable[str]) -> None:
+        self._write(SENT, commands)
+
+    def record_received(self, frame: bytes) -> None:
+        self._write(RECEIVED, (frame.decode("utf-8").rstrip("\n"),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def _write(self, direction: str, lines: Iterable[str]) -> None:
+        # needed internally
+        time_us = int((time.perf_counter() - self._start) * 1_000_000)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.writelines(f"{time_us} {direction} {line}\n" for line in lines)
+
+
+def start_recording(path: str, session: Session | None = None) -> WireRecorder:
+    """
+    Logs every command sent and every reply received from now on into the file.
+    A recording that is already running is stopped first.
+
+    Args:
+        path (str): File to write the log to, it is compressed if the name ends with .gz
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    session = _get_session(session)
+    stop_recording(session)
+    recorder = WireRecorder(path)
+    session.recorder = recorder
+    return recorder
+
+
+def stop_recording(session: Session | None = None) -> None:
+    """
+    Stops the recording and closes the log.
+
+    Args:
+        session (Session): The session to use, the default session (see connect()) if None
+    """
+    session = _get_session(session)
+    recorder, session.recorder = session.recorder, None
+    if recorder is not None:
+        recorder.close()
+
+
+def read_recording(path: str) -> list[WireEvent]:
+    """Reads a log written by start_recording()"""
+    with gzip.open(path, "rt", encoding="utf-8") if path.endswith(".gz") else open(path, encoding="utf-8") as f:
+        events = []
+        for line in f:
+            if line.startswith("#"):
+                continue
+            time_us, direction, text = line.rstrip("\n").split(" ", 2)
+            events.append(WireEvent(int(time_us), direction, text))
+    return events
+
+
+def pair_queries(events: Iterable[WireEvent]) -> list[tuple[str, str | None]]:
+    """
+    Every sent command with its reply (None for commands without one), in the order they were sent.
+    Request IDs are removed from commands and replies.
+    """
+    pairs: list[list] = []
+    waiting: dict[str, list] = {}
+    """ request ID -> pair, for tagged queries """
+    in_order: list[list] = []
+    """ untagged queries waiting for their reply, the server answers them in order """
+
+    for event in events:
+        request_id, line = _split_request_id(event.line)
+        if event.direction == SENT:
+            pair = [line, None]
+            pairs.append(pair)
+            if request_id is not None:
+                waiting[request_id] = pair
+            # the replies of the other queries are matched to them in order
+            elif line.split(ARG_SEPARATOR, 1)[0] in QUERY_COMMANDS:
+                in_order.append(pair)
+            continue
+
+        pair = waiting.pop(request_id, None) if request_id is not None else (in_order.pop(0) if in_order else None)
+        if pair is not None:
+            pair[1] = line
+
+    return [(command, reply) for command, reply in pairs]
+
+
+def replay(path: str, session: Session | None = None, *, speed: float | None = None) -> ReplayResult:
+    """
+    Sends the commands of a log again, e.g. to the mock server (st_minecraft.testing.MockServer).
+
+    Args:
+        path (str): The log
+        session (Session): The session to use, the default session (see connect()) if None
+        speed (float): None sends as fast as possible, 1.0 keeps the pauses of the recording, 2.0 halves them, ...
+    """
+    session = _get_session(session)
+    events = read_recording(path)
+    sent_at = [event.time_us for event in events if event.direction == SENT]
+
+    commands = 0
+    queries = 0
+    different_replies = 0
+    start = time.perf_counter()
+    for (command, recorded_reply), time_us in zip(pair_queries(events), sent_at):
+        if speed is not None:
+            wait = time_us / 1_000_000 / speed - (time.perf_counter() - start)
+            if wait > 0:
+                time.sleep(wait)
+
+        commands += 1
+        # decided by the command, not by the log: a query whose reply wasn't recorded (timed out, recording stopped)
+        # still gets a reply, which has to be read or it would be taken as the reply of the next query
+        if command.split(ARG_SEPARATOR, 1)[0] not in QUERY_COMMANDS:
+            session._send_command(command)
+            continue
+
+        queries += 1
+        reply = session._query(command).decode("utf-8").rstrip("\n")
+        if recorded_reply is not None and reply != recorded_reply:
+            different_replies += 1
+
+    return ReplayResult(commands, queries, time.perf_counter() - start, different_replies)
+
+
+def measure_parse_cost(path: str, repeat: int = 1) -> dict[str, ParseCost]:
+    """
+    Parses every recorded reply like the library does, without a server.
+    Shows how much of a session's time the client spends turning replies into objects.
+
+    Args:
+        path (str): The log
+        repeat (int): Parse every reply this often, for more stable numbers
+    """
+    parsers = _reply_parsers()
+    costs: dict[str, list] = {}
+
+    for command, reply in pair_queries(read_recording(path)):
+        if reply is None:
+            continue
+        name, *args = command.split(ARG_SEPARATOR)
+        parse = parsers.get(name)
+        if parse is None:
+            continue
+
+        data = f"{reply}\n".encode("utf-8")
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse(args, data)
+        cost = costs.setdefault(name, [0, 0.0])
+        cost[0] += repeat
+        cost[1] += time.perf_counter() - start
+
+    return {name: ParseCost(calls, seconds) for name, (calls, seconds) in costs.items()}
+
+
+def _split_request_id(line: str) -> tuple[str | None, str]:
+    # needed internally
+    if not line.startswith(REQUEST_ID_MARKER):
+        return None, line
+    request_id, _, rest = line.partition(ARG_SEPARATOR)
+    return request_id, rest
+
+
+def _reply_parsers() -> dict:
+    # needed internally
+    # imported here, st_minecraft.en imports st_minecraft.core
+    from st_minecraft.core.core import _bytes_to_text
+    from st_minecraft.en.data_models import Entity
+    from st_minecraft.en.data_models import Material
+    from st_minecraft.en.data_models import Player
+    from st_minecraft.en.main import _parse_chat
+    from st_minecraft.en.main import _parse_inventory
+
+    return {
+        "getBlock": lambda args, data: Material.from_string(
+            x=int(args[0]), y=int(args[1]), z=int(args[2]), dimension=args[3], type=_bytes_to_text(data).upper()
+        ),
+        "getPlayer": lambda args, data: Player.from_raw_data(data),
+        "getPlayerByName": lambda args, data: Player.from_raw_data(data),
+        "getInv": lambda args, data: _parse_inventory(data),
+        "pollChat": lambda args, data: _parse_chat(data),
+        "spawnEntity": lambda args, data: Entity.from_api_format(_bytes_to_text(data)),
+        "getEntity": lambda args, data: Entity.from_api_format(_bytes_to_text(data)),
+    }
@@ -1,3 +1,6 @@
+from st_minecraft.core import Session as Sitzung  # noqa: unused-import
+from st_minecraft.core import SessionPool as SitzungsPool  # noqa: unused-import
+from st_minecraft.core import TimeoutPolicy as ZeitlimitRegeln  # noqa: unused-import
 from st_minecraft.core import connect as verbinden  # noqa: unused-import
 from st_minecraft.de.boss_leiste import *  # noqa: unused-import
 from st_minecraft.de.daten_modelle import *  # noqa: unused-import
@@ -6,6 +9,7 @@ from st_minecraft.de.main import *  # noqa: unused-import
 try:
     from st_minecraft.de.entity import *  # noqa: unused-import
     from st_minecraft.de.material import *  # noqa: unused-import
+    from st_minecraft.de.material_eigenschaften import *  # noqa: unused-import
 
 except ModuleNotFoundError as e:
     raise RuntimeError(
@@ -2,10 +2,10 @@
 
 from enum import Enum
 
-from pydantic import BaseModel
-
 import st_minecraft.en as __st_minecraft_en
 import st_minecraft.en.boss_bar as _st_minecraft_en_boss_bar
+from st_minecraft.core import Session
+from st_minecraft.core.models import BaseModel
 from st_minecraft.de._exceptions import WertFehler
 
 
@@ -88,47 +88,48 @@ class BossLeiste(BaseModel):
         )
 
 
-def erzeuge_leiste(name: str, anzeige_text: str) -> BossLeiste:
+def erzeuge_leiste(name: str, anzeige_text: str, *, sitzung: Session | None = None) -> BossLeiste:
     """
     Erstelle eine Bossleiste
     Args:
         name: Ein von dir gewählter Name, wie die Bossleiste für dich heißen soll
         anzeige_text: Text der an der Leiste angezeigt werden soll
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
 
     Returns:
         Ein BossLeisten Objekt mit dessen Hilfe du die Leiste weiter konfigurieren kannst
     """
-    b = __st_minecraft_en.create_bar(name, anzeige_text)
+    b = __st_minecraft_en.create_bar(name, anzeige_text, session=sitzung)
     return BossLeiste.von_englisch(b)
 
 
-def setze_text(boss_leiste: BossLeiste, anzeige_text: str) -> BossLeiste:
+def setze_text(boss_leiste: BossLeiste, anzeige_text: str, *, sitzung: Session | None = None) -> BossLeiste:
     """Setze den Text der Leiste"""
-    b = __st_minecraft_en.set_text(boss_leiste.zu_englisch(), anzeige_text)
+    b = __st_minecraft_en.set_text(boss_leiste.zu_englisch(), anzeige_text, session=sitzung)
     return BossLeiste.von_englisch(b)
 
 
-def setze_farbe(boss_leiste: BossLeiste, farbe: BossLeisteFarben) -> BossLeiste:
+def setze_farbe(boss_leiste: BossLeiste, farbe: BossLeisteFarben, *, sitzung: Session | None = None) -> BossLeiste:
     """Setze die Farbe der Leiste"""
-    b = __st_minecraft_en.set_color(boss_leiste.zu_englisch(), farbe.zu_englisch())
+    b = __st_minecraft_en.set_color(boss_leiste.zu_englisch(), farbe.zu_englisch(), session=sitzung)
     return BossLeiste.von_englisch(b)
 
 
-def setze_wert(boss_leiste: BossLeiste, wert: float) -> BossLeiste:
+def setze_wert(boss_leiste: BossLeiste, wert: float, *, sitzung: Session | None = None) -> BossLeiste:
     """Setze zu welchem Anteil die leiste gefüllt sein soll (zwischen 0 und 1)"""
     if not 0 <= wert <= 1:
         raise WertFehler(f"Der Wert der Bossleiste muss zwischen 0 und 1 liegen. Du hast '{wert}' angegeben.")
 
-    b = __st_minecraft_en.set_value(boss_leiste.zu_englisch(), wert)
+    b = __st_minecraft_en.set_value(boss_leiste.zu_englisch(), wert, session=sitzung)
     return BossLeiste.von_englisch(b)
 
 
-def setze_stil(boss_leiste: BossLeiste, stil: BossLeisteStil) -> BossLeiste:
+def setze_stil(boss_leiste: BossLeiste, stil: BossLeisteStil, *, sitzung: Session | None = None) -> BossLeiste:
     """Setze den Stil der Leiste"""
-    b = __st_minecraft_en.set_style(boss_leiste.zu_englisch(), stil.zu_englisch())
+    b = __st_minecraft_en.set_style(boss_leiste.zu_englisch(), stil.zu_englisch(), session=sitzung)
     return BossLeiste.von_englisch(b)
 
 
-def loesche_leiste(boss_leiste: BossLeiste):
+def loesche_leiste(boss_leiste: BossLeiste, *, sitzung: Session | None = None):
     """Lösche eine Leiste"""
-    __st_minecraft_en.delete_bar(boss_leiste.zu_englisch())
+    __st_minecraft_en.delete_bar(boss_leiste.zu_englisch(), session=sitzung)
@@ -1,9 +1,8 @@
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel
-
 from st_minecraft.core.core import _to_enum
+from st_minecraft.core.models import BaseModel
 from st_minecraft.de._exceptions import InventarFeldLeerFehler
 from st_minecraft.de.entity import EntitySammlung
 from st_minecraft.de.material import MaterialSammlung
@@ -16,6 +15,31 @@ from st_minecraft.en import Item as _ItemEN
 from st_minecraft.en import Material as _MaterialEN
 from st_minecraft.en import Message as _MessageEN
 from st_minecraft.en import Player as _PlayerEN
+from st_minecraft.en.data_models import _entity_values
+from st_minecraft.en.data_models import _IndexedInventory
+from st_minecraft.en.data_models import _inventory_field_values
+from st_minecraft.en.data_models import _item_values
+from st_minecraft.en.data_models import _ModelSet
+from st_minecraft.en.data_models import _player_values
+
+_FELDNAMEN = {
+    "type": "typ",
+    "looking_at": "schaut_auf",
+    "max_health": "max_leben",
+    "health": "leben",
+    "saturation": "sättigung",
+    "xp_progress": "xp_fortschritt",
+    "display_name": "anzeige_name",
+    "amount": "anzahl",
+}
+""" Englische Feldnamen -> deutsche Feldnamen, nur die, die sich unterscheiden """
+
+
+def _deutsche_felder(modell_en: type[BaseModel]) -> tuple[str, ...]:
+    # needed internally
+    # die deutschen Feldnamen in der Reihenfolge der englischen Felder,
+    # so passen sie zu den Werten, die z.B. _player_values() aus der Antwort des Servers liest
+    return tuple(_FELDNAMEN.get(name, name) for name in modell_en.model_fields)
 
 
 class RichtungSammlung(Enum):
@@ -52,6 +76,16 @@ class Material(BaseModel):
     def __repr__(self):
         return f"Block(typ={self.typ}, x={self.x}, y={self.y}, z={self.z}, dimension={self.dimension})"
 
+    @staticmethod
+    def von_string(
+        typ: str,
+        x: int | None = None,
+        y: int | None = None,
+        z: int | None = None,
+        dimension: str | None = None,
+    ) -> "Material":
+        return Material(typ=_to_enum(MaterialSammlung, typ), x=x, y=y, z=z, dimension=_to_enum(Dimension, dimension))
+
     @staticmethod
     def von_englisch(m: _MaterialEN | None) -> Optional["Material"]:
         if m is None:
@@ -102,6 +136,11 @@ class Spieler(BaseModel):
     xp_level: float
     xp_fortschritt: float
 
+    @staticmethod
+    def von_antwort(daten: bytes) -> "Spieler":
+        """Liest die Antwort des Servers direkt ein, ohne den Umweg über den englischen Player"""
+        return Spieler(**dict(zip(_SPIELER_FELDER, _player_values(daten, Material.von_string))))
+
     @staticmethod
     def von_englisch(p: _PlayerEN):
         return Spieler(
@@ -198,6 +237,11 @@ class Entity(BaseModel):
         # TODO: brauchen wir das? falls nein können wir die default-Nones entfernen
         return Entity(typ=_to_enum(EntitySammlung, typ))
 
+    @staticmethod
+    def von_antwort(s: str) -> "Entity":
+        """Liest die Antwort des Servers direkt ein, ohne den Umweg über das englische Entity"""
+        return Entity(**dict(zip(_ENTITY_FELDER, _entity_values(s, EntitySammlung))))
+
     @staticmethod
     def von_englisch(e: _EntityEN):
         return Entity(
@@ -235,10 +279,17 @@ class Item(BaseModel):
     def __repr__(self):
         return f"Item(typ={self.typ}, anzeige_name={self.anzeige_name})"
 
+    @staticmethod
+    def von_antwort(s: str) -> "Item":
+        return Item(**dict(zip(_ITEM_FELDER, _item_values(s, MaterialSammlung))))
+
     @staticmethod
     def von_englisch(i: _ItemEN):
         return Item(typ=MaterialSammlung.von_englisch(i.type), anzeige_name=i.display_name)
 
+    def zu_englisch(self) -> _ItemEN:
+        return _ItemEN(type=self.typ.zu_englisch() if self.typ else None, display_name=self.anzeige_name)
+
 
 class InventarFeld(BaseModel):
     """Ein Feld im Inventar eine:r Spieler:in"""
@@ -253,6 +304,10 @@ class InventarFeld(BaseModel):
     def __repr__(self):
         return f"InventarFeld(index={self.index}, item={self.item!r}, anzahl={self.anzahl})"
 
+    @staticmethod
+    def von_antwort(s: str) -> "InventarFeld":
+        return InventarFeld(**dict(zip(_INVENTAR_FELD_FELDER, _inventory_field_values(s, Item.von_antwort))))
+
     @staticmethod
     def von_englisch(i: _InventoryFieldEN):
         return InventarFeld(index=i.index, item=Item.von_englisch(i.item), anzahl=i.amount)
@@ -261,28 +316,55 @@ class InventarFeld(BaseModel):
         return _InventoryFieldEN(index=self.index, item=self.item.zu_englisch(), amount=self.anzahl)
 
 
-class Inventar(dict[int, InventarFeld]):
+class Inventar(_IndexedInventory, dict[int, InventarFeld]):
     """
     Enthält das gesamte Inventar eines Spielers.
     Die Struktur ist ein dict.
     Das dict zeigt von Index des Inventars auf ein Objekt vom Typ InventarFeld, welcher die Infos über das Element in dem Feld enthält.
     Hinweis: Felder, die Leer sind, sind nicht in dem dict enthalten!
+    Ob ein Item (oder Material) im Inventar ist, prüfst du mit `item in inventar`,
+    für die Gesamtzahl gibt es anzahl(), felder_von() und hat_mindestens().
     """
 
-    def __contains__(self, item: Item):
-        """Überprüfe, ob ein Item im Inventar ist"""
-        for _, v in self.items():
-            if v.item == item:
-                return True
-        return False
+    _type_field = "typ"
+    _amount_field = "anzahl"
 
     def __getitem__(self, item: int):
         try:
-            super().__getitem__(item)
+            return super().__getitem__(item)
         # ich glaube, hier ist der peak der library. ein nicht-generischer wrapper um den KeyError.
         except KeyError:
             raise InventarFeldLeerFehler(f"Das Feld {item} ist leer. Daher kannst du hier nicht drauf zugreifen.")
 
+    def anzahl(self, material: MaterialSammlung) -> int:
+        """
+        Wie viele von dem Material im Inventar sind, alle Felder zusammengezählt
+        Args:
+            material (MaterialSammlung): z.B. MaterialSammlung.Diamant
+        Returns:
+            Die Gesamtzahl, 0 wenn das Material nicht im Inventar ist
+        """
+        return self.count(material)
+
+    def felder_von(self, material: MaterialSammlung) -> list[int]:
+        """
+        Die Indizes der Felder, in denen das Material liegt
+        Args:
+            material (MaterialSammlung): z.B. MaterialSammlung.Diamant
+        Returns:
+            Die Indizes aufsteigend sortiert, leer wenn das Material nicht im Inventar ist
+        """
+        return self.slots_of(material)
+
+    def hat_mindestens(self, material: MaterialSammlung, anzahl: int) -> bool:
+        """
+        Überprüfe, ob mindestens anzahl von dem Material im Inventar sind (alle Felder zusammengezählt)
+        Args:
+            material (MaterialSammlung): z.B. MaterialSammlung.Diamant
+            anzahl (int): Wie viele gebraucht werden
+        """
+        return self.has_at_least(material, anzahl)
+
     @staticmethod
     def von_englisch(i: _InventoryEN):
         return Inventar({index: InventarFeld.von_englisch(field) for index, field in i.items()})
@@ -303,7 +385,23 @@ class Nachricht(BaseModel):
 
     @staticmethod
     def von_englisch(m: _MessageEN):
-        return Nachricht(text=m.text, absender_name=m.sender_name)
+        return Nachricht(text=m.text, sender_name=m.sender_name)
 
     def zu_englisch(self) -> _MessageEN:
-        return _MessageEN(text=self.text, sender_name=self.absender_name)
+        return _MessageEN(text=self.text, sender_name=self.sender_name)
+
+
+_SPIELER_FELDER = _deutsche_felder(_PlayerEN)
+_ENTITY_FELDER = _deutsche_felder(_EntityEN)
+_ITEM_FELDER = _deutsche_felder(_ItemEN)
+_INVENTAR_FELD_FELDER = _deutsche_felder(_InventoryFieldEN)
+
+_DEUTSCHE_MODELLE = _ModelSet(
+    Material.von_string,
+    Spieler.von_antwort,
+    Entity.von_antwort,
+    InventarFeld.von_antwort,
+    Nachricht,
+    Inventar,
+)
+""" damit lesen die Funktionen aus st_minecraft.en die Antworten direkt in die deutschen Modelle ein """
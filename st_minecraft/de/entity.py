@@ -1,148 +1,68 @@
 """Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
 
-from enum import Enum
 from typing import Optional
 
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.de._exceptions import WertFehler
 from st_minecraft.en.entity import EntityCollection as _Collection
 
+_NAMEN = (
+    "Hilfsgeist Partikelwolke Rüstungsständer Pfeil Axolotl Fledermaus Biene Lohe Blockdarsteller Boot "
+    "Dromedar Katze Höhlenspinne Truhenboot Güterlore Huhn Kabeljau Befehlsblocklore Kuh Creeper Delfin "
+    "Esel Drachen_Feuerkugel Ertrunkener Geworfenes_Ei Großer_Wächter Enderkristall Enderdrache "
+    "Geworfene_Enderperle Enderman Endermite Magier Fangzähne Geworfenes_Erfahrungsfläschchen "
+    "Erfahrungskugel Enderauge Fallender_Block Feuerkugel Feuerwerksrakete Schwimmer Fuchs Frosch "
+    "Ofenlore Ghast Riese Leuchtrahmen Leuchttintenfisch Ziege Wächter Hoglin Trichterlore Pferd "
+    "Wüstenzombie Illusionist Interagierer Eisengolem Gegenstand Gegenstandsdarsteller Rahmen "
+    "Das_Killer_Kaninchen Leinenknoten Blitz Lama Lamaspucke Magmawürfel Marker Lore Mooshroom Maultier "
+    "Ozelot Gemälde Panda Papagei Phantom Schwein Piglin Piglin_Barbar Plünderer Spieler Eisbär Trank "
+    "Kugelfisch Kaninchen Verwüster Lachs Schaf Shulker Shulker_Geschoss Silberfischchen Skelett "
+    "Skelettpferd Schleim Kleine_Feuerkugel Schnüffler Schneegolem Schneeball Spawner_Lore Spektralpfeil "
+    "Spinne Tintenfisch Eiswanderer Schreiter Kaulquappe Textdarsteller Gezündetes_TNT TNT_Lore "
+    "Händlerlama Dreizack Tropenfisch Schildkröte Plagegeist Dorfbewohner Diener Fahrender_Händler "
+    "Wärter Hexe Wither Witherskelett Witherschädel Wolf Zoglin Zombie Zombiepferd Zombiedorfbewohner "
+    "Zombifizierter_Piglin "
+).split()
 
-class EntitySammlung(Enum):
+_ORDINALE = [
+    int(ordinal)
+    for ordinal in (
+        "0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 32 33 34 35 "
+        "36 37 38 39 40 41 42 43 44 45 46 47 48 49 50 51 52 53 54 55 56 57 58 59 60 61 62 63 64 65 66 67 68 "
+        "69 70 71 72 73 74 75 76 77 78 79 80 81 82 83 84 85 86 87 88 89 90 91 92 93 94 95 96 97 98 99 100 "
+        "101 102 103 104 105 106 107 108 109 110 111 112 113 114 115 116 117 118 119 120 121 122 123 124 "
+    ).split()
+]
+""" Ordinalzahl des englischen Members mit demselben Wert, für jeden Namen """
+
+
+class EntitySammlung(
+    CompactEnum,
+    names=_NAMEN,
+    values=[_Collection.from_ordinal(ordinal).value for ordinal in _ORDINALE],
+    ordinals=_ORDINALE,
+):
 
     @staticmethod
     def von_englisch(e: _Collection) -> Optional["EntitySammlung"]:
         try:
-            return EntitySammlung._value2member_map_[e.value]
-        except KeyError:
+            return EntitySammlung._by_ordinal_[e.ordinal]
+        except (IndexError, AttributeError):
             return None
 
     def zu_englisch(self) -> Optional[_Collection]:
-        try:
-            return _Collection._value2member_map_[self.value]
-        except KeyError:
-            return None
+        return _Collection._by_ordinal_[self._ordinal_]
+
 
-    Hilfsgeist = "ALLAY"
-    Partikelwolke = "AREA_EFFECT_CLOUD"
-    Rüstungsständer = "ARMOR_STAND"
-    Pfeil = "ARROW"
-    Axolotl = "AXOLOTL"
-    Fledermaus = "BAT"
-    Biene = "BEE"
-    Lohe = "BLAZE"
-    Blockdarsteller = "BLOCK_DISPLAY"
-    Boot = "BOAT"
-    Dromedar = "CAMEL"
-    Katze = "CAT"
-    Höhlenspinne = "CAVE_SPIDER"
-    Truhenboot = "CHEST_BOAT"
-    Güterlore = "CHEST_MINECART"
-    Huhn = "CHICKEN"
-    Kabeljau = "COD"
-    Befehlsblocklore = "COMMAND_BLOCK_MINECART"
-    Kuh = "COW"
-    Creeper = "CREEPER"
-    Delfin = "DOLPHIN"
-    Esel = "DONKEY"
-    Drachen_Feuerkugel = "DRAGON_FIREBALL"
-    Ertrunkener = "DROWNED"
-    Geworfenes_Ei = "EGG"
-    Großer_Wächter = "ELDER_GUARDIAN"
-    Enderkristall = "END_CRYSTAL"
-    Enderdrache = "ENDER_DRAGON"
-    Geworfene_Enderperle = "ENDER_PEARL"
-    Enderman = "ENDERMAN"
-    Endermite = "ENDERMITE"
-    Magier = "EVOKER"
-    Fangzähne = "EVOKER_FANGS"
-    Geworfenes_Erfahrungsfläschchen = "EXPERIENCE_BOTTLE"
-    Erfahrungskugel = "EXPERIENCE_ORB"
-    Enderauge = "EYE_OF_ENDER"
-    Fallender_Block = "FALLING_BLOCK"
-    Feuerkugel = "FIREBALL"
-    Feuerwerksrakete = "FIREWORK_ROCKET"
-    Schwimmer = "FISHING_BOBBER"
-    Fuchs = "FOX"
-    Frosch = "FROG"
-    Ofenlore = "FURNACE_MINECART"
-    Ghast = "GHAST"
-    Riese = "GIANT"
-    Leuchtrahmen = "GLOW_ITEM_FRAME"
-    Leuchttintenfisch = "GLOW_SQUID"
-    Ziege = "GOAT"
-    Wächter = "GUARDIAN"
-    Hoglin = "HOGLIN"
-    Trichterlore = "HOPPER_MINECART"
-    Pferd = "HORSE"
-    Wüstenzombie = "HUSK"
-    Illusionist = "ILLUSIONER"
-    Interagierer = "INTERACTION"
-    Eisengolem = "IRON_GOLEM"
-    Gegenstand = "ITEM"
-    Gegenstandsdarsteller = "ITEM_DISPLAY"
-    Rahmen = "ITEM_FRAME"
-    Das_Killer_Kaninchen = "KILLER_BUNNY"
-    Leinenknoten = "LEASH_KNOT"
-    Blitz = "LIGHTNING_BOLT"
-    Lama = "LLAMA"
-    Lamaspucke = "LLAMA_SPIT"
-    Magmawürfel = "MAGMA_CUBE"
-    Marker = "MARKER"
-    Lore = "MINECART"
-    Mooshroom = "MOOSHROOM"
-    Maultier = "MULE"
-    Ozelot = "OCELOT"
-    Gemälde = "PAINTING"
-    Panda = "PANDA"
-    Papagei = "PARROT"
-    Phantom = "PHANTOM"
-    Schwein = "PIG"
-    Piglin = "PIGLIN"
-    Piglin_Barbar = "PIGLIN_BRUTE"
-    Plünderer = "PILLAGER"
-    Spieler = "PLAYER"
-    Eisbär = "POLAR_BEAR"
-    Trank = "POTION"
-    Kugelfisch = "PUFFERFISH"
-    Kaninchen = "RABBIT"
-    Verwüster = "RAVAGER"
-    Lachs = "SALMON"
-    Schaf = "SHEEP"
-    Shulker = "SHULKER"
-    Shulker_Geschoss = "SHULKER_BULLET"
-    Silberfischchen = "SILVERFISH"
-    Skelett = "SKELETON"
-    Skelettpferd = "SKELETON_HORSE"
-    Schleim = "SLIME"
-    Kleine_Feuerkugel = "SMALL_FIREBALL"
-    Schnüffler = "SNIFFER"
-    Schneegolem = "SNOW_GOLEM"
-    Schneeball = "SNOWBALL"
-    Spawner_Lore = "SPAWNER_MINECART"
-    Spektralpfeil = "SPECTRAL_ARROW"
-    Spinne = "SPIDER"
-    Tintenfisch = "SQUID"
-    Eiswanderer = "STRAY"
-    Schreiter = "STRIDER"
-    Kaulquappe = "TADPOLE"
-    Textdarsteller = "TEXT_DISPLAY"
-    Gezündetes_TNT = "TNT"
-    TNT_Lore = "TNT_MINECART"
-    Händlerlama = "TRADER_LLAMA"
-    Dreizack = "TRIDENT"
-    Tropenfisch = "TROPICAL_FISH"
-    Schildkröte = "TURTLE"
-    Plagegeist = "VEX"
-    Dorfbewohner = "VILLAGER"
-    Diener = "VINDICATOR"
-    Fahrender_Händler = "WANDERING_TRADER"
-    Wärter = "WARDEN"
-    Hexe = "WITCH"
-    Wither = "WITHER"
-    Witherskelett = "WITHER_SKELETON"
-    Witherschädel = "WITHER_SKULL"
-    Wolf = "WOLF"
-    Zoglin = "ZOGLIN"
-    Zombie = "ZOMBIE"
-    Zombiepferd = "ZOMBIE_HORSE"
-    Zombiedorfbewohner = "ZOMBIE_VILLAGER"
-    Zombifizierter_Piglin = "ZOMBIFIED_PIGLIN"
+def entity_aus_ordinal(ordinal: int) -> EntitySammlung:
+    """
+    Die Entity mit der angegebenen Ordinalzahl (siehe zu_ordinal())
+    Args:
+        ordinal (int): z.B. EntitySammlung.Hilfsgeist.ordinal
+    Returns:
+        die Entity, ein WertFehler, wenn es keine Entity mit dieser Ordinalzahl gibt
+    """
+    try:
+        return EntitySammlung.from_ordinal(ordinal)
+    except ValueError:
+        raise WertFehler(f"Es gibt keine Entity mit der Ordinalzahl {ordinal}.") from None
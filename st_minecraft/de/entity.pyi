@@ -0,0 +1,138 @@
+"""Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
+
+from typing import Optional
+
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.en.entity import EntityCollection as _Collection
+
+class EntitySammlung(CompactEnum):
+    @staticmethod
+    def von_englisch(e: _Collection) -> Optional[EntitySammlung]: ...
+    def zu_englisch(self) -> Optional[_Collection]: ...
+    Hilfsgeist: EntitySammlung
+    Partikelwolke: EntitySammlung
+    Rüstungsständer: EntitySammlung
+    Pfeil: EntitySammlung
+    Axolotl: EntitySammlung
+    Fledermaus: EntitySammlung
+    Biene: EntitySammlung
+    Lohe: EntitySammlung
+    Blockdarsteller: EntitySammlung
+    Boot: EntitySammlung
+    Dromedar: EntitySammlung
+    Katze: EntitySammlung
+    Höhlenspinne: EntitySammlung
+    Truhenboot: EntitySammlung
+    Güterlore: EntitySammlung
+    Huhn: EntitySammlung
+    Kabeljau: EntitySammlung
+    Befehlsblocklore: EntitySammlung
+    Kuh: EntitySammlung
+    Creeper: EntitySammlung
+    Delfin: EntitySammlung
+    Esel: EntitySammlung
+    Drachen_Feuerkugel: EntitySammlung
+    Ertrunkener: EntitySammlung
+    Geworfenes_Ei: EntitySammlung
+    Großer_Wächter: EntitySammlung
+    Enderkristall: EntitySammlung
+    Enderdrache: EntitySammlung
+    Geworfene_Enderperle: EntitySammlung
+    Enderman: EntitySammlung
+    Endermite: EntitySammlung
+    Magier: EntitySammlung
+    Fangzähne: EntitySammlung
+    Geworfenes_Erfahrungsfläschchen: EntitySammlung
+    Erfahrungskugel: EntitySammlung
+    Enderauge: EntitySammlung
+    Fallender_Block: EntitySammlung
+    Feuerkugel: EntitySammlung
+    Feuerwerksrakete: EntitySammlung
+    Schwimmer: EntitySammlung
+    Fuchs: EntitySammlung
+    Frosch: EntitySammlung
+    Ofenlore: EntitySammlung
+    Ghast: EntitySammlung
+    Riese: EntitySammlung
+    Leuchtrahmen: EntitySammlung
+    Leuchttintenfisch: EntitySammlung
+    Ziege: EntitySammlung
+    Wächter: EntitySammlung
+    Hoglin: EntitySammlung
+    Trichterlore: EntitySammlung
+    Pferd: EntitySammlung
+    Wüstenzombie: EntitySammlung
+    Illusionist: EntitySammlung
+    Interagierer: EntitySammlung
+    Eisengolem: EntitySammlung
+    Gegenstand: EntitySammlung
+    Gegenstandsdarsteller: EntitySammlung
+    Rahmen: EntitySammlung
+    Das_Killer_Kaninchen: EntitySammlung
+    Leinenknoten: EntitySammlung
+    Blitz: EntitySammlung
+    Lama: EntitySammlung
+    Lamaspucke: EntitySammlung
+    Magmawürfel: EntitySammlung
+    Marker: EntitySammlung
+    Lore: EntitySammlung
+    Mooshroom: EntitySammlung
+    Maultier: EntitySammlung
+    Ozelot: EntitySammlung
+    Gemälde: EntitySammlung
+    Panda: EntitySammlung
+    Papagei: EntitySammlung
+    Phantom: EntitySammlung
+    Schwein: EntitySammlung
+    Piglin: EntitySammlung
+    Piglin_Barbar: EntitySammlung
+    Plünderer: EntitySammlung
+    Spieler: EntitySammlung
+    Eisbär: EntitySammlung
+    Trank: EntitySammlung
+    Kugelfisch: EntitySammlung
+    Kaninchen: EntitySammlung
+    Verwüster: EntitySammlung
+    Lachs: EntitySammlung
+    Schaf: EntitySammlung
+    Shulker: EntitySammlung
+    Shulker_Geschoss: EntitySammlung
+    Silberfischchen: EntitySammlung
+    Skelett: EntitySammlung
+    Skelettpferd: EntitySammlung
+    Schleim: EntitySammlung
+    Kleine_Feuerkugel: EntitySammlung
+    Schnüffler: EntitySammlung
+    Schneegolem: EntitySammlung
+    Schneeball: EntitySammlung
+    Spawner_Lore: EntitySammlung
+    Spektralpfeil: EntitySammlung
+    Spinne: EntitySammlung
+    Tintenfisch: EntitySammlung
+    Eiswanderer: EntitySammlung
+    Schreiter: EntitySammlung
+    Kaulquappe: EntitySammlung
+    Textdarsteller: EntitySammlung
+    Gezündetes_TNT: EntitySammlung
+    TNT_Lore: EntitySammlung
+    Händlerlama: EntitySammlung
+    Dreizack: EntitySammlung
+    Tropenfisch: EntitySammlung
+    Schildkröte: EntitySammlung
+    Plagegeist: EntitySammlung
+    Dorfbewohner: EntitySammlung
+    Diener: EntitySammlung
+    Fahrender_Händler: EntitySammlung
+    Wärter: EntitySammlung
+    Hexe: EntitySammlung
+    Wither: EntitySammlung
+    Witherskelett: EntitySammlung
+    Witherschädel: EntitySammlung
+    Wolf: EntitySammlung
+    Zoglin: EntitySammlung
+    Zombie: EntitySammlung
+    Zombiepferd: EntitySammlung
+    Zombiedorfbewohner: EntitySammlung
+    Zombifizierter_Piglin: EntitySammlung
+
+def entity_aus_ordinal(ordinal: int) -> EntitySammlung: ...
@@ -1,8 +1,15 @@
 """haupt-funktionalitäten der bibliothek"""
 
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
 import st_minecraft.en as __st_minecraft_en
+from st_minecraft.core import Session
+from st_minecraft.de.daten_modelle import _DEUTSCHE_MODELLE
 from st_minecraft.de.daten_modelle import Entity
 from st_minecraft.de.daten_modelle import Inventar
+from st_minecraft.de.daten_modelle import Item
 from st_minecraft.de.daten_modelle import Material
 from st_minecraft.de.daten_modelle import Nachricht
 from st_minecraft.de.daten_modelle import RichtungSammlung
@@ -10,9 +17,25 @@ from st_minecraft.de.daten_modelle import Spieler
 from st_minecraft.de.entity import EntitySammlung
 from st_minecraft.de.material import MaterialSammlung
 from st_minecraft.en import Dimension
+from st_minecraft.en.data_models import _call_with_models
+from st_minecraft.en.material import MaterialCollection
+
+
+def _auf_deutsch(funktion: Callable, *args, **kwargs) -> Any:
+    # needed internally
+    # ruft eine Funktion aus st_minecraft.en auf, deren Antworten dabei direkt in die deutschen Modelle gelesen werden
+    return _call_with_models(_DEUTSCHE_MODELLE, funktion, *args, **kwargs)
 
 
-def setze_block(x: int, y: int, z: int, block_typ: MaterialSammlung, dimension: Dimension = Dimension.World) -> None:
+def setze_block(
+    x: int,
+    y: int,
+    z: int,
+    block_typ: MaterialSammlung,
+    dimension: Dimension = Dimension.World,
+    *,
+    sitzung: Session | None = None,
+) -> None:
     """
     Setzt einen Block im Minecraft-Spiel.
     Du kannst damit auch bereits existierende Blöcke ersetzen.
@@ -26,12 +49,46 @@ def setze_block(x: int, y: int, z: int, block_typ: MaterialSammlung, dimension:
         z (int): Z-Koordinate für den Block
         block_typ (MaterialSammlung): Block als Element aus der MaterialSammlung, z.B. MaterialSammlung.Melone
         dimension (Dimension): Dimension in der nach dem Block gesucht werden soll (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     """
     # TODO: Das genaue Befehlsformat für das Protokoll festlegen
-    return __st_minecraft_en.set_block(x, y, z, block_typ.zu_englisch(), dimension)
+    return __st_minecraft_en.set_block(x, y, z, _block_auf_englisch(block_typ), dimension, session=sitzung)
+
+
+def setze_bloecke(
+    bloecke: Iterable[tuple[int, int, int, MaterialSammlung]],
+    dimension: Dimension = Dimension.World,
+    *,
+    sitzung: Session | None = None,
+) -> int:
+    """
+    Setzt viele Blöcke auf einmal.
+    Das ist viel schneller als setze_block() für jeden Block aufzurufen, weil die Blöcke zusammen verschickt werden.
 
+    Beispiel: setze_bloecke([(0, 64, 0, MaterialSammlung.Stein), (1, 64, 0, MaterialSammlung.Melone)])
 
-def hole_block(x: int, y: int, z: int, dimension: Dimension = Dimension.World) -> Material:
+    Args:
+        bloecke: Die Blöcke die gesetzt werden sollen, jeweils als (x, y, z, block_typ)
+        dimension (Dimension): Dimension in der die Blöcke gesetzt werden sollen (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    Returns:
+        Die Anzahl der gesetzten Blöcke
+    """
+    bloecke_en = [(x, y, z, _block_auf_englisch(block_typ)) for x, y, z, block_typ in bloecke]
+    return __st_minecraft_en.set_blocks(bloecke_en, dimension, session=sitzung)
+
+
+def _block_auf_englisch(block_typ: MaterialSammlung) -> MaterialCollection:
+    # needed internally
+    # setze_block() und setze_bloecke() prüfen gleich, ein falscher Block-Typ kommt nie beim Server an
+    if not isinstance(block_typ, MaterialSammlung):
+        raise TypeError(f"Ein Block-Typ muss aus der MaterialSammlung sein. Du hast '{block_typ!r}' angegeben.")
+    return block_typ.zu_englisch()
+
+
+def hole_block(
+    x: int, y: int, z: int, dimension: Dimension = Dimension.World, *, sitzung: Session | None = None
+) -> Material:
     """
     Frag ab was für ein Block sich an der Koordinate befindet
     Du bekommst ein Block-Objekt zurück, dass unter .typ den typ enthält
@@ -42,40 +99,74 @@ def hole_block(x: int, y: int, z: int, dimension: Dimension = Dimension.World) -
         y (int): Y-Koordinate des Blocks
         z (int): Z-Koordinate des Blocks
         dimension (Dimension): Dimension in der nach dem Block gesucht werden soll (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Den Block an der Koordinate als Datentyp `Material`
     """
-    m = __st_minecraft_en.get_block(x, y, z, dimension)
+    return _auf_deutsch(__st_minecraft_en.get_block, x, y, z, dimension, session=sitzung)
 
-    return Material.von_englisch(m)
+
+def hole_bloecke(
+    koordinaten: Iterable[tuple[int, int, int]],
+    dimension: Dimension = Dimension.World,
+    *,
+    sitzung: Session | None = None,
+) -> list[Material]:
+    """
+    Frag die Blöcke an vielen Koordinaten auf einmal ab.
+    Das ist viel schneller als hole_block() für jede Koordinate aufzurufen,
+    weil alle Anfragen zusammen verschickt und die Antworten danach eingesammelt werden.
+
+    Beispiel: hole_bloecke([(0, 64, 0), (1, 64, 0), (2, 64, 0)])
+
+    Args:
+        koordinaten: Die Koordinaten (x, y, z) der Blöcke
+        dimension (Dimension): Dimension in der nach den Blöcken gesucht werden soll (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    Returns:
+        Eine Liste mit den Blöcken in der gleichen Reihenfolge wie die Koordinaten
+    """
+    return _auf_deutsch(__st_minecraft_en.get_blocks, koordinaten, dimension, session=sitzung)
 
 
-def hole_entity(entity: Entity) -> Entity:
+def hole_entity(entity: Entity, *, sitzung: Session | None = None) -> Entity:
     """Bekomme den aktuellsten zustand eines bereits erstellten Entities
     Args:
         Das Entity Objekt von dem du ein Update abfragen möchtest
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Eine aktualisierte Version des entsprechenden Entities
 
     """
-    e = __st_minecraft_en.get_entity(entity.zu_englisch())
-    return Entity.von_englisch(e)
+    return _auf_deutsch(__st_minecraft_en.get_entity, entity, session=sitzung)
 
 
-def hole_spieler_durch_name(name: str) -> Spieler:
+def hole_entities(entities: Iterable[Entity], *, sitzung: Session | None = None) -> list[Entity]:
+    """Bekomme den aktuellsten Zustand von vielen bereits erstellten Entities auf einmal
+    Args:
+        Die Entity Objekte von denen du ein Update abfragen möchtest
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    Returns:
+        Aktualisierte Versionen der Entities in der gleichen Reihenfolge
+    """
+    return _auf_deutsch(__st_minecraft_en.get_entities, entities, session=sitzung)
+
+
+def hole_spieler_durch_name(name: str, *, sitzung: Session | None = None) -> Spieler:
     """
     Frage den Zustand eines Spielers Angabe eines namens ab.
     Args:
         name: Name der abzufragenden Spieler:in
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst ein Spieler Objekt zurück, welches eine Menge Infos über den Spieler enthält
     """
     # ONLY convencience wrapper for the users
     # please use hole_spieler() directly for library development
-    return hole_spieler(name=name)
+    return hole_spieler(name=name, sitzung=sitzung)
 
 
-def hole_spieler_durch_index(index: int = 0) -> Spieler:
+def hole_spieler_durch_index(index: int = 0, *, sitzung: Session | None = None) -> Spieler:
     """
     Frage den Zustand eines Spielers durch Angabe eines index ab.
     Die Spieler sind durchnummeriert in der Reihenfolge in der sie dem Server beigetreten sind.
@@ -85,15 +176,16 @@ def hole_spieler_durch_index(index: int = 0) -> Spieler:
 
     Args:
         index: Index der abzufragenden Spieler:in
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst ein Spieler Objekt zurück, welches eine Menge Infos über den Spieler enthält
     """
     # ONLY convenience wrapper for the users
     # please use hole_spieler() directly for library development
-    return hole_spieler(index=index)
+    return hole_spieler(index=index, sitzung=sitzung)
 
 
-def hole_spieler(*, index: int | None = None, name: str | None = None) -> Spieler:
+def hole_spieler(*, index: int | None = None, name: str | None = None, sitzung: Session | None = None) -> Spieler:
     """
     Frage den Zustand eines Spielers durch index oder name ab.
     Die Spieler sind durchnummeriert in der Reihenfolge in der sie dem Server beigetreten sind.
@@ -105,42 +197,62 @@ def hole_spieler(*, index: int | None = None, name: str | None = None) -> Spiele
     Args:
         index: Index der abzufragenden Spieler:in ist optional (wenn du keinen Index angibst, wird index=0 verwendet)
         name: Name der abzufragenden Spieler:in ist optional (wenn du keinen Index angibst, wird index=0 verwendet)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst ein Spieler Objekt zurück, welches eine Menge Infos über den Spieler enthält
     """
-    p = __st_minecraft_en.get_player(index=index, name=name)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.get_player, index=index, name=name, session=sitzung)
+
+
+def hole_mehrere_spieler(
+    *, indizes: Iterable[int] | None = None, namen: Iterable[str] | None = None, sitzung: Session | None = None
+) -> list[Spieler]:
+    """
+    Frage den Zustand von mehreren Spieler:innen auf einmal ab, entweder durch index oder durch name.
+    Das ist viel schneller als hole_spieler() für jede Spieler:in aufzurufen.
 
+    Hinweis.: Du MUSST explizit angeben, ob du namen oder indizes meinst.
+    Beispiel: `hole_mehrere_spieler(indizes=[0, 1, 2])` oder `hole_mehrere_spieler(namen=["jumebonn1", "jumebonn2"])`
 
-def sende_an_chat(nachricht: str):
+    Args:
+        indizes: Indizes der abzufragenden Spieler:innen
+        namen: Namen der abzufragenden Spieler:innen
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    Returns:
+        Eine Liste von Spieler Objekten in der gleichen Reihenfolge wie die Indizes oder Namen
+    """
+    return _auf_deutsch(__st_minecraft_en.get_players, indices=indizes, names=namen, session=sitzung)
+
+
+def sende_an_chat(nachricht: str, *, sitzung: Session | None = None):
     """
     Sende eine Nachricht in den Ingame Chat.
     Du kannst auch besondere Formatierungen vornehmen, siehe diesen Wiki Eintrag:
     https://minecraft.fandom.com/de/wiki/Formatierungscodes
     Args:
         nachricht: Die Nachricht, die du versenden willst
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     """
-    return __st_minecraft_en.send_to_chat(nachricht)
+    return __st_minecraft_en.send_to_chat(nachricht, session=sitzung)
 
 
-def hole_chat() -> list[Nachricht]:
+def hole_chat(*, sitzung: Session | None = None) -> list[Nachricht]:
     """
     Hole alle Nachrichten die seit der letzen Abfrage in den Chat geschrieben wurden.
     Returns:
         Du bekommst eine Liste aller gesendeten Nachrichten zurück
     """
-    nachrichten = __st_minecraft_en.get_chat()
-
-    return [Nachricht.von_englisch(n) for n in nachrichten]
+    return _auf_deutsch(__st_minecraft_en.get_chat, session=sitzung)
 
 
-def sende_befehl(befehl: str) -> None:
+def sende_befehl(befehl: str, *, sitzung: Session | None = None) -> None:
     """
     Sende einen Befehl an den Server.
     Args:
         befehl: Der Befehl, der an den Server gesendet werden soll (ohne / am Anfang)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     """
-    return __st_minecraft_en.send_command(befehl)
+    return __st_minecraft_en.send_command(befehl, session=sitzung)
 
 
 def zeige_titel(
@@ -151,6 +263,7 @@ def zeige_titel(
     einblende_zeit: float = 1,
     anzeige_zeit: float = 5,
     ausblende_zeit: float = 1,
+    sitzung: Session | None = None,
 ):
     """
     Zeigt eine Titel-Nachricht für eine Auswahl an Spielern an.
@@ -163,6 +276,7 @@ def zeige_titel(
         einblende_zeit: Zeit (in Sekunden), die benötigt wird, um den Titel einzublenden
         anzeige_zeit: Zeit (in Sekunden), die der Titel angezeigt wird
         ausblende_zeit: Zeit (in Sekunden), die benötigt wird, um den Titel auszublenden
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     """
 
     # Es gibt 20 Ticks pro Sekunde
@@ -173,10 +287,19 @@ def zeige_titel(
         fade_in_time=einblende_zeit,
         display_time=anzeige_zeit,
         fade_out_time=ausblende_zeit,
+        session=sitzung,
     )
 
 
-def erzeuge_entity(x: int, y: int, z: int, entity: EntitySammlung, dimension: Dimension = Dimension.World) -> Entity:
+def erzeuge_entity(
+    x: int,
+    y: int,
+    z: int,
+    entity: EntitySammlung,
+    dimension: Dimension = Dimension.World,
+    *,
+    sitzung: Session | None = None,
+) -> Entity:
     """
     Erzeuge eine entity an einer bestimmten Position
     Eine Liste aller Entities findest du hier:
@@ -188,12 +311,12 @@ def erzeuge_entity(x: int, y: int, z: int, entity: EntitySammlung, dimension: Di
         z (int): Z-Koordinate an der das Entity gespawnt werden soll
         entity: Ein Element aus der EntitySammlung z.B. EntitySammlung.Schaf
         dimension (Dimension): Dimension in der das Entity gespawnt werden soll (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
 
     Returns:
         Du bekommst ein Entity Objekt zurück. Mit diesem kannst du später wieder auf das Entity zugreifen.
     """
-    e = __st_minecraft_en.spawn_entity(x, y, z, entity.zu_englisch(), dimension)
-    return Entity.von_englisch(e)
+    return _auf_deutsch(__st_minecraft_en.spawn_entity, x, y, z, entity, dimension, session=sitzung)
 
 
 def gebe_item(
@@ -203,6 +326,8 @@ def gebe_item(
     name: str | None = None,
     inventar_feld: int | None = None,
     unzerstörbar: bool = False,
+    *,
+    sitzung: Session | None = None,
 ) -> Inventar:
     """
     Gebe einer Spieler:in ein Item
@@ -216,30 +341,112 @@ def gebe_item(
         name: (optional) Wie soll das item heißen?
         inventar_feld: (optional) Feld in dem das item landen soll (als zahl)
         unzerstörbar: (optional) Wenn das item unzerstörbar sein soll auf True setzen, der standard ist zerstörbar
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
 
     Returns:
         Du bekommst Informationen über den Inventarzustand der Spielerin nach der Item-Vergabe zurück
 
     """
-    i = __st_minecraft_en.give_item(spieler.zu_englisch(), item, anzahl, name, inventar_feld, unzerstörbar)
-    return Inventar.von_englisch(i)
+    return _auf_deutsch(
+        __st_minecraft_en.give_item,
+        spieler,
+        _als_material(item),
+        anzahl,
+        name,
+        inventar_feld,
+        unzerstörbar,
+        session=sitzung,
+    )
 
 
-def hole_inventar(spieler: Spieler) -> Inventar:
+def gebe_items(
+    spieler: Spieler,
+    items: Iterable[tuple],
+    *,
+    inventar_holen: bool = True,
+    sitzung: Session | None = None,
+) -> Inventar | None:
+    """
+    Gebe einer Spieler:in viele Items auf einmal, z.B. eine Startausrüstung.
+    Das ist viel schneller als gebe_item() für jedes Item aufzurufen, weil alle Items zusammen verschickt werden
+    und das Inventar nur einmal am Ende abgefragt wird (oder gar nicht).
+
+    Beispiel: gebe_items(spieler, [(MaterialSammlung.Brot, 16), (MaterialSammlung.Eisenschwert, 1, {"name": "Stich"})])
+
+    Args:
+        spieler: Spieler:in die die Items erhalten soll
+        items: Die Items, jeweils als (item, anzahl) oder (item, anzahl, optionen),
+            optionen ist ein dict mit den optionalen Argumenten von gebe_item(): name, inventar_feld und unzerstörbar
+        inventar_holen: (optional, Keyword-Argument) auf False setzen, wenn du das Inventar danach nicht brauchst,
+            dann muss auf keine Antwort gewartet werden
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+
+    Returns:
+        Das Inventar der Spieler:in nach der Item-Vergabe, None wenn inventar_holen False ist
+    """
+    items_en = []
+    for eintrag in items:
+        if len(eintrag) not in (2, 3):
+            raise TypeError(
+                f"Erwartet wird (item, anzahl) oder (item, anzahl, optionen). Du hast '{eintrag!r}' angegeben."
+            )
+        item, anzahl, *optionen = eintrag
+        optionen_en = {_OPTIONEN_EN.get(name, name): wert for name, wert in (optionen[0] if optionen else {}).items()}
+        items_en.append((_als_material(item), anzahl, optionen_en))
+
+    return _auf_deutsch(
+        __st_minecraft_en.give_items, spieler, items_en, fetch_inventory=inventar_holen, session=sitzung
+    )
+
+
+_OPTIONEN_EN = {"name": "name", "inventar_feld": "inventory_slot", "unzerstörbar": "unbreakable"}
+""" Optionen von gebe_items() -> Argumente von give_items() """
+
+
+def _als_material(item: MaterialSammlung | Item) -> MaterialSammlung:
+    # needed internally
+    # gebe_item() nimmt auch ein Item (z.B. aus dem Inventar), st_minecraft.en kennt nur das englische Item
+    if isinstance(item, Item):
+        return item.typ
+    return item
+
+
+def hole_inventar(spieler: Spieler, *, sitzung: Session | None = None) -> Inventar:
     """
     Rufe das Inventar eines Spielers ab.
     Args:
         spieler: Spieler von dem du das Inventar abfragen willst
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
 
     Returns:
         Du bekommst ein Inventar Object (wie ein dict) zurück"""
 
-    i = __st_minecraft_en.get_inventory(spieler.zu_englisch())
-    return Inventar.von_englisch(i)
+    return _auf_deutsch(__st_minecraft_en.get_inventory, spieler, session=sitzung)
+
+
+def hole_inventare(spieler: Iterable[Spieler], *, sitzung: Session | None = None) -> list[Inventar]:
+    """
+    Rufe die Inventare von vielen Spieler:innen auf einmal ab.
+    Das ist viel schneller als hole_inventar() für jede Spieler:in aufzurufen, weil alle Abfragen zusammen verschickt werden.
+    Args:
+        spieler: Spieler:innen von denen du das Inventar abfragen willst
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+
+    Returns:
+        Die Inventare in der gleichen Reihenfolge wie die Spieler:innen
+    """
+    return _auf_deutsch(__st_minecraft_en.get_inventories, spieler, session=sitzung)
 
 
 def spieler_position_setzen(
-    spieler: Spieler, x: int, y: int, z: int, *, rotation: int = None, dimension: Dimension = Dimension.World
+    spieler: Spieler,
+    x: int,
+    y: int,
+    z: int,
+    *,
+    rotation: int = None,
+    dimension: Dimension = Dimension.World,
+    sitzung: Session | None = None,
 ) -> Spieler:
     """
     Verändere die position in x-, y-, z-Richtung, Dimension und Rotation
@@ -252,6 +459,7 @@ def spieler_position_setzen(
         z: neue z-koordinate
         rotation: (optional, keyword-Argument) rotation des spielers (von -180 bis 180), wenn du sie nicht angibst, wird sie nicht verändert.
         dimension: (optional, keyword-Argument) Dimension in die der Spieler gesetzt werden soll (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
 
     Wenn du die Rotation oder Dimension verändern willst, musst du das als Keyword-Argument tun.
 
@@ -266,11 +474,14 @@ def spieler_position_setzen(
         Du bekommst eine aktualisierte Version des Spielers zurück (Zustand, nachdem er bewegt wurde)
     """
 
-    p = __st_minecraft_en.set_player_position(spieler.zu_englisch(), x, y, z, rotation=rotation, dimension=dimension)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(
+        __st_minecraft_en.set_player_position, spieler, x, y, z, rotation=rotation, dimension=dimension, session=sitzung
+    )
 
 
-def spieler_geschwindigkeit_setzen(spieler: Spieler, richtung: RichtungSammlung, wert: float) -> Spieler:
+def spieler_geschwindigkeit_setzen(
+    spieler: Spieler, richtung: RichtungSammlung, wert: float, *, sitzung: Session | None = None
+) -> Spieler:
     """
     Verändere die Bewegungsgeschwindigkeit einer Spieler:in in verschiedene Richtungen.
     Alle Richtungen, die du beeinflussen kannst, findest du in der RichtungSammlung
@@ -279,35 +490,36 @@ def spieler_geschwindigkeit_setzen(spieler: Spieler, richtung: RichtungSammlung,
         spieler: Spieler Objekt, dass beeinflusst werden soll
         richtung: Richtung die verändert werden soll, als Element der RichtungSammlung, z.B. RichtungSammlung.Vorwärts
         wert: 1 ist normale geschwindigkeit, 0 ist einfrieren, die Zahl darf beliebig groß (und damit beliebig schnell) werden
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst eine aktualisierte Version des Spielers zurück (Zustand, nachdem die Geschwindigkeit verändert wurde)
 
     """
-    p = __st_minecraft_en.set_player_velocity(spieler.zu_englisch(), richtung, wert)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.set_player_velocity, spieler, richtung, wert, session=sitzung)
 
 
-def spieler_max_leben_setzten(spieler: Spieler, wert: float) -> Spieler:
+def spieler_max_leben_setzten(spieler: Spieler, wert: float, *, sitzung: Session | None = None) -> Spieler:
     """Setze die maximalen Leben einer Spielerin"""
-    p = __st_minecraft_en.set_player_max_health(spieler.zu_englisch(), wert)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.set_player_max_health, spieler, wert, session=sitzung)
 
 
-def spieler_leben_setzen(spieler: Spieler, wert: float) -> Spieler:
+def spieler_leben_setzen(spieler: Spieler, wert: float, *, sitzung: Session | None = None) -> Spieler:
     """
     Setze die aktuellen Leben einer Spielerin
     Ist der Wert größer als das gesetzte Maximum werden alle überschüssigen Leben ignoriert
     Args:
         spieler: Spieler Objekt, dass beeinflusst werden soll
         wert: Anzahl an Leben als Kommazahl.
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst eine aktualisierte Version des Spielers zurück (Zustand, nachdem die Leben verändert wurden)
     """
-    p = __st_minecraft_en.set_player_health(spieler.zu_englisch(), wert)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.set_player_health, spieler, wert, session=sitzung)
 
 
-def spieler_hunger_setzen(spieler: Spieler, wert: float, sättigung: float | None = None) -> Spieler:
+def spieler_hunger_setzen(
+    spieler: Spieler, wert: float, sättigung: float | None = None, *, sitzung: Session | None = None
+) -> Spieler:
     """
     Setze den Hunger eines Spielers.
     Du kannst optional auch noch die Sättigung setzen.
@@ -316,54 +528,56 @@ def spieler_hunger_setzen(spieler: Spieler, wert: float, sättigung: float | Non
         spieler: Spieler Objekt, dass beeinflusst werden soll
         wert: Anzahl an Hunger als Kommazahl.
         sättigung: (optional) Du kannst die Sättigung mit setzen. Lässt du sie leer, wird sie nicht verändert.
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst eine aktualisierte Version des Spielers zurück (Zustand, nachdem der Hunger verändert wurde)
     """
-    p = __st_minecraft_en.set_player_hunger(spieler.zu_englisch(), wert, sättigung)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.set_player_hunger, spieler, wert, sättigung, session=sitzung)
 
 
-def spieler_xp_level_setzen(spieler: Spieler, wert: float) -> Spieler:
+def spieler_xp_level_setzen(spieler: Spieler, wert: float, *, sitzung: Session | None = None) -> Spieler:
     """
     Setze das aktuelle Level einer Spielerin
 
     Args:
         spieler: Spieler Objekt, dass beeinflusst werden soll
         wert: Level als Kommazahl
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst eine aktualisierte Version des Spielers zurück (Zustand, nachdem das Level verändert wurde)
     """
-    p = __st_minecraft_en.set_player_xp_level(spieler.zu_englisch(), wert)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.set_player_xp_level, spieler, wert, session=sitzung)
 
 
-def spieler_xp_fortschritt_setzen(spieler: Spieler, wert: float) -> Spieler:
+def spieler_xp_fortschritt_setzen(spieler: Spieler, wert: float, *, sitzung: Session | None = None) -> Spieler:
     """
     Setze den Fortschritt innerhalb des Levels eines Spielers
     Args:
         spieler: Spieler Objekt, dass beeinflusst werden soll
         wert: Fortschritt als Kommazahl
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Du bekommst eine aktualisierte Version des Spielers zurück (Zustand, nachdem der Fortschritt verändert wurde)
     """
-    p = __st_minecraft_en.set_player_xp_progress(spieler.zu_englisch(), wert)
-    return Spieler.von_englisch(p)
+    return _auf_deutsch(__st_minecraft_en.set_player_xp_progress, spieler, wert, session=sitzung)
 
 
-def entity_name_setzen(entity: Entity, name: str) -> Entity:
+def entity_name_setzen(entity: Entity, name: str, *, sitzung: Session | None = None) -> Entity:
     """
     Setzen den Namen eines Entities
     Args:
         entity: Das zu bearbeitende Entity, nicht EntitySammlung!
         name: Der neue Name des Entities
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Eine aktualisierte Version des Entities (Zustand nach der Veränderung)
     """
-    e = __st_minecraft_en.set_entity_name(entity.zu_englisch(), name)
-    return Entity.von_englisch(e)
+    return _auf_deutsch(__st_minecraft_en.set_entity_name, entity, name, session=sitzung)
 
 
-def entity_position_setzen(entity: Entity, x: int, y: int, z: int, dimension: Dimension = Dimension.World) -> Entity:
+def entity_position_setzen(
+    entity: Entity, x: int, y: int, z: int, dimension: Dimension = Dimension.World, *, sitzung: Session | None = None
+) -> Entity:
     """
     Setzen die Position eines Entities
 
@@ -373,35 +587,79 @@ def entity_position_setzen(entity: Entity, x: int, y: int, z: int, dimension: Di
         y (int): neue Y-Koordinate
         z (int): neue Z-Koordinate
         dimension (Dimension): Dimension in die das Entity gesetzt werden soll (Standard: Dimension.World)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     Returns:
         Eine aktualisierte Version des Entities (Zustand nach der Veränderung)
     """
-    e = __st_minecraft_en.set_entity_position(entity.zu_englisch(), x, y, z, dimension)
-    return Entity.von_englisch(e)
+    return _auf_deutsch(__st_minecraft_en.set_entity_position, entity, x, y, z, dimension, session=sitzung)
 
 
-def entity_ai_setzen(entity: Entity, status: bool) -> Entity:
+def entity_ai_setzen(entity: Entity, status: bool, *, sitzung: Session | None = None) -> Entity:
     """
     Setzen den AI eines Entities. Wenn es keine AI hat (False), bewegt es sich nicht.
 
     Args:
         entity: Das zu bearbeitende Entity, nicht EntitySammlung!
         status: True (wenn es sich bewegen soll), sonst False
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
 
     Returns:
         Eine aktualisierte Version des Entities (Zustand nach der Veränderung)
     """
-    e = __st_minecraft_en.set_entity_ai(entity.zu_englisch(), status)
-    return Entity.von_englisch(e)
+    return _auf_deutsch(__st_minecraft_en.set_entity_ai, entity, status, session=sitzung)
 
 
-def entity_leben_setzen(entity: Entity, leben: float) -> Entity:
+def entity_leben_setzen(entity: Entity, leben: float, *, sitzung: Session | None = None) -> Entity:
     """
     Setzen den Leben eines Entities. Wenn Leben auf 0 gesetzt werden, stirbt es.
 
     Args:
         entity: Das zu bearbeitende Entity, nicht EntitySammlung!
         leben: Wie viele Leben das Entity haben soll (0=tot).
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    """
+    return _auf_deutsch(__st_minecraft_en.set_entity_health, entity, leben, session=sitzung)
+
+
+def starte_hintergrund_sender(max_wartend: int | None = None, *, sitzung: Session | None = None) -> None:
+    """
+    Befehle, die keine Antwort erwarten (z.B. setze_block(), sende_an_chat(), Änderungen an Boss-Leisten),
+    werden ab jetzt von einem Hintergrund-Thread gesendet, damit dein Programm nicht auf das Netzwerk warten muss.
+    Abfragen (z.B. hole_spieler()) warten weiterhin, bis alles vor ihnen gesendet wurde.
+
+    Args:
+        max_wartend (int): Wie viele Befehle höchstens warten dürfen, bevor dein Programm warten muss (Standard: 10000)
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    """
+    __st_minecraft_en.start_background_writer(max_wartend, session=sitzung)
+
+
+def stoppe_hintergrund_sender(*, sitzung: Session | None = None) -> None:
+    """
+    Sendet alles, was noch wartet, und sendet Befehle danach wieder sofort.
+
+    Args:
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    """
+    __st_minecraft_en.stop_background_writer(session=sitzung)
+
+
+def warte_bis_gesendet(*, sitzung: Session | None = None) -> None:
+    """
+    Wartet, bis alle Befehle, die im Hintergrund warten, gesendet wurden.
+
+    Args:
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
+    """
+    __st_minecraft_en.flush(session=sitzung)
+
+
+def warte_auf_hintergrund_sender(*, sitzung: Session | None = None) -> None:
+    """
+    Wartet, bis der Hintergrund-Thread aufgeholt hat, falls viele Befehle darauf warten, gesendet zu werden.
+    Rufe es in jedem Durchlauf einer schnellen Schleife auf, damit sie dem Server nicht weit vorauslaufen kann.
+
+    Args:
+        sitzung: (optional, Keyword-Argument) Sitzung die verwendet werden soll (Standard: die Verbindung von verbinden())
     """
-    e = __st_minecraft_en.set_entity_health(entity.zu_englisch(), leben)
-    return Entity.von_englisch(e)
+    __st_minecraft_en.drain(session=sitzung)
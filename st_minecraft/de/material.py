@@ -1,1344 +1,357 @@
 """Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
 
-from enum import Enum
 from typing import Optional
 
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.core.compact_enum import to_ordinal as zu_ordinal  # noqa: unused-import
+from st_minecraft.de._exceptions import WertFehler
 from st_minecraft.en.material import MaterialCollection as _Collection
 
+_NAMEN = (
+    "Akazienholzknopf Akazienholztür Akazienholzzaun Akazienholzzauntor Akazienholzhängeschild "
+    "Akazienlaub Akazienstamm Akazienholzbretter Akazienholzdruckplatte Akaziensetzling "
+    "Akazienholzschild Akazienholzstufe Akazienholztreppe Akazienholzfalltür Akazienholzwandhängeschild "
+    "Akazienholzwandschild Akazienholz Aktivierungsschiene Luft Zierlauch Amethystblock Amethysthaufen "
+    "Antiker_Schrott Andesit Andesitstufe Andesittreppe Andesitmauer Amboss Melonenranke Kürbisranke "
+    "Azalee Azaleenlaub Porzellansternchen Bambus Bambusblock Bambusknopf Bambustür Bambuszaun "
+    "Bambuszauntor Bambushängeschild Bambusmosaik Bambusmosaikstufe Bambusmosaiktreppe Bambusbretter "
+    "Bambusdruckplatte Bambussprössling Bambusschild Bambusstufe Bambustreppe Bambusfalltür "
+    "Bambuswandhängeschild Bambuswandschild Fass Barriere Basalt Leuchtfeuer Grundgestein Bienennest "
+    "Bienenstock Rote_Bete Glocke Großes_Tropfblatt Großer_Tropfblattstiel Birkenholzknopf Birkenholztür "
+    "Birkenholzzaun Birkenholzzauntor Birkenholzhängeschild Birkenlaub Birkenstamm Birkenholzbretter "
+    "Birkenholzdruckplatte Birkensetzling Birkenholzschild Birkenholzstufe Birkenholztreppe "
+    "Birkenholzfalltür Birkenholzwandhängeschild Birkenholzwandschild Birkenholz Schwarzes_Banner "
+    "Schwarzes_Bett Schwarze_Kerze Kuchen_mit_schwarzer_Kerze Schwarzer_Teppich Schwarzer_Beton "
+    "Schwarzer_Trockenbeton Schwarze_glasierte_Keramik Schwarze_Shulker_Kiste Schwarzes_Glas "
+    "Schwarze_Glasscheibe Schwarze_Keramik Schwarze_Wolle Schwarzstein Schwarzsteinstufe "
+    "Schwarzsteintreppe Schwarzsteinmauer Schmelzofen Blaues_Banner Blaues_Bett Blaue_Kerze "
+    "Kuchen_mit_blauer_Kerze Blauer_Teppich Blauer_Beton Blauer_Trockenbeton Blaue_glasierte_Keramik "
+    "Blaueis Blaue_Orchidee Blaue_Shulker_Kiste Blaues_Glas Blaue_Glasscheibe Blaue_Keramik Blaue_Wolle "
+    "Knochenblock Bücherregal Hirnkoralle Hirnkorallenblock Hirnkorallenfächer Hirnkorallenwandfächer "
+    "Braustand Ziegelstufe Ziegeltreppe Ziegelsteinmauer Ziegelsteine Braunes_Banner Braunes_Bett "
+    "Braune_Kerze Kuchen_mit_brauner_Kerze Brauner_Teppich Brauner_Beton Brauner_Trockenbeton "
+    "Braune_glasierte_Keramik Brauner_Pilz Brauner_Pilzblock Braune_Shulker_Kiste Braunes_Glas "
+    "Braune_Glasscheibe Braune_Keramik Braune_Wolle Blasensäule Blasenkoralle Blasenkorallenblock "
+    "Blasenkorallenfächer Blasenkorallenwandfächer Amethystknospenblock Kaktus Kuchen Kalzit Lagerfeuer "
+    "Kerze Kuchen_mit_Kerze Karotten Kartentisch Geschnitzter_Kürbis Kessel Höhlenluft Höhlenranken "
+    "Höhlenrankenpflanze Kette Ketten_Befehlsblock Kirschholzknopf Kirschholztür Kirschholzzaun "
+    "Kirschholzzauntor Kirschholzhängeschild Kirschlaub Kirschstamm Kirschholzbretter "
+    "Kirschholzdruckplatte Kirschsetzling Kirschholzschild Kirschholzstufe Kirschholztreppe "
+    "Kirschholzfalltür Kirschholzwandhängeschild Kirschholzwandschild Kirschholz Truhe "
+    "Angeschlagener_Amboss Gearbeitetes_Bücherregal Gemeißelter_Tiefenschiefer Gemeißelte_Netherziegel "
+    "Gemeißelter_polierter_Schwarzstein Gemeißelter_Quarzblock Gemeißelter_roter_Sandstein "
+    "Gemeißelter_Sandstein Gemeißelte_Steinziegel Chorusblüte Choruspflanze Ton Kohleblock Steinkohle "
+    "Grobe_Erde Bruchtiefenschiefer Bruchtiefenschieferstufe Bruchtiefenschiefertreppe "
+    "Bruchtiefenschiefermauer Bruchstein Bruchsteinstufe Bruchsteintreppe Bruchsteinmauer Spinnennetz "
+    "Kakao Befehlsblock Redstone_Komparator Komposter Aquisator Kupferblock Kupfererz Kornblume "
+    "Rissige_Tiefenschieferziegel Rissige_Tiefenschieferfliesen Rissige_Netherziegel "
+    "Rissige_polierte_Schwarzsteinziegel Rissige_Steinziegel Werkbank Creeperkopf Creeper_Wandkopf "
+    "Karmesinknopf Karmesintür Karmesinzaun Karmesinzauntor Karmesinpilz Karmesinhängeschild "
+    "Karmesinhyphen Karmesin_Nezel Karmesinbretter Karmesindruckplatte Karmesinwurzeln Karmesinschild "
+    "Karmesinstufe Karmesintreppe Karmesinstiel Karmesinfalltür Karmesinwandhängeschild "
+    "Karmesinwandschild Weinender_Obsidian Geschnittener_Kupferblock Geschnittene_Kupferstufe "
+    "Geschnittene_Kupfertreppe Geschnittener_roter_Sandstein Geschnittene_rote_Sandsteinstufe "
+    "Geschnittener_Sandstein Geschnittene_Sandsteinstufe Türkises_Banner Türkises_Bett Türkise_Kerze "
+    "Kuchen_mit_türkiser_Kerze Türkiser_Teppich Türkiser_Beton Türkiser_Trockenbeton "
+    "Türkise_glasierte_Keramik Türkise_Shulker_Kiste Türkises_Glas Türkise_Glasscheibe Türkise_Keramik "
+    "Türkise_Wolle Beschädigter_Amboss Löwenzahn Schwarzeichenholzknopf Schwarzeichenholztür "
+    "Schwarzeichenholzzaun Schwarzeichenholzzauntor Schwarzeichenholzhängeschild Schwarzeichenlaub "
+    "Schwarzeichenstamm Schwarzeichenholzbretter Schwarzeichenholzdruckplatte Schwarzeichensetzling "
+    "Schwarzeichenholzschild Schwarzeichenholzstufe Schwarzeichenholztreppe Schwarzeichenholzfalltür "
+    "Schwarzeichenholzwandhängeschild Schwarzeichenholzwandschild Schwarzeichenholz Dunkler_Prismarin "
+    "Dunkle_Prismarinstufe Dunkle_Prismarintreppe Tageslichtsensor Abgestorbene_Hirnkoralle "
+    "Abgestorbener_Hirnkorallenblock Abgestorbener_Hirnkorallenfächer "
+    "Abgestorbener_Hirnkorallenwandfächer Abgestorbene_Blasenkoralle Abgestorbener_Blasenkorallenblock "
+    "Abgestorbener_Blasenkorallenfächer Abgestorbener_Blasenkorallenwandfächer Toter_Busch "
+    "Abgestorbene_Feuerkoralle Abgestorbener_Feuerkorallenblock Abgestorbener_Feuerkorallenfächer "
+    "Abgestorbener_Feuerkorallenwandfächer Abgestorbene_Geweihkoralle Abgestorbener_Geweihkorallenblock "
+    "Abgestorbener_Geweihkorallenfächer Abgestorbener_Geweihkorallenwandfächer Abgestorbene_Orgelkoralle "
+    "Abgestorbener_Orgelkorallenblock Abgestorbener_Orgelkorallenfächer "
+    "Abgestorbener_Orgelkorallenwandfächer Verzierter_Krug Tiefenschiefer Tiefenschieferziegelstufe "
+    "Tiefenschieferziegeltreppe Tiefenschieferziegelmauer Tiefenschieferziegel Tiefenschiefer_Steinkohle "
+    "Tiefenschiefer_Kupfererz Tiefenschiefer_Diamanterz Tiefenschiefer_Smaragderz Tiefenschiefer_Golderz "
+    "Tiefenschiefer_Eisenerz Tiefenschiefer_Lapislazulierz Tiefenschiefer_Redstone_Erz "
+    "Tiefenschieferfliesenstufe Tiefenschieferfliesentreppe Tiefenschieferfliesenmauer "
+    "Tiefenschieferfliesen Sensorschiene Diamantblock Diamanterz Diorit Dioritstufe Diorittreppe "
+    "Dioritmauer Erde Trampelpfad Werfer Drachenei Drachenkopf Drachen_Wandkopf "
+    "Getrockneter_Seetangblock Tropfsteinblock Spender Smaragdblock Smaragderz Zaubertisch "
+    "Endtransitportal Endportal Endportalrahmen Endstab Endstein Endsteinziegelstufe "
+    "Endsteinziegeltreppe Endsteinziegelmauer Endsteinziegel Endertruhe Angelaufener_Kupferblock "
+    "Angelaufener_geschnittener_Kupferblock Angelaufene_geschnittene_Kupferstufe "
+    "Angelaufene_geschnittene_Kupfertreppe Ackerboden Farn Feuer Feuerkoralle Feuerkorallenblock "
+    "Feuerkorallenfächer Feuerkorallenwandfächer Bognertisch Blumentopf Blühende_Azalee "
+    "Blühendes_Azaleenlaub Froschlaich Brüchiges_Eis Ofen Golddurchzogener_Schwarzstein Glas Glasscheibe "
+    "Leuchtflechte Leuchtstein Goldblock Golderz Granit Granitstufe Granittreppe Granitmauer Grasblock "
+    "Kies Graues_Banner Graues_Bett Graue_Kerze Kuchen_mit_grauer_Kerze Grauer_Teppich Grauer_Beton "
+    "Grauer_Trockenbeton Graue_glasierte_Keramik Graue_Shulker_Kiste Graues_Glas Graue_Glasscheibe "
+    "Graue_Keramik Graue_Wolle Grünes_Banner Grünes_Bett Grüne_Kerze Kuchen_mit_grüner_Kerze "
+    "Grüner_Teppich Grüner_Beton Grüner_Trockenbeton Grüne_glasierte_Keramik Grüne_Shulker_Kiste "
+    "Grünes_Glas Grüne_Glasscheibe Grüne_Keramik Grüne_Wolle Schleifstein Hängende_Wurzeln Strohballen "
+    "Grobwägeplatte Honigblock Honigwabenblock Trichter Geweihkoralle Geweihkorallenblock "
+    "Geweihkorallenfächer Geweihkorallenwandfächer Eis Befallene_gemeißelte_Steinziegel "
+    "Befallener_Bruchstein Befallene_rissige_Steinziegel Befallener_Tiefenschiefer "
+    "Befallene_bemooste_Steinziegel Befallener_Stein Befallene_Steinziegel Eisengitter Eisenblock "
+    "Eisentür Eisenerz Eisenfalltür Kürbislaterne Verbundblock Plattenspieler Tropenholzknopf "
+    "Tropenholztür Tropenholzzaun Tropenholzzauntor Tropenholzhängeschild Tropenbaumlaub Tropenbaumstamm "
+    "Tropenholzbretter Tropenholzdruckplatte Tropenbaumsetzling Tropenholzschild Tropenholzstufe "
+    "Tropenholztreppe Tropenholzfalltür Tropenholzwandhängeschild Tropenholzwandschild Tropenholz "
+    "Seetang Seetangstängel Leiter Laterne Lapislazuliblock Lapislazulierz Große_Amethystknospe "
+    "Großer_Farn Lava Lavakessel Lesepult Hebel Lichtblock Hellblaues_Banner Hellblaues_Bett "
+    "Hellblaue_Kerze Kuchen_mit_hellblauer_Kerze Hellblauer_Teppich Hellblauer_Beton "
+    "Hellblauer_Trockenbeton Hellblaue_glasierte_Keramik Hellblaue_Shulker_Kiste Hellblaues_Glas "
+    "Hellblaue_Glasscheibe Hellblaue_Keramik Hellblaue_Wolle Hellgraues_Banner Hellgraues_Bett "
+    "Hellgraue_Kerze Kuchen_mit_hellgrauer_Kerze Hellgrauer_Teppich Hellgrauer_Beton "
+    "Hellgrauer_Trockenbeton Hellgraue_glasierte_Keramik Hellgraue_Shulker_Kiste Hellgraues_Glas "
+    "Hellgraue_Glasscheibe Hellgraue_Keramik Hellgraue_Wolle Feinwägeplatte Blitzableiter Flieder "
+    "Maiglöckchen Seerosenblatt Hellgrünes_Banner Hellgrünes_Bett Hellgrüne_Kerze "
+    "Kuchen_mit_hellgrüner_Kerze Hellgrüner_Teppich Hellgrüner_Beton Hellgrüner_Trockenbeton "
+    "Hellgrüne_glasierte_Keramik Hellgrüne_Shulker_Kiste Hellgrünes_Glas Hellgrüne_Glasscheibe "
+    "Hellgrüne_Keramik Hellgrüne_Wolle Leitstein Webstuhl Magenta_Banner Magenta_Bett Magenta_Kerze "
+    "Kuchen_mit_magenta_Kerze Magenta_Teppich Magenta_Beton Magenta_Trockenbeton "
+    "Magenta_glasierte_Keramik Magenta_Shulker_Kiste Magenta_Glas Magenta_Glasscheibe Magenta_Keramik "
+    "Magenta_Wolle Magmablock Mangrovenholzknopf Mangrovenholztür Mangrovenholzzaun Mangrovenholzzauntor "
+    "Mangrovenholzhängeschild Mangrovenlaub Mangrovenstamm Mangrovenholzbretter Mangrovenholzdruckplatte "
+    "Mangroven_Keimling Mangrovenwurzeln Mangrovenholzschild Mangrovenholzstufe Mangrovenholztreppe "
+    "Mangrovenholzfalltür Mangrovenholzwandhängeschild Mangrovenholzwandschild Mangrovenholz "
+    "Mittlere_Amethystknospe Melone Melonenpflanze Moosblock Moosteppich Bemooster_Bruchstein "
+    "Bemooste_Bruchsteinstufe Bemooste_Bruchsteintreppe Bemooste_Bruchsteinmauer "
+    "Bemooste_Steinziegelstufe Bemooste_Steinziegeltreppe Bemooste_Steinziegelmauer Bemooste_Steinziegel "
+    "Bewegter_Block Schlamm Schlammziegelstufe Schlammziegeltreppe Schlammziegelmauer Schlammziegel "
+    "Schlammige_Mangrovenwurzeln Pilzstiel Myzel Netherziegelzaun Netherziegelstufe Netherziegeltreppe "
+    "Netherziegelmauer Netherziegel Nethergolderz Netherportal Netherquarzerz Nethersprossen "
+    "Netherwarzen Netherwarzenblock Netheritblock Netherrack Notenblock Eichenholzknopf Eichenholztür "
+    "Eichenholzzaun Eichenholzzauntor Eichenholzhängeschild Eichenlaub Eichenstamm Eichenholzbretter "
+    "Eichenholzdruckplatte Eichensetzling Eichenholzschild Eichenholzstufe Eichenholztreppe "
+    "Eichenholzfalltür Eichenholzwandhängeschild Eichenholzwandschild Eichenholz Beobachter Obsidian "
+    "Ockernes_Froschlicht Oranges_Banner Oranges_Bett Orange_Kerze Kuchen_mit_oranger_Kerze "
+    "Oranger_Teppich Oranger_Beton Oranger_Trockenbeton Orange_glasierte_Keramik Orange_Shulker_Kiste "
+    "Oranges_Glas Orange_Glasscheibe Orange_Keramik Orange_Tulpe Orange_Wolle Margerite "
+    "Oxidierter_Kupferblock Oxidierter_geschnittener_Kupferblock Oxidierte_geschnittene_Kupferstufe "
+    "Oxidierte_geschnittene_Kupfertreppe Packeis Fester_Schlamm Perlmutternes_Froschlicht Pfingstrose "
+    "Versteinerte_Eichenholzstufe Piglinkopf Piglin_Wandkopf Rosa_Banner Rosa_Bett Rosa_Kerze "
+    "Kuchen_mit_rosa_Kerze Rosa_Teppich Rosa_Beton Rosa_Trockenbeton Rosa_glasierte_Keramik "
+    "Rosa_Blütenblätter Rosa_Shulker_Kiste Rosa_Glas Rosa_Glasscheibe Rosa_Keramik Rosa_Tulpe Rosa_Wolle "
+    "Kolben Kolbenkopf Spielerkopf Spieler_Wandkopf Podsol Spitzer_Tropfstein Polierter_Andesit "
+    "Polierte_Andesitstufe Polierte_Andesittreppe Polierter_Basalt Polierter_Schwarzstein "
+    "Polierte_Schwarzsteinziegelstufe Polierte_Schwarzsteinziegeltreppe Polierte_Schwarzsteinziegelmauer "
+    "Polierte_Schwarzsteinziegel Polierter_Schwarzsteinknopf Polierte_Schwarzsteindruckplatte "
+    "Polierte_Schwarzsteinstufe Polierte_Schwarzsteintreppe Polierte_Schwarzsteinmauer "
+    "Polierter_Tiefenschiefer Polierte_Tiefenschieferstufe Polierte_Tiefenschiefertreppe "
+    "Polierte_Tiefenschiefermauer Polierter_Diorit Polierte_Dioritstufe Polierte_Diorittreppe "
+    "Polierter_Granit Polierte_Granitstufe Polierte_Granittreppe Mohn Kartoffeln "
+    "Eingetopfter_Akaziensetzling Eingetopfter_Zierlauch Eingetopfte_Azalee "
+    "Eingetopftes_Porzellansternchen Eingetopfter_Bambus Eingetopfter_Birkensetzling "
+    "Eingetopfte_blaue_Orchidee Eingetopfter_brauner_Pilz Eingetopfter_Kaktus "
+    "Eingetopfter_Kirschsetzling Eingetopfte_Kornblume Eingetopfter_Karmesinpilz "
+    "Eingetopfte_Karmesinwurzeln Eingetopfter_Löwenzahn Eingetopfter_Schwarzeichensetzling "
+    "Eingetopfter_toter_Busch Eingetopfter_Farn Eingetopfte_blühende_Azalee "
+    "Eingetopfter_Tropenbaumsetzling Eingetopftes_Maiglöckchen Eingetopfter_Mangroven_Keimling "
+    "Eingetopfter_Eichensetzling Eingetopfte_orange_Tulpe Eingetopfte_Margerite Eingetopfte_rosa_Tulpe "
+    "Eingetopfter_Mohn Eingetopfter_roter_Pilz Eingetopfte_rote_Tulpe Eingetopfter_Fichtensetzling "
+    "Eingetopfte_Fackellilie Eingetopfter_Wirrpilz Eingetopfte_Wirrwurzeln Eingetopfte_weiße_Tulpe "
+    "Eingetopfte_Wither_Rose Pulverschnee Pulverschneekessel Antriebsschiene Prismarin "
+    "Prismarinziegelstufe Prismarinziegeltreppe Prismarinziegel Prismarinstufe Prismarintreppe "
+    "Prismarinmauer Kürbis Kürbispflanze Violettes_Banner Violettes_Bett Violette_Kerze "
+    "Kuchen_mit_violetter_Kerze Violetter_Teppich Violetter_Beton Violetter_Trockenbeton "
+    "Violette_glasierte_Keramik Violette_Shulker_Kiste Violettes_Glas Violette_Glasscheibe "
+    "Violette_Keramik Violette_Wolle Purpurblock Purpursäule Purpurstufe Purpurtreppe Quarzblock "
+    "Quarzziegel Quarzsäule Quarzstufe Quarztreppe Schiene Rohkupferblock Rohgoldblock Roheisenblock "
+    "Rotes_Banner Rotes_Bett Rote_Kerze Kuchen_mit_roter_Kerze Roter_Teppich Roter_Beton "
+    "Roter_Trockenbeton Rote_glasierte_Keramik Roter_Pilz Roter_Pilzblock Rote_Netherziegelstufe "
+    "Rote_Netherziegeltreppe Rote_Netherziegelmauer Rote_Netherziegel Roter_Sand Roter_Sandstein "
+    "Rote_Sandsteinstufe Rote_Sandsteintreppe Rote_Sandsteinmauer Rote_Shulker_Kiste Rotes_Glas "
+    "Rote_Glasscheibe Rote_Keramik Rote_Tulpe Rote_Wolle Redstone_Block Redstone_Lampe Redstone_Erz "
+    "Redstone_Fackel Redstone_Wandfackel Redstone_Leitung Verstärkter_Tiefenschiefer Redstone_Verstärker "
+    "Wiederhol_Befehlsblock Seelenanker Wurzelerde Rosenstrauch Sand Sandstein Sandsteinstufe "
+    "Sandsteintreppe Sandsteinmauer Gerüst Sculk Sculk_Katalysator Sculk_Sensor Sculk_Kreischer "
+    "Sculk_Ader Seelaterne Meeresgurke Seegras Pilzlicht Shulker_Kiste Skelettschädel "
+    "Skelett_Wandschädel Schleimblock Kleine_Amethystknospe Kleines_Tropfblatt Schmiedetisch Räucherofen "
+    "Glatter_Basalt Glatter_Quarzblock Glatte_Quarzstufe Glatte_Quarztreppe Glatter_roter_Sandstein "
+    "Glatte_rote_Sandsteinstufe Glatte_rote_Sandsteintreppe Glatter_Sandstein Glatte_Sandsteinstufe "
+    "Glatte_Sandsteintreppe Glatter_Stein Glatte_Steinstufe Schnee Schneeblock Seelenlagerfeuer "
+    "Seelenfeuer Seelenlaterne Seelensand Seelenerde Seelenfackel Seelenwandfackel Spawner Schwamm "
+    "Sporenblüte Fichtenholzknopf Fichtenholztür Fichtenholzzaun Fichtenholzzauntor "
+    "Fichtenholzhängeschild Fichtennadeln Fichtenstamm Fichtenholzbretter Fichtenholzdruckplatte "
+    "Fichtensetzling Fichtenholzschild Fichtenholzstufe Fichtenholztreppe Fichtenholzfalltür "
+    "Fichtenholzwandhängeschild Fichtenholzwandschild Fichtenholz Klebriger_Kolben Stein "
+    "Steinziegelstufe Steinziegeltreppe Steinziegelmauer Steinziegel Steinknopf Steindruckplatte "
+    "Steinstufe Steintreppe Steinsäge Entrindeter_Akazienstamm Entrindetes_Akazienholz "
+    "Geschälter_Bambusblock Entrindeter_Birkenstamm Entrindetes_Birkenholz Entrindeter_Kirschstamm "
+    "Entrindetes_Kirschholz Geschälte_Karmesinhyphen Geschälter_Karmesinstiel "
+    "Entrindeter_Schwarzeichenstamm Entrindetes_Schwarzeichenholz Entrindeter_Tropenbaumstamm "
+    "Entrindetes_Tropenholz Entrindeter_Mangrovenstamm Entrindetes_Mangrovenholz Entrindeter_Eichenstamm "
+    "Entrindetes_Eichenholz Entrindeter_Fichtenstamm Entrindetes_Fichtenholz Geschälte_Wirrhyphen "
+    "Geschälter_Wirrstiel Konstruktionsblock Konstruktionsleere Zuckerrohr Sonnenblume Seltsamer_Sand "
+    "Süßbeerstrauch Hohes_Gras Hohes_Seegras Zielblock Keramik Getöntes_Glas TNT Fackel Fackellilie "
+    "Fackellilienpflanze Redstone_Truhe Stolperdraht Haken Orgelkoralle Orgelkorallenblock "
+    "Orgelkorallenfächer Orgelkorallenwandfächer Tuffstein Schildkrötenei Zwirbelranken "
+    "Zwirbelrankenpflanze Junggrünes_Froschlicht Ranken Leerenluft Wandfackel Wirrknopf Wirrtür Wirrzaun "
+    "Wirrzauntor Wirrpilz Wirrhängeschild Wirrhyphen Wirr_Nezel Wirrbretter Wirrdruckplatte Wirrwurzeln "
+    "Wirrschild Wirrstufe Wirrtreppe Wirrstiel Wirrfalltür Wirrwandhängeschild Wirrwandschild "
+    "Wirrwarzenblock Wasser Wasserkessel Gewachster_Kupferblock Gewachster_geschnittener_Kupferblock "
+    "Gewachste_geschnittene_Kupferstufe Gewachste_geschnittene_Kupfertreppe "
+    "Gewachster_angelaufener_Kupferblock Gewachster_angelaufener_geschnittener_Kupferblock "
+    "Gewachste_angelaufene_geschnittene_Kupferstufe Gewachste_angelaufene_geschnittene_Kupfertreppe "
+    "Gewachster_oxidierter_Kupferblock Gewachster_oxidierter_geschnittener_Kupferblock "
+    "Gewachste_oxidierte_geschnittene_Kupferstufe Gewachste_oxidierte_geschnittene_Kupfertreppe "
+    "Gewachster_verwitterter_Kupferblock Gewachster_verwitterter_geschnittener_Kupferblock "
+    "Gewachste_verwitterte_geschnittene_Kupferstufe Gewachste_verwitterte_geschnittene_Kupfertreppe "
+    "Verwitterter_Kupferblock Verwitterter_geschnittener_Kupferblock "
+    "Verwitterte_geschnittene_Kupferstufe Verwitterte_geschnittene_Kupfertreppe Trauerranken "
+    "Trauerrankenpflanze Nasser_Schwamm Weizenpflanze Weißes_Banner Weißes_Bett Weiße_Kerze "
+    "Kuchen_mit_weißer_Kerze Weißer_Teppich Weißer_Beton Weißer_Trockenbeton Weiße_glasierte_Keramik "
+    "Weiße_Shulker_Kiste Weißes_Glas Weiße_Glasscheibe Weiße_Keramik Weiße_Tulpe Weiße_Wolle Wither_Rose "
+    "Witherskelettschädel Witherskelett_Wandschädel Gelbes_Banner Gelbes_Bett Gelbe_Kerze "
+    "Kuchen_mit_gelber_Kerze Gelber_Teppich Gelber_Beton Gelber_Trockenbeton Gelbe_glasierte_Keramik "
+    "Gelbe_Shulker_Kiste Gelbes_Glas Gelbe_Glasscheibe Gelbe_Keramik Gelbe_Wolle Zombiekopf "
+    "Zombie_Wandkopf Akazienholzboot Akazienholztruhenboot Hilfsgeist_Spawn_Ei Amethystscherbe Apfel "
+    "Rüstungsständer Pfeil Axolotleimer Axolotl_Spawn_Ei Ofenkartoffel Bambus_Truhenfloß Bambusfloß "
+    "Fledermaus_Spawn_Ei Bienen_Spawn_Ei Rohes_Rindfleisch Rote_Bete_Samen Borschtsch Birkenholzboot "
+    "Birkenholztruhenboot Schwarzer_Farbstoff Lohenstaub Lohenrute Lohen_Spawn_Ei Blauer_Farbstoff "
+    "Knochen Knochenmehl Buch Bogen Schüssel Brot Ziegel Brauner_Farbstoff Pinsel Eimer Bündel "
+    "Dromedar_Spawn_Ei Karotte Karottenrute Katzen_Spawn_Ei Höhlenspinnen_Spawn_Ei Kettenstiefel "
+    "Kettenhemd Kettenhaube Kettenhose Holzkohle Kirschholzboot Kirschholztruhenboot Güterlore "
+    "Rohes_Hühnchen Huhn_Spawn_Ei Chorusfrucht Tonklumpen Uhr Kohle Kakaobohnen Roher_Kabeljau "
+    "Kabeljaueimer Kabeljau_Spawn_Ei Befehlsblocklore Kompass Steak Gebratenes_Hühnchen "
+    "Gebratener_Kabeljau Gebratenes_Hammelfleisch Gebratenes_Schweinefleisch Gebratenes_Kaninchen "
+    "Gebratener_Lachs Keks Kupferbarren Kuh_Spawn_Ei Bannervorlage Creeper_Spawn_Ei Armbrust "
+    "Türkiser_Farbstoff Schwarzeichenholzboot Schwarzeichenholztruhenboot Debug_Stab Diamant Diamantaxt "
+    "Diamantstiefel Diamantharnisch Diamanthelm Diamanthacke Diamantener_Rossharnisch Diamantbeinschutz "
+    "Diamantspitzhacke Diamantschaufel Diamantschwert Plattenbruchstück Delfin_Spawn_Ei Esel_Spawn_Ei "
+    "Drachenatem Getrockneter_Seetang Ertrunkenen_Spawn_Ei Echoscherbe Ei Großer_Wächter_Spawn_Ei "
+    "Elytren Smaragd Verzaubertes_Buch Verzauberter_goldener_Apfel Enderkristall Enderdrachen_Spawn_Ei "
+    "Enderauge Enderperle Enderman_Spawn_Ei Endermiten_Spawn_Ei Magier_Spawn_Ei Erfahrungsfläschchen "
+    "Feder Fermentiertes_Spinnenauge Karte Feuerkugel Feuerwerksrakete Feuerwerksstern Angel Feuerstein "
+    "Feuerzeug Fuchs_Spawn_Ei Frosch_Spawn_Ei Ofenlore Ghast_Spawn_Ei Ghast_Träne Glasflasche "
+    "Glitzernde_Melonenscheibe Leuchtbeeren Leuchttintenbeutel Leuchtrahmen Leuchttintenfisch_Spawn_Ei "
+    "Leuchtsteinstaub Bockshorn Ziegen_Spawn_Ei Goldbarren Goldklumpen Goldener_Apfel Goldaxt "
+    "Goldstiefel Goldene_Karotte Goldharnisch Goldhelm Goldhacke Goldener_Rossharnisch Goldbeinschutz "
+    "Goldspitzhacke Goldschaufel Goldschwert Grauer_Farbstoff Grüner_Farbstoff Wächter_Spawn_Ei "
+    "Schwarzpulver Herz_des_Meeres Hoglin_Spawn_Ei Honigflasche Honigwabe Trichterlore Pferde_Spawn_Ei "
+    "Wüstenzombie_Spawn_Ei Tintenbeutel Eisenaxt Eisenstiefel Eisenharnisch Eisengolem_Spawn_Ei "
+    "Eisenhelm Eisenhacke Eiserner_Rossharnisch Eisenbarren Eisenbeinschutz Eisenklumpen Eisenspitzhacke "
+    "Eisenschaufel Eisenschwert Rahmen Tropenholzboot Tropenholztruhenboot Buch_des_Wissens Lapislazuli "
+    "Lavaeimer Leine Leder Lederstiefel Lederjacke Lederkappe Lederner_Rossharnisch Lederhose "
+    "Hellblauer_Farbstoff Hellgrauer_Farbstoff Hellgrüner_Farbstoff Verweiltrank Lama_Spawn_Ei "
+    "Magenta_Farbstoff Magmacreme Magmawürfel_Spawn_Ei Mangrovenholzboot Mangrovenholztruhenboot "
+    "Leere_Karte Melonenkerne Melonenscheibe Milcheimer Lore Mooshroom_Spawn_Ei Maultier_Spawn_Ei "
+    "Pilzsuppe Schallplatte Rohes_Hammelfleisch Namensschild Nautilusschale Netherstern Netherwarze "
+    "Netheritaxt Netheritstiefel Netheritharnisch Netherithelm Netherithacke Netheritbarren "
+    "Netheritbeinschutz Netheritspitzhacke Netheritplatten Netheritschaufel Netheritschwert "
+    "Eichenholzboot Eichenholztruhenboot Ozelot_Spawn_Ei Oranger_Farbstoff Gemälde Panda_Spawn_Ei Papier "
+    "Papageien_Spawn_Ei Phantomhaut Phantom_Spawn_Ei Schweine_Spawn_Ei Piglin_Barbaren_Spawn_Ei "
+    "Piglin_Spawn_Ei Plünderer_Spawn_Ei Rosa_Farbstoff Giftige_Kartoffel Eisbären_Spawn_Ei "
+    "Geplatzte_Chorusfrucht Rohes_Schweinefleisch Kartoffel Trank Pulverschneeeimer Prismarinkristalle "
+    "Prismarinscherbe Kugelfisch Kugelfischeimer Kugelfisch_Spawn_Ei Kürbiskuchen Kürbiskerne "
+    "Violetter_Farbstoff Netherquarz Rohes_Kaninchen Hasenpfote Kaninchenfell Kaninchen_Spawn_Ei "
+    "Kaninchenragout Verwüster_Spawn_Ei Rohkupfer Rohgold Roheisen Bergungskompass Roter_Farbstoff "
+    "Redstone_Staub Verrottetes_Fleisch Sattel Roher_Lachs Lachseimer Lachs_Spawn_Ei Schere "
+    "Schafs_Spawn_Ei Schild Shulker_Schale Shulker_Spawn_Ei Silberfischchen_Spawn_Ei "
+    "Skelettpferde_Spawn_Ei Skelett_Spawn_Ei Schleimball Schleim_Spawn_Ei Schnüffler_Spawn_Ei "
+    "Schneegolem_Spawn_Ei Schneeball Spektralpfeil Spinnenauge Spinnen_Spawn_Ei Wurftrank "
+    "Fichtenholzboot Fichtenholztruhenboot Fernrohr Tintenfisch_Spawn_Ei Stock Steinaxt Steinhacke "
+    "Steinspitzhacke Steinschaufel Steinschwert Eiswanderer_Spawn_Ei Schreiter_Spawn_Ei Faden Zucker "
+    "Seltsame_Suppe Süßbeeren Kaulquappeneimer Kaulquappen_Spawn_Ei Getränkter_Pfeil TNT_Lore "
+    "Fackelliliensamen Totem_der_Unsterblichkeit Händlerlama_Spawn_Ei Dreizack Tropenfisch "
+    "Tropenfischeimer Tropenfisch_Spawn_Ei Schildkrötenpanzer Schildkröten_Spawn_Ei "
+    "Plagegeister_Spawn_Ei Dorfbewohner_Spawn_Ei Diener_Spawn_Ei Fahrender_Händler_Spawn_Ei "
+    "Wärter_Spawn_Ei Wirrpilzrute Wassereimer Weizen Weizenkörner Weißer_Farbstoff Hexen_Spawn_Ei "
+    "Witherskelett_Spawn_Ei Wither_Spawn_Ei Wolfs_Spawn_Ei Holzaxt Holzhacke Holzspitzhacke Holzschaufel "
+    "Holzschwert Buch_und_Feder Beschriebenes_Buch Gelber_Farbstoff Zoglin_Spawn_Ei "
+    "Zombiepferde_Spawn_Ei Zombie_Spawn_Ei Zombiedorfbewohner_Spawn_Ei Zombifizierter_Piglin_Spawn_Ei "
+).split()
 
-class MaterialSammlung(Enum):
+_ORDINALE = [
+    int(ordinal)
+    for ordinal in (
+        "0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25 26 27 28 29 30 31 32 33 34 35 "
+        "36 37 38 39 40 41 42 43 44 45 46 47 48 49 50 51 52 53 54 55 56 57 58 59 60 61 62 63 64 65 66 67 68 "
+        "69 70 71 72 73 74 75 76 77 78 79 80 81 82 83 84 85 86 87 88 89 90 91 92 93 94 95 96 97 98 99 100 "
+        "101 102 103 104 105 106 107 108 109 110 111 112 113 114 115 116 117 118 119 120 121 122 123 124 125 "
+        "126 127 128 129 130 131 132 133 134 135 136 137 138 139 140 141 142 143 144 145 146 147 148 149 150 "
+        "151 152 153 154 155 156 157 158 159 160 161 162 163 164 165 166 167 168 169 170 171 172 173 174 175 "
+        "176 177 178 179 180 181 182 183 184 185 186 187 188 189 190 191 192 193 194 195 196 197 198 199 200 "
+        "201 202 203 204 205 206 207 208 209 210 211 212 213 214 215 216 217 218 219 220 221 222 223 224 225 "
+        "226 227 228 229 230 231 232 233 234 235 236 237 238 239 240 241 242 243 244 245 246 247 248 249 250 "
+        "251 252 253 254 255 256 257 258 259 260 261 262 263 264 265 266 267 268 269 270 271 272 273 274 275 "
+        "276 277 278 279 280 281 282 283 284 285 286 287 288 289 290 291 292 293 294 295 296 297 298 299 300 "
+        "301 302 303 304 305 306 307 308 309 310 311 312 313 314 315 316 317 318 319 320 321 322 323 324 325 "
+        "326 327 328 329 330 331 332 333 334 335 336 337 338 339 340 341 342 343 344 345 346 347 348 349 350 "
+        "351 352 353 354 355 356 357 358 359 360 361 362 363 364 365 366 367 368 369 370 371 372 373 374 375 "
+        "376 377 378 379 380 381 382 383 384 385 386 387 388 389 390 391 392 393 394 395 396 397 398 399 400 "
+        "401 402 403 404 405 406 407 408 409 410 411 412 413 414 415 416 417 418 419 420 421 422 423 424 425 "
+        "426 427 428 429 430 431 432 433 434 435 436 437 438 439 440 441 442 443 444 445 446 447 448 449 450 "
+        "451 452 453 454 455 456 457 458 459 460 461 462 463 464 465 466 467 468 469 470 471 472 473 474 475 "
+        "476 477 478 479 480 481 482 483 484 485 486 487 488 489 490 491 492 493 494 495 496 497 498 499 500 "
+        "501 502 503 504 505 506 507 508 509 510 511 512 513 514 515 516 517 518 519 520 521 522 523 524 525 "
+        "526 527 528 529 530 531 532 533 534 535 536 537 538 539 540 541 542 543 544 545 546 547 548 549 550 "
+        "551 552 553 554 555 556 557 558 559 560 561 562 563 564 565 566 567 568 569 570 571 572 573 574 575 "
+        "576 577 578 579 580 581 582 583 584 585 586 587 588 589 590 591 592 593 594 595 596 597 598 599 600 "
+        "601 602 603 604 605 606 607 608 609 610 611 612 613 614 615 616 617 618 619 620 621 622 623 624 625 "
+        "626 627 628 629 630 631 632 633 634 635 636 637 638 639 640 641 642 643 644 645 646 647 648 649 650 "
+        "651 652 653 654 655 656 657 658 659 660 661 662 663 664 665 666 667 668 669 670 671 672 673 674 675 "
+        "676 677 678 679 680 681 682 683 684 685 686 687 688 689 690 691 692 693 694 695 696 697 698 699 700 "
+        "701 702 703 704 705 706 707 708 709 710 711 712 713 714 715 716 717 718 719 720 721 722 723 724 725 "
+        "726 727 728 729 730 731 732 733 734 735 736 737 738 739 740 741 742 743 744 745 746 747 748 749 750 "
+        "751 752 753 754 755 756 757 758 759 760 761 762 763 764 765 766 767 768 769 770 771 772 773 774 775 "
+        "776 777 778 779 780 781 782 783 784 785 786 787 788 789 790 791 792 793 794 795 796 797 798 799 800 "
+        "801 802 803 804 805 806 807 808 809 810 811 812 813 814 815 816 817 818 819 820 821 822 823 824 825 "
+        "826 827 828 829 830 831 832 833 834 835 836 837 838 839 840 841 842 843 844 845 846 847 848 849 850 "
+        "851 852 853 854 855 856 857 858 859 860 861 862 863 864 865 866 867 868 869 870 871 872 873 874 875 "
+        "876 877 878 879 880 881 882 883 884 885 886 887 888 889 890 891 892 893 894 895 896 897 898 899 900 "
+        "901 902 903 904 905 906 907 908 909 910 911 912 913 914 915 916 917 918 919 920 921 922 923 924 925 "
+        "926 927 928 929 930 931 932 933 934 935 936 937 938 939 940 941 942 943 944 945 946 947 948 949 950 "
+        "951 952 953 954 955 956 957 958 959 960 961 962 963 964 965 966 967 968 969 970 971 972 973 974 975 "
+        "976 977 978 979 980 981 982 983 984 985 986 987 988 989 990 991 992 993 994 995 997 998 999 1000 "
+        "1001 1002 1003 1004 1005 1006 1007 1008 1009 1010 1011 1012 1013 1014 1015 1016 1017 1018 1019 1020 "
+        "1021 1022 1023 1024 1025 1026 1027 1028 1029 1030 1031 1032 1033 1034 1035 1036 1037 1038 1039 1040 "
+        "1041 1042 1043 1044 1045 1046 1047 1048 1049 1050 1051 1052 1053 1054 1055 1056 1057 1058 1059 1060 "
+        "1061 1062 1063 1064 1065 1066 1067 1068 1069 1070 1071 1072 1073 1074 1075 1076 1077 1078 1079 1080 "
+        "1081 1082 1083 1084 1085 1086 1087 1088 1089 1090 1091 1092 1093 1094 1095 1096 1097 1098 1099 1101 "
+        "1102 1103 1104 1105 1106 1107 1109 1110 1111 1112 1113 1114 1115 1116 1117 1118 1119 1120 1121 1122 "
+        "1123 1124 1125 1126 1127 1128 1129 1130 1131 1132 1133 1134 1135 1136 1137 1138 1139 1140 1141 1142 "
+        "1143 1144 1145 1146 1147 1148 1149 1150 1151 1152 1153 1154 1155 1156 1157 1158 1159 1160 1161 1162 "
+        "1163 1164 1165 1166 1167 1168 1169 1170 1171 1172 1173 1174 1175 1176 1177 1178 1179 1180 1181 1182 "
+        "1184 1185 1186 1187 1202 1203 1204 1206 571 1207 1208 1209 1210 1211 1212 1213 1214 1215 1216 1217 "
+        "1218 1219 1220 1221 1222 1223 1224 1225 1226 1227 1228 1230 1231 1232 1233 1234 1235 1236 1237 1238 "
+        "1239 1240 1241 1242 1243 1244 1245 1246 1247 1248 1249 1250 1251 1252 1253 1254 1255 1256 1257 1258 "
+        "1259 1260 1261 1262 1263 1264 1265 1266 1267 1268 1269 1270 1271 1272 1273 1274 1276 1277 1278 1279 "
+        "1280 1281 1282 1283 1284 1285 1286 1287 1288 1289 1290 1291 1292 1293 1294 1295 1296 1297 1298 1299 "
+        "1300 1301 1302 1303 1304 1305 1306 1307 1308 1309 1310 1311 1312 1313 1314 1315 1316 1317 1318 1319 "
+        "1320 948 1321 1322 1323 1324 1325 1326 1327 1328 1329 1330 1331 1332 1333 1334 1335 1336 1337 1338 "
+        "1339 "
+    ).split()
+]
+""" Ordinalzahl des englischen Members mit demselben Wert, für jeden Namen """
+
+
+class MaterialSammlung(
+    CompactEnum,
+    names=_NAMEN,
+    values=[_Collection.from_ordinal(ordinal).value for ordinal in _ORDINALE],
+    ordinals=_ORDINALE,
+):
 
     @staticmethod
     def von_englisch(e: _Collection) -> Optional["MaterialSammlung"]:
         try:
-            return MaterialSammlung._value2member_map_[e.value]
-        except (KeyError, AttributeError):
+            return MaterialSammlung._by_ordinal_[e.ordinal]
+        except (IndexError, AttributeError):
             return None
 
     def zu_englisch(self) -> Optional[_Collection]:
-        try:
-            return _Collection._value2member_map_[self.value]
-        except (KeyError, AttributeError):
-            return None
+        return _Collection._by_ordinal_[self._ordinal_]
+
 
-    Akazienholzknopf = "ACACIA_BUTTON"
-    Akazienholztür = "ACACIA_DOOR"
-    Akazienholzzaun = "ACACIA_FENCE"
-    Akazienholzzauntor = "ACACIA_FENCE_GATE"
-    Akazienholzhängeschild = "ACACIA_HANGING_SIGN"
-    Akazienlaub = "ACACIA_LEAVES"
-    Akazienstamm = "ACACIA_LOG"
-    Akazienholzbretter = "ACACIA_PLANKS"
-    Akazienholzdruckplatte = "ACACIA_PRESSURE_PLATE"
-    Akaziensetzling = "ACACIA_SAPLING"
-    Akazienholzschild = "ACACIA_SIGN"
-    Akazienholzstufe = "ACACIA_SLAB"
-    Akazienholztreppe = "ACACIA_STAIRS"
-    Akazienholzfalltür = "ACACIA_TRAPDOOR"
-    Akazienholzwandhängeschild = "ACACIA_WALL_HANGING_SIGN"
-    Akazienholzwandschild = "ACACIA_WALL_SIGN"
-    Akazienholz = "ACACIA_WOOD"
-    Aktivierungsschiene = "ACTIVATOR_RAIL"
-    Luft = "AIR"
-    Zierlauch = "ALLIUM"
-    Amethystblock = "AMETHYST_BLOCK"
-    Amethysthaufen = "AMETHYST_CLUSTER"
-    Antiker_Schrott = "ANCIENT_DEBRIS"
-    Andesit = "ANDESITE"
-    Andesitstufe = "ANDESITE_SLAB"
-    Andesittreppe = "ANDESITE_STAIRS"
-    Andesitmauer = "ANDESITE_WALL"
-    Amboss = "ANVIL"
-    Melonenranke = "ATTACHED_MELON_STEM"
-    Kürbisranke = "ATTACHED_PUMPKIN_STEM"
-    Azalee = "AZALEA"
-    Azaleenlaub = "AZALEA_LEAVES"
-    Porzellansternchen = "AZURE_BLUET"
-    Bambus = "BAMBOO"
-    Bambusblock = "BAMBOO_BLOCK"
-    Bambusknopf = "BAMBOO_BUTTON"
-    Bambustür = "BAMBOO_DOOR"
-    Bambuszaun = "BAMBOO_FENCE"
-    Bambuszauntor = "BAMBOO_FENCE_GATE"
-    Bambushängeschild = "BAMBOO_HANGING_SIGN"
-    Bambusmosaik = "BAMBOO_MOSAIC"
-    Bambusmosaikstufe = "BAMBOO_MOSAIC_SLAB"
-    Bambusmosaiktreppe = "BAMBOO_MOSAIC_STAIRS"
-    Bambusbretter = "BAMBOO_PLANKS"
-    Bambusdruckplatte = "BAMBOO_PRESSURE_PLATE"
-    Bambussprössling = "BAMBOO_SAPLING"
-    Bambusschild = "BAMBOO_SIGN"
-    Bambusstufe = "BAMBOO_SLAB"
-    Bambustreppe = "BAMBOO_STAIRS"
-    Bambusfalltür = "BAMBOO_TRAPDOOR"
-    Bambuswandhängeschild = "BAMBOO_WALL_HANGING_SIGN"
-    Bambuswandschild = "BAMBOO_WALL_SIGN"
-    Fass = "BARREL"
-    Barriere = "BARRIER"
-    Basalt = "BASALT"
-    Leuchtfeuer = "BEACON"
-    Grundgestein = "BEDROCK"
-    Bienennest = "BEE_NEST"
-    Bienenstock = "BEEHIVE"
-    Rote_Bete = "BEETROOTS"
-    Glocke = "BELL"
-    Großes_Tropfblatt = "BIG_DRIPLEAF"
-    Großer_Tropfblattstiel = "BIG_DRIPLEAF_STEM"
-    Birkenholzknopf = "BIRCH_BUTTON"
-    Birkenholztür = "BIRCH_DOOR"
-    Birkenholzzaun = "BIRCH_FENCE"
-    Birkenholzzauntor = "BIRCH_FENCE_GATE"
-    Birkenholzhängeschild = "BIRCH_HANGING_SIGN"
-    Birkenlaub = "BIRCH_LEAVES"
-    Birkenstamm = "BIRCH_LOG"
-    Birkenholzbretter = "BIRCH_PLANKS"
-    Birkenholzdruckplatte = "BIRCH_PRESSURE_PLATE"
-    Birkensetzling = "BIRCH_SAPLING"
-    Birkenholzschild = "BIRCH_SIGN"
-    Birkenholzstufe = "BIRCH_SLAB"
-    Birkenholztreppe = "BIRCH_STAIRS"
-    Birkenholzfalltür = "BIRCH_TRAPDOOR"
-    Birkenholzwandhängeschild = "BIRCH_WALL_HANGING_SIGN"
-    Birkenholzwandschild = "BIRCH_WALL_SIGN"
-    Birkenholz = "BIRCH_WOOD"
-    Schwarzes_Banner = "BLACK_BANNER"
-    Schwarzes_Bett = "BLACK_BED"
-    Schwarze_Kerze = "BLACK_CANDLE"
-    Kuchen_mit_schwarzer_Kerze = "BLACK_CANDLE_CAKE"
-    Schwarzer_Teppich = "BLACK_CARPET"
-    Schwarzer_Beton = "BLACK_CONCRETE"
-    Schwarzer_Trockenbeton = "BLACK_CONCRETE_POWDER"
-    Schwarze_glasierte_Keramik = "BLACK_GLAZED_TERRACOTTA"
-    Schwarze_Shulker_Kiste = "BLACK_SHULKER_BOX"
-    Schwarzes_Glas = "BLACK_STAINED_GLASS"
-    Schwarze_Glasscheibe = "BLACK_STAINED_GLASS_PANE"
-    Schwarze_Keramik = "BLACK_TERRACOTTA"
-    Schwarze_Wolle = "BLACK_WOOL"
-    Schwarzstein = "BLACKSTONE"
-    Schwarzsteinstufe = "BLACKSTONE_SLAB"
-    Schwarzsteintreppe = "BLACKSTONE_STAIRS"
-    Schwarzsteinmauer = "BLACKSTONE_WALL"
-    Schmelzofen = "BLAST_FURNACE"
-    Blaues_Banner = "BLUE_BANNER"
-    Blaues_Bett = "BLUE_BED"
-    Blaue_Kerze = "BLUE_CANDLE"
-    Kuchen_mit_blauer_Kerze = "BLUE_CANDLE_CAKE"
-    Blauer_Teppich = "BLUE_CARPET"
-    Blauer_Beton = "BLUE_CONCRETE"
-    Blauer_Trockenbeton = "BLUE_CONCRETE_POWDER"
-    Blaue_glasierte_Keramik = "BLUE_GLAZED_TERRACOTTA"
-    Blaueis = "BLUE_ICE"
-    Blaue_Orchidee = "BLUE_ORCHID"
-    Blaue_Shulker_Kiste = "BLUE_SHULKER_BOX"
-    Blaues_Glas = "BLUE_STAINED_GLASS"
-    Blaue_Glasscheibe = "BLUE_STAINED_GLASS_PANE"
-    Blaue_Keramik = "BLUE_TERRACOTTA"
-    Blaue_Wolle = "BLUE_WOOL"
-    Knochenblock = "BONE_BLOCK"
-    Bücherregal = "BOOKSHELF"
-    Hirnkoralle = "BRAIN_CORAL"
-    Hirnkorallenblock = "BRAIN_CORAL_BLOCK"
-    Hirnkorallenfächer = "BRAIN_CORAL_FAN"
-    Hirnkorallenwandfächer = "BRAIN_CORAL_WALL_FAN"
-    Braustand = "BREWING_STAND"
-    Ziegelstufe = "BRICK_SLAB"
-    Ziegeltreppe = "BRICK_STAIRS"
-    Ziegelsteinmauer = "BRICK_WALL"
-    Ziegelsteine = "BRICKS"
-    Braunes_Banner = "BROWN_BANNER"
-    Braunes_Bett = "BROWN_BED"
-    Braune_Kerze = "BROWN_CANDLE"
-    Kuchen_mit_brauner_Kerze = "BROWN_CANDLE_CAKE"
-    Brauner_Teppich = "BROWN_CARPET"
-    Brauner_Beton = "BROWN_CONCRETE"
-    Brauner_Trockenbeton = "BROWN_CONCRETE_POWDER"
-    Braune_glasierte_Keramik = "BROWN_GLAZED_TERRACOTTA"
-    Brauner_Pilz = "BROWN_MUSHROOM"
-    Brauner_Pilzblock = "BROWN_MUSHROOM_BLOCK"
-    Braune_Shulker_Kiste = "BROWN_SHULKER_BOX"
-    Braunes_Glas = "BROWN_STAINED_GLASS"
-    Braune_Glasscheibe = "BROWN_STAINED_GLASS_PANE"
-    Braune_Keramik = "BROWN_TERRACOTTA"
-    Braune_Wolle = "BROWN_WOOL"
-    Blasensäule = "BUBBLE_COLUMN"
-    Blasenkoralle = "BUBBLE_CORAL"
-    Blasenkorallenblock = "BUBBLE_CORAL_BLOCK"
-    Blasenkorallenfächer = "BUBBLE_CORAL_FAN"
-    Blasenkorallenwandfächer = "BUBBLE_CORAL_WALL_FAN"
-    Amethystknospenblock = "BUDDING_AMETHYST"
-    Kaktus = "CACTUS"
-    Kuchen = "CAKE"
-    Kalzit = "CALCITE"
-    Lagerfeuer = "CAMPFIRE"
-    Kerze = "CANDLE"
-    Kuchen_mit_Kerze = "CANDLE_CAKE"
-    Karotten = "CARROTS"
-    Kartentisch = "CARTOGRAPHY_TABLE"
-    Geschnitzter_Kürbis = "CARVED_PUMPKIN"
-    Kessel = "CAULDRON"
-    Höhlenluft = "CAVE_AIR"
-    Höhlenranken = "CAVE_VINES"
-    Höhlenrankenpflanze = "CAVE_VINES_PLANT"
-    Kette = "CHAIN"
-    Ketten_Befehlsblock = "CHAIN_COMMAND_BLOCK"
-    Kirschholzknopf = "CHERRY_BUTTON"
-    Kirschholztür = "CHERRY_DOOR"
-    Kirschholzzaun = "CHERRY_FENCE"
-    Kirschholzzauntor = "CHERRY_FENCE_GATE"
-    Kirschholzhängeschild = "CHERRY_HANGING_SIGN"
-    Kirschlaub = "CHERRY_LEAVES"
-    Kirschstamm = "CHERRY_LOG"
-    Kirschholzbretter = "CHERRY_PLANKS"
-    Kirschholzdruckplatte = "CHERRY_PRESSURE_PLATE"
-    Kirschsetzling = "CHERRY_SAPLING"
-    Kirschholzschild = "CHERRY_SIGN"
-    Kirschholzstufe = "CHERRY_SLAB"
-    Kirschholztreppe = "CHERRY_STAIRS"
-    Kirschholzfalltür = "CHERRY_TRAPDOOR"
-    Kirschholzwandhängeschild = "CHERRY_WALL_HANGING_SIGN"
-    Kirschholzwandschild = "CHERRY_WALL_SIGN"
-    Kirschholz = "CHERRY_WOOD"
-    Truhe = "CHEST"
-    Angeschlagener_Amboss = "CHIPPED_ANVIL"
-    Gearbeitetes_Bücherregal = "CHISELED_BOOKSHELF"
-    Gemeißelter_Tiefenschiefer = "CHISELED_DEEPSLATE"
-    Gemeißelte_Netherziegel = "CHISELED_NETHER_BRICKS"
-    Gemeißelter_polierter_Schwarzstein = "CHISELED_POLISHED_BLACKSTONE"
-    Gemeißelter_Quarzblock = "CHISELED_QUARTZ_BLOCK"
-    Gemeißelter_roter_Sandstein = "CHISELED_RED_SANDSTONE"
-    Gemeißelter_Sandstein = "CHISELED_SANDSTONE"
-    Gemeißelte_Steinziegel = "CHISELED_STONE_BRICKS"
-    Chorusblüte = "CHORUS_FLOWER"
-    Choruspflanze = "CHORUS_PLANT"
-    Ton = "CLAY"
-    Kohleblock = "COAL_BLOCK"
-    Steinkohle = "COAL_ORE"
-    Grobe_Erde = "COARSE_DIRT"
-    Bruchtiefenschiefer = "COBBLED_DEEPSLATE"
-    Bruchtiefenschieferstufe = "COBBLED_DEEPSLATE_SLAB"
-    Bruchtiefenschiefertreppe = "COBBLED_DEEPSLATE_STAIRS"
-    Bruchtiefenschiefermauer = "COBBLED_DEEPSLATE_WALL"
-    Bruchstein = "COBBLESTONE"
-    Bruchsteinstufe = "COBBLESTONE_SLAB"
-    Bruchsteintreppe = "COBBLESTONE_STAIRS"
-    Bruchsteinmauer = "COBBLESTONE_WALL"
-    Spinnennetz = "COBWEB"
-    Kakao = "COCOA"
-    Befehlsblock = "COMMAND_BLOCK"
-    Redstone_Komparator = "COMPARATOR"
-    Komposter = "COMPOSTER"
-    Aquisator = "CONDUIT"
-    Kupferblock = "COPPER_BLOCK"
-    Kupfererz = "COPPER_ORE"
-    Kornblume = "CORNFLOWER"
-    Rissige_Tiefenschieferziegel = "CRACKED_DEEPSLATE_BRICKS"
-    Rissige_Tiefenschieferfliesen = "CRACKED_DEEPSLATE_TILES"
-    Rissige_Netherziegel = "CRACKED_NETHER_BRICKS"
-    Rissige_polierte_Schwarzsteinziegel = "CRACKED_POLISHED_BLACKSTONE_BRICKS"
-    Rissige_Steinziegel = "CRACKED_STONE_BRICKS"
-    Werkbank = "CRAFTING_TABLE"
-    Creeperkopf = "CREEPER_HEAD"
-    Creeper_Wandkopf = "CREEPER_WALL_HEAD"
-    Karmesinknopf = "CRIMSON_BUTTON"
-    Karmesintür = "CRIMSON_DOOR"
-    Karmesinzaun = "CRIMSON_FENCE"
-    Karmesinzauntor = "CRIMSON_FENCE_GATE"
-    Karmesinpilz = "CRIMSON_FUNGUS"
-    Karmesinhängeschild = "CRIMSON_HANGING_SIGN"
-    Karmesinhyphen = "CRIMSON_HYPHAE"
-    Karmesin_Nezel = "CRIMSON_NYLIUM"
-    Karmesinbretter = "CRIMSON_PLANKS"
-    Karmesindruckplatte = "CRIMSON_PRESSURE_PLATE"
-    Karmesinwurzeln = "CRIMSON_ROOTS"
-    Karmesinschild = "CRIMSON_SIGN"
-    Karmesinstufe = "CRIMSON_SLAB"
-    Karmesintreppe = "CRIMSON_STAIRS"
-    Karmesinstiel = "CRIMSON_STEM"
-    Karmesinfalltür = "CRIMSON_TRAPDOOR"
-    Karmesinwandhängeschild = "CRIMSON_WALL_HANGING_SIGN"
-    Karmesinwandschild = "CRIMSON_WALL_SIGN"
-    Weinender_Obsidian = "CRYING_OBSIDIAN"
-    Geschnittener_Kupferblock = "CUT_COPPER"
-    Geschnittene_Kupferstufe = "CUT_COPPER_SLAB"
-    Geschnittene_Kupfertreppe = "CUT_COPPER_STAIRS"
-    Geschnittener_roter_Sandstein = "CUT_RED_SANDSTONE"
-    Geschnittene_rote_Sandsteinstufe = "CUT_RED_SANDSTONE_SLAB"
-    Geschnittener_Sandstein = "CUT_SANDSTONE"
-    Geschnittene_Sandsteinstufe = "CUT_SANDSTONE_SLAB"
-    Türkises_Banner = "CYAN_BANNER"
-    Türkises_Bett = "CYAN_BED"
-    Türkise_Kerze = "CYAN_CANDLE"
-    Kuchen_mit_türkiser_Kerze = "CYAN_CANDLE_CAKE"
-    Türkiser_Teppich = "CYAN_CARPET"
-    Türkiser_Beton = "CYAN_CONCRETE"
-    Türkiser_Trockenbeton = "CYAN_CONCRETE_POWDER"
-    Türkise_glasierte_Keramik = "CYAN_GLAZED_TERRACOTTA"
-    Türkise_Shulker_Kiste = "CYAN_SHULKER_BOX"
-    Türkises_Glas = "CYAN_STAINED_GLASS"
-    Türkise_Glasscheibe = "CYAN_STAINED_GLASS_PANE"
-    Türkise_Keramik = "CYAN_TERRACOTTA"
-    Türkise_Wolle = "CYAN_WOOL"
-    Beschädigter_Amboss = "DAMAGED_ANVIL"
-    Löwenzahn = "DANDELION"
-    Schwarzeichenholzknopf = "DARK_OAK_BUTTON"
-    Schwarzeichenholztür = "DARK_OAK_DOOR"
-    Schwarzeichenholzzaun = "DARK_OAK_FENCE"
-    Schwarzeichenholzzauntor = "DARK_OAK_FENCE_GATE"
-    Schwarzeichenholzhängeschild = "DARK_OAK_HANGING_SIGN"
-    Schwarzeichenlaub = "DARK_OAK_LEAVES"
-    Schwarzeichenstamm = "DARK_OAK_LOG"
-    Schwarzeichenholzbretter = "DARK_OAK_PLANKS"
-    Schwarzeichenholzdruckplatte = "DARK_OAK_PRESSURE_PLATE"
-    Schwarzeichensetzling = "DARK_OAK_SAPLING"
-    Schwarzeichenholzschild = "DARK_OAK_SIGN"
-    Schwarzeichenholzstufe = "DARK_OAK_SLAB"
-    Schwarzeichenholztreppe = "DARK_OAK_STAIRS"
-    Schwarzeichenholzfalltür = "DARK_OAK_TRAPDOOR"
-    Schwarzeichenholzwandhängeschild = "DARK_OAK_WALL_HANGING_SIGN"
-    Schwarzeichenholzwandschild = "DARK_OAK_WALL_SIGN"
-    Schwarzeichenholz = "DARK_OAK_WOOD"
-    Dunkler_Prismarin = "DARK_PRISMARINE"
-    Dunkle_Prismarinstufe = "DARK_PRISMARINE_SLAB"
-    Dunkle_Prismarintreppe = "DARK_PRISMARINE_STAIRS"
-    Tageslichtsensor = "DAYLIGHT_DETECTOR"
-    Abgestorbene_Hirnkoralle = "DEAD_BRAIN_CORAL"
-    Abgestorbener_Hirnkorallenblock = "DEAD_BRAIN_CORAL_BLOCK"
-    Abgestorbener_Hirnkorallenfächer = "DEAD_BRAIN_CORAL_FAN"
-    Abgestorbener_Hirnkorallenwandfächer = "DEAD_BRAIN_CORAL_WALL_FAN"
-    Abgestorbene_Blasenkoralle = "DEAD_BUBBLE_CORAL"
-    Abgestorbener_Blasenkorallenblock = "DEAD_BUBBLE_CORAL_BLOCK"
-    Abgestorbener_Blasenkorallenfächer = "DEAD_BUBBLE_CORAL_FAN"
-    Abgestorbener_Blasenkorallenwandfächer = "DEAD_BUBBLE_CORAL_WALL_FAN"
-    Toter_Busch = "DEAD_BUSH"
-    Abgestorbene_Feuerkoralle = "DEAD_FIRE_CORAL"
-    Abgestorbener_Feuerkorallenblock = "DEAD_FIRE_CORAL_BLOCK"
-    Abgestorbener_Feuerkorallenfächer = "DEAD_FIRE_CORAL_FAN"
-    Abgestorbener_Feuerkorallenwandfächer = "DEAD_FIRE_CORAL_WALL_FAN"
-    Abgestorbene_Geweihkoralle = "DEAD_HORN_CORAL"
-    Abgestorbener_Geweihkorallenblock = "DEAD_HORN_CORAL_BLOCK"
-    Abgestorbener_Geweihkorallenfächer = "DEAD_HORN_CORAL_FAN"
-    Abgestorbener_Geweihkorallenwandfächer = "DEAD_HORN_CORAL_WALL_FAN"
-    Abgestorbene_Orgelkoralle = "DEAD_TUBE_CORAL"
-    Abgestorbener_Orgelkorallenblock = "DEAD_TUBE_CORAL_BLOCK"
-    Abgestorbener_Orgelkorallenfächer = "DEAD_TUBE_CORAL_FAN"
-    Abgestorbener_Orgelkorallenwandfächer = "DEAD_TUBE_CORAL_WALL_FAN"
-    Verzierter_Krug = "DECORATED_POT"
-    Tiefenschiefer = "DEEPSLATE"
-    Tiefenschieferziegelstufe = "DEEPSLATE_BRICK_SLAB"
-    Tiefenschieferziegeltreppe = "DEEPSLATE_BRICK_STAIRS"
-    Tiefenschieferziegelmauer = "DEEPSLATE_BRICK_WALL"
-    Tiefenschieferziegel = "DEEPSLATE_BRICKS"
-    Tiefenschiefer_Steinkohle = "DEEPSLATE_COAL_ORE"
-    Tiefenschiefer_Kupfererz = "DEEPSLATE_COPPER_ORE"
-    Tiefenschiefer_Diamanterz = "DEEPSLATE_DIAMOND_ORE"
-    Tiefenschiefer_Smaragderz = "DEEPSLATE_EMERALD_ORE"
-    Tiefenschiefer_Golderz = "DEEPSLATE_GOLD_ORE"
-    Tiefenschiefer_Eisenerz = "DEEPSLATE_IRON_ORE"
-    Tiefenschiefer_Lapislazulierz = "DEEPSLATE_LAPIS_ORE"
-    Tiefenschiefer_Redstone_Erz = "DEEPSLATE_REDSTONE_ORE"
-    Tiefenschieferfliesenstufe = "DEEPSLATE_TILE_SLAB"
-    Tiefenschieferfliesentreppe = "DEEPSLATE_TILE_STAIRS"
-    Tiefenschieferfliesenmauer = "DEEPSLATE_TILE_WALL"
-    Tiefenschieferfliesen = "DEEPSLATE_TILES"
-    Sensorschiene = "DETECTOR_RAIL"
-    Diamantblock = "DIAMOND_BLOCK"
-    Diamanterz = "DIAMOND_ORE"
-    Diorit = "DIORITE"
-    Dioritstufe = "DIORITE_SLAB"
-    Diorittreppe = "DIORITE_STAIRS"
-    Dioritmauer = "DIORITE_WALL"
-    Erde = "DIRT"
-    Trampelpfad = "DIRT_PATH"
-    Werfer = "DISPENSER"
-    Drachenei = "DRAGON_EGG"
-    Drachenkopf = "DRAGON_HEAD"
-    Drachen_Wandkopf = "DRAGON_WALL_HEAD"
-    Getrockneter_Seetangblock = "DRIED_KELP_BLOCK"
-    Tropfsteinblock = "DRIPSTONE_BLOCK"
-    Spender = "DROPPER"
-    Smaragdblock = "EMERALD_BLOCK"
-    Smaragderz = "EMERALD_ORE"
-    Zaubertisch = "ENCHANTING_TABLE"
-    Endtransitportal = "END_GATEWAY"
-    Endportal = "END_PORTAL"
-    Endportalrahmen = "END_PORTAL_FRAME"
-    Endstab = "END_ROD"
-    Endstein = "END_STONE"
-    Endsteinziegelstufe = "END_STONE_BRICK_SLAB"
-    Endsteinziegeltreppe = "END_STONE_BRICK_STAIRS"
-    Endsteinziegelmauer = "END_STONE_BRICK_WALL"
-    Endsteinziegel = "END_STONE_BRICKS"
-    Endertruhe = "ENDER_CHEST"
-    Angelaufener_Kupferblock = "EXPOSED_COPPER"
-    Angelaufener_geschnittener_Kupferblock = "EXPOSED_CUT_COPPER"
-    Angelaufene_geschnittene_Kupferstufe = "EXPOSED_CUT_COPPER_SLAB"
-    Angelaufene_geschnittene_Kupfertreppe = "EXPOSED_CUT_COPPER_STAIRS"
-    Ackerboden = "FARMLAND"
-    Farn = "FERN"
-    Feuer = "FIRE"
-    Feuerkoralle = "FIRE_CORAL"
-    Feuerkorallenblock = "FIRE_CORAL_BLOCK"
-    Feuerkorallenfächer = "FIRE_CORAL_FAN"
-    Feuerkorallenwandfächer = "FIRE_CORAL_WALL_FAN"
-    Bognertisch = "FLETCHING_TABLE"
-    Blumentopf = "FLOWER_POT"
-    Blühende_Azalee = "FLOWERING_AZALEA"
-    Blühendes_Azaleenlaub = "FLOWERING_AZALEA_LEAVES"
-    Froschlaich = "FROGSPAWN"
-    Brüchiges_Eis = "FROSTED_ICE"
-    Ofen = "FURNACE"
-    Golddurchzogener_Schwarzstein = "GILDED_BLACKSTONE"
-    Glas = "GLASS"
-    Glasscheibe = "GLASS_PANE"
-    Leuchtflechte = "GLOW_LICHEN"
-    Leuchtstein = "GLOWSTONE"
-    Goldblock = "GOLD_BLOCK"
-    Golderz = "GOLD_ORE"
-    Granit = "GRANITE"
-    Granitstufe = "GRANITE_SLAB"
-    Granittreppe = "GRANITE_STAIRS"
-    Granitmauer = "GRANITE_WALL"
-    Grasblock = "GRASS_BLOCK"
-    Kies = "GRAVEL"
-    Graues_Banner = "GRAY_BANNER"
-    Graues_Bett = "GRAY_BED"
-    Graue_Kerze = "GRAY_CANDLE"
-    Kuchen_mit_grauer_Kerze = "GRAY_CANDLE_CAKE"
-    Grauer_Teppich = "GRAY_CARPET"
-    Grauer_Beton = "GRAY_CONCRETE"
-    Grauer_Trockenbeton = "GRAY_CONCRETE_POWDER"
-    Graue_glasierte_Keramik = "GRAY_GLAZED_TERRACOTTA"
-    Graue_Shulker_Kiste = "GRAY_SHULKER_BOX"
-    Graues_Glas = "GRAY_STAINED_GLASS"
-    Graue_Glasscheibe = "GRAY_STAINED_GLASS_PANE"
-    Graue_Keramik = "GRAY_TERRACOTTA"
-    Graue_Wolle = "GRAY_WOOL"
-    Grünes_Banner = "GREEN_BANNER"
-    Grünes_Bett = "GREEN_BED"
-    Grüne_Kerze = "GREEN_CANDLE"
-    Kuchen_mit_grüner_Kerze = "GREEN_CANDLE_CAKE"
-    Grüner_Teppich = "GREEN_CARPET"
-    Grüner_Beton = "GREEN_CONCRETE"
-    Grüner_Trockenbeton = "GREEN_CONCRETE_POWDER"
-    Grüne_glasierte_Keramik = "GREEN_GLAZED_TERRACOTTA"
-    Grüne_Shulker_Kiste = "GREEN_SHULKER_BOX"
-    Grünes_Glas = "GREEN_STAINED_GLASS"
-    Grüne_Glasscheibe = "GREEN_STAINED_GLASS_PANE"
-    Grüne_Keramik = "GREEN_TERRACOTTA"
-    Grüne_Wolle = "GREEN_WOOL"
-    Schleifstein = "GRINDSTONE"
-    Hängende_Wurzeln = "HANGING_ROOTS"
-    Strohballen = "HAY_BLOCK"
-    Grobwägeplatte = "HEAVY_WEIGHTED_PRESSURE_PLATE"
-    Honigblock = "HONEY_BLOCK"
-    Honigwabenblock = "HONEYCOMB_BLOCK"
-    Trichter = "HOPPER"
-    Geweihkoralle = "HORN_CORAL"
-    Geweihkorallenblock = "HORN_CORAL_BLOCK"
-    Geweihkorallenfächer = "HORN_CORAL_FAN"
-    Geweihkorallenwandfächer = "HORN_CORAL_WALL_FAN"
-    Eis = "ICE"
-    Befallene_gemeißelte_Steinziegel = "INFESTED_CHISELED_STONE_BRICKS"
-    Befallener_Bruchstein = "INFESTED_COBBLESTONE"
-    Befallene_rissige_Steinziegel = "INFESTED_CRACKED_STONE_BRICKS"
-    Befallener_Tiefenschiefer = "INFESTED_DEEPSLATE"
-    Befallene_bemooste_Steinziegel = "INFESTED_MOSSY_STONE_BRICKS"
-    Befallener_Stein = "INFESTED_STONE"
-    Befallene_Steinziegel = "INFESTED_STONE_BRICKS"
-    Eisengitter = "IRON_BARS"
-    Eisenblock = "IRON_BLOCK"
-    Eisentür = "IRON_DOOR"
-    Eisenerz = "IRON_ORE"
-    Eisenfalltür = "IRON_TRAPDOOR"
-    Kürbislaterne = "JACK_O_LANTERN"
-    Verbundblock = "JIGSAW"
-    Plattenspieler = "JUKEBOX"
-    Tropenholzknopf = "JUNGLE_BUTTON"
-    Tropenholztür = "JUNGLE_DOOR"
-    Tropenholzzaun = "JUNGLE_FENCE"
-    Tropenholzzauntor = "JUNGLE_FENCE_GATE"
-    Tropenholzhängeschild = "JUNGLE_HANGING_SIGN"
-    Tropenbaumlaub = "JUNGLE_LEAVES"
-    Tropenbaumstamm = "JUNGLE_LOG"
-    Tropenholzbretter = "JUNGLE_PLANKS"
-    Tropenholzdruckplatte = "JUNGLE_PRESSURE_PLATE"
-    Tropenbaumsetzling = "JUNGLE_SAPLING"
-    Tropenholzschild = "JUNGLE_SIGN"
-    Tropenholzstufe = "JUNGLE_SLAB"
-    Tropenholztreppe = "JUNGLE_STAIRS"
-    Tropenholzfalltür = "JUNGLE_TRAPDOOR"
-    Tropenholzwandhängeschild = "JUNGLE_WALL_HANGING_SIGN"
-    Tropenholzwandschild = "JUNGLE_WALL_SIGN"
-    Tropenholz = "JUNGLE_WOOD"
-    Seetang = "KELP"
-    Seetangstängel = "KELP_PLANT"
-    Leiter = "LADDER"
-    Laterne = "LANTERN"
-    Lapislazuliblock = "LAPIS_BLOCK"
-    Lapislazulierz = "LAPIS_ORE"
-    Große_Amethystknospe = "LARGE_AMETHYST_BUD"
-    Großer_Farn = "LARGE_FERN"
-    Lava = "LAVA"
-    Lavakessel = "LAVA_CAULDRON"
-    Lesepult = "LECTERN"
-    Hebel = "LEVER"
-    Lichtblock = "LIGHT"
-    Hellblaues_Banner = "LIGHT_BLUE_BANNER"
-    Hellblaues_Bett = "LIGHT_BLUE_BED"
-    Hellblaue_Kerze = "LIGHT_BLUE_CANDLE"
-    Kuchen_mit_hellblauer_Kerze = "LIGHT_BLUE_CANDLE_CAKE"
-    Hellblauer_Teppich = "LIGHT_BLUE_CARPET"
-    Hellblauer_Beton = "LIGHT_BLUE_CONCRETE"
-    Hellblauer_Trockenbeton = "LIGHT_BLUE_CONCRETE_POWDER"
-    Hellblaue_glasierte_Keramik = "LIGHT_BLUE_GLAZED_TERRACOTTA"
-    Hellblaue_Shulker_Kiste = "LIGHT_BLUE_SHULKER_BOX"
-    Hellblaues_Glas = "LIGHT_BLUE_STAINED_GLASS"
-    Hellblaue_Glasscheibe = "LIGHT_BLUE_STAINED_GLASS_PANE"
-    Hellblaue_Keramik = "LIGHT_BLUE_TERRACOTTA"
-    Hellblaue_Wolle = "LIGHT_BLUE_WOOL"
-    Hellgraues_Banner = "LIGHT_GRAY_BANNER"
-    Hellgraues_Bett = "LIGHT_GRAY_BED"
-    Hellgraue_Kerze = "LIGHT_GRAY_CANDLE"
-    Kuchen_mit_hellgrauer_Kerze = "LIGHT_GRAY_CANDLE_CAKE"
-    Hellgrauer_Teppich = "LIGHT_GRAY_CARPET"
-    Hellgrauer_Beton = "LIGHT_GRAY_CONCRETE"
-    Hellgrauer_Trockenbeton = "LIGHT_GRAY_CONCRETE_POWDER"
-    Hellgraue_glasierte_Keramik = "LIGHT_GRAY_GLAZED_TERRACOTTA"
-    Hellgraue_Shulker_Kiste = "LIGHT_GRAY_SHULKER_BOX"
-    Hellgraues_Glas = "LIGHT_GRAY_STAINED_GLASS"
-    Hellgraue_Glasscheibe = "LIGHT_GRAY_STAINED_GLASS_PANE"
-    Hellgraue_Keramik = "LIGHT_GRAY_TERRACOTTA"
-    Hellgraue_Wolle = "LIGHT_GRAY_WOOL"
-    Feinwägeplatte = "LIGHT_WEIGHTED_PRESSURE_PLATE"
-    Blitzableiter = "LIGHTNING_ROD"
-    Flieder = "LILAC"
-    Maiglöckchen = "LILY_OF_THE_VALLEY"
-    Seerosenblatt = "LILY_PAD"
-    Hellgrünes_Banner = "LIME_BANNER"
-    Hellgrünes_Bett = "LIME_BED"
-    Hellgrüne_Kerze = "LIME_CANDLE"
-    Kuchen_mit_hellgrüner_Kerze = "LIME_CANDLE_CAKE"
-    Hellgrüner_Teppich = "LIME_CARPET"
-    Hellgrüner_Beton = "LIME_CONCRETE"
-    Hellgrüner_Trockenbeton = "LIME_CONCRETE_POWDER"
-    Hellgrüne_glasierte_Keramik = "LIME_GLAZED_TERRACOTTA"
-    Hellgrüne_Shulker_Kiste = "LIME_SHULKER_BOX"
-    Hellgrünes_Glas = "LIME_STAINED_GLASS"
-    Hellgrüne_Glasscheibe = "LIME_STAINED_GLASS_PANE"
-    Hellgrüne_Keramik = "LIME_TERRACOTTA"
-    Hellgrüne_Wolle = "LIME_WOOL"
-    Leitstein = "LODESTONE"
-    Webstuhl = "LOOM"
-    Magenta_Banner = "MAGENTA_BANNER"
-    Magenta_Bett = "MAGENTA_BED"
-    Magenta_Kerze = "MAGENTA_CANDLE"
-    Kuchen_mit_magenta_Kerze = "MAGENTA_CANDLE_CAKE"
-    Magenta_Teppich = "MAGENTA_CARPET"
-    Magenta_Beton = "MAGENTA_CONCRETE"
-    Magenta_Trockenbeton = "MAGENTA_CONCRETE_POWDER"
-    Magenta_glasierte_Keramik = "MAGENTA_GLAZED_TERRACOTTA"
-    Magenta_Shulker_Kiste = "MAGENTA_SHULKER_BOX"
-    Magenta_Glas = "MAGENTA_STAINED_GLASS"
-    Magenta_Glasscheibe = "MAGENTA_STAINED_GLASS_PANE"
-    Magenta_Keramik = "MAGENTA_TERRACOTTA"
-    Magenta_Wolle = "MAGENTA_WOOL"
-    Magmablock = "MAGMA_BLOCK"
-    Mangrovenholzknopf = "MANGROVE_BUTTON"
-    Mangrovenholztür = "MANGROVE_DOOR"
-    Mangrovenholzzaun = "MANGROVE_FENCE"
-    Mangrovenholzzauntor = "MANGROVE_FENCE_GATE"
-    Mangrovenholzhängeschild = "MANGROVE_HANGING_SIGN"
-    Mangrovenlaub = "MANGROVE_LEAVES"
-    Mangrovenstamm = "MANGROVE_LOG"
-    Mangrovenholzbretter = "MANGROVE_PLANKS"
-    Mangrovenholzdruckplatte = "MANGROVE_PRESSURE_PLATE"
-    Mangroven_Keimling = "MANGROVE_PROPAGULE"
-    Mangrovenwurzeln = "MANGROVE_ROOTS"
-    Mangrovenholzschild = "MANGROVE_SIGN"
-    Mangrovenholzstufe = "MANGROVE_SLAB"
-    Mangrovenholztreppe = "MANGROVE_STAIRS"
-    Mangrovenholzfalltür = "MANGROVE_TRAPDOOR"
-    Mangrovenholzwandhängeschild = "MANGROVE_WALL_HANGING_SIGN"
-    Mangrovenholzwandschild = "MANGROVE_WALL_SIGN"
-    Mangrovenholz = "MANGROVE_WOOD"
-    Mittlere_Amethystknospe = "MEDIUM_AMETHYST_BUD"
-    Melone = "MELON"
-    Melonenpflanze = "MELON_STEM"
-    Moosblock = "MOSS_BLOCK"
-    Moosteppich = "MOSS_CARPET"
-    Bemooster_Bruchstein = "MOSSY_COBBLESTONE"
-    Bemooste_Bruchsteinstufe = "MOSSY_COBBLESTONE_SLAB"
-    Bemooste_Bruchsteintreppe = "MOSSY_COBBLESTONE_STAIRS"
-    Bemooste_Bruchsteinmauer = "MOSSY_COBBLESTONE_WALL"
-    Bemooste_Steinziegelstufe = "MOSSY_STONE_BRICK_SLAB"
-    Bemooste_Steinziegeltreppe = "MOSSY_STONE_BRICK_STAIRS"
-    Bemooste_Steinziegelmauer = "MOSSY_STONE_BRICK_WALL"
-    Bemooste_Steinziegel = "MOSSY_STONE_BRICKS"
-    Bewegter_Block = "MOVING_PISTON"
-    Schlamm = "MUD"
-    Schlammziegelstufe = "MUD_BRICK_SLAB"
-    Schlammziegeltreppe = "MUD_BRICK_STAIRS"
-    Schlammziegelmauer = "MUD_BRICK_WALL"
-    Schlammziegel = "MUD_BRICKS"
-    Schlammige_Mangrovenwurzeln = "MUDDY_MANGROVE_ROOTS"
-    Pilzstiel = "MUSHROOM_STEM"
-    Myzel = "MYCELIUM"
-    Netherziegelzaun = "NETHER_BRICK_FENCE"
-    Netherziegelstufe = "NETHER_BRICK_SLAB"
-    Netherziegeltreppe = "NETHER_BRICK_STAIRS"
-    Netherziegelmauer = "NETHER_BRICK_WALL"
-    Netherziegel = "NETHER_BRICKS"
-    Nethergolderz = "NETHER_GOLD_ORE"
-    Netherportal = "NETHER_PORTAL"
-    Netherquarzerz = "NETHER_QUARTZ_ORE"
-    Nethersprossen = "NETHER_SPROUTS"
-    Netherwarzen = "NETHER_WART"
-    Netherwarzenblock = "NETHER_WART_BLOCK"
-    Netheritblock = "NETHERITE_BLOCK"
-    Netherrack = "NETHERRACK"
-    Notenblock = "NOTE_BLOCK"
-    Eichenholzknopf = "OAK_BUTTON"
-    Eichenholztür = "OAK_DOOR"
-    Eichenholzzaun = "OAK_FENCE"
-    Eichenholzzauntor = "OAK_FENCE_GATE"
-    Eichenholzhängeschild = "OAK_HANGING_SIGN"
-    Eichenlaub = "OAK_LEAVES"
-    Eichenstamm = "OAK_LOG"
-    Eichenholzbretter = "OAK_PLANKS"
-    Eichenholzdruckplatte = "OAK_PRESSURE_PLATE"
-    Eichensetzling = "OAK_SAPLING"
-    Eichenholzschild = "OAK_SIGN"
-    Eichenholzstufe = "OAK_SLAB"
-    Eichenholztreppe = "OAK_STAIRS"
-    Eichenholzfalltür = "OAK_TRAPDOOR"
-    Eichenholzwandhängeschild = "OAK_WALL_HANGING_SIGN"
-    Eichenholzwandschild = "OAK_WALL_SIGN"
-    Eichenholz = "OAK_WOOD"
-    Beobachter = "OBSERVER"
-    Obsidian = "OBSIDIAN"
-    Ockernes_Froschlicht = "OCHRE_FROGLIGHT"
-    Oranges_Banner = "ORANGE_BANNER"
-    Oranges_Bett = "ORANGE_BED"
-    Orange_Kerze = "ORANGE_CANDLE"
-    Kuchen_mit_oranger_Kerze = "ORANGE_CANDLE_CAKE"
-    Oranger_Teppich = "ORANGE_CARPET"
-    Oranger_Beton = "ORANGE_CONCRETE"
-    Oranger_Trockenbeton = "ORANGE_CONCRETE_POWDER"
-    Orange_glasierte_Keramik = "ORANGE_GLAZED_TERRACOTTA"
-    Orange_Shulker_Kiste = "ORANGE_SHULKER_BOX"
-    Oranges_Glas = "ORANGE_STAINED_GLASS"
-    Orange_Glasscheibe = "ORANGE_STAINED_GLASS_PANE"
-    Orange_Keramik = "ORANGE_TERRACOTTA"
-    Orange_Tulpe = "ORANGE_TULIP"
-    Orange_Wolle = "ORANGE_WOOL"
-    Margerite = "OXEYE_DAISY"
-    Oxidierter_Kupferblock = "OXIDIZED_COPPER"
-    Oxidierter_geschnittener_Kupferblock = "OXIDIZED_CUT_COPPER"
-    Oxidierte_geschnittene_Kupferstufe = "OXIDIZED_CUT_COPPER_SLAB"
-    Oxidierte_geschnittene_Kupfertreppe = "OXIDIZED_CUT_COPPER_STAIRS"
-    Packeis = "PACKED_ICE"
-    Fester_Schlamm = "PACKED_MUD"
-    Perlmutternes_Froschlicht = "PEARLESCENT_FROGLIGHT"
-    Pfingstrose = "PEONY"
-    Versteinerte_Eichenholzstufe = "PETRIFIED_OAK_SLAB"
-    Piglinkopf = "PIGLIN_HEAD"
-    Piglin_Wandkopf = "PIGLIN_WALL_HEAD"
-    Rosa_Banner = "PINK_BANNER"
-    Rosa_Bett = "PINK_BED"
-    Rosa_Kerze = "PINK_CANDLE"
-    Kuchen_mit_rosa_Kerze = "PINK_CANDLE_CAKE"
-    Rosa_Teppich = "PINK_CARPET"
-    Rosa_Beton = "PINK_CONCRETE"
-    Rosa_Trockenbeton = "PINK_CONCRETE_POWDER"
-    Rosa_glasierte_Keramik = "PINK_GLAZED_TERRACOTTA"
-    Rosa_Blütenblätter = "PINK_PETALS"
-    Rosa_Shulker_Kiste = "PINK_SHULKER_BOX"
-    Rosa_Glas = "PINK_STAINED_GLASS"
-    Rosa_Glasscheibe = "PINK_STAINED_GLASS_PANE"
-    Rosa_Keramik = "PINK_TERRACOTTA"
-    Rosa_Tulpe = "PINK_TULIP"
-    Rosa_Wolle = "PINK_WOOL"
-    Kolben = "PISTON"
-    Kolbenkopf = "PISTON_HEAD"
-    Spielerkopf = "PLAYER_HEAD"
-    Spieler_Wandkopf = "PLAYER_WALL_HEAD"
-    Podsol = "PODZOL"
-    Spitzer_Tropfstein = "POINTED_DRIPSTONE"
-    Polierter_Andesit = "POLISHED_ANDESITE"
-    Polierte_Andesitstufe = "POLISHED_ANDESITE_SLAB"
-    Polierte_Andesittreppe = "POLISHED_ANDESITE_STAIRS"
-    Polierter_Basalt = "POLISHED_BASALT"
-    Polierter_Schwarzstein = "POLISHED_BLACKSTONE"
-    Polierte_Schwarzsteinziegelstufe = "POLISHED_BLACKSTONE_BRICK_SLAB"
-    Polierte_Schwarzsteinziegeltreppe = "POLISHED_BLACKSTONE_BRICK_STAIRS"
-    Polierte_Schwarzsteinziegelmauer = "POLISHED_BLACKSTONE_BRICK_WALL"
-    Polierte_Schwarzsteinziegel = "POLISHED_BLACKSTONE_BRICKS"
-    Polierter_Schwarzsteinknopf = "POLISHED_BLACKSTONE_BUTTON"
-    Polierte_Schwarzsteindruckplatte = "POLISHED_BLACKSTONE_PRESSURE_PLATE"
-    Polierte_Schwarzsteinstufe = "POLISHED_BLACKSTONE_SLAB"
-    Polierte_Schwarzsteintreppe = "POLISHED_BLACKSTONE_STAIRS"
-    Polierte_Schwarzsteinmauer = "POLISHED_BLACKSTONE_WALL"
-    Polierter_Tiefenschiefer = "POLISHED_DEEPSLATE"
-    Polierte_Tiefenschieferstufe = "POLISHED_DEEPSLATE_SLAB"
-    Polierte_Tiefenschiefertreppe = "POLISHED_DEEPSLATE_STAIRS"
-    Polierte_Tiefenschiefermauer = "POLISHED_DEEPSLATE_WALL"
-    Polierter_Diorit = "POLISHED_DIORITE"
-    Polierte_Dioritstufe = "POLISHED_DIORITE_SLAB"
-    Polierte_Diorittreppe = "POLISHED_DIORITE_STAIRS"
-    Polierter_Granit = "POLISHED_GRANITE"
-    Polierte_Granitstufe = "POLISHED_GRANITE_SLAB"
-    Polierte_Granittreppe = "POLISHED_GRANITE_STAIRS"
-    Mohn = "POPPY"
-    Kartoffeln = "POTATOES"
-    Eingetopfter_Akaziensetzling = "POTTED_ACACIA_SAPLING"
-    Eingetopfter_Zierlauch = "POTTED_ALLIUM"
-    Eingetopfte_Azalee = "POTTED_AZALEA_BUSH"
-    Eingetopftes_Porzellansternchen = "POTTED_AZURE_BLUET"
-    Eingetopfter_Bambus = "POTTED_BAMBOO"
-    Eingetopfter_Birkensetzling = "POTTED_BIRCH_SAPLING"
-    Eingetopfte_blaue_Orchidee = "POTTED_BLUE_ORCHID"
-    Eingetopfter_brauner_Pilz = "POTTED_BROWN_MUSHROOM"
-    Eingetopfter_Kaktus = "POTTED_CACTUS"
-    Eingetopfter_Kirschsetzling = "POTTED_CHERRY_SAPLING"
-    Eingetopfte_Kornblume = "POTTED_CORNFLOWER"
-    Eingetopfter_Karmesinpilz = "POTTED_CRIMSON_FUNGUS"
-    Eingetopfte_Karmesinwurzeln = "POTTED_CRIMSON_ROOTS"
-    Eingetopfter_Löwenzahn = "POTTED_DANDELION"
-    Eingetopfter_Schwarzeichensetzling = "POTTED_DARK_OAK_SAPLING"
-    Eingetopfter_toter_Busch = "POTTED_DEAD_BUSH"
-    Eingetopfter_Farn = "POTTED_FERN"
-    Eingetopfte_blühende_Azalee = "POTTED_FLOWERING_AZALEA_BUSH"
-    Eingetopfter_Tropenbaumsetzling = "POTTED_JUNGLE_SAPLING"
-    Eingetopftes_Maiglöckchen = "POTTED_LILY_OF_THE_VALLEY"
-    Eingetopfter_Mangroven_Keimling = "POTTED_MANGROVE_PROPAGULE"
-    Eingetopfter_Eichensetzling = "POTTED_OAK_SAPLING"
-    Eingetopfte_orange_Tulpe = "POTTED_ORANGE_TULIP"
-    Eingetopfte_Margerite = "POTTED_OXEYE_DAISY"
-    Eingetopfte_rosa_Tulpe = "POTTED_PINK_TULIP"
-    Eingetopfter_Mohn = "POTTED_POPPY"
-    Eingetopfter_roter_Pilz = "POTTED_RED_MUSHROOM"
-    Eingetopfte_rote_Tulpe = "POTTED_RED_TULIP"
-    Eingetopfter_Fichtensetzling = "POTTED_SPRUCE_SAPLING"
-    Eingetopfte_Fackellilie = "POTTED_TORCHFLOWER"
-    Eingetopfter_Wirrpilz = "POTTED_WARPED_FUNGUS"
-    Eingetopfte_Wirrwurzeln = "POTTED_WARPED_ROOTS"
-    Eingetopfte_weiße_Tulpe = "POTTED_WHITE_TULIP"
-    Eingetopfte_Wither_Rose = "POTTED_WITHER_ROSE"
-    Pulverschnee = "POWDER_SNOW"
-    Pulverschneekessel = "POWDER_SNOW_CAULDRON"
-    Antriebsschiene = "POWERED_RAIL"
-    Prismarin = "PRISMARINE"
-    Prismarinziegelstufe = "PRISMARINE_BRICK_SLAB"
-    Prismarinziegeltreppe = "PRISMARINE_BRICK_STAIRS"
-    Prismarinziegel = "PRISMARINE_BRICKS"
-    Prismarinstufe = "PRISMARINE_SLAB"
-    Prismarintreppe = "PRISMARINE_STAIRS"
-    Prismarinmauer = "PRISMARINE_WALL"
-    Kürbis = "PUMPKIN"
-    Kürbispflanze = "PUMPKIN_STEM"
-    Violettes_Banner = "PURPLE_BANNER"
-    Violettes_Bett = "PURPLE_BED"
-    Violette_Kerze = "PURPLE_CANDLE"
-    Kuchen_mit_violetter_Kerze = "PURPLE_CANDLE_CAKE"
-    Violetter_Teppich = "PURPLE_CARPET"
-    Violetter_Beton = "PURPLE_CONCRETE"
-    Violetter_Trockenbeton = "PURPLE_CONCRETE_POWDER"
-    Violette_glasierte_Keramik = "PURPLE_GLAZED_TERRACOTTA"
-    Violette_Shulker_Kiste = "PURPLE_SHULKER_BOX"
-    Violettes_Glas = "PURPLE_STAINED_GLASS"
-    Violette_Glasscheibe = "PURPLE_STAINED_GLASS_PANE"
-    Violette_Keramik = "PURPLE_TERRACOTTA"
-    Violette_Wolle = "PURPLE_WOOL"
-    Purpurblock = "PURPUR_BLOCK"
-    Purpursäule = "PURPUR_PILLAR"
-    Purpurstufe = "PURPUR_SLAB"
-    Purpurtreppe = "PURPUR_STAIRS"
-    Quarzblock = "QUARTZ_BLOCK"
-    Quarzziegel = "QUARTZ_BRICKS"
-    Quarzsäule = "QUARTZ_PILLAR"
-    Quarzstufe = "QUARTZ_SLAB"
-    Quarztreppe = "QUARTZ_STAIRS"
-    Schiene = "RAIL"
-    Rohkupferblock = "RAW_COPPER_BLOCK"
-    Rohgoldblock = "RAW_GOLD_BLOCK"
-    Roheisenblock = "RAW_IRON_BLOCK"
-    Rotes_Banner = "RED_BANNER"
-    Rotes_Bett = "RED_BED"
-    Rote_Kerze = "RED_CANDLE"
-    Kuchen_mit_roter_Kerze = "RED_CANDLE_CAKE"
-    Roter_Teppich = "RED_CARPET"
-    Roter_Beton = "RED_CONCRETE"
-    Roter_Trockenbeton = "RED_CONCRETE_POWDER"
-    Rote_glasierte_Keramik = "RED_GLAZED_TERRACOTTA"
-    Roter_Pilz = "RED_MUSHROOM"
-    Roter_Pilzblock = "RED_MUSHROOM_BLOCK"
-    Rote_Netherziegelstufe = "RED_NETHER_BRICK_SLAB"
-    Rote_Netherziegeltreppe = "RED_NETHER_BRICK_STAIRS"
-    Rote_Netherziegelmauer = "RED_NETHER_BRICK_WALL"
-    Rote_Netherziegel = "RED_NETHER_BRICKS"
-    Roter_Sand = "RED_SAND"
-    Roter_Sandstein = "RED_SANDSTONE"
-    Rote_Sandsteinstufe = "RED_SANDSTONE_SLAB"
-    Rote_Sandsteintreppe = "RED_SANDSTONE_STAIRS"
-    Rote_Sandsteinmauer = "RED_SANDSTONE_WALL"
-    Rote_Shulker_Kiste = "RED_SHULKER_BOX"
-    Rotes_Glas = "RED_STAINED_GLASS"
-    Rote_Glasscheibe = "RED_STAINED_GLASS_PANE"
-    Rote_Keramik = "RED_TERRACOTTA"
-    Rote_Tulpe = "RED_TULIP"
-    Rote_Wolle = "RED_WOOL"
-    Redstone_Block = "REDSTONE_BLOCK"
-    Redstone_Lampe = "REDSTONE_LAMP"
-    Redstone_Erz = "REDSTONE_ORE"
-    Redstone_Fackel = "REDSTONE_TORCH"
-    Redstone_Wandfackel = "REDSTONE_WALL_TORCH"
-    Redstone_Leitung = "REDSTONE_WIRE"
-    Verstärkter_Tiefenschiefer = "REINFORCED_DEEPSLATE"
-    Redstone_Verstärker = "REPEATER"
-    Wiederhol_Befehlsblock = "REPEATING_COMMAND_BLOCK"
-    Seelenanker = "RESPAWN_ANCHOR"
-    Wurzelerde = "ROOTED_DIRT"
-    Rosenstrauch = "ROSE_BUSH"
-    Sand = "SAND"
-    Sandstein = "SANDSTONE"
-    Sandsteinstufe = "SANDSTONE_SLAB"
-    Sandsteintreppe = "SANDSTONE_STAIRS"
-    Sandsteinmauer = "SANDSTONE_WALL"
-    Gerüst = "SCAFFOLDING"
-    Sculk = "SCULK"
-    Sculk_Katalysator = "SCULK_CATALYST"
-    Sculk_Sensor = "SCULK_SENSOR"
-    Sculk_Kreischer = "SCULK_SHRIEKER"
-    Sculk_Ader = "SCULK_VEIN"
-    Seelaterne = "SEA_LANTERN"
-    Meeresgurke = "SEA_PICKLE"
-    Seegras = "SEAGRASS"
-    Pilzlicht = "SHROOMLIGHT"
-    Shulker_Kiste = "SHULKER_BOX"
-    Skelettschädel = "SKELETON_SKULL"
-    Skelett_Wandschädel = "SKELETON_WALL_SKULL"
-    Schleimblock = "SLIME_BLOCK"
-    Kleine_Amethystknospe = "SMALL_AMETHYST_BUD"
-    Kleines_Tropfblatt = "SMALL_DRIPLEAF"
-    Schmiedetisch = "SMITHING_TABLE"
-    Räucherofen = "SMOKER"
-    Glatter_Basalt = "SMOOTH_BASALT"
-    Glatter_Quarzblock = "SMOOTH_QUARTZ"
-    Glatte_Quarzstufe = "SMOOTH_QUARTZ_SLAB"
-    Glatte_Quarztreppe = "SMOOTH_QUARTZ_STAIRS"
-    Glatter_roter_Sandstein = "SMOOTH_RED_SANDSTONE"
-    Glatte_rote_Sandsteinstufe = "SMOOTH_RED_SANDSTONE_SLAB"
-    Glatte_rote_Sandsteintreppe = "SMOOTH_RED_SANDSTONE_STAIRS"
-    Glatter_Sandstein = "SMOOTH_SANDSTONE"
-    Glatte_Sandsteinstufe = "SMOOTH_SANDSTONE_SLAB"
-    Glatte_Sandsteintreppe = "SMOOTH_SANDSTONE_STAIRS"
-    Glatter_Stein = "SMOOTH_STONE"
-    Glatte_Steinstufe = "SMOOTH_STONE_SLAB"
-    Schnee = "SNOW"
-    Schneeblock = "SNOW_BLOCK"
-    Seelenlagerfeuer = "SOUL_CAMPFIRE"
-    Seelenfeuer = "SOUL_FIRE"
-    Seelenlaterne = "SOUL_LANTERN"
-    Seelensand = "SOUL_SAND"
-    Seelenerde = "SOUL_SOIL"
-    Seelenfackel = "SOUL_TORCH"
-    Seelenwandfackel = "SOUL_WALL_TORCH"
-    Spawner = "SPAWNER"
-    Schwamm = "SPONGE"
-    Sporenblüte = "SPORE_BLOSSOM"
-    Fichtenholzknopf = "SPRUCE_BUTTON"
-    Fichtenholztür = "SPRUCE_DOOR"
-    Fichtenholzzaun = "SPRUCE_FENCE"
-    Fichtenholzzauntor = "SPRUCE_FENCE_GATE"
-    Fichtenholzhängeschild = "SPRUCE_HANGING_SIGN"
-    Fichtennadeln = "SPRUCE_LEAVES"
-    Fichtenstamm = "SPRUCE_LOG"
-    Fichtenholzbretter = "SPRUCE_PLANKS"
-    Fichtenholzdruckplatte = "SPRUCE_PRESSURE_PLATE"
-    Fichtensetzling = "SPRUCE_SAPLING"
-    Fichtenholzschild = "SPRUCE_SIGN"
-    Fichtenholzstufe = "SPRUCE_SLAB"
-    Fichtenholztreppe = "SPRUCE_STAIRS"
-    Fichtenholzfalltür = "SPRUCE_TRAPDOOR"
-    Fichtenholzwandhängeschild = "SPRUCE_WALL_HANGING_SIGN"
-    Fichtenholzwandschild = "SPRUCE_WALL_SIGN"
-    Fichtenholz = "SPRUCE_WOOD"
-    Klebriger_Kolben = "STICKY_PISTON"
-    Stein = "STONE"
-    Steinziegelstufe = "STONE_BRICK_SLAB"
-    Steinziegeltreppe = "STONE_BRICK_STAIRS"
-    Steinziegelmauer = "STONE_BRICK_WALL"
-    Steinziegel = "STONE_BRICKS"
-    Steinknopf = "STONE_BUTTON"
-    Steindruckplatte = "STONE_PRESSURE_PLATE"
-    Steinstufe = "STONE_SLAB"
-    Steintreppe = "STONE_STAIRS"
-    Steinsäge = "STONECUTTER"
-    Entrindeter_Akazienstamm = "STRIPPED_ACACIA_LOG"
-    Entrindetes_Akazienholz = "STRIPPED_ACACIA_WOOD"
-    Geschälter_Bambusblock = "STRIPPED_BAMBOO_BLOCK"
-    Entrindeter_Birkenstamm = "STRIPPED_BIRCH_LOG"
-    Entrindetes_Birkenholz = "STRIPPED_BIRCH_WOOD"
-    Entrindeter_Kirschstamm = "STRIPPED_CHERRY_LOG"
-    Entrindetes_Kirschholz = "STRIPPED_CHERRY_WOOD"
-    Geschälte_Karmesinhyphen = "STRIPPED_CRIMSON_HYPHAE"
-    Geschälter_Karmesinstiel = "STRIPPED_CRIMSON_STEM"
-    Entrindeter_Schwarzeichenstamm = "STRIPPED_DARK_OAK_LOG"
-    Entrindetes_Schwarzeichenholz = "STRIPPED_DARK_OAK_WOOD"
-    Entrindeter_Tropenbaumstamm = "STRIPPED_JUNGLE_LOG"
-    Entrindetes_Tropenholz = "STRIPPED_JUNGLE_WOOD"
-    Entrindeter_Mangrovenstamm = "STRIPPED_MANGROVE_LOG"
-    Entrindetes_Mangrovenholz = "STRIPPED_MANGROVE_WOOD"
-    Entrindeter_Eichenstamm = "STRIPPED_OAK_LOG"
-    Entrindetes_Eichenholz = "STRIPPED_OAK_WOOD"
-    Entrindeter_Fichtenstamm = "STRIPPED_SPRUCE_LOG"
-    Entrindetes_Fichtenholz = "STRIPPED_SPRUCE_WOOD"
-    Geschälte_Wirrhyphen = "STRIPPED_WARPED_HYPHAE"
-    Geschälter_Wirrstiel = "STRIPPED_WARPED_STEM"
-    Konstruktionsblock = "STRUCTURE_BLOCK"
-    Konstruktionsleere = "STRUCTURE_VOID"
-    Zuckerrohr = "SUGAR_CANE"
-    Sonnenblume = "SUNFLOWER"
-    Seltsamer_Sand = "SUSPICIOUS_SAND"
-    Süßbeerstrauch = "SWEET_BERRY_BUSH"
-    Hohes_Gras = "TALL_GRASS"
-    Hohes_Seegras = "TALL_SEAGRASS"
-    Zielblock = "TARGET"
-    Keramik = "TERRACOTTA"
-    Getöntes_Glas = "TINTED_GLASS"
-    TNT = "TNT"
-    Fackel = "TORCH"
-    Fackellilie = "TORCHFLOWER"
-    Fackellilienpflanze = "TORCHFLOWER_CROP"
-    Redstone_Truhe = "TRAPPED_CHEST"
-    Stolperdraht = "TRIPWIRE"
-    Haken = "TRIPWIRE_HOOK"
-    Orgelkoralle = "TUBE_CORAL"
-    Orgelkorallenblock = "TUBE_CORAL_BLOCK"
-    Orgelkorallenfächer = "TUBE_CORAL_FAN"
-    Orgelkorallenwandfächer = "TUBE_CORAL_WALL_FAN"
-    Tuffstein = "TUFF"
-    Schildkrötenei = "TURTLE_EGG"
-    Zwirbelranken = "TWISTING_VINES"
-    Zwirbelrankenpflanze = "TWISTING_VINES_PLANT"
-    Junggrünes_Froschlicht = "VERDANT_FROGLIGHT"
-    Ranken = "VINE"
-    Leerenluft = "VOID_AIR"
-    Wandfackel = "WALL_TORCH"
-    Wirrknopf = "WARPED_BUTTON"
-    Wirrtür = "WARPED_DOOR"
-    Wirrzaun = "WARPED_FENCE"
-    Wirrzauntor = "WARPED_FENCE_GATE"
-    Wirrpilz = "WARPED_FUNGUS"
-    Wirrhängeschild = "WARPED_HANGING_SIGN"
-    Wirrhyphen = "WARPED_HYPHAE"
-    Wirr_Nezel = "WARPED_NYLIUM"
-    Wirrbretter = "WARPED_PLANKS"
-    Wirrdruckplatte = "WARPED_PRESSURE_PLATE"
-    Wirrwurzeln = "WARPED_ROOTS"
-    Wirrschild = "WARPED_SIGN"
-    Wirrstufe = "WARPED_SLAB"
-    Wirrtreppe = "WARPED_STAIRS"
-    Wirrstiel = "WARPED_STEM"
-    Wirrfalltür = "WARPED_TRAPDOOR"
-    Wirrwandhängeschild = "WARPED_WALL_HANGING_SIGN"
-    Wirrwandschild = "WARPED_WALL_SIGN"
-    Wirrwarzenblock = "WARPED_WART_BLOCK"
-    Wasser = "WATER"
-    Wasserkessel = "WATER_CAULDRON"
-    Gewachster_Kupferblock = "WAXED_COPPER_BLOCK"
-    Gewachster_geschnittener_Kupferblock = "WAXED_CUT_COPPER"
-    Gewachste_geschnittene_Kupferstufe = "WAXED_CUT_COPPER_SLAB"
-    Gewachste_geschnittene_Kupfertreppe = "WAXED_CUT_COPPER_STAIRS"
-    Gewachster_angelaufener_Kupferblock = "WAXED_EXPOSED_COPPER"
-    Gewachster_angelaufener_geschnittener_Kupferblock = "WAXED_EXPOSED_CUT_COPPER"
-    Gewachste_angelaufene_geschnittene_Kupferstufe = "WAXED_EXPOSED_CUT_COPPER_SLAB"
-    Gewachste_angelaufene_geschnittene_Kupfertreppe = "WAXED_EXPOSED_CUT_COPPER_STAIRS"
-    Gewachster_oxidierter_Kupferblock = "WAXED_OXIDIZED_COPPER"
-    Gewachster_oxidierter_geschnittener_Kupferblock = "WAXED_OXIDIZED_CUT_COPPER"
-    Gewachste_oxidierte_geschnittene_Kupferstufe = "WAXED_OXIDIZED_CUT_COPPER_SLAB"
-    Gewachste_oxidierte_geschnittene_Kupfertreppe = "WAXED_OXIDIZED_CUT_COPPER_STAIRS"
-    Gewachster_verwitterter_Kupferblock = "WAXED_WEATHERED_COPPER"
-    Gewachster_verwitterter_geschnittener_Kupferblock = "WAXED_WEATHERED_CUT_COPPER"
-    Gewachste_verwitterte_geschnittene_Kupferstufe = "WAXED_WEATHERED_CUT_COPPER_SLAB"
-    Gewachste_verwitterte_geschnittene_Kupfertreppe = "WAXED_WEATHERED_CUT_COPPER_STAIRS"
-    Verwitterter_Kupferblock = "WEATHERED_COPPER"
-    Verwitterter_geschnittener_Kupferblock = "WEATHERED_CUT_COPPER"
-    Verwitterte_geschnittene_Kupferstufe = "WEATHERED_CUT_COPPER_SLAB"
-    Verwitterte_geschnittene_Kupfertreppe = "WEATHERED_CUT_COPPER_STAIRS"
-    Trauerranken = "WEEPING_VINES"
-    Trauerrankenpflanze = "WEEPING_VINES_PLANT"
-    Nasser_Schwamm = "WET_SPONGE"
-    Weizenpflanze = "WHEAT"
-    Weißes_Banner = "WHITE_BANNER"
-    Weißes_Bett = "WHITE_BED"
-    Weiße_Kerze = "WHITE_CANDLE"
-    Kuchen_mit_weißer_Kerze = "WHITE_CANDLE_CAKE"
-    Weißer_Teppich = "WHITE_CARPET"
-    Weißer_Beton = "WHITE_CONCRETE"
-    Weißer_Trockenbeton = "WHITE_CONCRETE_POWDER"
-    Weiße_glasierte_Keramik = "WHITE_GLAZED_TERRACOTTA"
-    Weiße_Shulker_Kiste = "WHITE_SHULKER_BOX"
-    Weißes_Glas = "WHITE_STAINED_GLASS"
-    Weiße_Glasscheibe = "WHITE_STAINED_GLASS_PANE"
-    Weiße_Keramik = "WHITE_TERRACOTTA"
-    Weiße_Tulpe = "WHITE_TULIP"
-    Weiße_Wolle = "WHITE_WOOL"
-    Wither_Rose = "WITHER_ROSE"
-    Witherskelettschädel = "WITHER_SKELETON_SKULL"
-    Witherskelett_Wandschädel = "WITHER_SKELETON_WALL_SKULL"
-    Gelbes_Banner = "YELLOW_BANNER"
-    Gelbes_Bett = "YELLOW_BED"
-    Gelbe_Kerze = "YELLOW_CANDLE"
-    Kuchen_mit_gelber_Kerze = "YELLOW_CANDLE_CAKE"
-    Gelber_Teppich = "YELLOW_CARPET"
-    Gelber_Beton = "YELLOW_CONCRETE"
-    Gelber_Trockenbeton = "YELLOW_CONCRETE_POWDER"
-    Gelbe_glasierte_Keramik = "YELLOW_GLAZED_TERRACOTTA"
-    Gelbe_Shulker_Kiste = "YELLOW_SHULKER_BOX"
-    Gelbes_Glas = "YELLOW_STAINED_GLASS"
-    Gelbe_Glasscheibe = "YELLOW_STAINED_GLASS_PANE"
-    Gelbe_Keramik = "YELLOW_TERRACOTTA"
-    Gelbe_Wolle = "YELLOW_WOOL"
-    Zombiekopf = "ZOMBIE_HEAD"
-    Zombie_Wandkopf = "ZOMBIE_WALL_HEAD"
-    Akazienholzboot = "ACACIA_BOAT"
-    Akazienholztruhenboot = "ACACIA_CHEST_BOAT"
-    Hilfsgeist_Spawn_Ei = "ALLAY_SPAWN_EGG"
-    Amethystscherbe = "AMETHYST_SHARD"
-    Apfel = "APPLE"
-    Rüstungsständer = "ARMOR_STAND"
-    Pfeil = "ARROW"
-    Axolotleimer = "AXOLOTL_BUCKET"
-    Axolotl_Spawn_Ei = "AXOLOTL_SPAWN_EGG"
-    Ofenkartoffel = "BAKED_POTATO"
-    Bambus_Truhenfloß = "BAMBOO_CHEST_RAFT"
-    Bambusfloß = "BAMBOO_RAFT"
-    Fledermaus_Spawn_Ei = "BAT_SPAWN_EGG"
-    Bienen_Spawn_Ei = "BEE_SPAWN_EGG"
-    Rohes_Rindfleisch = "BEEF"
-    Rote_Bete_Samen = "BEETROOT_SEEDS"
-    Borschtsch = "BEETROOT_SOUP"
-    Birkenholzboot = "BIRCH_BOAT"
-    Birkenholztruhenboot = "BIRCH_CHEST_BOAT"
-    Schwarzer_Farbstoff = "BLACK_DYE"
-    Lohenstaub = "BLAZE_POWDER"
-    Lohenrute = "BLAZE_ROD"
-    Lohen_Spawn_Ei = "BLAZE_SPAWN_EGG"
-    Blauer_Farbstoff = "BLUE_DYE"
-    Knochen = "BONE"
-    Knochenmehl = "BONE_MEAL"
-    Buch = "BOOK"
-    Bogen = "BOW"
-    Schüssel = "BOWL"
-    Brot = "BREAD"
-    Ziegel = "BRICK"
-    Brauner_Farbstoff = "BROWN_DYE"
-    Pinsel = "BRUSH"
-    Eimer = "BUCKET"
-    Bündel = "BUNDLE"
-    Dromedar_Spawn_Ei = "CAMEL_SPAWN_EGG"
-    Karotte = "CARROT"
-    Karottenrute = "CARROT_ON_A_STICK"
-    Katzen_Spawn_Ei = "CAT_SPAWN_EGG"
-    Höhlenspinnen_Spawn_Ei = "CAVE_SPIDER_SPAWN_EGG"
-    Kettenstiefel = "CHAINMAIL_BOOTS"
-    Kettenhemd = "CHAINMAIL_CHESTPLATE"
-    Kettenhaube = "CHAINMAIL_HELMET"
-    Kettenhose = "CHAINMAIL_LEGGINGS"
-    Holzkohle = "CHARCOAL"
-    Kirschholzboot = "CHERRY_BOAT"
-    Kirschholztruhenboot = "CHERRY_CHEST_BOAT"
-    Güterlore = "CHEST_MINECART"
-    Rohes_Hühnchen = "CHICKEN"
-    Huhn_Spawn_Ei = "CHICKEN_SPAWN_EGG"
-    Chorusfrucht = "CHORUS_FRUIT"
-    Tonklumpen = "CLAY_BALL"
-    Uhr = "CLOCK"
-    Kohle = "COAL"
-    Kakaobohnen = "COCOA_BEANS"
-    Roher_Kabeljau = "COD"
-    Kabeljaueimer = "COD_BUCKET"
-    Kabeljau_Spawn_Ei = "COD_SPAWN_EGG"
-    Befehlsblocklore = "COMMAND_BLOCK_MINECART"
-    Kompass = "COMPASS"
-    Steak = "COOKED_BEEF"
-    Gebratenes_Hühnchen = "COOKED_CHICKEN"
-    Gebratener_Kabeljau = "COOKED_COD"
-    Gebratenes_Hammelfleisch = "COOKED_MUTTON"
-    Gebratenes_Schweinefleisch = "COOKED_PORKCHOP"
-    Gebratenes_Kaninchen = "COOKED_RABBIT"
-    Gebratener_Lachs = "COOKED_SALMON"
-    Keks = "COOKIE"
-    Kupferbarren = "COPPER_INGOT"
-    Kuh_Spawn_Ei = "COW_SPAWN_EGG"
-    Bannervorlage = "CREEPER_BANNER_PATTERN"
-    Creeper_Spawn_Ei = "CREEPER_SPAWN_EGG"
-    Armbrust = "CROSSBOW"
-    Türkiser_Farbstoff = "CYAN_DYE"
-    Schwarzeichenholzboot = "DARK_OAK_BOAT"
-    Schwarzeichenholztruhenboot = "DARK_OAK_CHEST_BOAT"
-    Debug_Stab = "DEBUG_STICK"
-    Diamant = "DIAMOND"
-    Diamantaxt = "DIAMOND_AXE"
-    Diamantstiefel = "DIAMOND_BOOTS"
-    Diamantharnisch = "DIAMOND_CHESTPLATE"
-    Diamanthelm = "DIAMOND_HELMET"
-    Diamanthacke = "DIAMOND_HOE"
-    Diamantener_Rossharnisch = "DIAMOND_HORSE_ARMOR"
-    Diamantbeinschutz = "DIAMOND_LEGGINGS"
-    Diamantspitzhacke = "DIAMOND_PICKAXE"
-    Diamantschaufel = "DIAMOND_SHOVEL"
-    Diamantschwert = "DIAMOND_SWORD"
-    Plattenbruchstück = "DISC_FRAGMENT_5"
-    Delfin_Spawn_Ei = "DOLPHIN_SPAWN_EGG"
-    Esel_Spawn_Ei = "DONKEY_SPAWN_EGG"
-    Drachenatem = "DRAGON_BREATH"
-    Getrockneter_Seetang = "DRIED_KELP"
-    Ertrunkenen_Spawn_Ei = "DROWNED_SPAWN_EGG"
-    Echoscherbe = "ECHO_SHARD"
-    Ei = "EGG"
-    Großer_Wächter_Spawn_Ei = "ELDER_GUARDIAN_SPAWN_EGG"
-    Elytren = "ELYTRA"
-    Smaragd = "EMERALD"
-    Verzaubertes_Buch = "ENCHANTED_BOOK"
-    Verzauberter_goldener_Apfel = "ENCHANTED_GOLDEN_APPLE"
-    Enderkristall = "END_CRYSTAL"
-    Enderdrachen_Spawn_Ei = "ENDER_DRAGON_SPAWN_EGG"
-    Enderauge = "ENDER_EYE"
-    Enderperle = "ENDER_PEARL"
-    Enderman_Spawn_Ei = "ENDERMAN_SPAWN_EGG"
-    Endermiten_Spawn_Ei = "ENDERMITE_SPAWN_EGG"
-    Magier_Spawn_Ei = "EVOKER_SPAWN_EGG"
-    Erfahrungsfläschchen = "EXPERIENCE_BOTTLE"
-    Feder = "FEATHER"
-    Fermentiertes_Spinnenauge = "FERMENTED_SPIDER_EYE"
-    Karte = "FILLED_MAP"
-    Feuerkugel = "FIRE_CHARGE"
-    Feuerwerksrakete = "FIREWORK_ROCKET"
-    Feuerwerksstern = "FIREWORK_STAR"
-    Angel = "FISHING_ROD"
-    Feuerstein = "FLINT"
-    Feuerzeug = "FLINT_AND_STEEL"
-    Fuchs_Spawn_Ei = "FOX_SPAWN_EGG"
-    Frosch_Spawn_Ei = "FROG_SPAWN_EGG"
-    Ofenlore = "FURNACE_MINECART"
-    Ghast_Spawn_Ei = "GHAST_SPAWN_EGG"
-    Ghast_Träne = "GHAST_TEAR"
-    Glasflasche = "GLASS_BOTTLE"
-    Glitzernde_Melonenscheibe = "GLISTERING_MELON_SLICE"
-    Leuchtbeeren = "GLOW_BERRIES"
-    Leuchttintenbeutel = "GLOW_INK_SAC"
-    Leuchtrahmen = "GLOW_ITEM_FRAME"
-    Leuchttintenfisch_Spawn_Ei = "GLOW_SQUID_SPAWN_EGG"
-    Leuchtsteinstaub = "GLOWSTONE_DUST"
-    Bockshorn = "GOAT_HORN"
-    Ziegen_Spawn_Ei = "GOAT_SPAWN_EGG"
-    Goldbarren = "GOLD_INGOT"
-    Goldklumpen = "GOLD_NUGGET"
-    Goldener_Apfel = "GOLDEN_APPLE"
-    Goldaxt = "GOLDEN_AXE"
-    Goldstiefel = "GOLDEN_BOOTS"
-    Goldene_Karotte = "GOLDEN_CARROT"
-    Goldharnisch = "GOLDEN_CHESTPLATE"
-    Goldhelm = "GOLDEN_HELMET"
-    Goldhacke = "GOLDEN_HOE"
-    Goldener_Rossharnisch = "GOLDEN_HORSE_ARMOR"
-    Goldbeinschutz = "GOLDEN_LEGGINGS"
-    Goldspitzhacke = "GOLDEN_PICKAXE"
-    Goldschaufel = "GOLDEN_SHOVEL"
-    Goldschwert = "GOLDEN_SWORD"
-    Grauer_Farbstoff = "GRAY_DYE"
-    Grüner_Farbstoff = "GREEN_DYE"
-    Wächter_Spawn_Ei = "GUARDIAN_SPAWN_EGG"
-    Schwarzpulver = "GUNPOWDER"
-    Herz_des_Meeres = "HEART_OF_THE_SEA"
-    Hoglin_Spawn_Ei = "HOGLIN_SPAWN_EGG"
-    Honigflasche = "HONEY_BOTTLE"
-    Honigwabe = "HONEYCOMB"
-    Trichterlore = "HOPPER_MINECART"
-    Pferde_Spawn_Ei = "HORSE_SPAWN_EGG"
-    Wüstenzombie_Spawn_Ei = "HUSK_SPAWN_EGG"
-    Tintenbeutel = "INK_SAC"
-    Eisenaxt = "IRON_AXE"
-    Eisenstiefel = "IRON_BOOTS"
-    Eisenharnisch = "IRON_CHESTPLATE"
-    Eisengolem_Spawn_Ei = "IRON_GOLEM_SPAWN_EGG"
-    Eisenhelm = "IRON_HELMET"
-    Eisenhacke = "IRON_HOE"
-    Eiserner_Rossharnisch = "IRON_HORSE_ARMOR"
-    Eisenbarren = "IRON_INGOT"
-    Eisenbeinschutz = "IRON_LEGGINGS"
-    Eisenklumpen = "IRON_NUGGET"
-    Eisenspitzhacke = "IRON_PICKAXE"
-    Eisenschaufel = "IRON_SHOVEL"
-    Eisenschwert = "IRON_SWORD"
-    Rahmen = "ITEM_FRAME"
-    Tropenholzboot = "JUNGLE_BOAT"
-    Tropenholztruhenboot = "JUNGLE_CHEST_BOAT"
-    Buch_des_Wissens = "KNOWLEDGE_BOOK"
-    Lapislazuli = "LAPIS_LAZULI"
-    Lavaeimer = "LAVA_BUCKET"
-    Leine = "LEAD"
-    Leder = "LEATHER"
-    Lederstiefel = "LEATHER_BOOTS"
-    Lederjacke = "LEATHER_CHESTPLATE"
-    Lederkappe = "LEATHER_HELMET"
-    Lederner_Rossharnisch = "LEATHER_HORSE_ARMOR"
-    Lederhose = "LEATHER_LEGGINGS"
-    Hellblauer_Farbstoff = "LIGHT_BLUE_DYE"
-    Hellgrauer_Farbstoff = "LIGHT_GRAY_DYE"
-    Hellgrüner_Farbstoff = "LIME_DYE"
-    Verweiltrank = "LINGERING_POTION"
-    Lama_Spawn_Ei = "LLAMA_SPAWN_EGG"
-    Magenta_Farbstoff = "MAGENTA_DYE"
-    Magmacreme = "MAGMA_CREAM"
-    Magmawürfel_Spawn_Ei = "MAGMA_CUBE_SPAWN_EGG"
-    Mangrovenholzboot = "MANGROVE_BOAT"
-    Mangrovenholztruhenboot = "MANGROVE_CHEST_BOAT"
-    Leere_Karte = "MAP"
-    Melonenkerne = "MELON_SEEDS"
-    Melonenscheibe = "MELON_SLICE"
-    Milcheimer = "MILK_BUCKET"
-    Lore = "MINECART"
-    Mooshroom_Spawn_Ei = "MOOSHROOM_SPAWN_EGG"
-    Maultier_Spawn_Ei = "MULE_SPAWN_EGG"
-    Pilzsuppe = "MUSHROOM_STEW"
-    Schallplatte = "MUSIC_DISC_11"
-    Rohes_Hammelfleisch = "MUTTON"
-    Namensschild = "NAME_TAG"
-    Nautilusschale = "NAUTILUS_SHELL"
-    Netherstern = "NETHER_STAR"
-    Netherwarze = "NETHER_WART"
-    Netheritaxt = "NETHERITE_AXE"
-    Netheritstiefel = "NETHERITE_BOOTS"
-    Netheritharnisch = "NETHERITE_CHESTPLATE"
-    Netherithelm = "NETHERITE_HELMET"
-    Netherithacke = "NETHERITE_HOE"
-    Netheritbarren = "NETHERITE_INGOT"
-    Netheritbeinschutz = "NETHERITE_LEGGINGS"
-    Netheritspitzhacke = "NETHERITE_PICKAXE"
-    Netheritplatten = "NETHERITE_SCRAP"
-    Netheritschaufel = "NETHERITE_SHOVEL"
-    Netheritschwert = "NETHERITE_SWORD"
-    Eichenholzboot = "OAK_BOAT"
-    Eichenholztruhenboot = "OAK_CHEST_BOAT"
-    Ozelot_Spawn_Ei = "OCELOT_SPAWN_EGG"
-    Oranger_Farbstoff = "ORANGE_DYE"
-    Gemälde = "PAINTING"
-    Panda_Spawn_Ei = "PANDA_SPAWN_EGG"
-    Papier = "PAPER"
-    Papageien_Spawn_Ei = "PARROT_SPAWN_EGG"
-    Phantomhaut = "PHANTOM_MEMBRANE"
-    Phantom_Spawn_Ei = "PHANTOM_SPAWN_EGG"
-    Schweine_Spawn_Ei = "PIG_SPAWN_EGG"
-    Piglin_Barbaren_Spawn_Ei = "PIGLIN_BRUTE_SPAWN_EGG"
-    Piglin_Spawn_Ei = "PIGLIN_SPAWN_EGG"
-    Plünderer_Spawn_Ei = "PILLAGER_SPAWN_EGG"
-    Rosa_Farbstoff = "PINK_DYE"
-    Giftige_Kartoffel = "POISONOUS_POTATO"
-    Eisbären_Spawn_Ei = "POLAR_BEAR_SPAWN_EGG"
-    Geplatzte_Chorusfrucht = "POPPED_CHORUS_FRUIT"
-    Rohes_Schweinefleisch = "PORKCHOP"
-    Kartoffel = "POTATO"
-    Trank = "POTION"
-    Pulverschneeeimer = "POWDER_SNOW_BUCKET"
-    Prismarinkristalle = "PRISMARINE_CRYSTALS"
-    Prismarinscherbe = "PRISMARINE_SHARD"
-    Kugelfisch = "PUFFERFISH"
-    Kugelfischeimer = "PUFFERFISH_BUCKET"
-    Kugelfisch_Spawn_Ei = "PUFFERFISH_SPAWN_EGG"
-    Kürbiskuchen = "PUMPKIN_PIE"
-    Kürbiskerne = "PUMPKIN_SEEDS"
-    Violetter_Farbstoff = "PURPLE_DYE"
-    Netherquarz = "QUARTZ"
-    Rohes_Kaninchen = "RABBIT"
-    Hasenpfote = "RABBIT_FOOT"
-    Kaninchenfell = "RABBIT_HIDE"
-    Kaninchen_Spawn_Ei = "RABBIT_SPAWN_EGG"
-    Kaninchenragout = "RABBIT_STEW"
-    Verwüster_Spawn_Ei = "RAVAGER_SPAWN_EGG"
-    Rohkupfer = "RAW_COPPER"
-    Rohgold = "RAW_GOLD"
-    Roheisen = "RAW_IRON"
-    Bergungskompass = "RECOVERY_COMPASS"
-    Roter_Farbstoff = "RED_DYE"
-    Redstone_Staub = "REDSTONE"
-    Verrottetes_Fleisch = "ROTTEN_FLESH"
-    Sattel = "SADDLE"
-    Roher_Lachs = "SALMON"
-    Lachseimer = "SALMON_BUCKET"
-    Lachs_Spawn_Ei = "SALMON_SPAWN_EGG"
-    Schere = "SHEARS"
-    Schafs_Spawn_Ei = "SHEEP_SPAWN_EGG"
-    Schild = "SHIELD"
-    Shulker_Schale = "SHULKER_SHELL"
-    Shulker_Spawn_Ei = "SHULKER_SPAWN_EGG"
-    Silberfischchen_Spawn_Ei = "SILVERFISH_SPAWN_EGG"
-    Skelettpferde_Spawn_Ei = "SKELETON_HORSE_SPAWN_EGG"
-    Skelett_Spawn_Ei = "SKELETON_SPAWN_EGG"
-    Schleimball = "SLIME_BALL"
-    Schleim_Spawn_Ei = "SLIME_SPAWN_EGG"
-    Schnüffler_Spawn_Ei = "SNIFFER_SPAWN_EGG"
-    Schneegolem_Spawn_Ei = "SNOW_GOLEM_SPAWN_EGG"
-    Schneeball = "SNOWBALL"
-    Spektralpfeil = "SPECTRAL_ARROW"
-    Spinnenauge = "SPIDER_EYE"
-    Spinnen_Spawn_Ei = "SPIDER_SPAWN_EGG"
-    Wurftrank = "SPLASH_POTION"
-    Fichtenholzboot = "SPRUCE_BOAT"
-    Fichtenholztruhenboot = "SPRUCE_CHEST_BOAT"
-    Fernrohr = "SPYGLASS"
-    Tintenfisch_Spawn_Ei = "SQUID_SPAWN_EGG"
-    Stock = "STICK"
-    Steinaxt = "STONE_AXE"
-    Steinhacke = "STONE_HOE"
-    Steinspitzhacke = "STONE_PICKAXE"
-    Steinschaufel = "STONE_SHOVEL"
-    Steinschwert = "STONE_SWORD"
-    Eiswanderer_Spawn_Ei = "STRAY_SPAWN_EGG"
-    Schreiter_Spawn_Ei = "STRIDER_SPAWN_EGG"
-    Faden = "STRING"
-    Zucker = "SUGAR"
-    Seltsame_Suppe = "SUSPICIOUS_STEW"
-    Süßbeeren = "SWEET_BERRIES"
-    Kaulquappeneimer = "TADPOLE_BUCKET"
-    Kaulquappen_Spawn_Ei = "TADPOLE_SPAWN_EGG"
-    Getränkter_Pfeil = "TIPPED_ARROW"
-    TNT_Lore = "TNT_MINECART"
-    Fackelliliensamen = "TORCHFLOWER_SEEDS"
-    Totem_der_Unsterblichkeit = "TOTEM_OF_UNDYING"
-    Händlerlama_Spawn_Ei = "TRADER_LLAMA_SPAWN_EGG"
-    Dreizack = "TRIDENT"
-    Tropenfisch = "TROPICAL_FISH"
-    Tropenfischeimer = "TROPICAL_FISH_BUCKET"
-    Tropenfisch_Spawn_Ei = "TROPICAL_FISH_SPAWN_EGG"
-    Schildkrötenpanzer = "TURTLE_HELMET"
-    Schildkröten_Spawn_Ei = "TURTLE_SPAWN_EGG"
-    Plagegeister_Spawn_Ei = "VEX_SPAWN_EGG"
-    Dorfbewohner_Spawn_Ei = "VILLAGER_SPAWN_EGG"
-    Diener_Spawn_Ei = "VINDICATOR_SPAWN_EGG"
-    Fahrender_Händler_Spawn_Ei = "WANDERING_TRADER_SPAWN_EGG"
-    Wärter_Spawn_Ei = "WARDEN_SPAWN_EGG"
-    Wirrpilzrute = "WARPED_FUNGUS_ON_A_STICK"
-    Wassereimer = "WATER_BUCKET"
-    Weizen = "WHEAT"
-    Weizenkörner = "WHEAT_SEEDS"
-    Weißer_Farbstoff = "WHITE_DYE"
-    Hexen_Spawn_Ei = "WITCH_SPAWN_EGG"
-    Witherskelett_Spawn_Ei = "WITHER_SKELETON_SPAWN_EGG"
-    Wither_Spawn_Ei = "WITHER_SPAWN_EGG"
-    Wolfs_Spawn_Ei = "WOLF_SPAWN_EGG"
-    Holzaxt = "WOODEN_AXE"
-    Holzhacke = "WOODEN_HOE"
-    Holzspitzhacke = "WOODEN_PICKAXE"
-    Holzschaufel = "WOODEN_SHOVEL"
-    Holzschwert = "WOODEN_SWORD"
-    Buch_und_Feder = "WRITABLE_BOOK"
-    Beschriebenes_Buch = "WRITTEN_BOOK"
-    Gelber_Farbstoff = "YELLOW_DYE"
-    Zoglin_Spawn_Ei = "ZOGLIN_SPAWN_EGG"
-    Zombiepferde_Spawn_Ei = "ZOMBIE_HORSE_SPAWN_EGG"
-    Zombie_Spawn_Ei = "ZOMBIE_SPAWN_EGG"
-    Zombiedorfbewohner_Spawn_Ei = "ZOMBIE_VILLAGER_SPAWN_EGG"
-    Zombifizierter_Piglin_Spawn_Ei = "ZOMBIFIED_PIGLIN_SPAWN_EGG"
+def material_aus_ordinal(ordinal: int) -> MaterialSammlung:
+    """
+    Das Material mit der angegebenen Ordinalzahl (siehe zu_ordinal())
+    Args:
+        ordinal (int): z.B. MaterialSammlung.Akazienholzknopf.ordinal
+    Returns:
+        das Material, ein WertFehler, wenn es kein Material mit dieser Ordinalzahl gibt
+    """
+    try:
+        return MaterialSammlung.from_ordinal(ordinal)
+    except ValueError:
+        raise WertFehler(f"Es gibt kein Material mit der Ordinalzahl {ordinal}.") from None
@@ -0,0 +1,1335 @@
+"""Diese Datei ist auto-generiert! Siehe ressourcen/generate_enums.py im git repo! """
+
+from typing import Optional
+
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.core.compact_enum import to_ordinal as zu_ordinal  # noqa: unused-import
+from st_minecraft.en.material import MaterialCollection as _Collection
+
+class MaterialSammlung(CompactEnum):
+    @staticmethod
+    def von_englisch(e: _Collection) -> Optional[MaterialSammlung]: ...
+    def zu_englisch(self) -> Optional[_Collection]: ...
+    Akazienholzknopf: MaterialSammlung
+    Akazienholztür: MaterialSammlung
+    Akazienholzzaun: MaterialSammlung
+    Akazienholzzauntor: MaterialSammlung
+    Akazienholzhängeschild: MaterialSammlung
+    Akazienlaub: MaterialSammlung
+    Akazienstamm: MaterialSammlung
+    Akazienholzbretter: MaterialSammlung
+    Akazienholzdruckplatte: MaterialSammlung
+    Akaziensetzling: MaterialSammlung
+    Akazienholzschild: MaterialSammlung
+    Akazienholzstufe: MaterialSammlung
+    Akazienholztreppe: MaterialSammlung
+    Akazienholzfalltür: MaterialSammlung
+    Akazienholzwandhängeschild: MaterialSammlung
+    Akazienholzwandschild: MaterialSammlung
+    Akazienholz: MaterialSammlung
+    Aktivierungsschiene: MaterialSammlung
+    Luft: MaterialSammlung
+    Zierlauch: MaterialSammlung
+    Amethystblock: MaterialSammlung
+    Amethysthaufen: MaterialSammlung
+    Antiker_Schrott: MaterialSammlung
+    Andesit: MaterialSammlung
+    Andesitstufe: MaterialSammlung
+    Andesittreppe: MaterialSammlung
+    Andesitmauer: MaterialSammlung
+    Amboss: MaterialSammlung
+    Melonenranke: MaterialSammlung
+    Kürbisranke: MaterialSammlung
+    Azalee: MaterialSammlung
+    Azaleenlaub: MaterialSammlung
+    Porzellansternchen: MaterialSammlung
+    Bambus: MaterialSammlung
+    Bambusblock: MaterialSammlung
+    Bambusknopf: MaterialSammlung
+    Bambustür: MaterialSammlung
+    Bambuszaun: MaterialSammlung
+    Bambuszauntor: MaterialSammlung
+    Bambushängeschild: MaterialSammlung
+    Bambusmosaik: MaterialSammlung
+    Bambusmosaikstufe: MaterialSammlung
+    Bambusmosaiktreppe: MaterialSammlung
+    Bambusbretter: MaterialSammlung
+    Bambusdruckplatte: MaterialSammlung
+    Bambussprössling: MaterialSammlung
+    Bambusschild: MaterialSammlung
+    Bambusstufe: MaterialSammlung
+    Bambustreppe: MaterialSammlung
+    Bambusfalltür: MaterialSammlung
+    Bambuswandhängeschild: MaterialSammlung
+    Bambuswandschild: MaterialSammlung
+    Fass: MaterialSammlung
+    Barriere: MaterialSammlung
+    Basalt: MaterialSammlung
+    Leuchtfeuer: MaterialSammlung
+    Grundgestein: MaterialSammlung
+    Bienennest: MaterialSammlung
+    Bienenstock: MaterialSammlung
+    Rote_Bete: MaterialSammlung
+    Glocke: MaterialSammlung
+    Großes_Tropfblatt: MaterialSammlung
+    Großer_Tropfblattstiel: MaterialSammlung
+    Birkenholzknopf: MaterialSammlung
+    Birkenholztür: MaterialSammlung
+    Birkenholzzaun: MaterialSammlung
+    Birkenholzzauntor: MaterialSammlung
+    Birkenholzhängeschild: MaterialSammlung
+    Birkenlaub: MaterialSammlung
+    Birkenstamm: MaterialSammlung
+    Birkenholzbretter: MaterialSammlung
+    Birkenholzdruckplatte: MaterialSammlung
+    Birkensetzling: MaterialSammlung
+    Birkenholzschild: MaterialSammlung
+    Birkenholzstufe: MaterialSammlung
+    Birkenholztreppe: MaterialSammlung
+    Birkenholzfalltür: MaterialSammlung
+    Birkenholzwandhängeschild: MaterialSammlung
+    Birkenholzwandschild: MaterialSammlung
+    Birkenholz: MaterialSammlung
+    Schwarzes_Banner: MaterialSammlung
+    Schwarzes_Bett: MaterialSammlung
+    Schwarze_Kerze: MaterialSammlung
+    Kuchen_mit_schwarzer_Kerze: MaterialSammlung
+    Schwarzer_Teppich: MaterialSammlung
+    Schwarzer_Beton: MaterialSammlung
+    Schwarzer_Trockenbeton: MaterialSammlung
+    Schwarze_glasierte_Keramik: MaterialSammlung
+    Schwarze_Shulker_Kiste: MaterialSammlung
+    Schwarzes_Glas: MaterialSammlung
+    Schwarze_Glasscheibe: MaterialSammlung
+    Schwarze_Keramik: MaterialSammlung
+    Schwarze_Wolle: MaterialSammlung
+    Schwarzstein: MaterialSammlung
+    Schwarzsteinstufe: MaterialSammlung
+    Schwarzsteintreppe: MaterialSammlung
+    Schwarzsteinmauer: MaterialSammlung
+    Schmelzofen: MaterialSammlung
+    Blaues_Banner: MaterialSammlung
+    Blaues_Bett: MaterialSammlung
+    Blaue_Kerze: MaterialSammlung
+    Kuchen_mit_blauer_Kerze: MaterialSammlung
+    Blauer_Teppich: MaterialSammlung
+    Blauer_Beton: MaterialSammlung
+    Blauer_Trockenbeton: MaterialSammlung
+    Blaue_glasierte_Keramik: MaterialSammlung
+    Blaueis: MaterialSammlung
+    Blaue_Orchidee: MaterialSammlung
+    Blaue_Shulker_Kiste: MaterialSammlung
+    Blaues_Glas: MaterialSammlung
+    Blaue_Glasscheibe: MaterialSammlung
+    Blaue_Keramik: MaterialSammlung
+    Blaue_Wolle: MaterialSammlung
+    Knochenblock: MaterialSammlung
+    Bücherregal: MaterialSammlung
+    Hirnkoralle: MaterialSammlung
+    Hirnkorallenblock: MaterialSammlung
+    Hirnkorallenfächer: MaterialSammlung
+    Hirnkorallenwandfächer: MaterialSammlung
+    Braustand: MaterialSammlung
+    Ziegelstufe: MaterialSammlung
+    Ziegeltreppe: MaterialSammlung
+    Ziegelsteinmauer: MaterialSammlung
+    Ziegelsteine: MaterialSammlung
+    Braunes_Banner: MaterialSammlung
+    Braunes_Bett: MaterialSammlung
+    Braune_Kerze: MaterialSammlung
+    Kuchen_mit_brauner_Kerze: MaterialSammlung
+    Brauner_Teppich: MaterialSammlung
+    Brauner_Beton: MaterialSammlung
+    Brauner_Trockenbeton: MaterialSammlung
+    Braune_glasierte_Keramik: MaterialSammlung
+    Brauner_Pilz: MaterialSammlung
+    Brauner_Pilzblock: MaterialSammlung
+    Braune_Shulker_Kiste: MaterialSammlung
+    Braunes_Glas: MaterialSammlung
+    Braune_Glasscheibe: MaterialSammlung
+    Braune_Keramik: MaterialSammlung
+    Braune_Wolle: MaterialSammlung
+    Blasensäule: MaterialSammlung
+    Blasenkoralle: MaterialSammlung
+    Blasenkorallenblock: MaterialSammlung
+    Blasenkorallenfächer: MaterialSammlung
+    Blasenkorallenwandfächer: MaterialSammlung
+    Amethystknospenblock: MaterialSammlung
+    Kaktus: MaterialSammlung
+    Kuchen: MaterialSammlung
+    Kalzit: MaterialSammlung
+    Lagerfeuer: MaterialSammlung
+    Kerze: MaterialSammlung
+    Kuchen_mit_Kerze: MaterialSammlung
+    Karotten: MaterialSammlung
+    Kartentisch: MaterialSammlung
+    Geschnitzter_Kürbis: MaterialSammlung
+    Kessel: MaterialSammlung
+    Höhlenluft: MaterialSammlung
+    Höhlenranken: MaterialSammlung
+    Höhlenrankenpflanze: MaterialSammlung
+    Kette: MaterialSammlung
+    Ketten_Befehlsblock: MaterialSammlung
+    Kirschholzknopf: MaterialSammlung
+    Kirschholztür: MaterialSammlung
+    Kirschholzzaun: MaterialSammlung
+    Kirschholzzauntor: MaterialSammlung
+    Kirschholzhängeschild: MaterialSammlung
+    Kirschlaub: MaterialSammlung
+    Kirschstamm: MaterialSammlung
+    Kirschholzbretter: MaterialSammlung
+    Kirschholzdruckplatte: MaterialSammlung
+    Kirschsetzling: MaterialSammlung
+    Kirschholzschild: MaterialSammlung
+    Kirschholzstufe: MaterialSammlung
+    Kirschholztreppe: MaterialSammlung
+    Kirschholzfalltür: MaterialSammlung
+    Kirschholzwandhängeschild: MaterialSammlung
+    Kirschholzwandschild: MaterialSammlung
+    Kirschholz: MaterialSammlung
+    Truhe: MaterialSammlung
+    Angeschlagener_Amboss: MaterialSammlung
+    Gearbeitetes_Bücherregal: MaterialSammlung
+    Gemeißelter_Tiefenschiefer: MaterialSammlung
+    Gemeißelte_Netherziegel: MaterialSammlung
+    Gemeißelter_polierter_Schwarzstein: MaterialSammlung
+    Gemeißelter_Quarzblock: MaterialSammlung
+    Gemeißelter_roter_Sandstein: MaterialSammlung
+    Gemeißelter_Sandstein: MaterialSammlung
+    Gemeißelte_Steinziegel: MaterialSammlung
+    Chorusblüte: MaterialSammlung
+    Choruspflanze: MaterialSammlung
+    Ton: MaterialSammlung
+    Kohleblock: MaterialSammlung
+    Steinkohle: MaterialSammlung
+    Grobe_Erde: MaterialSammlung
+    Bruchtiefenschiefer: MaterialSammlung
+    Bruchtiefenschieferstufe: MaterialSammlung
+    Bruchtiefenschiefertreppe: MaterialSammlung
+    Bruchtiefenschiefermauer: MaterialSammlung
+    Bruchstein: MaterialSammlung
+    Bruchsteinstufe: MaterialSammlung
+    Bruchsteintreppe: MaterialSammlung
+    Bruchsteinmauer: MaterialSammlung
+    Spinnennetz: MaterialSammlung
+    Kakao: MaterialSammlung
+    Befehlsblock: MaterialSammlung
+    Redstone_Komparator: MaterialSammlung
+    Komposter: MaterialSammlung
+    Aquisator: MaterialSammlung
+    Kupferblock: MaterialSammlung
+    Kupfererz: MaterialSammlung
+    Kornblume: MaterialSammlung
+    Rissige_Tiefenschieferziegel: MaterialSammlung
+    Rissige_Tiefenschieferfliesen: MaterialSammlung
+    Rissige_Netherziegel: MaterialSammlung
+    Rissige_polierte_Schwarzsteinziegel: MaterialSammlung
+    Rissige_Steinziegel: MaterialSammlung
+    Werkbank: MaterialSammlung
+    Creeperkopf: MaterialSammlung
+    Creeper_Wandkopf: MaterialSammlung
+    Karmesinknopf: MaterialSammlung
+    Karmesintür: MaterialSammlung
+    Karmesinzaun: MaterialSammlung
+    Karmesinzauntor: MaterialSammlung
+    Karmesinpilz: MaterialSammlung
+    Karmesinhängeschild: MaterialSammlung
+    Karmesinhyphen: MaterialSammlung
+    Karmesin_Nezel: MaterialSammlung
+    Karmesinbretter: MaterialSammlung
+    Karmesindruckplatte: MaterialSammlung
+    Karmesinwurzeln: MaterialSammlung
+    Karmesinschild: MaterialSammlung
+    Karmesinstufe: MaterialSammlung
+    Karmesintreppe: MaterialSammlung
+    Karmesinstiel: MaterialSammlung
+    Karmesinfalltür: MaterialSammlung
+    Karmesinwandhängeschild: MaterialSammlung
+    Karmesinwandschild: MaterialSammlung
+    Weinender_Obsidian: MaterialSammlung
+    Geschnittener_Kupferblock: MaterialSammlung
+    Geschnittene_Kupferstufe: MaterialSammlung
+    Geschnittene_Kupfertreppe: MaterialSammlung
+    Geschnittener_roter_Sandstein: MaterialSammlung
+    Geschnittene_rote_Sandsteinstufe: MaterialSammlung
+    Geschnittener_Sandstein: MaterialSammlung
+    Geschnittene_Sandsteinstufe: MaterialSammlung
+    Türkises_Banner: MaterialSammlung
+    Türkises_Bett: MaterialSammlung
+    Türkise_Kerze: MaterialSammlung
+    Kuchen_mit_türkiser_Kerze: MaterialSammlung
+    Türkiser_Teppich: MaterialSammlung
+    Türkiser_Beton: MaterialSammlung
+    Türkiser_Trockenbeton: MaterialSammlung
+    Türkise_glasierte_Keramik: MaterialSammlung
+    Türkise_Shulker_Kiste: MaterialSammlung
+    Türkises_Glas: MaterialSammlung
+    Türkise_Glasscheibe: MaterialSammlung
+    Türkise_Keramik: MaterialSammlung
+    Türkise_Wolle: MaterialSammlung
+    Beschädigter_Amboss: MaterialSammlung
+    Löwenzahn: MaterialSammlung
+    Schwarzeichenholzknopf: MaterialSammlung
+    Schwarzeichenholztür: MaterialSammlung
+    Schwarzeichenholzzaun: MaterialSammlung
+    Schwarzeichenholzzauntor: MaterialSammlung
+    Schwarzeichenholzhängeschild: MaterialSammlung
+    Schwarzeichenlaub: MaterialSammlung
+    Schwarzeichenstamm: MaterialSammlung
+    Schwarzeichenholzbretter: MaterialSammlung
+    Schwarzeichenholzdruckplatte: MaterialSammlung
+    Schwarzeichensetzling: MaterialSammlung
+    Schwarzeichenholzschild: MaterialSammlung
+    Schwarzeichenholzstufe: MaterialSammlung
+    Schwarzeichenholztreppe: MaterialSammlung
+    Schwarzeichenholzfalltür: MaterialSammlung
+    Schwarzeichenholzwandhängeschild: MaterialSammlung
+    Schwarzeichenholzwandschild: MaterialSammlung
+    Schwarzeichenholz: MaterialSammlung
+    Dunkler_Prismarin: MaterialSammlung
+    Dunkle_Prismarinstufe: MaterialSammlung
+    Dunkle_Prismarintreppe: MaterialSammlung
+    Tageslichtsensor: MaterialSammlung
+    Abgestorbene_Hirnkoralle: MaterialSammlung
+    Abgestorbener_Hirnkorallenblock: MaterialSammlung
+    Abgestorbener_Hirnkorallenfächer: MaterialSammlung
+    Abgestorbener_Hirnkorallenwandfächer: MaterialSammlung
+    Abgestorbene_Blasenkoralle: MaterialSammlung
+    Abgestorbener_Blasenkorallenblock: MaterialSammlung
+    Abgestorbener_Blasenkorallenfächer: MaterialSammlung
+    Abgestorbener_Blasenkorallenwandfächer: MaterialSammlung
+    Toter_Busch: MaterialSammlung
+    Abgestorbene_Feuerkoralle: MaterialSammlung
+    Abgestorbener_Feuerkorallenblock: MaterialSammlung
+    Abgestorbener_Feuerkorallenfächer: MaterialSammlung
+    Abgestorbener_Feuerkorallenwandfächer: MaterialSammlung
+    Abgestorbene_Geweihkoralle: MaterialSammlung
+    Abgestorbener_Geweihkorallenblock: MaterialSammlung
+    Abgestorbener_Geweihkorallenfächer: MaterialSammlung
+    Abgestorbener_Geweihkorallenwandfächer: MaterialSammlung
+    Abgestorbene_Orgelkoralle: MaterialSammlung
+    Abgestorbener_Orgelkorallenblock: MaterialSammlung
+    Abgestorbener_Orgelkorallenfächer: MaterialSammlung
+    Abgestorbener_Orgelkorallenwandfächer: MaterialSammlung
+    Verzierter_Krug: MaterialSammlung
+    Tiefenschiefer: MaterialSammlung
+    Tiefenschieferziegelstufe: MaterialSammlung
+    Tiefenschieferziegeltreppe: MaterialSammlung
+    Tiefenschieferziegelmauer: MaterialSammlung
+    Tiefenschieferziegel: MaterialSammlung
+    Tiefenschiefer_Steinkohle: MaterialSammlung
+    Tiefenschiefer_Kupfererz: MaterialSammlung
+    Tiefenschiefer_Diamanterz: MaterialSammlung
+    Tiefenschiefer_Smaragderz: MaterialSammlung
+    Tiefenschiefer_Golderz: MaterialSammlung
+    Tiefenschiefer_Eisenerz: MaterialSammlung
+    Tiefenschiefer_Lapislazulierz: MaterialSammlung
+    Tiefenschiefer_Redstone_Erz: MaterialSammlung
+    Tiefenschieferfliesenstufe: MaterialSammlung
+    Tiefenschieferfliesentreppe: MaterialSammlung
+    Tiefenschieferfliesenmauer: MaterialSammlung
+    Tiefenschieferfliesen: MaterialSammlung
+    Sensorschiene: MaterialSammlung
+    Diamantblock: MaterialSammlung
+    Diamanterz: MaterialSammlung
+    Diorit: MaterialSammlung
+    Dioritstufe: MaterialSammlung
+    Diorittreppe: MaterialSammlung
+    Dioritmauer: MaterialSammlung
+    Erde: MaterialSammlung
+    Trampelpfad: MaterialSammlung
+    Werfer: MaterialSammlung
+    Drachenei: MaterialSammlung
+    Drachenkopf: MaterialSammlung
+    Drachen_Wandkopf: MaterialSammlung
+    Getrockneter_Seetangblock: MaterialSammlung
+    Tropfsteinblock: MaterialSammlung
+    Spender: MaterialSammlung
+    Smaragdblock: MaterialSammlung
+    Smaragderz: MaterialSammlung
+    Zaubertisch: MaterialSammlung
+    Endtransitportal: MaterialSammlung
+    Endportal: MaterialSammlung
+    Endportalrahmen: MaterialSammlung
+    Endstab: MaterialSammlung
+    Endstein: MaterialSammlung
+    Endsteinziegelstufe: MaterialSammlung
+    Endsteinziegeltreppe: MaterialSammlung
+    Endsteinziegelmauer: MaterialSammlung
+    Endsteinziegel: MaterialSammlung
+    Endertruhe: MaterialSammlung
+    Angelaufener_Kupferblock: MaterialSammlung
+    Angelaufener_geschnittener_Kupferblock: MaterialSammlung
+    Angelaufene_geschnittene_Kupferstufe: MaterialSammlung
+    Angelaufene_geschnittene_Kupfertreppe: MaterialSammlung
+    Ackerboden: MaterialSammlung
+    Farn: MaterialSammlung
+    Feuer: MaterialSammlung
+    Feuerkoralle: MaterialSammlung
+    Feuerkorallenblock: MaterialSammlung
+    Feuerkorallenfächer: MaterialSammlung
+    Feuerkorallenwandfächer: MaterialSammlung
+    Bognertisch: MaterialSammlung
+    Blumentopf: MaterialSammlung
+    Blühende_Azalee: MaterialSammlung
+    Blühendes_Azaleenlaub: MaterialSammlung
+    Froschlaich: MaterialSammlung
+    Brüchiges_Eis: MaterialSammlung
+    Ofen: MaterialSammlung
+    Golddurchzogener_Schwarzstein: MaterialSammlung
+    Glas: MaterialSammlung
+    Glasscheibe: MaterialSammlung
+    Leuchtflechte: MaterialSammlung
+    Leuchtstein: MaterialSammlung
+    Goldblock: MaterialSammlung
+    Golderz: MaterialSammlung
+    Granit: MaterialSammlung
+    Granitstufe: MaterialSammlung
+    Granittreppe: MaterialSammlung
+    Granitmauer: MaterialSammlung
+    Grasblock: MaterialSammlung
+    Kies: MaterialSammlung
+    Graues_Banner: MaterialSammlung
+    Graues_Bett: MaterialSammlung
+    Graue_Kerze: MaterialSammlung
+    Kuchen_mit_grauer_Kerze: MaterialSammlung
+    Grauer_Teppich: MaterialSammlung
+    Grauer_Beton: MaterialSammlung
+    Grauer_Trockenbeton: MaterialSammlung
+    Graue_glasierte_Keramik: MaterialSammlung
+    Graue_Shulker_Kiste: MaterialSammlung
+    Graues_Glas: MaterialSammlung
+    Graue_Glasscheibe: MaterialSammlung
+    Graue_Keramik: MaterialSammlung
+    Graue_Wolle: MaterialSammlung
+    Grünes_Banner: MaterialSammlung
+    Grünes_Bett: MaterialSammlung
+    Grüne_Kerze: MaterialSammlung
+    Kuchen_mit_grüner_Kerze: MaterialSammlung
+    Grüner_Teppich: MaterialSammlung
+    Grüner_Beton: MaterialSammlung
+    Grüner_Trockenbeton: MaterialSammlung
+    Grüne_glasierte_Keramik: MaterialSammlung
+    Grüne_Shulker_Kiste: MaterialSammlung
+    Grünes_Glas: MaterialSammlung
+    Grüne_Glasscheibe: MaterialSammlung
+    Grüne_Keramik: MaterialSammlung
+    Grüne_Wolle: MaterialSammlung
+    Schleifstein: MaterialSammlung
+    Hängende_Wurzeln: MaterialSammlung
+    Strohballen: MaterialSammlung
+    Grobwägeplatte: MaterialSammlung
+    Honigblock: MaterialSammlung
+    Honigwabenblock: MaterialSammlung
+    Trichter: MaterialSammlung
+    Geweihkoralle: MaterialSammlung
+    Geweihkorallenblock: MaterialSammlung
+    Geweihkorallenfächer: MaterialSammlung
+    Geweihkorallenwandfächer: MaterialSammlung
+    Eis: MaterialSammlung
+    Befallene_gemeißelte_Steinziegel: MaterialSammlung
+    Befallener_Bruchstein: MaterialSammlung
+    Befallene_rissige_Steinziegel: MaterialSammlung
+    Befallener_Tiefenschiefer: MaterialSammlung
+    Befallene_bemooste_Steinziegel: MaterialSammlung
+    Befallener_Stein: MaterialSammlung
+    Befallene_Steinziegel: MaterialSammlung
+    Eisengitter: MaterialSammlung
+    Eisenblock: MaterialSammlung
+    Eisentür: MaterialSammlung
+    Eisenerz: MaterialSammlung
+    Eisenfalltür: MaterialSammlung
+    Kürbislaterne: MaterialSammlung
+    Verbundblock: MaterialSammlung
+    Plattenspieler: MaterialSammlung
+    Tropenholzknopf: MaterialSammlung
+    Tropenholztür: MaterialSammlung
+    Tropenholzzaun: MaterialSammlung
+    Tropenholzzauntor: MaterialSammlung
+    Tropenholzhängeschild: MaterialSammlung
+    Tropenbaumlaub: MaterialSammlung
+    Tropenbaumstamm: MaterialSammlung
+    Tropenholzbretter: MaterialSammlung
+    Tropenholzdruckplatte: MaterialSammlung
+    Tropenbaumsetzling: MaterialSammlung
+    Tropenholzschild: MaterialSammlung
+    Tropenholzstufe: MaterialSammlung
+    Tropenholztreppe: MaterialSammlung
+    Tropenholzfalltür: MaterialSammlung
+    Tropenholzwandhängeschild: MaterialSammlung
+    Tropenholzwandschild: MaterialSammlung
+    Tropenholz: MaterialSammlung
+    Seetang: MaterialSammlung
+    Seetangstängel: MaterialSammlung
+    Leiter: MaterialSammlung
+    Laterne: MaterialSammlung
+    Lapislazuliblock: MaterialSammlung
+    Lapislazulierz: MaterialSammlung
+    Große_Amethystknospe: MaterialSammlung
+    Großer_Farn: MaterialSammlung
+    Lava: MaterialSammlung
+    Lavakessel: MaterialSammlung
+    Lesepult: MaterialSammlung
+    Hebel: MaterialSammlung
+    Lichtblock: MaterialSammlung
+    Hellblaues_Banner: MaterialSammlung
+    Hellblaues_Bett: MaterialSammlung
+    Hellblaue_Kerze: MaterialSammlung
+    Kuchen_mit_hellblauer_Kerze: MaterialSammlung
+    Hellblauer_Teppich: MaterialSammlung
+    Hellblauer_Beton: MaterialSammlung
+    Hellblauer_Trockenbeton: MaterialSammlung
+    Hellblaue_glasierte_Keramik: MaterialSammlung
+    Hellblaue_Shulker_Kiste: MaterialSammlung
+    Hellblaues_Glas: MaterialSammlung
+    Hellblaue_Glasscheibe: MaterialSammlung
+    Hellblaue_Keramik: MaterialSammlung
+    Hellblaue_Wolle: MaterialSammlung
+    Hellgraues_Banner: MaterialSammlung
+    Hellgraues_Bett: MaterialSammlung
+    Hellgraue_Kerze: MaterialSammlung
+    Kuchen_mit_hellgrauer_Kerze: MaterialSammlung
+    Hellgrauer_Teppich: MaterialSammlung
+    Hellgrauer_Beton: MaterialSammlung
+    Hellgrauer_Trockenbeton: MaterialSammlung
+    Hellgraue_glasierte_Keramik: MaterialSammlung
+    Hellgraue_Shulker_Kiste: MaterialSammlung
+    Hellgraues_Glas: MaterialSammlung
+    Hellgraue_Glasscheibe: MaterialSammlung
+    Hellgraue_Keramik: MaterialSammlung
+    Hellgraue_Wolle: MaterialSammlung
+    Feinwägeplatte: MaterialSammlung
+    Blitzableiter: MaterialSammlung
+    Flieder: MaterialSammlung
+    Maiglöckchen: MaterialSammlung
+    Seerosenblatt: MaterialSammlung
+    Hellgrünes_Banner: MaterialSammlung
+    Hellgrünes_Bett: MaterialSammlung
+    Hellgrüne_Kerze: MaterialSammlung
+    Kuchen_mit_hellgrüner_Kerze: MaterialSammlung
+    Hellgrüner_Teppich: MaterialSammlung
+    Hellgrüner_Beton: MaterialSammlung
+    Hellgrüner_Trockenbeton: MaterialSammlung
+    Hellgrüne_glasierte_Keramik: MaterialSammlung
+    Hellgrüne_Shulker_Kiste: MaterialSammlung
+    Hellgrünes_Glas: MaterialSammlung
+    Hellgrüne_Glasscheibe: MaterialSammlung
+    Hellgrüne_Keramik: MaterialSammlung
+    Hellgrüne_Wolle: MaterialSammlung
+    Leitstein: MaterialSammlung
+    Webstuhl: MaterialSammlung
+    Magenta_Banner: MaterialSammlung
+    Magenta_Bett: MaterialSammlung
+    Magenta_Kerze: MaterialSammlung
+    Kuchen_mit_magenta_Kerze: MaterialSammlung
+    Magenta_Teppich: MaterialSammlung
+    Magenta_Beton: MaterialSammlung
+    Magenta_Trockenbeton: MaterialSammlung
+    Magenta_glasierte_Keramik: MaterialSammlung
+    Magenta_Shulker_Kiste: MaterialSammlung
+    Magenta_Glas: MaterialSammlung
+    Magenta_Glasscheibe: MaterialSammlung
+    Magenta_Keramik: MaterialSammlung
+    Magenta_Wolle: MaterialSammlung
+    Magmablock: MaterialSammlung
+    Mangrovenholzknopf: MaterialSammlung
+    Mangrovenholztür: MaterialSammlung
+    Mangrovenholzzaun: MaterialSammlung
+    Mangrovenholzzauntor: MaterialSammlung
+    Mangrovenholzhängeschild: MaterialSammlung
+    Mangrovenlaub: MaterialSammlung
+    Mangrovenstamm: MaterialSammlung
+    Mangrovenholzbretter: MaterialSammlung
+    Mangrovenholzdruckplatte: MaterialSammlung
+    Mangroven_Keimling: MaterialSammlung
+    Mangrovenwurzeln: MaterialSammlung
+    Mangrovenholzschild: MaterialSammlung
+    Mangrovenholzstufe: MaterialSammlung
+    Mangrovenholztreppe: MaterialSammlung
+    Mangrovenholzfalltür: MaterialSammlung
+    Mangrovenholzwandhängeschild: MaterialSammlung
+    Mangrovenholzwandschild: MaterialSammlung
+    Mangrovenholz: MaterialSammlung
+    Mittlere_Amethystknospe: MaterialSammlung
+    Melone: MaterialSammlung
+    Melonenpflanze: MaterialSammlung
+    Moosblock: MaterialSammlung
+    Moosteppich: MaterialSammlung
+    Bemooster_Bruchstein: MaterialSammlung
+    Bemooste_Bruchsteinstufe: MaterialSammlung
+    Bemooste_Bruchsteintreppe: MaterialSammlung
+    Bemooste_Bruchsteinmauer: MaterialSammlung
+    Bemooste_Steinziegelstufe: MaterialSammlung
+    Bemooste_Steinziegeltreppe: MaterialSammlung
+    Bemooste_Steinziegelmauer: MaterialSammlung
+    Bemooste_Steinziegel: MaterialSammlung
+    Bewegter_Block: MaterialSammlung
+    Schlamm: MaterialSammlung
+    Schlammziegelstufe: MaterialSammlung
+    Schlammziegeltreppe: MaterialSammlung
+    Schlammziegelmauer: MaterialSammlung
+    Schlammziegel: MaterialSammlung
+    Schlammige_Mangrovenwurzeln: MaterialSammlung
+    Pilzstiel: MaterialSammlung
+    Myzel: MaterialSammlung
+    Netherziegelzaun: MaterialSammlung
+    Netherziegelstufe: MaterialSammlung
+    Netherziegeltreppe: MaterialSammlung
+    Netherziegelmauer: MaterialSammlung
+    Netherziegel: MaterialSammlung
+    Nethergolderz: MaterialSammlung
+    Netherportal: MaterialSammlung
+    Netherquarzerz: MaterialSammlung
+    Nethersprossen: MaterialSammlung
+    Netherwarzen: MaterialSammlung
+    Netherwarzenblock: MaterialSammlung
+    Netheritblock: MaterialSammlung
+    Netherrack: MaterialSammlung
+    Notenblock: MaterialSammlung
+    Eichenholzknopf: MaterialSammlung
+    Eichenholztür: MaterialSammlung
+    Eichenholzzaun: MaterialSammlung
+    Eichenholzzauntor: MaterialSammlung
+    Eichenholzhängeschild: MaterialSammlung
+    Eichenlaub: MaterialSammlung
+    Eichenstamm: MaterialSammlung
+    Eichenholzbretter: MaterialSammlung
+    Eichenholzdruckplatte: MaterialSammlung
+    Eichensetzling: MaterialSammlung
+    Eichenholzschild: MaterialSammlung
+    Eichenholzstufe: MaterialSammlung
+    Eichenholztreppe: MaterialSammlung
+    Eichenholzfalltür: MaterialSammlung
+    Eichenholzwandhängeschild: MaterialSammlung
+    Eichenholzwandschild: MaterialSammlung
+    Eichenholz: MaterialSammlung
+    Beobachter: MaterialSammlung
+    Obsidian: MaterialSammlung
+    Ockernes_Froschlicht: MaterialSammlung
+    Oranges_Banner: MaterialSammlung
+    Oranges_Bett: MaterialSammlung
+    Orange_Kerze: MaterialSammlung
+    Kuchen_mit_oranger_Kerze: MaterialSammlung
+    Oranger_Teppich: MaterialSammlung
+    Oranger_Beton: MaterialSammlung
+    Oranger_Trockenbeton: MaterialSammlung
+    Orange_glasierte_Keramik: MaterialSammlung
+    Orange_Shulker_Kiste: MaterialSammlung
+    Oranges_Glas: MaterialSammlung
+    Orange_Glasscheibe: MaterialSammlung
+    Orange_Keramik: MaterialSammlung
+    Orange_Tulpe: MaterialSammlung
+    Orange_Wolle: MaterialSammlung
+    Margerite: MaterialSammlung
+    Oxidierter_Kupferblock: MaterialSammlung
+    Oxidierter_geschnittener_Kupferblock: MaterialSammlung
+    Oxidierte_geschnittene_Kupferstufe: MaterialSammlung
+    Oxidierte_geschnittene_Kupfertreppe: MaterialSammlung
+    Packeis: MaterialSammlung
+    Fester_Schlamm: MaterialSammlung
+    Perlmutternes_Froschlicht: MaterialSammlung
+    Pfingstrose: MaterialSammlung
+    Versteinerte_Eichenholzstufe: MaterialSammlung
+    Piglinkopf: MaterialSammlung
+    Piglin_Wandkopf: MaterialSammlung
+    Rosa_Banner: MaterialSammlung
+    Rosa_Bett: MaterialSammlung
+    Rosa_Kerze: MaterialSammlung
+    Kuchen_mit_rosa_Kerze: MaterialSammlung
+    Rosa_Teppich: MaterialSammlung
+    Rosa_Beton: MaterialSammlung
+    Rosa_Trockenbeton: MaterialSammlung
+    Rosa_glasierte_Keramik: MaterialSammlung
+    Rosa_Blütenblätter: MaterialSammlung
+    Rosa_Shulker_Kiste: MaterialSammlung
+    Rosa_Glas: MaterialSammlung
+    Rosa_Glasscheibe: MaterialSammlung
+    Rosa_Keramik: MaterialSammlung
+    Rosa_Tulpe: MaterialSammlung
+    Rosa_Wolle: MaterialSammlung
+    Kolben: MaterialSammlung
+    Kolbenkopf: MaterialSammlung
+    Spielerkopf: MaterialSammlung
+    Spieler_Wandkopf: MaterialSammlung
+    Podsol: MaterialSammlung
+    Spitzer_Tropfstein: MaterialSammlung
+    Polierter_Andesit: MaterialSammlung
+    Polierte_Andesitstufe: MaterialSammlung
+    Polierte_Andesittreppe: MaterialSammlung
+    Polierter_Basalt: MaterialSammlung
+    Polierter_Schwarzstein: MaterialSammlung
+    Polierte_Schwarzsteinziegelstufe: MaterialSammlung
+    Polierte_Schwarzsteinziegeltreppe: MaterialSammlung
+    Polierte_Schwarzsteinziegelmauer: MaterialSammlung
+    Polierte_Schwarzsteinziegel: MaterialSammlung
+    Polierter_Schwarzsteinknopf: MaterialSammlung
+    Polierte_Schwarzsteindruckplatte: MaterialSammlung
+    Polierte_Schwarzsteinstufe: MaterialSammlung
+    Polierte_Schwarzsteintreppe: MaterialSammlung
+    Polierte_Schwarzsteinmauer: MaterialSammlung
+    Polierter_Tiefenschiefer: MaterialSammlung
+    Polierte_Tiefenschieferstufe: MaterialSammlung
+    Polierte_Tiefenschiefertreppe: MaterialSammlung
+    Polierte_Tiefenschiefermauer: MaterialSammlung
+    Polierter_Diorit: MaterialSammlung
+    Polierte_Dioritstufe: MaterialSammlung
+    Polierte_Diorittreppe: MaterialSammlung
+    Polierter_Granit: MaterialSammlung
+    Polierte_Granitstufe: MaterialSammlung
+    Polierte_Granittreppe: MaterialSammlung
+    Mohn: MaterialSammlung
+    Kartoffeln: MaterialSammlung
+    Eingetopfter_Akaziensetzling: MaterialSammlung
+    Eingetopfter_Zierlauch: MaterialSammlung
+    Eingetopfte_Azalee: MaterialSammlung
+    Eingetopftes_Porzellansternchen: MaterialSammlung
+    Eingetopfter_Bambus: MaterialSammlung
+    Eingetopfter_Birkensetzling: MaterialSammlung
+    Eingetopfte_blaue_Orchidee: MaterialSammlung
+    Eingetopfter_brauner_Pilz: MaterialSammlung
+    Eingetopfter_Kaktus: MaterialSammlung
+    Eingetopfter_Kirschsetzling: MaterialSammlung
+    Eingetopfte_Kornblume: MaterialSammlung
+    Eingetopfter_Karmesinpilz: MaterialSammlung
+    Eingetopfte_Karmesinwurzeln: MaterialSammlung
+    Eingetopfter_Löwenzahn: MaterialSammlung
+    Eingetopfter_Schwarzeichensetzling: MaterialSammlung
+    Eingetopfter_toter_Busch: MaterialSammlung
+    Eingetopfter_Farn: MaterialSammlung
+    Eingetopfte_blühende_Azalee: MaterialSammlung
+    Eingetopfter_Tropenbaumsetzling: MaterialSammlung
+    Eingetopftes_Maiglöckchen: MaterialSammlung
+    Eingetopfter_Mangroven_Keimling: MaterialSammlung
+    Eingetopfter_Eichensetzling: MaterialSammlung
+    Eingetopfte_orange_Tulpe: MaterialSammlung
+    Eingetopfte_Margerite: MaterialSammlung
+    Eingetopfte_rosa_Tulpe: MaterialSammlung
+    Eingetopfter_Mohn: MaterialSammlung
+    Eingetopfter_roter_Pilz: MaterialSammlung
+    Eingetopfte_rote_Tulpe: MaterialSammlung
+    Eingetopfter_Fichtensetzling: MaterialSammlung
+    Eingetopfte_Fackellilie: MaterialSammlung
+    Eingetopfter_Wirrpilz: MaterialSammlung
+    Eingetopfte_Wirrwurzeln: MaterialSammlung
+    Eingetopfte_weiße_Tulpe: MaterialSammlung
+    Eingetopfte_Wither_Rose: MaterialSammlung
+    Pulverschnee: MaterialSammlung
+    Pulverschneekessel: MaterialSammlung
+    Antriebsschiene: MaterialSammlung
+    Prismarin: MaterialSammlung
+    Prismarinziegelstufe: MaterialSammlung
+    Prismarinziegeltreppe: MaterialSammlung
+    Prismarinziegel: MaterialSammlung
+    Prismarinstufe: MaterialSammlung
+    Prismarintreppe: MaterialSammlung
+    Prismarinmauer: MaterialSammlung
+    Kürbis: MaterialSammlung
+    Kürbispflanze: MaterialSammlung
+    Violettes_Banner: MaterialSammlung
+    Violettes_Bett: MaterialSammlung
+    Violette_Kerze: MaterialSammlung
+    Kuchen_mit_violetter_Kerze: MaterialSammlung
+    Violetter_Teppich: MaterialSammlung
+    Violetter_Beton: MaterialSammlung
+    Violetter_Trockenbeton: MaterialSammlung
+    Violette_glasierte_Keramik: MaterialSammlung
+    Violette_Shulker_Kiste: MaterialSammlung
+    Violettes_Glas: MaterialSammlung
+    Violette_Glasscheibe: MaterialSammlung
+    Violette_Keramik: MaterialSammlung
+    Violette_Wolle: MaterialSammlung
+    Purpurblock: MaterialSammlung
+    Purpursäule: MaterialSammlung
+    Purpurstufe: MaterialSammlung
+    Purpurtreppe: MaterialSammlung
+    Quarzblock: MaterialSammlung
+    Quarzziegel: MaterialSammlung
+    Quarzsäule: MaterialSammlung
+    Quarzstufe: MaterialSammlung
+    Quarztreppe: MaterialSammlung
+    Schiene: MaterialSammlung
+    Rohkupferblock: MaterialSammlung
+    Rohgoldblock: MaterialSammlung
+    Roheisenblock: MaterialSammlung
+    Rotes_Banner: MaterialSammlung
+    Rotes_Bett: MaterialSammlung
+    Rote_Kerze: MaterialSammlung
+    Kuchen_mit_roter_Kerze: MaterialSammlung
+    Roter_Teppich: MaterialSammlung
+    Roter_Beton: MaterialSammlung
+    Roter_Trockenbeton: MaterialSammlung
+    Rote_glasierte_Keramik: MaterialSammlung
+    Roter_Pilz: MaterialSammlung
+    Roter_Pilzblock: MaterialSammlung
+    Rote_Netherziegelstufe: MaterialSammlung
+    Rote_Netherziegeltreppe: MaterialSammlung
+    Rote_Netherziegelmauer: MaterialSammlung
+    Rote_Netherziegel: MaterialSammlung
+    Roter_Sand: MaterialSammlung
+    Roter_Sandstein: MaterialSammlung
+    Rote_Sandsteinstufe: MaterialSammlung
+    Rote_Sandsteintreppe: MaterialSammlung
+    Rote_Sandsteinmauer: MaterialSammlung
+    Rote_Shulker_Kiste: MaterialSammlung
+    Rotes_Glas: MaterialSammlung
+    Rote_Glasscheibe: MaterialSammlung
+    Rote_Keramik: MaterialSammlung
+    Rote_Tulpe: MaterialSammlung
+    Rote_Wolle: MaterialSammlung
+    Redstone_Block: MaterialSammlung
+    Redstone_Lampe: MaterialSammlung
+    Redstone_Erz: MaterialSammlung
+    Redstone_Fackel: MaterialSammlung
+    Redstone_Wandfackel: MaterialSammlung
+    Redstone_Leitung: MaterialSammlung
+    Verstärkter_Tiefenschiefer: MaterialSammlung
+    Redstone_Verstärker: MaterialSammlung
+    Wiederhol_Befehlsblock: MaterialSammlung
+    Seelenanker: MaterialSammlung
+    Wurzelerde: MaterialSammlung
+    Rosenstrauch: MaterialSammlung
+    Sand: MaterialSammlung
+    Sandstein: MaterialSammlung
+    Sandsteinstufe: MaterialSammlung
+    Sandsteintreppe: MaterialSammlung
+    Sandsteinmauer: MaterialSammlung
+    Gerüst: MaterialSammlung
+    Sculk: MaterialSammlung
+    Sculk_Katalysator: MaterialSammlung
+    Sculk_Sensor: MaterialSammlung
+    Sculk_Kreischer: MaterialSammlung
+    Sculk_Ader: MaterialSammlung
+    Seelaterne: MaterialSammlung
+    Meeresgurke: MaterialSammlung
+    Seegras: MaterialSammlung
+    Pilzlicht: MaterialSammlung
+    Shulker_Kiste: MaterialSammlung
+    Skelettschädel: MaterialSammlung
+    Skelett_Wandschädel: MaterialSammlung
+    Schleimblock: MaterialSammlung
+    Kleine_Amethystknospe: MaterialSammlung
+    Kleines_Tropfblatt: MaterialSammlung
+    Schmiedetisch: MaterialSammlung
+    Räucherofen: MaterialSammlung
+    Glatter_Basalt: MaterialSammlung
+    Glatter_Quarzblock: MaterialSammlung
+    Glatte_Quarzstufe: MaterialSammlung
+    Glatte_Quarztreppe: MaterialSammlung
+    Glatter_roter_Sandstein: MaterialSammlung
+    Glatte_rote_Sandsteinstufe: MaterialSammlung
+    Glatte_rote_Sandsteintreppe: MaterialSammlung
+    Glatter_Sandstein: MaterialSammlung
+    Glatte_Sandsteinstufe: MaterialSammlung
+    Glatte_Sandsteintreppe: MaterialSammlung
+    Glatter_Stein: MaterialSammlung
+    Glatte_Steinstufe: MaterialSammlung
+    Schnee: MaterialSammlung
+    Schneeblock: MaterialSammlung
+    Seelenlagerfeuer: MaterialSammlung
+    Seelenfeuer: MaterialSammlung
+    Seelenlaterne: MaterialSammlung
+    Seelensand: MaterialSammlung
+    Seelenerde: MaterialSammlung
+    Seelenfackel: MaterialSammlung
+    Seelenwandfackel: MaterialSammlung
+    Spawner: MaterialSammlung
+    Schwamm: MaterialSammlung
+    Sporenblüte: MaterialSammlung
+    Fichtenholzknopf: MaterialSammlung
+    Fichtenholztür: MaterialSammlung
+    Fichtenholzzaun: MaterialSammlung
+    Fichtenholzzauntor: MaterialSammlung
+    Fichtenholzhängeschild: MaterialSammlung
+    Fichtennadeln: MaterialSammlung
+    Fichtenstamm: MaterialSammlung
+    Fichtenholzbretter: MaterialSammlung
+    Fichtenholzdruckplatte: MaterialSammlung
+    Fichtensetzling: MaterialSammlung
+    Fichtenholzschild: MaterialSammlung
+    Fichtenholzstufe: MaterialSammlung
+    Fichtenholztreppe: MaterialSammlung
+    Fichtenholzfalltür: MaterialSammlung
+    Fichtenholzwandhängeschild: MaterialSammlung
+    Fichtenholzwandschild: MaterialSammlung
+    Fichtenholz: MaterialSammlung
+    Klebriger_Kolben: MaterialSammlung
+    Stein: MaterialSammlung
+    Steinziegelstufe: MaterialSammlung
+    Steinziegeltreppe: MaterialSammlung
+    Steinziegelmauer: MaterialSammlung
+    Steinziegel: MaterialSammlung
+    Steinknopf: MaterialSammlung
+    Steindruckplatte: MaterialSammlung
+    Steinstufe: MaterialSammlung
+    Steintreppe: MaterialSammlung
+    Steinsäge: MaterialSammlung
+    Entrindeter_Akazienstamm: MaterialSammlung
+    Entrindetes_Akazienholz: MaterialSammlung
+    Geschälter_Bambusblock: MaterialSammlung
+    Entrindeter_Birkenstamm: MaterialSammlung
+    Entrindetes_Birkenholz: MaterialSammlung
+    Entrindeter_Kirschstamm: MaterialSammlung
+    Entrindetes_Kirschholz: MaterialSammlung
+    Geschälte_Karmesinhyphen: MaterialSammlung
+    Geschälter_Karmesinstiel: MaterialSammlung
+    Entrindeter_Schwarzeichenstamm: MaterialSammlung
+    Entrindetes_Schwarzeichenholz: MaterialSammlung
+    Entrindeter_Tropenbaumstamm: MaterialSammlung
+    Entrindetes_Tropenholz: MaterialSammlung
+    Entrindeter_Mangrovenstamm: MaterialSammlung
+    Entrindetes_Mangrovenholz: MaterialSammlung
+    Entrindeter_Eichenstamm: MaterialSammlung
+    Entrindetes_Eichenholz: MaterialSammlung
+    Entrindeter_Fichtenstamm: MaterialSammlung
+    Entrindetes_Fichtenholz: MaterialSammlung
+    Geschälte_Wirrhyphen: MaterialSammlung
+    Geschälter_Wirrstiel: MaterialSammlung
+    Konstruktionsblock: MaterialSammlung
+    Konstruktionsleere: MaterialSammlung
+    Zuckerrohr: MaterialSammlung
+    Sonnenblume: MaterialSammlung
+    Seltsamer_Sand: MaterialSammlung
+    Süßbeerstrauch: MaterialSammlung
+    Hohes_Gras: MaterialSammlung
+    Hohes_Seegras: MaterialSammlung
+    Zielblock: MaterialSammlung
+    Keramik: MaterialSammlung
+    Getöntes_Glas: MaterialSammlung
+    TNT: MaterialSammlung
+    Fackel: MaterialSammlung
+    Fackellilie: MaterialSammlung
+    Fackellilienpflanze: MaterialSammlung
+    Redstone_Truhe: MaterialSammlung
+    Stolperdraht: MaterialSammlung
+    Haken: MaterialSammlung
+    Orgelkoralle: MaterialSammlung
+    Orgelkorallenblock: MaterialSammlung
+    Orgelkorallenfächer: MaterialSammlung
+    Orgelkorallenwandfächer: MaterialSammlung
+    Tuffstein: MaterialSammlung
+    Schildkrötenei: MaterialSammlung
+    Zwirbelranken: MaterialSammlung
+    Zwirbelrankenpflanze: MaterialSammlung
+    Junggrünes_Froschlicht: MaterialSammlung
+    Ranken: MaterialSammlung
+    Leerenluft: MaterialSammlung
+    Wandfackel: MaterialSammlung
+    Wirrknopf: MaterialSammlung
+    Wirrtür: MaterialSammlung
+    Wirrzaun: MaterialSammlung
+    Wirrzauntor: MaterialSammlung
+    Wirrpilz: MaterialSammlung
+    Wirrhängeschild: MaterialSammlung
+    Wirrhyphen: MaterialSammlung
+    Wirr_Nezel: MaterialSammlung
+    Wirrbretter: MaterialSammlung
+    Wirrdruckplatte: MaterialSammlung
+    Wirrwurzeln: MaterialSammlung
+    Wirrschild: MaterialSammlung
+    Wirrstufe: MaterialSammlung
+    Wirrtreppe: MaterialSammlung
+    Wirrstiel: MaterialSammlung
+    Wirrfalltür: MaterialSammlung
+    Wirrwandhängeschild: MaterialSammlung
+    Wirrwandschild: MaterialSammlung
+    Wirrwarzenblock: MaterialSammlung
+    Wasser: MaterialSammlung
+    Wasserkessel: MaterialSammlung
+    Gewachster_Kupferblock: MaterialSammlung
+    Gewachster_geschnittener_Kupferblock: MaterialSammlung
+    Gewachste_geschnittene_Kupferstufe: MaterialSammlung
+    Gewachste_geschnittene_Kupfertreppe: MaterialSammlung
+    Gewachster_angelaufener_Kupferblock: MaterialSammlung
+    Gewachster_angelaufener_geschnittener_Kupferblock: MaterialSammlung
+    Gewachste_angelaufene_geschnittene_Kupferstufe: MaterialSammlung
+    Gewachste_angelaufene_geschnittene_Kupfertreppe: MaterialSammlung
+    Gewachster_oxidierter_Kupferblock: MaterialSammlung
+    Gewachster_oxidierter_geschnittener_Kupferblock: MaterialSammlung
+    Gewachste_oxidierte_geschnittene_Kupferstufe: MaterialSammlung
+    Gewachste_oxidierte_geschnittene_Kupfertreppe: MaterialSammlung
+    Gewachster_verwitterter_Kupferblock: MaterialSammlung
+    Gewachster_verwitterter_geschnittener_Kupferblock: MaterialSammlung
+    Gewachste_verwitterte_geschnittene_Kupferstufe: MaterialSammlung
+    Gewachste_verwitterte_geschnittene_Kupfertreppe: MaterialSammlung
+    Verwitterter_Kupferblock: MaterialSammlung
+    Verwitterter_geschnittener_Kupferblock: MaterialSammlung
+    Verwitterte_geschnittene_Kupferstufe: MaterialSammlung
+    Verwitterte_geschnittene_Kupfertreppe: MaterialSammlung
+    Trauerranken: MaterialSammlung
+    Trauerrankenpflanze: MaterialSammlung
+    Nasser_Schwamm: MaterialSammlung
+    Weizenpflanze: MaterialSammlung
+    Weißes_Banner: MaterialSammlung
+    Weißes_Bett: MaterialSammlung
+    Weiße_Kerze: MaterialSammlung
+    Kuchen_mit_weißer_Kerze: MaterialSammlung
+    Weißer_Teppich: MaterialSammlung
+    Weißer_Beton: MaterialSammlung
+    Weißer_Trockenbeton: MaterialSammlung
+    Weiße_glasierte_Keramik: MaterialSammlung
+    Weiße_Shulker_Kiste: MaterialSammlung
+    Weißes_Glas: MaterialSammlung
+    Weiße_Glasscheibe: MaterialSammlung
+    Weiße_Keramik: MaterialSammlung
+    Weiße_Tulpe: MaterialSammlung
+    Weiße_Wolle: MaterialSammlung
+    Wither_Rose: MaterialSammlung
+    Witherskelettschädel: MaterialSammlung
+    Witherskelett_Wandschädel: MaterialSammlung
+    Gelbes_Banner: MaterialSammlung
+    Gelbes_Bett: MaterialSammlung
+    Gelbe_Kerze: MaterialSammlung
+    Kuchen_mit_gelber_Kerze: MaterialSammlung
+    Gelber_Teppich: MaterialSammlung
+    Gelber_Beton: MaterialSammlung
+    Gelber_Trockenbeton: MaterialSammlung
+    Gelbe_glasierte_Keramik: MaterialSammlung
+    Gelbe_Shulker_Kiste: MaterialSammlung
+    Gelbes_Glas: MaterialSammlung
+    Gelbe_Glasscheibe: MaterialSammlung
+    Gelbe_Keramik: MaterialSammlung
+    Gelbe_Wolle: MaterialSammlung
+    Zombiekopf: MaterialSammlung
+    Zombie_Wandkopf: MaterialSammlung
+    Akazienholzboot: MaterialSammlung
+    Akazienholztruhenboot: MaterialSammlung
+    Hilfsgeist_Spawn_Ei: MaterialSammlung
+    Amethystscherbe: MaterialSammlung
+    Apfel: MaterialSammlung
+    Rüstungsständer: MaterialSammlung
+    Pfeil: MaterialSammlung
+    Axolotleimer: MaterialSammlung
+    Axolotl_Spawn_Ei: MaterialSammlung
+    Ofenkartoffel: MaterialSammlung
+    Bambus_Truhenfloß: MaterialSammlung
+    Bambusfloß: MaterialSammlung
+    Fledermaus_Spawn_Ei: MaterialSammlung
+    Bienen_Spawn_Ei: MaterialSammlung
+    Rohes_Rindfleisch: MaterialSammlung
+    Rote_Bete_Samen: MaterialSammlung
+    Borschtsch: MaterialSammlung
+    Birkenholzboot: MaterialSammlung
+    Birkenholztruhenboot: MaterialSammlung
+    Schwarzer_Farbstoff: MaterialSammlung
+    Lohenstaub: MaterialSammlung
+    Lohenrute: MaterialSammlung
+    Lohen_Spawn_Ei: MaterialSammlung
+    Blauer_Farbstoff: MaterialSammlung
+    Knochen: MaterialSammlung
+    Knochenmehl: MaterialSammlung
+    Buch: MaterialSammlung
+    Bogen: MaterialSammlung
+    Schüssel: MaterialSammlung
+    Brot: MaterialSammlung
+    Ziegel: MaterialSammlung
+    Brauner_Farbstoff: MaterialSammlung
+    Pinsel: MaterialSammlung
+    Eimer: MaterialSammlung
+    Bündel: MaterialSammlung
+    Dromedar_Spawn_Ei: MaterialSammlung
+    Karotte: MaterialSammlung
+    Karottenrute: MaterialSammlung
+    Katzen_Spawn_Ei: MaterialSammlung
+    Höhlenspinnen_Spawn_Ei: MaterialSammlung
+    Kettenstiefel: MaterialSammlung
+    Kettenhemd: MaterialSammlung
+    Kettenhaube: MaterialSammlung
+    Kettenhose: MaterialSammlung
+    Holzkohle: MaterialSammlung
+    Kirschholzboot: MaterialSammlung
+    Kirschholztruhenboot: MaterialSammlung
+    Güterlore: MaterialSammlung
+    Rohes_Hühnchen: MaterialSammlung
+    Huhn_Spawn_Ei: MaterialSammlung
+    Chorusfrucht: MaterialSammlung
+    Tonklumpen: MaterialSammlung
+    Uhr: MaterialSammlung
+    Kohle: MaterialSammlung
+    Kakaobohnen: MaterialSammlung
+    Roher_Kabeljau: MaterialSammlung
+    Kabeljaueimer: MaterialSammlung
+    Kabeljau_Spawn_Ei: MaterialSammlung
+    Befehlsblocklore: MaterialSammlung
+    Kompass: MaterialSammlung
+    Steak: MaterialSammlung
+    Gebratenes_Hühnchen: MaterialSammlung
+    Gebratener_Kabeljau: MaterialSammlung
+    Gebratenes_Hammelfleisch: MaterialSammlung
+    Gebratenes_Schweinefleisch: MaterialSammlung
+    Gebratenes_Kaninchen: MaterialSammlung
+    Gebratener_Lachs: MaterialSammlung
+    Keks: MaterialSammlung
+    Kupferbarren: MaterialSammlung
+    Kuh_Spawn_Ei: MaterialSammlung
+    Bannervorlage: MaterialSammlung
+    Creeper_Spawn_Ei: MaterialSammlung
+    Armbrust: MaterialSammlung
+    Türkiser_Farbstoff: MaterialSammlung
+    Schwarzeichenholzboot: MaterialSammlung
+    Schwarzeichenholztruhenboot: MaterialSammlung
+    Debug_Stab: MaterialSammlung
+    Diamant: MaterialSammlung
+    Diamantaxt: MaterialSammlung
+    Diamantstiefel: MaterialSammlung
+    Diamantharnisch: MaterialSammlung
+    Diamanthelm: MaterialSammlung
+    Diamanthacke: MaterialSammlung
+    Diamantener_Rossharnisch: MaterialSammlung
+    Diamantbeinschutz: MaterialSammlung
+    Diamantspitzhacke: MaterialSammlung
+    Diamantschaufel: MaterialSammlung
+    Diamantschwert: MaterialSammlung
+    Plattenbruchstück: MaterialSammlung
+    Delfin_Spawn_Ei: MaterialSammlung
+    Esel_Spawn_Ei: MaterialSammlung
+    Drachenatem: MaterialSammlung
+    Getrockneter_Seetang: MaterialSammlung
+    Ertrunkenen_Spawn_Ei: MaterialSammlung
+    Echoscherbe: MaterialSammlung
+    Ei: MaterialSammlung
+    Großer_Wächter_Spawn_Ei: MaterialSammlung
+    Elytren: MaterialSammlung
+    Smaragd: MaterialSammlung
+    Verzaubertes_Buch: MaterialSammlung
+    Verzauberter_goldener_Apfel: MaterialSammlung
+    Enderkristall: MaterialSammlung
+    Enderdrachen_Spawn_Ei: MaterialSammlung
+    Enderauge: MaterialSammlung
+    Enderperle: MaterialSammlung
+    Enderman_Spawn_Ei: MaterialSammlung
+    Endermiten_Spawn_Ei: MaterialSammlung
+    Magier_Spawn_Ei: MaterialSammlung
+    Erfahrungsfläschchen: MaterialSammlung
+    Feder: MaterialSammlung
+    Fermentiertes_Spinnenauge: MaterialSammlung
+    Karte: MaterialSammlung
+    Feuerkugel: MaterialSammlung
+    Feuerwerksrakete: MaterialSammlung
+    Feuerwerksstern: MaterialSammlung
+    Angel: MaterialSammlung
+    Feuerstein: MaterialSammlung
+    Feuerzeug: MaterialSammlung
+    Fuchs_Spawn_Ei: MaterialSammlung
+    Frosch_Spawn_Ei: MaterialSammlung
+    Ofenlore: MaterialSammlung
+    Ghast_Spawn_Ei: MaterialSammlung
+    Ghast_Träne: MaterialSammlung
+    Glasflasche: MaterialSammlung
+    Glitzernde_Melonenscheibe: MaterialSammlung
+    Leuchtbeeren: MaterialSammlung
+    Leuchttintenbeutel: MaterialSammlung
+    Leuchtrahmen: MaterialSammlung
+    Leuchttintenfisch_Spawn_Ei: MaterialSammlung
+    Leuchtsteinstaub: MaterialSammlung
+    Bockshorn: MaterialSammlung
+    Ziegen_Spawn_Ei: MaterialSammlung
+    Goldbarren: MaterialSammlung
+    Goldklumpen: MaterialSammlung
+    Goldener_Apfel: MaterialSammlung
+    Goldaxt: MaterialSammlung
+    Goldstiefel: MaterialSammlung
+    Goldene_Karotte: MaterialSammlung
+    Goldharnisch: MaterialSammlung
+    Goldhelm: MaterialSammlung
+    Goldhacke: MaterialSammlung
+    Goldener_Rossharnisch: MaterialSammlung
+    Goldbeinschutz: MaterialSammlung
+    Goldspitzhacke: MaterialSammlung
+    Goldschaufel: MaterialSammlung
+    Goldschwert: MaterialSammlung
+    Grauer_Farbstoff: MaterialSammlung
+    Grüner_Farbstoff: MaterialSammlung
+    Wächter_Spawn_Ei: MaterialSammlung
+    Schwarzpulver: MaterialSammlung
+    Herz_des_Meeres: MaterialSammlung
+    Hoglin_Spawn_Ei: MaterialSammlung
+    Honigflasche: MaterialSammlung
+    Honigwabe: MaterialSammlung
+    Trichterlore: MaterialSammlung
+    Pferde_Spawn_Ei: MaterialSammlung
+    Wüstenzombie_Spawn_Ei: MaterialSammlung
+    Tintenbeutel: MaterialSammlung
+    Eisenaxt: MaterialSammlung
+    Eisenstiefel: MaterialSammlung
+    Eisenharnisch: MaterialSammlung
+    Eisengolem_Spawn_Ei: MaterialSammlung
+    Eisenhelm: MaterialSammlung
+    Eisenhacke: MaterialSammlung
+    Eiserner_Rossharnisch: MaterialSammlung
+    Eisenbarren: MaterialSammlung
+    Eisenbeinschutz: MaterialSammlung
+    Eisenklumpen: MaterialSammlung
+    Eisenspitzhacke: MaterialSammlung
+    Eisenschaufel: MaterialSammlung
+    Eisenschwert: MaterialSammlung
+    Rahmen: MaterialSammlung
+    Tropenholzboot: MaterialSammlung
+    Tropenholztruhenboot: MaterialSammlung
+    Buch_des_Wissens: MaterialSammlung
+    Lapislazuli: MaterialSammlung
+    Lavaeimer: MaterialSammlung
+    Leine: MaterialSammlung
+    Leder: MaterialSammlung
+    Lederstiefel: MaterialSammlung
+    Lederjacke: MaterialSammlung
+    Lederkappe: MaterialSammlung
+    Lederner_Rossharnisch: MaterialSammlung
+    Lederhose: MaterialSammlung
+    Hellblauer_Farbstoff: MaterialSammlung
+    Hellgrauer_Farbstoff: MaterialSammlung
+    Hellgrüner_Farbstoff: MaterialSammlung
+    Verweiltrank: MaterialSammlung
+    Lama_Spawn_Ei: MaterialSammlung
+    Magenta_Farbstoff: MaterialSammlung
+    Magmacreme: MaterialSammlung
+    Magmawürfel_Spawn_Ei: MaterialSammlung
+    Mangrovenholzboot: MaterialSammlung
+    Mangrovenholztruhenboot: MaterialSammlung
+    Leere_Karte: MaterialSammlung
+    Melonenkerne: MaterialSammlung
+    Melonenscheibe: MaterialSammlung
+    Milcheimer: MaterialSammlung
+    Lore: MaterialSammlung
+    Mooshroom_Spawn_Ei: MaterialSammlung
+    Maultier_Spawn_Ei: MaterialSammlung
+    Pilzsuppe: MaterialSammlung
+    Schallplatte: MaterialSammlung
+    Rohes_Hammelfleisch: MaterialSammlung
+    Namensschild: MaterialSammlung
+    Nautilusschale: MaterialSammlung
+    Netherstern: MaterialSammlung
+    Netherwarze: MaterialSammlung
+    Netheritaxt: MaterialSammlung
+    Netheritstiefel: MaterialSammlung
+    Netheritharnisch: MaterialSammlung
+    Netherithelm: MaterialSammlung
+    Netherithacke: MaterialSammlung
+    Netheritbarren: MaterialSammlung
+    Netheritbeinschutz: MaterialSammlung
+    Netheritspitzhacke: MaterialSammlung
+    Netheritplatten: MaterialSammlung
+    Netheritschaufel: MaterialSammlung
+    Netheritschwert: MaterialSammlung
+    Eichenholzboot: MaterialSammlung
+    Eichenholztruhenboot: MaterialSammlung
+    Ozelot_Spawn_Ei: MaterialSammlung
+    Oranger_Farbstoff: MaterialSammlung
+    Gemälde: MaterialSammlung
+    Panda_Spawn_Ei: MaterialSammlung
+    Papier: MaterialSammlung
+    Papageien_Spawn_Ei: MaterialSammlung
+    Phantomhaut: MaterialSammlung
+    Phantom_Spawn_Ei: MaterialSammlung
+    Schweine_Spawn_Ei: MaterialSammlung
+    Piglin_Barbaren_Spawn_Ei: MaterialSammlung
+    Piglin_Spawn_Ei: MaterialSammlung
+    Plünderer_Spawn_Ei: MaterialSammlung
+    Rosa_Farbstoff: MaterialSammlung
+    Giftige_Kartoffel: MaterialSammlung
+    Eisbären_Spawn_Ei: MaterialSammlung
+    Geplatzte_Chorusfrucht: MaterialSammlung
+    Rohes_Schweinefleisch: MaterialSammlung
+    Kartoffel: MaterialSammlung
+    Trank: MaterialSammlung
+    Pulverschneeeimer: MaterialSammlung
+    Prismarinkristalle: MaterialSammlung
+    Prismarinscherbe: MaterialSammlung
+    Kugelfisch: MaterialSammlung
+    Kugelfischeimer: MaterialSammlung
+    Kugelfisch_Spawn_Ei: MaterialSammlung
+    Kürbiskuchen: MaterialSammlung
+    Kürbiskerne: MaterialSammlung
+    Violetter_Farbstoff: MaterialSammlung
+    Netherquarz: MaterialSammlung
+    Rohes_Kaninchen: MaterialSammlung
+    Hasenpfote: MaterialSammlung
+    Kaninchenfell: MaterialSammlung
+    Kaninchen_Spawn_Ei: MaterialSammlung
+    Kaninchenragout: MaterialSammlung
+    Verwüster_Spawn_Ei: MaterialSammlung
+    Rohkupfer: MaterialSammlung
+    Rohgold: MaterialSammlung
+    Roheisen: MaterialSammlung
+    Bergungskompass: MaterialSammlung
+    Roter_Farbstoff: MaterialSammlung
+    Redstone_Staub: MaterialSammlung
+    Verrottetes_Fleisch: MaterialSammlung
+    Sattel: MaterialSammlung
+    Roher_Lachs: MaterialSammlung
+    Lachseimer: MaterialSammlung
+    Lachs_Spawn_Ei: MaterialSammlung
+    Schere: MaterialSammlung
+    Schafs_Spawn_Ei: MaterialSammlung
+    Schild: MaterialSammlung
+    Shulker_Schale: MaterialSammlung
+    Shulker_Spawn_Ei: MaterialSammlung
+    Silberfischchen_Spawn_Ei: MaterialSammlung
+    Skelettpferde_Spawn_Ei: MaterialSammlung
+    Skelett_Spawn_Ei: MaterialSammlung
+    Schleimball: MaterialSammlung
+    Schleim_Spawn_Ei: MaterialSammlung
+    Schnüffler_Spawn_Ei: MaterialSammlung
+    Schneegolem_Spawn_Ei: MaterialSammlung
+    Schneeball: MaterialSammlung
+    Spektralpfeil: MaterialSammlung
+    Spinnenauge: MaterialSammlung
+    Spinnen_Spawn_Ei: MaterialSammlung
+    Wurftrank: MaterialSammlung
+    Fichtenholzboot: MaterialSammlung
+    Fichtenholztruhenboot: MaterialSammlung
+    Fernrohr: MaterialSammlung
+    Tintenfisch_Spawn_Ei: MaterialSammlung
+    Stock: MaterialSammlung
+    Steinaxt: MaterialSammlung
+    Steinhacke: MaterialSammlung
+    Steinspitzhacke: MaterialSammlung
+    Steinschaufel: MaterialSammlung
+    Steinschwert: MaterialSammlung
+    Eiswanderer_Spawn_Ei: MaterialSammlung
+    Schreiter_Spawn_Ei: MaterialSammlung
+    Faden: MaterialSammlung
+    Zucker: MaterialSammlung
+    Seltsame_Suppe: MaterialSammlung
+    Süßbeeren: MaterialSammlung
+    Kaulquappeneimer: MaterialSammlung
+    Kaulquappen_Spawn_Ei: MaterialSammlung
+    Getränkter_Pfeil: MaterialSammlung
+    TNT_Lore: MaterialSammlung
+    Fackelliliensamen: MaterialSammlung
+    Totem_der_Unsterblichkeit: MaterialSammlung
+    Händlerlama_Spawn_Ei: MaterialSammlung
+    Dreizack: MaterialSammlung
+    Tropenfisch: MaterialSammlung
+    Tropenfischeimer: MaterialSammlung
+    Tropenfisch_Spawn_Ei: MaterialSammlung
+    Schildkrötenpanzer: MaterialSammlung
+    Schildkröten_Spawn_Ei: MaterialSammlung
+    Plagegeister_Spawn_Ei: MaterialSammlung
+    Dorfbewohner_Spawn_Ei: MaterialSammlung
+    Diener_Spawn_Ei: MaterialSammlung
+    Fahrender_Händler_Spawn_Ei: MaterialSammlung
+    Wärter_Spawn_Ei: MaterialSammlung
+    Wirrpilzrute: MaterialSammlung
+    Wassereimer: MaterialSammlung
+    Weizen: MaterialSammlung
+    Weizenkörner: MaterialSammlung
+    Weißer_Farbstoff: MaterialSammlung
+    Hexen_Spawn_Ei: MaterialSammlung
+    Witherskelett_Spawn_Ei: MaterialSammlung
+    Wither_Spawn_Ei: MaterialSammlung
+    Wolfs_Spawn_Ei: MaterialSammlung
+    Holzaxt: MaterialSammlung
+    Holzhacke: MaterialSammlung
+    Holzspitzhacke: MaterialSammlung
+    Holzschaufel: MaterialSammlung
+    Holzschwert: MaterialSammlung
+    Buch_und_Feder: MaterialSammlung
+    Beschriebenes_Buch: MaterialSammlung
+    Gelber_Farbstoff: MaterialSammlung
+    Zoglin_Spawn_Ei: MaterialSammlung
+    Zombiepferde_Spawn_Ei: MaterialSammlung
+    Zombie_Spawn_Ei: MaterialSammlung
+    Zombiedorfbewohner_Spawn_Ei: MaterialSammlung
+    Zombifizierter_Piglin_Spawn_Ei: MaterialSammlung
+
+def material_aus_ordinal(ordinal: int) -> MaterialSammlung: ...
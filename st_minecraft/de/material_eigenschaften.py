@@ -0,0 +1,82 @@
+"""
+Eigenschaften der Materialien: fest, flüssig, durchsichtig, fällt herunter, leuchtet und die durchschnittliche Farbe.
+Alle Funktionen bekommen ein Material aus der MaterialSammlung, z.B. ist_fest(hole_block(x, y, z).typ)
+Ein Block, den die Library nicht kennt, hat den Typ None, für ihn sind alle Eigenschaften False (lichtstaerke() 0).
+
+Die Eigenschaften liegen in Tabellen, die mit der Ordinalzahl des Materials indiziert sind (siehe zu_ordinal()).
+Um ganze Bereiche auf einmal zu prüfen, gibt numpy_tabellen() sie als NumPy-Arrays zurück (pip install numpy),
+z.B. mit den Ordinalzahlen eines Bereichs in einem Array: numpy_tabellen()["fest"][ordinale] markiert die festen Blöcke.
+"""
+
+from typing import Any
+
+import st_minecraft.en.material_properties as __material_properties
+from st_minecraft.de.material import MaterialSammlung
+
+
+def ist_block(material: MaterialSammlung | None) -> bool:
+    """True, wenn das Material als Block gesetzt werden kann, False für Items wie MaterialSammlung.Diamantschwert"""
+    return __material_properties.is_block(material)
+
+
+def ist_fest(material: MaterialSammlung | None) -> bool:
+    """True, wenn Spieler und Entities nicht durch den Block können (z.B. Stein, Glas, Laub, aber nicht Luft, Wasser)"""
+    return __material_properties.is_solid(material)
+
+
+def ist_fluessig(material: MaterialSammlung | None) -> bool:
+    """True für Wasser und Lava"""
+    return __material_properties.is_liquid(material)
+
+
+def ist_durchsichtig(material: MaterialSammlung | None) -> bool:
+    """True, wenn Licht durch den Block scheint (z.B. Luft, Glas, Laub)"""
+    return __material_properties.is_transparent(material)
+
+
+def faellt_herunter(material: MaterialSammlung | None) -> bool:
+    """True, wenn der Block herunterfällt, sobald nichts unter ihm ist (z.B. Sand, Kies, Amboss)"""
+    return __material_properties.has_gravity(material)
+
+
+def leuchtet(material: MaterialSammlung | None) -> bool:
+    """True, wenn der Block eine Lichtquelle ist (z.B. Fackel, Leuchtstein, Lava)"""
+    return __material_properties.emits_light(material)
+
+
+def lichtstaerke(material: MaterialSammlung | None) -> int:
+    """
+    Wie hell das Licht des Blocks ist
+    Returns:
+        Die Lichtstärke von 0 (kein Licht) bis 15 (z.B. Leuchtstein)
+    """
+    return __material_properties.light_level(material)
+
+
+def durchschnittsfarbe(material: MaterialSammlung | None) -> tuple[int, int, int] | None:
+    """
+    Die durchschnittliche Farbe der Textur, pro Art von Material geschätzt, praktisch für Pixel-Art
+    Returns:
+        (rot, grün, blau), jeweils von 0 bis 255, None für einen unbekannten Block (None)
+    """
+    return __material_properties.average_color(material)
+
+
+def numpy_tabellen() -> dict[str, Any]:
+    """
+    Alle Eigenschaften als NumPy-Arrays, indiziert mit der Ordinalzahl. NumPy muss installiert sein (pip install numpy).
+    Returns:
+        Ein dict mit den Arrays "block", "fest", "fluessig", "durchsichtig", "faellt_herunter", "leuchtet" (bool),
+        "lichtstaerke" (uint8) und "farbe" (uint8, eine Zeile (rot, grün, blau) pro Material)
+    """
+    tabellen = __material_properties.numpy_tables()
+    return {
+        "block": tabellen["block"],
+        "fest": tabellen["solid"],
+        "fluessig": tabellen["liquid"],
+        "durchsichtig": tabellen["transparent"],
+        "faellt_herunter": tabellen["gravity"],
+        "leuchtet": tabellen["light_emitting"],
+        "lichtstaerke": tabellen["light"],
+        "farbe": tabellen["color"],
+    }
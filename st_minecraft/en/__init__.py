@@ -1,4 +1,11 @@
+from st_minecraft.core import Session  # noqa: unused-import
+from st_minecraft.core import SessionPool  # noqa: unused-import
+from st_minecraft.core import TimeoutPolicy  # noqa: unused-import
 from st_minecraft.core import connect  # noqa: unused-import
+from st_minecraft.core import drain  # noqa: unused-import
+from st_minecraft.core import flush  # noqa: unused-import
+from st_minecraft.core import start_background_writer  # noqa: unused-import
+from st_minecraft.core import stop_background_writer  # noqa: unused-import
 from st_minecraft.en.boss_bar import *  # noqa: unused-import
 from st_minecraft.en.data_models import *  # noqa: unused-import
 from st_minecraft.en.main import *  # noqa: unused-import
@@ -6,6 +13,7 @@ from st_minecraft.en.main import *  # noqa: unused-import
 try:
     from st_minecraft.en.entity import *  # noqa: unused-import
     from st_minecraft.en.material import *  # noqa: unused-import
+    from st_minecraft.en.material_properties import *  # noqa: unused-import
 
 except ModuleNotFoundError as e:
     raise RuntimeError(
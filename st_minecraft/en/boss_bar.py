@@ -2,11 +2,11 @@
 
 from enum import Enum
 
-from pydantic import BaseModel
-
 from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import Session
 from st_minecraft.core.core import _build_command
 from st_minecraft.core.core import _send_command
+from st_minecraft.core.models import BaseModel
 
 
 class BossBarStyle(Enum):
@@ -55,24 +55,25 @@ class BossBar(BaseModel):
         )
 
 
-def _send_boss_bar_command(sub_command: str):
+def _send_boss_bar_command(sub_command: str, session: Session | None = None):
     # needed internally
     command = f"editBossBar{ARG_SEPARATOR}{sub_command}"
-    _send_command(command)
+    _send_command(command, session)
 
 
-def create_bar(name: str, display_text: str) -> BossBar:
+def create_bar(name: str, display_text: str, *, session: Session | None = None) -> BossBar:
     """
     Create a boss bar
     Args:
         name: A name you choose, what the boss bar should be called for you
         display_text: Text that should be displayed on the bar
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
 
     Returns:
         A BossBar object with which you can further configure the bar
     """
     command = _build_command("spawnBossBar", name, display_text)
-    _send_command(command)
+    _send_command(command, session)
 
     # some of the values are set when creating.
     return BossBar(
@@ -84,46 +85,46 @@ def create_bar(name: str, display_text: str) -> BossBar:
     )
 
 
-def set_text(boss_bar: BossBar, display_text: str) -> BossBar:
+def set_text(boss_bar: BossBar, display_text: str, *, session: Session | None = None) -> BossBar:
     """Set the text of the bar"""
     sub_command = _build_command("text", boss_bar.name, f"text:{display_text}")
-    _send_boss_bar_command(sub_command)
+    _send_boss_bar_command(sub_command, session)
     boss_bar.display_text = display_text
     return boss_bar
 
 
-def set_color(boss_bar: BossBar, color: BossBarColor) -> BossBar:
+def set_color(boss_bar: BossBar, color: BossBarColor, *, session: Session | None = None) -> BossBar:
     """Set the color of the bar"""
     sub_command = _build_command("color", boss_bar.name, f"color:{color.value}")
-    _send_boss_bar_command(sub_command)
+    _send_boss_bar_command(sub_command, session)
     boss_bar.color = color
     return boss_bar
 
 
-def set_value(boss_bar: BossBar, value: float) -> BossBar:
+def set_value(boss_bar: BossBar, value: float, *, session: Session | None = None) -> BossBar:
     """Set to what proportion the bar should be filled (between 0 and 1)"""
     if not 0 <= value <= 1:
         raise ValueError(f"The value of the boss bar must be between 0 and 1. You specified '{value}'.")
 
     sub_command = _build_command("value", boss_bar.name, f"value:{value}")
-    _send_boss_bar_command(sub_command)
+    _send_boss_bar_command(sub_command, session)
     boss_bar.value = value
     return boss_bar
 
 
-def set_style(boss_bar: BossBar, style: BossBarStyle) -> BossBar:
+def set_style(boss_bar: BossBar, style: BossBarStyle, *, session: Session | None = None) -> BossBar:
     """Set the style of the bar"""
     sub_command = _build_command("style", boss_bar.name, f"style:{style.value}")
-    _send_boss_bar_command(sub_command)
+    _send_boss_bar_command(sub_command, session)
     boss_bar.style = style
     return boss_bar
 
 
-def delete_bar(boss_bar: BossBar):
+def delete_bar(boss_bar: BossBar, *, session: Session | None = None):
     """Delete a bar"""
-    _delete_bar_str(boss_bar.name)
+    _delete_bar_str(boss_bar.name, session)
 
 
-def _delete_bar_str(boss_bar_name: str):
+def _delete_bar_str(boss_bar_name: str, session: Session | None = None):
     command = _build_command("deleteBossBar", boss_bar_name)
-    _send_command(command)
+    _send_command(command, session)
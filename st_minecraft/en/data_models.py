@@ -1,19 +1,27 @@
+import os
+from contextvars import ContextVar
 from enum import Enum
+from typing import Any
+from typing import Callable
 from typing import Literal
+from typing import NamedTuple
 from typing import Optional
 
-from pydantic import BaseModel
-from pydantic import ValidationError
-
 from st_minecraft.core import InventoryFieldEmptyError
+from st_minecraft.core.compact_enum import CompactEnum
 from st_minecraft.core.core import ARG_SEPARATOR
 from st_minecraft.core.core import _bytes_to_text
 from st_minecraft.core.core import _to_enum
+from st_minecraft.core.models import BaseModel
+from st_minecraft.core.models import ValidationError
 from st_minecraft.en.entity import EntityCollection
 from st_minecraft.en.material import MaterialCollection
 
 dimensionT = Literal["world", "world_nether", "world_the_end"]
 
+FAST_MODELS_ENV = "SK_FAST_MODELS"
+""" if this environment variable is 1 (or lazy), replies are parsed into the fast models (see use_fast_models()) """
+
 
 class Dimension(Enum):
     World = "world"
@@ -92,43 +100,7 @@ class Player(BaseModel):
     @staticmethod
     def from_raw_data(data: bytes) -> "Player":
         """raw data is index, name, x, y, z"""
-        if data == b"error invalid_index\n":
-            raise ConnectionError(f"Can't fetch player. Are you sure this player is connected?")
-
-        (
-            _id,
-            name,
-            x,
-            y,
-            z,
-            dimension,
-            rot,
-            looking_at,
-            sneaked,
-            max_health,
-            health,
-            hunger,
-            saturation,
-            xp_level,
-            xp_progress,
-        ) = _bytes_to_text(data).split(ARG_SEPARATOR)
-        return Player(
-            id=int(_id),
-            name=name,
-            x=int(x),
-            y=int(y),
-            z=int(z),
-            dimension=_to_enum(Dimension, dimension),
-            rotation=int(rot),
-            looking_at=Material.from_string(looking_at),
-            sneaked=sneaked.lower() == "true",
-            max_health=float(max_health),
-            hunger=float(hunger),
-            saturation=float(saturation),
-            xp_level=float(xp_level),
-            xp_progress=float(xp_progress),
-            health=float(health),
-        )
+        return Player(**dict(zip(Player.model_fields, _player_values(data, Material.from_string))))
 
     def __repr__(self):
         return (
@@ -189,19 +161,7 @@ class Entity(BaseModel):
 
     @staticmethod
     def from_api_format(s: str):
-        _id, type, name, x, y, z, dimension, health, ai = s.split(ARG_SEPARATOR)
-        _type = _to_enum(EntityCollection, type)
-        return Entity(
-            id=_id,
-            type=_type,
-            name=name if name != "null" else None,
-            x=float(x),
-            y=float(y),
-            z=float(z),
-            dimension=_to_enum(Dimension, dimension),
-            health=float(health),
-            ai=ai == "true",
-        )
+        return Entity(**dict(zip(Entity.model_fields, _entity_values(s))))
 
 
 class Item(BaseModel):
@@ -213,11 +173,7 @@ class Item(BaseModel):
     @staticmethod
     def from_api_format(s: str):
         """we expect ; separated contents here"""
-        type, display_name = s.split(";")
-        if not display_name:
-            display_name = None
-
-        return Item(type=_to_enum(MaterialCollection, type), display_name=display_name)
+        return Item(**dict(zip(Item.model_fields, _item_values(s))))
 
     def __repr__(self):
         return f"Item(type={self.type}, display_name={self.display_name})"
@@ -235,30 +191,180 @@ class InventoryField(BaseModel):
 
     @staticmethod
     def from_api_format(s: str):
-        idx, itm, amt = s.split(":")
-
-        itm = Item.from_api_format(itm)
-        return InventoryField(index=int(idx), item=itm, amount=int(amt))
+        return InventoryField(
+            **dict(zip(InventoryField.model_fields, _inventory_field_values(s, Item.from_api_format)))
+        )
 
     def __repr__(self):
         return f"InventarFeld(index={self.index}, item={self.item!r}, amount={self.amount})"
 
 
-class Inventory(dict[int, InventoryField]):
+class _IndexedInventory(dict):
+    """
+    Base of Inventory and Inventar: a dict index -> field, that also keeps track of the slots and the total amount
+    of every material, so count(), slots_of(), has_at_least() and `in` don't have to look at every field.
+    The index is updated whenever a field is set or removed
+    (changing the amount of a field object in place is not noticed, set the field again instead).
+    copy() and | return an inventory of the same type with its own index.
+    Materials are compared by ordinal, so MaterialCollection and MaterialSammlung can be used with both inventories.
+    """
+
+    # needed internally
+    _type_field = "type"
+    _amount_field = "amount"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._slots: dict[int | None, dict[int, None]] = {}
+        """ ordinal of the material (None if unknown) -> its slots, a dict is used as ordered set """
+        self._amounts: dict[int | None, int] = {}
+        """ ordinal of the material (None if unknown) -> total amount """
+        self.update(*args, **kwargs)
+
+    def _add(self, index: int, field: Any) -> None:
+        # needed internally
+        # called for every field when an inventory is parsed, so it's kept short
+        key = _material_key(getattr(field.item, self._type_field))
+        amounts = self._amounts
+        if key in amounts:
+            self._slots[key][index] = None
+            amounts[key] += getattr(field, self._amount_field)
+        else:
+            self._slots[key] = {index: None}
+            amounts[key] = getattr(field, self._amount_field)
+
+    def _remove(self, index: int, field: Any) -> None:
+        # needed internally
+        key = _material_key(getattr(field.item, self._type_field))
+        slots = self._slots[key]
+        del slots[index]
+        if slots:
+            self._amounts[key] -= getattr(field, self._amount_field)
+        else:
+            del self._slots[key]
+            del self._amounts[key]
+
+    def __setitem__(self, index: int, field: Any) -> None:
+        old_field = dict.get(self, index)
+        if old_field is not None:
+            self._remove(index, old_field)
+        dict.__setitem__(self, index, field)
+        self._add(index, field)
+
+    def __delitem__(self, index: int) -> None:
+        field = dict.__getitem__(self, index)
+        super().__delitem__(index)
+        self._remove(index, field)
+
+    def pop(self, index: int, *default: Any) -> Any:
+        if not dict.__contains__(self, index):
+            return super().pop(index, *default)
+        field = super().pop(index)
+        self._remove(index, field)
+        return field
+
+    def popitem(self) -> tuple[int, Any]:
+        index, field = super().popitem()
+        self._remove(index, field)
+        return index, field
+
+    def setdefault(self, index: int, default: Any = None) -> Any:
+        if not dict.__contains__(self, index):
+            self[index] = default
+        return dict.__getitem__(self, index)
+
+    def update(self, *args, **kwargs) -> None:
+        for index, field in dict(*args, **kwargs).items():
+            self[index] = field
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def copy(self):
+        """A copy of the same type, with its own index"""
+        return type(self)(self)
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = type(self)(other)
+        merged.update(self)
+        return merged
+
+    def clear(self) -> None:
+        super().clear()
+        self._slots.clear()
+        self._amounts.clear()
+
+    def __reduce__(self):
+        # copies and pickles are rebuilt through __init__, so they get their own index
+        return type(self), (dict(self),)
+
+    def __contains__(self, item: Any) -> bool:
+        """Check if an item (or a material) is in the inventory"""
+        if isinstance(item, CompactEnum):
+            return item.ordinal in self._slots
+        key = _material_key(getattr(item, self._type_field, None))
+        return any(dict.__getitem__(self, index).item == item for index in self._slots.get(key, ()))
+
+    def count(self, material: MaterialCollection) -> int:
+        """
+        How many of the material are in the inventory, all fields added up
+        Args:
+            material (MaterialCollection): e.g. MaterialCollection.Diamond, a TypeError is raised for anything else
+        Returns:
+            The total amount, 0 if the material is not in the inventory
+        """
+        return self._amounts.get(_material_key(material), 0)
+
+    def slots_of(self, material: MaterialCollection) -> list[int]:
+        """
+        The indices of the fields that contain the material
+        Args:
+            material (MaterialCollection): e.g. MaterialCollection.Diamond
+        Returns:
+            The indices in ascending order, empty if the material is not in the inventory
+        """
+        return sorted(self._slots.get(_material_key(material), ()))
+
+    def has_at_least(self, material: MaterialCollection, amount: int) -> bool:
+        """
+        Check if there are at least amount of the material in the inventory (all fields added up)
+        Args:
+            material (MaterialCollection): e.g. MaterialCollection.Diamond
+            amount (int): How many are needed
+        """
+        return self._amounts.get(_material_key(material), 0) >= amount
+
+
+def _material_key(material: CompactEnum | None) -> int | None:
+    # needed internally
+    # unknown materials (None) are counted together. the one place that decides the key, adding and removing
+    # fields both go through here so their bookkeeping can't drift apart
+    if material is None:
+        return None
+    if not isinstance(material, CompactEnum):
+        raise TypeError(f"Expected a material like MaterialCollection.Stone. You said '{material!r}'.")
+    return material._ordinal_
+
+
+class Inventory(_IndexedInventory, dict[int, InventoryField]):
     """
     Contains the entire inventory of a player.
     The structure is a dict.
     The dict maps from inventory index to an object of type InventarFeld, which contains the info about the element in the field.
     Note: Fields that are empty are not included in the dict!
+    Check for items with `item in inventory`, for totals use count(), slots_of() and has_at_least().
     """
 
-    def __contains__(self, item: Item):
-        """Check if an item is in the inventory"""
-        for _, v in self.items():
-            if v.item == item:
-                return True
-        return False
-
     def __getitem__(self, item: int):
         try:
             return super().__getitem__(item)
@@ -276,3 +382,432 @@ class Message(BaseModel):
     """The text sent to the chat"""
     sender_name: str
     """Name of the player that sent this message"""
+
+
+def _player_values(data: bytes, material_from_string) -> tuple:
+    # needed internally
+    # shared by all player models (Player, FastPlayer and the German Spieler), so they parse the reply the same way
+    # the values are in the order of the fields of Player
+    if data == b"error invalid_index\n":
+        raise ConnectionError(f"Can't fetch player. Are you sure this player is connected?")
+
+    (
+        _id,
+        name,
+        x,
+        y,
+        z,
+        dimension,
+        rot,
+        looking_at,
+        sneaked,
+        max_health,
+        health,
+        hunger,
+        saturation,
+        xp_level,
+        xp_progress,
+    ) = _bytes_to_text(data).split(ARG_SEPARATOR)
+    return (
+        int(_id),
+        name,
+        int(x),
+        int(y),
+        int(z),
+        _to_enum(Dimension, dimension),
+        int(rot),
+        material_from_string(looking_at),
+        sneaked.lower() == "true",
+        float(max_health),
+        float(health),
+        float(hunger),
+        float(saturation),
+        float(xp_level),
+        float(xp_progress),
+    )
+
+
+def _entity_values(s: str, entity_enum: type[CompactEnum] = EntityCollection) -> tuple:
+    # needed internally
+    if s.startswith("error "):
+        raise ValueError(f"Can't fetch entity ({s}). Are you sure this entity still exists?")
+
+    _id, type, name, x, y, z, dimension, health, ai = s.split(ARG_SEPARATOR)
+    return (
+        _to_enum(entity_enum, type),
+        _id,
+        name if name != "null" else None,
+        float(x),
+        float(y),
+        float(z),
+        _to_enum(Dimension, dimension),
+        float(health),
+        ai == "true",
+    )
+
+
+def _item_values(s: str, material_enum: type[CompactEnum] = MaterialCollection) -> tuple:
+    # needed internally
+    type, display_name = s.split(";")
+    return _to_enum(material_enum, type), display_name or None
+
+
+def _inventory_field_values(s: str, item_from_api_format) -> tuple:
+    # needed internally
+    idx, itm, amt = s.split(":")
+    return int(idx), item_from_api_format(itm), int(amt)
+
+
+class _SlottedModel:
+    """
+    Base of the fast models.
+    These are plain classes with __slots__: the parsed values are stored as they are, nothing is validated.
+    Attribute names, repr and str are the same as the ones of the pydantic model they stand in for.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...]
+    """ names of the fields, in the order of the pydantic model """
+    _validated: type[BaseModel]
+    """ the pydantic model with the same fields """
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, self._validated) or (
+            isinstance(other, _SlottedModel) and other._validated is self._validated
+        ):
+            return self._values() == tuple(getattr(other, name) for name in self._fields)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self._validated.__name__}({self.__repr_args(', ')})"
+
+    def __str__(self):
+        return self.__repr_args(" ")
+
+    def __repr_args(self, separator: str) -> str:
+        return separator.join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+
+    def model_dump(self) -> dict:
+        """The fields as a dict, nested models are dumped as well (like pydantic's model_dump())"""
+        return {
+            name: value.model_dump() if isinstance(value, _SlottedModel) else value
+            for name, value in zip(self._fields, self._values())
+        }
+
+    def to_pydantic(self) -> BaseModel:
+        """Validate the values and convert to the model this stands in for, e.g. Player for a FastPlayer"""
+        return self._validated.model_validate(self.model_dump())
+
+
+class FastMaterial(_SlottedModel):
+    """Fast stand-in for Material, see use_fast_models()"""
+
+    __slots__ = _fields = ("type", "x", "y", "z", "dimension")
+    _validated = Material
+    __repr__ = Material.__repr__
+
+    def __init__(
+        self,
+        type: MaterialCollection | None,
+        x: int | None = None,
+        y: int | None = None,
+        z: int | None = None,
+        dimension: Dimension | None = None,
+    ):
+        self.type = type
+        self.x = x
+        self.y = y
+        self.z = z
+        self.dimension = dimension
+
+    @staticmethod
+    def from_string(
+        type: str,
+        x: int | None = None,
+        y: int | None = None,
+        z: int | None = None,
+        dimension: dimensionT | None = None,
+    ) -> "FastMaterial":
+        return FastMaterial(_to_enum(MaterialCollection, type), x, y, z, _to_enum(Dimension, dimension))
+
+
+class FastPlayer(_SlottedModel):
+    """Fast stand-in for Player, see use_fast_models()"""
+
+    __slots__ = _fields = (
+        "id",
+        "name",
+        "x",
+        "y",
+        "z",
+        "dimension",
+        "rotation",
+        "looking_at",
+        "sneaked",
+        "max_health",
+        "health",
+        "hunger",
+        "saturation",
+        "xp_level",
+        "xp_progress",
+    )
+    _validated = Player
+    __repr__ = Player.__repr__
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        x: int,
+        y: int,
+        z: int,
+        dimension: Dimension,
+        rotation: int,
+        looking_at: FastMaterial | None,
+        sneaked: bool,
+        max_health: float,
+        health: float,
+        hunger: float,
+        saturation: float,
+        xp_level: float,
+        xp_progress: float,
+    ):
+        self.id = id
+        self.name = name
+        self.x = x
+        self.y = y
+        self.z = z
+        self.dimension = dimension
+        self.rotation = rotation
+        self.looking_at = looking_at
+        self.sneaked = sneaked
+        self.max_health = max_health
+        self.health = health
+        self.hunger = hunger
+        self.saturation = saturation
+        self.xp_level = xp_level
+        self.xp_progress = xp_progress
+
+    @staticmethod
+    def from_raw_data(data: bytes) -> "FastPlayer":
+        return FastPlayer(*_player_values(data, FastMaterial.from_string))
+
+
+class _LazyField:
+    """Field of a LazyPlayer: converted when it is read for the first time, afterward the value is in __dict__"""
+
+    __slots__ = ("index", "convert", "name")
+
+    def __init__(self, index: int, convert: Callable[[str], Any]):
+        self.index = index
+        """ index of the field in the reply """
+        self.convert = convert
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # no __set__, so from now on the attribute lookup finds the value in __dict__ and never calls us again
+        value = instance.__dict__[self.name] = self.convert(instance._raw[self.index])
+        return value
+
+
+class LazyPlayer(_SlottedModel):
+    """
+    Lazy stand-in for Player, see use_fast_models(lazy=True).
+    The reply is only split into its fields, each field is converted when it is read for the first time.
+    Loops that only read a few fields (e.g. x, y, z) don't pay for the others.
+    """
+
+    _fields = FastPlayer._fields
+    _validated = Player
+    __repr__ = Player.__repr__
+
+    # the conversions are the same as in _player_values()
+    id = _LazyField(0, int)
+    name = _LazyField(1, str)
+    x = _LazyField(2, int)
+    y = _LazyField(3, int)
+    z = _LazyField(4, int)
+    dimension = _LazyField(5, lambda dimension: _to_enum(Dimension, dimension))
+    rotation = _LazyField(6, int)
+    looking_at = _LazyField(7, FastMaterial.from_string)
+    sneaked = _LazyField(8, lambda sneaked: sneaked.lower() == "true")
+    max_health = _LazyField(9, float)
+    health = _LazyField(10, float)
+    hunger = _LazyField(11, float)
+    saturation = _LazyField(12, float)
+    xp_level = _LazyField(13, float)
+    xp_progress = _LazyField(14, float)
+
+    def __init__(self, raw: list[str]):
+        self._raw = raw
+        """ the fields of the reply, as text """
+
+    @staticmethod
+    def from_raw_data(data: bytes) -> "LazyPlayer":
+        if data == b"error invalid_index\n":
+            raise ConnectionError(f"Can't fetch player. Are you sure this player is connected?")
+
+        raw = _bytes_to_text(data).split(ARG_SEPARATOR)
+        if len(raw) != len(LazyPlayer._fields):
+            raise ValueError(f"Expected {len(LazyPlayer._fields)} fields for a player, but got {len(raw)}.")
+        return LazyPlayer(raw)
+
+
+class FastEntity(_SlottedModel):
+    """Fast stand-in for Entity, see use_fast_models()"""
+
+    __slots__ = _fields = ("type", "id", "name", "x", "y", "z", "dimension", "health", "ai")
+    _validated = Entity
+    __repr__ = Entity.__repr__
+
+    def __init__(
+        self,
+        type: EntityCollection,
+        id: str | None = None,
+        name: str | None = None,
+        x: float | None = None,
+        y: float | None = None,
+        z: float | None = None,
+        dimension: Dimension | None = None,
+        health: float | None = None,
+        ai: bool | None = None,
+    ):
+        self.type = type
+        self.id = id
+        self.name = name
+        self.x = x
+        self.y = y
+        self.z = z
+        self.dimension = dimension
+        self.health = health
+        self.ai = ai
+
+    @staticmethod
+    def from_api_format(s: str) -> "FastEntity":
+        return FastEntity(*_entity_values(s))
+
+
+class FastItem(_SlottedModel):
+    """Fast stand-in for Item, see use_fast_models()"""
+
+    __slots__ = _fields = ("type", "display_name")
+    _validated = Item
+    __repr__ = Item.__repr__
+
+    def __init__(self, type: MaterialCollection, display_name: str | None):
+        self.type = type
+        self.display_name = display_name
+
+    @staticmethod
+    def from_api_format(s: str) -> "FastItem":
+        return FastItem(*_item_values(s))
+
+
+class FastInventoryField(_SlottedModel):
+    """Fast stand-in for InventoryField, see use_fast_models()"""
+
+    __slots__ = _fields = ("index", "item", "amount")
+    _validated = InventoryField
+    __repr__ = InventoryField.__repr__
+
+    def __init__(self, index: int, item: FastItem, amount: int):
+        self.index = index
+        self.item = item
+        self.amount = amount
+
+    @staticmethod
+    def from_api_format(s: str) -> "FastInventoryField":
+        return FastInventoryField(*_inventory_field_values(s, FastItem.from_api_format))
+
+
+class FastMessage(_SlottedModel):
+    """Fast stand-in for Message, see use_fast_models()"""
+
+    __slots__ = _fields = ("text", "sender_name")
+    _validated = Message
+
+    def __init__(self, text: str, sender_name: str):
+        self.text = text
+        self.sender_name = sender_name
+
+
+class _ModelSet(NamedTuple):
+    """Functions that turn (parts of) the replies into models"""
+
+    material: Callable
+    """ called like Material.from_string(type, x, y, z, dimension), with positional arguments """
+    player: Callable
+    """ like Player.from_raw_data() """
+    entity: Callable
+    """ like Entity.from_api_format() """
+    inventory_field: Callable
+    """ like InventoryField.from_api_format() """
+    message: Callable
+    """ called with text= and sender_name= """
+    inventory: type
+    """ dict the inventory fields are put into """
+
+
+_VALIDATED_MODELS = _ModelSet(
+    Material.from_string,
+    Player.from_raw_data,
+    Entity.from_api_format,
+    InventoryField.from_api_format,
+    Message,
+    Inventory,
+)
+_FAST_MODELS = _ModelSet(
+    FastMaterial.from_string,
+    FastPlayer.from_raw_data,
+    FastEntity.from_api_format,
+    FastInventoryField.from_api_format,
+    FastMessage,
+    Inventory,
+)
+_LAZY_MODELS = _FAST_MODELS._replace(player=LazyPlayer.from_raw_data)
+_models = {"1": _FAST_MODELS, "lazy": _LAZY_MODELS}.get(os.getenv(FAST_MODELS_ENV), _VALIDATED_MODELS)
+_models_override: ContextVar[_ModelSet | None] = ContextVar("_models_override", default=None)
+""" set while other models are wanted for a single call, e.g. by st_minecraft.de for its own models """
+
+
+def use_fast_models(enabled: bool = True, *, lazy: bool = False) -> None:
+    """
+    Parse the replies of the server into fast models instead of the pydantic models.
+    The fast models (FastPlayer, FastEntity, FastMaterial, ...) have the same attributes and repr,
+    but skip the validation, which makes polling loops several times cheaper.
+    The values are exactly the ones the pydantic models would hold; to get a pydantic model, call to_pydantic().
+    Note: isinstance(player, Player) is False for a FastPlayer.
+    Can also be turned on by setting the environment variable SK_FAST_MODELS=1 (or SK_FAST_MODELS=lazy).
+
+    Args:
+        enabled: True for the fast models, False to go back to the pydantic models
+        lazy: (optional, keyword argument) players are LazyPlayer objects, which convert each field on first access.
+            Worth it if you mostly read a few fields, e.g. only the position
+    """
+    global _models
+    if not enabled:
+        _models = _VALIDATED_MODELS
+    else:
+        _models = _LAZY_MODELS if lazy else _FAST_MODELS
+
+
+def _get_models() -> _ModelSet:
+    # needed internally
+    return _models_override.get() or _models
+
+
+def _call_with_models(models: _ModelSet, func: Callable, *args, **kwargs) -> Any:
+    # needed internally
+    # the replies that func receives are parsed with models instead of the ones chosen by use_fast_models()
+    token = _models_override.set(models)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _models_override.reset(token)
@@ -1,131 +1,35 @@
-""" This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
+"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
 
-from enum import Enum
+from st_minecraft.core.compact_enum import CompactEnum
 
+_NAMES = (
+    "Allay Area_Effect_Cloud Armor_Stand Arrow Axolotl Bat Bee Blaze Block_Display Boat Camel Cat "
+    "Cave_Spider Chest_Boat Chest_Minecart Chicken Cod Command_Block_Minecart Cow Creeper Dolphin Donkey "
+    "Dragon_Fireball Drowned Egg Elder_Guardian End_Crystal Ender_Dragon Ender_Pearl Enderman Endermite "
+    "Evoker Evoker_Fangs Experience_Bottle Experience_Orb Eye_Of_Ender Falling_Block Fireball "
+    "Firework_Rocket Fishing_Bobber Fox Frog Furnace_Minecart Ghast Giant Glow_Item_Frame Glow_Squid "
+    "Goat Guardian Hoglin Hopper_Minecart Horse Husk Illusioner Interaction Iron_Golem Item Item_Display "
+    "Item_Frame Killer_Bunny Leash_Knot Lightning_Bolt Llama Llama_Spit Magma_Cube Marker Minecart "
+    "Mooshroom Mule Ocelot Painting Panda Parrot Phantom Pig Piglin Piglin_Brute Pillager Player "
+    "Polar_Bear Potion Pufferfish Rabbit Ravager Salmon Sheep Shulker Shulker_Bullet Silverfish Skeleton "
+    "Skeleton_Horse Slime Small_Fireball Sniffer Snow_Golem Snowball Spawner_Minecart Spectral_Arrow "
+    "Spider Squid Stray Strider Tadpole Text_Display Tnt Tnt_Minecart Trader_Llama Trident Tropical_Fish "
+    "Turtle Vex Villager Vindicator Wandering_Trader Warden Witch Wither Wither_Skeleton Wither_Skull "
+    "Wolf Zoglin Zombie Zombie_Horse Zombie_Villager Zombified_Piglin "
+).split()
+""" the ordinal of a member is its position in this table """
 
-class EntityCollection(Enum):
-    Allay = "ALLAY"
-    Area_Effect_Cloud = "AREA_EFFECT_CLOUD"
-    Armor_Stand = "ARMOR_STAND"
-    Arrow = "ARROW"
-    Axolotl = "AXOLOTL"
-    Bat = "BAT"
-    Bee = "BEE"
-    Blaze = "BLAZE"
-    Block_Display = "BLOCK_DISPLAY"
-    Boat = "BOAT"
-    Camel = "CAMEL"
-    Cat = "CAT"
-    Cave_Spider = "CAVE_SPIDER"
-    Chest_Boat = "CHEST_BOAT"
-    Chest_Minecart = "CHEST_MINECART"
-    Chicken = "CHICKEN"
-    Cod = "COD"
-    Command_Block_Minecart = "COMMAND_BLOCK_MINECART"
-    Cow = "COW"
-    Creeper = "CREEPER"
-    Dolphin = "DOLPHIN"
-    Donkey = "DONKEY"
-    Dragon_Fireball = "DRAGON_FIREBALL"
-    Drowned = "DROWNED"
-    Egg = "EGG"
-    Elder_Guardian = "ELDER_GUARDIAN"
-    End_Crystal = "END_CRYSTAL"
-    Ender_Dragon = "ENDER_DRAGON"
-    Ender_Pearl = "ENDER_PEARL"
-    Enderman = "ENDERMAN"
-    Endermite = "ENDERMITE"
-    Evoker = "EVOKER"
-    Evoker_Fangs = "EVOKER_FANGS"
-    Experience_Bottle = "EXPERIENCE_BOTTLE"
-    Experience_Orb = "EXPERIENCE_ORB"
-    Eye_Of_Ender = "EYE_OF_ENDER"
-    Falling_Block = "FALLING_BLOCK"
-    Fireball = "FIREBALL"
-    Firework_Rocket = "FIREWORK_ROCKET"
-    Fishing_Bobber = "FISHING_BOBBER"
-    Fox = "FOX"
-    Frog = "FROG"
-    Furnace_Minecart = "FURNACE_MINECART"
-    Ghast = "GHAST"
-    Giant = "GIANT"
-    Glow_Item_Frame = "GLOW_ITEM_FRAME"
-    Glow_Squid = "GLOW_SQUID"
-    Goat = "GOAT"
-    Guardian = "GUARDIAN"
-    Hoglin = "HOGLIN"
-    Hopper_Minecart = "HOPPER_MINECART"
-    Horse = "HORSE"
-    Husk = "HUSK"
-    Illusioner = "ILLUSIONER"
-    Interaction = "INTERACTION"
-    Iron_Golem = "IRON_GOLEM"
-    Item = "ITEM"
-    Item_Display = "ITEM_DISPLAY"
-    Item_Frame = "ITEM_FRAME"
-    Killer_Bunny = "KILLER_BUNNY"
-    Leash_Knot = "LEASH_KNOT"
-    Lightning_Bolt = "LIGHTNING_BOLT"
-    Llama = "LLAMA"
-    Llama_Spit = "LLAMA_SPIT"
-    Magma_Cube = "MAGMA_CUBE"
-    Marker = "MARKER"
-    Minecart = "MINECART"
-    Mooshroom = "MOOSHROOM"
-    Mule = "MULE"
-    Ocelot = "OCELOT"
-    Painting = "PAINTING"
-    Panda = "PANDA"
-    Parrot = "PARROT"
-    Phantom = "PHANTOM"
-    Pig = "PIG"
-    Piglin = "PIGLIN"
-    Piglin_Brute = "PIGLIN_BRUTE"
-    Pillager = "PILLAGER"
-    Player = "PLAYER"
-    Polar_Bear = "POLAR_BEAR"
-    Potion = "POTION"
-    Pufferfish = "PUFFERFISH"
-    Rabbit = "RABBIT"
-    Ravager = "RAVAGER"
-    Salmon = "SALMON"
-    Sheep = "SHEEP"
-    Shulker = "SHULKER"
-    Shulker_Bullet = "SHULKER_BULLET"
-    Silverfish = "SILVERFISH"
-    Skeleton = "SKELETON"
-    Skeleton_Horse = "SKELETON_HORSE"
-    Slime = "SLIME"
-    Small_Fireball = "SMALL_FIREBALL"
-    Sniffer = "SNIFFER"
-    Snow_Golem = "SNOW_GOLEM"
-    Snowball = "SNOWBALL"
-    Spawner_Minecart = "SPAWNER_MINECART"
-    Spectral_Arrow = "SPECTRAL_ARROW"
-    Spider = "SPIDER"
-    Squid = "SQUID"
-    Stray = "STRAY"
-    Strider = "STRIDER"
-    Tadpole = "TADPOLE"
-    Text_Display = "TEXT_DISPLAY"
-    Tnt = "TNT"
-    Tnt_Minecart = "TNT_MINECART"
-    Trader_Llama = "TRADER_LLAMA"
-    Trident = "TRIDENT"
-    Tropical_Fish = "TROPICAL_FISH"
-    Turtle = "TURTLE"
-    Vex = "VEX"
-    Villager = "VILLAGER"
-    Vindicator = "VINDICATOR"
-    Wandering_Trader = "WANDERING_TRADER"
-    Warden = "WARDEN"
-    Witch = "WITCH"
-    Wither = "WITHER"
-    Wither_Skeleton = "WITHER_SKELETON"
-    Wither_Skull = "WITHER_SKULL"
-    Wolf = "WOLF"
-    Zoglin = "ZOGLIN"
-    Zombie = "ZOMBIE"
-    Zombie_Horse = "ZOMBIE_HORSE"
-    Zombie_Villager = "ZOMBIE_VILLAGER"
-    Zombified_Piglin = "ZOMBIFIED_PIGLIN"
+
+class EntityCollection(CompactEnum, names=_NAMES, values=[name.upper() for name in _NAMES]):
+    pass
+
+
+def entity_from_ordinal(ordinal: int) -> EntityCollection:
+    """
+    The entity with the given ordinal (see to_ordinal())
+    Args:
+        ordinal (int): e.g. EntityCollection.Allay.ordinal
+    Returns:
+        the entity, raises a ValueError if no entity has that ordinal
+    """
+    return EntityCollection.from_ordinal(ordinal)
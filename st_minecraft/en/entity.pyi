@@ -0,0 +1,132 @@
+"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
+
+from st_minecraft.core.compact_enum import CompactEnum
+
+class EntityCollection(CompactEnum):
+    Allay: EntityCollection
+    Area_Effect_Cloud: EntityCollection
+    Armor_Stand: EntityCollection
+    Arrow: EntityCollection
+    Axolotl: EntityCollection
+    Bat: EntityCollection
+    Bee: EntityCollection
+    Blaze: EntityCollection
+    Block_Display: EntityCollection
+    Boat: EntityCollection
+    Camel: EntityCollection
+    Cat: EntityCollection
+    Cave_Spider: EntityCollection
+    Chest_Boat: EntityCollection
+    Chest_Minecart: EntityCollection
+    Chicken: EntityCollection
+    Cod: EntityCollection
+    Command_Block_Minecart: EntityCollection
+    Cow: EntityCollection
+    Creeper: EntityCollection
+    Dolphin: EntityCollection
+    Donkey: EntityCollection
+    Dragon_Fireball: EntityCollection
+    Drowned: EntityCollection
+    Egg: EntityCollection
+    Elder_Guardian: EntityCollection
+    End_Crystal: EntityCollection
+    Ender_Dragon: EntityCollection
+    Ender_Pearl: EntityCollection
+    Enderman: EntityCollection
+    Endermite: EntityCollection
+    Evoker: EntityCollection
+    Evoker_Fangs: EntityCollection
+    Experience_Bottle: EntityCollection
+    Experience_Orb: EntityCollection
+    Eye_Of_Ender: EntityCollection
+    Falling_Block: EntityCollection
+    Fireball: EntityCollection
+    Firework_Rocket: EntityCollection
+    Fishing_Bobber: EntityCollection
+    Fox: EntityCollection
+    Frog: EntityCollection
+    Furnace_Minecart: EntityCollection
+    Ghast: EntityCollection
+    Giant: EntityCollection
+    Glow_Item_Frame: EntityCollection
+    Glow_Squid: EntityCollection
+    Goat: EntityCollection
+    Guardian: EntityCollection
+    Hoglin: EntityCollection
+    Hopper_Minecart: EntityCollection
+    Horse: EntityCollection
+    Husk: EntityCollection
+    Illusioner: EntityCollection
+    Interaction: EntityCollection
+    Iron_Golem: EntityCollection
+    Item: EntityCollection
+    Item_Display: EntityCollection
+    Item_Frame: EntityCollection
+    Killer_Bunny: EntityCollection
+    Leash_Knot: EntityCollection
+    Lightning_Bolt: EntityCollection
+    Llama: EntityCollection
+    Llama_Spit: EntityCollection
+    Magma_Cube: EntityCollection
+    Marker: EntityCollection
+    Minecart: EntityCollection
+    Mooshroom: EntityCollection
+    Mule: EntityCollection
+    Ocelot: EntityCollection
+    Painting: EntityCollection
+    Panda: EntityCollection
+    Parrot: EntityCollection
+    Phantom: EntityCollection
+    Pig: EntityCollection
+    Piglin: EntityCollection
+    Piglin_Brute: EntityCollection
+    Pillager: EntityCollection
+    Player: EntityCollection
+    Polar_Bear: EntityCollection
+    Potion: EntityCollection
+    Pufferfish: EntityCollection
+    Rabbit: EntityCollection
+    Ravager: EntityCollection
+    Salmon: EntityCollection
+    Sheep: EntityCollection
+    Shulker: EntityCollection
+    Shulker_Bullet: EntityCollection
+    Silverfish: EntityCollection
+    Skeleton: EntityCollection
+    Skeleton_Horse: EntityCollection
+    Slime: EntityCollection
+    Small_Fireball: EntityCollection
+    Sniffer: EntityCollection
+    Snow_Golem: EntityCollection
+    Snowball: EntityCollection
+    Spawner_Minecart: EntityCollection
+    Spectral_Arrow: EntityCollection
+    Spider: EntityCollection
+    Squid: EntityCollection
+    Stray: EntityCollection
+    Strider: EntityCollection
+    Tadpole: EntityCollection
+    Text_Display: EntityCollection
+    Tnt: EntityCollection
+    Tnt_Minecart: EntityCollection
+    Trader_Llama: EntityCollection
+    Trident: EntityCollection
+    Tropical_Fish: EntityCollection
+    Turtle: EntityCollection
+    Vex: EntityCollection
+    Villager: EntityCollection
+    Vindicator: EntityCollection
+    Wandering_Trader: EntityCollection
+    Warden: EntityCollection
+    Witch: EntityCollection
+    Wither: EntityCollection
+    Wither_Skeleton: EntityCollection
+    Wither_Skull: EntityCollection
+    Wolf: EntityCollection
+    Zoglin: EntityCollection
+    Zombie: EntityCollection
+    Zombie_Horse: EntityCollection
+    Zombie_Villager: EntityCollection
+    Zombified_Piglin: EntityCollection
+
+def entity_from_ordinal(ordinal: int) -> EntityCollection: ...
@@ -1,28 +1,42 @@
 """main functionalities of the library"""
 
+from typing import Iterable
 from typing import Literal
 from typing import cast
 
 from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import Session
 from st_minecraft.core.core import _build_command
 from st_minecraft.core.core import _bytes_to_text
-from st_minecraft.core.core import _receive
+from st_minecraft.core.core import _query
+from st_minecraft.core.core import _query_many
 from st_minecraft.core.core import _send_command
+from st_minecraft.core.core import _send_commands
 from st_minecraft.en.data_models import Dimension
 from st_minecraft.en.data_models import DirectionCollection
 from st_minecraft.en.data_models import Entity
+from st_minecraft.en.data_models import FastItem
 from st_minecraft.en.data_models import Inventory
 from st_minecraft.en.data_models import InventoryField
 from st_minecraft.en.data_models import Item
 from st_minecraft.en.data_models import Material
 from st_minecraft.en.data_models import Message
 from st_minecraft.en.data_models import Player
+from st_minecraft.en.data_models import _get_models
 from st_minecraft.en.data_models import dimensionT
 from st_minecraft.en.entity import EntityCollection
 from st_minecraft.en.material import MaterialCollection
 
 
-def set_block(x: int, y: int, z: int, block_type: MaterialCollection, dimension: Dimension = Dimension.World) -> None:
+def set_block(
+    x: int,
+    y: int,
+    z: int,
+    block_type: MaterialCollection,
+    dimension: Dimension = Dimension.World,
+    *,
+    session: Session | None = None,
+) -> None:
     """
     Places a block in the Minecraft game.
     You can also use this to replace already existing blocks.
@@ -36,13 +50,47 @@ def set_block(x: int, y: int, z: int, block_type: MaterialCollection, dimension:
         z (int): Z coordinate for the block
         block_type (MaterialCollection): Block as an element from MaterialCollection, e.g. MaterialCollection.Melone
         dimension (Dimension): dimension to look for the block (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     """
     # TODO: Determine the exact command format for the protocol
-    command = _build_command("setBlock", x, y, z, dimension.value, block_type.value)
-    _send_command(command)
+    _send_command(_set_block_command(x, y, z, block_type, dimension), session)
+
+
+def set_blocks(
+    blocks: Iterable[tuple[int, int, int, MaterialCollection]],
+    dimension: Dimension = Dimension.World,
+    *,
+    session: Session | None = None,
+) -> int:
+    """
+    Places many blocks at once.
+    This is a lot faster than calling set_block() for each block, because the blocks are sent together.
+
+    Example: set_blocks([(0, 64, 0, MaterialCollection.Stone), (1, 64, 0, MaterialCollection.Melon)])
+
+    Args:
+        blocks: The blocks to place, each as (x, y, z, block_type)
+        dimension (Dimension): dimension to place the blocks in (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
+    Returns:
+        The number of blocks that were placed
+    """
+    # build all commands before sending, so an invalid block can't leave the world half changed
+    commands = [_set_block_command(x, y, z, block_type, dimension) for x, y, z, block_type in blocks]
+    return _send_commands(commands, session)
 
 
-def get_block(x: int, y: int, z: int, dimension: Dimension = Dimension.World) -> Material:
+def _set_block_command(x: int, y: int, z: int, block_type: MaterialCollection, dimension: Dimension) -> str:
+    # needed internally
+    # set_block() and set_blocks() check the same way, a wrong block type never reaches the server
+    if not isinstance(block_type, MaterialCollection):
+        raise TypeError(f"A block type must be from MaterialCollection. You said '{block_type!r}'.")
+    return _build_command("setBlock", x, y, z, dimension.value, block_type.value)
+
+
+def get_block(
+    x: int, y: int, z: int, dimension: Dimension = Dimension.World, *, session: Session | None = None
+) -> Material:
     """
     Query what type of block is at the coordinate
     You get a block object back that contains the type under .typ
@@ -53,47 +101,91 @@ def get_block(x: int, y: int, z: int, dimension: Dimension = Dimension.World) ->
         y (int): Y coordinate of the block
         z (int): Z coordinate of the block
         dimension (Dimension): dimension to look for the block (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         The block at the coordinate as data type `Material`
     """
     command = _build_command("getBlock", x, y, z, dimension.value)
-    _send_command(command)
-    data = _receive()
-    block = Material.from_string(
-        x=x, y=y, z=z, dimension=cast(dimensionT, dimension.value), type=_bytes_to_text(data).upper()
-    )
+    data = _query(command, session)
+    block = _get_models().material(_bytes_to_text(data).upper(), x, y, z, cast(dimensionT, dimension.value))
     return block
 
 
-def get_entity(entity: Entity) -> Entity:
+def get_blocks(
+    coordinates: Iterable[tuple[int, int, int]],
+    dimension: Dimension = Dimension.World,
+    *,
+    session: Session | None = None,
+) -> list[Material]:
+    """
+    Query the blocks at many coordinates at once.
+    This is a lot faster than calling get_block() for each coordinate,
+    because all queries are sent together and the answers are collected afterward.
+
+    Example: get_blocks([(0, 64, 0), (1, 64, 0), (2, 64, 0)])
+
+    Args:
+        coordinates: The coordinates (x, y, z) of the blocks
+        dimension (Dimension): dimension to look for the blocks (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
+    Returns:
+        A list with the blocks in the same order as the coordinates
+    """
+    coordinates = list(coordinates)
+    # build all commands before sending, so invalid coordinates can't leave us with a half sent batch
+    commands = [_build_command("getBlock", x, y, z, dimension.value) for x, y, z in coordinates]
+    # all replies are collected first, so a failed parse can't leave unread replies behind
+    replies = _query_many(commands, session)
+    material_from_string = _get_models().material
+    return [
+        material_from_string(_bytes_to_text(data).upper(), x, y, z, cast(dimensionT, dimension.value))
+        for (x, y, z), data in zip(coordinates, replies)
+    ]
+
+
+def get_entity(entity: Entity, *, session: Session | None = None) -> Entity:
     """Get the most current state of an already created entity
     Args:
         The Entity object from which you want to query an update
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         An updated version of the corresponding entity
 
     """
     command = _build_command("getEntity", entity.id)
-    _send_command(command)
-    data = _receive()
-    entity = Entity.from_api_format(_bytes_to_text(data))
+    data = _query(command, session)
+    entity = _get_models().entity(_bytes_to_text(data))
     return entity
 
 
-def get_player_by_name(name: str) -> Player:
+def get_entities(entities: Iterable[Entity], *, session: Session | None = None) -> list[Entity]:
+    """Get the most current state of many already created entities at once
+    Args:
+        The Entity objects from which you want to query an update
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
+    Returns:
+        Updated versions of the entities in the same order
+    """
+    replies = _query_many([_build_command("getEntity", entity.id) for entity in entities], session)
+    entity_from_api_format = _get_models().entity
+    return [entity_from_api_format(_bytes_to_text(data)) for data in replies]
+
+
+def get_player_by_name(name: str, *, session: Session | None = None) -> Player:
     """
     Query the state of a player by providing their username
     Args:
         name: Name of the player to query
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get a player object back that contains a lot of information about the player
     """
     # ONLY convencience wrapper for the users
     # please use get_player() directly for library development
-    return get_player(name=name)
+    return get_player(name=name, session=session)
 
 
-def get_player_by_index(index: int = 0) -> Player:
+def get_player_by_index(index: int = 0, *, session: Session | None = None) -> Player:
     """
     Query the state of a player by providing their id
     Players are numbered in the order in which they joined the server.
@@ -103,15 +195,16 @@ def get_player_by_index(index: int = 0) -> Player:
 
     Args:
         index: Index of the player to query is optional (if you don't specify an id, id=0 is used)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get a player object back that contains a lot of information about the player
     """
     # ONLY convencience wrapper for the users
     # please use get_player() directly for library development
-    return get_player(index=index)
+    return get_player(index=index, session=session)
 
 
-def get_player(*, index: int | None = None, name: str | None = None) -> Player:
+def get_player(*, index: int | None = None, name: str | None = None, session: Session | None = None) -> Player:
     """
     Query the state of a player by index or name.
     Players are numbered in the order in which they joined the server.
@@ -123,6 +216,7 @@ def get_player(*, index: int | None = None, name: str | None = None) -> Player:
     Args:
         index: Index of the player to query is optional (if you don't specify an index, index=0 is used)
         name: Name of the player to query is optional (if you don't specify a name, index=0 is used)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get a player object back that contains a lot of information about the player
     """
@@ -145,25 +239,59 @@ def get_player(*, index: int | None = None, name: str | None = None) -> Player:
     else:
         command = _build_command("getPlayer", index)
 
-    _send_command(command)
-    data = _receive()
-    player = Player.from_raw_data(data)
+    data = _query(command, session)
+    player = _get_models().player(data)
     return player
 
 
-def send_to_chat(message: str):
+def get_players(
+    *, indices: Iterable[int] | None = None, names: Iterable[str] | None = None, session: Session | None = None
+) -> list[Player]:
+    """
+    Query the state of many players at once, either by index or by name.
+    This is a lot faster than calling get_player() for each player.
+
+    Note: You MUST explicitly specify whether you mean names or indices.
+    Example: get_players(indices=[0, 1, 2]) or get_players(names=["jumebonn1", "jumebonn2"])
+
+    Args:
+        indices: Indices of the players to query
+        names: Names of the players to query
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
+    Returns:
+        A list of player objects in the same order as the indices or names
+    """
+    if indices is not None and names is not None:
+        raise ValueError(
+            f"You can't provide names and indices at the same time to get_players(), please choose what to set"
+        )
+
+    if names is not None:
+        commands = [_build_command("getPlayerByName", name) for name in names]
+    elif indices is not None:
+        commands = [_build_command("getPlayer", index) for index in indices]
+    else:
+        raise ValueError(f"Please provide either names or indices to get_players()")
+
+    replies = _query_many(commands, session)
+    player_from_raw_data = _get_models().player
+    return [player_from_raw_data(data) for data in replies]
+
+
+def send_to_chat(message: str, *, session: Session | None = None):
     """
     Send a message to the ingame chat.
     You can also apply special formatting, see this wiki entry:
     https://minecraft.fandom.com/de/wiki/Formatierungscodes
     Args:
         message: The message you want to send
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     """
     command = _build_command("postChat", message)
-    _send_command(command)
+    _send_command(command, session)
 
 
-def get_chat() -> list[Message]:
+def get_chat(*, session: Session | None = None) -> list[Message]:
     """
     Get all messages that have been written to the chat since the last query.
     Returns:
@@ -171,9 +299,12 @@ def get_chat() -> list[Message]:
     """
     command = _build_command("pollChat")
 
-    _send_command(command)
-    data = _receive()
+    data = _query(command, session)
+    return _parse_chat(data)
+
 
+def _parse_chat(data: bytes) -> list[Message]:
+    # needed internally
     messages_str = _bytes_to_text(data)
 
     if messages_str == "":
@@ -181,8 +312,9 @@ def get_chat() -> list[Message]:
 
     messages_str = messages_str.split(ARG_SEPARATOR)
 
+    message = _get_models().message
     messages = [
-        Message(text=text, sender_name=player_name) for player_name, text in map(lambda s: s.split(":"), messages_str)
+        message(text=text, sender_name=player_name) for player_name, text in map(lambda s: s.split(":"), messages_str)
     ]
 
     return messages
@@ -202,6 +334,7 @@ def show_title(
     fade_in_time: float = 1,
     display_time: float = 5,
     fade_out_time: float = 1,
+    session: Session | None = None,
 ):
     """
     Show a title message to a set of players.
@@ -214,6 +347,7 @@ def show_title(
         fade_in_time: Time (in seconds) it takes for the title to fade in
         display_time: Time (in seconds) the title is displayed
         fade_out_time: Time (in seconds) it takes for the title to fade out
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     """
 
     command = _build_command(
@@ -225,23 +359,32 @@ def show_title(
         seconds_to_ticks(display_time),
         seconds_to_ticks(fade_out_time),
     )
-    _send_command(command)
+    _send_command(command, session)
 
 
-def send_command(command: str):
+def send_command(command: str, *, session: Session | None = None):
     """
     Execute a Minecraft command, as if you were entering it on the server.
     The / at the beginning of a command is not necessary.
     Args:
         command: The command as a string without the slash / at the beginning.
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     """
     if command.startswith("/"):
         print("Warning: You entered a '/' at the beginning of the command. This is probably not necessary!")
     command = _build_command("chatCommand", command)
-    _send_command(command)
+    _send_command(command, session)
 
 
-def spawn_entity(x: int, y: int, z: int, entity: EntityCollection, dimension: Dimension = Dimension.World) -> Entity:
+def spawn_entity(
+    x: int,
+    y: int,
+    z: int,
+    entity: EntityCollection,
+    dimension: Dimension = Dimension.World,
+    *,
+    session: Session | None = None,
+) -> Entity:
     """
     Spawn an entity at a specific position
     A list of all entities can be found here:
@@ -253,15 +396,15 @@ def spawn_entity(x: int, y: int, z: int, entity: EntityCollection, dimension: Di
         z (int): Z coordinate where the entity should be spawned
         entity: An element from EntitySammlung e.g. EntitySammlung.Schaf
         dimension (Dimension): dimension to look for the block (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
 
     Returns:
         You get an Entity object back. With this you can later access the entity again.
     """
     command = _build_command("spawnEntity", x, y, z, dimension.value, entity.value)
     print(command)
-    _send_command(command)
-    data = _receive()
-    entity = Entity.from_api_format(_bytes_to_text(data))
+    data = _query(command, session)
+    entity = _get_models().entity(_bytes_to_text(data))
     return entity
 
 
@@ -272,6 +415,8 @@ def give_item(
     name: str | None = None,
     inventory_slot: int | None = None,
     unbreakable: bool = False,
+    *,
+    session: Session | None = None,
 ) -> Inventory:
     """
     Give a player an item
@@ -285,13 +430,66 @@ def give_item(
         name: (optional) What should the item be called?
         inventory_slot: (optional) Slot where the item should land (as a number)
         unbreakable: (optional) If the item should be unbreakable set to True, the default is breakable
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
 
     Returns:
         You get information about the inventory state of the player after the item was given
 
     """
-    if isinstance(item, Item):
-        item = item.typ
+    _send_command(_give_item_command(player, item, amount, name, inventory_slot, unbreakable), session)
+    return get_inventory(player, session=session)
+
+
+def give_items(
+    player: Player,
+    items: Iterable[tuple],
+    *,
+    fetch_inventory: bool = True,
+    session: Session | None = None,
+) -> Inventory | None:
+    """
+    Give a player many items at once, e.g. a starter kit.
+    This is a lot faster than calling give_item() for each item, because the items are sent together
+    and the inventory is only fetched once at the end (or not at all).
+
+    Example: give_items(player, [(MaterialCollection.Bread, 16), (MaterialCollection.Iron_Sword, 1, {"name": "Sting"})])
+
+    Args:
+        player: Player who should receive the items
+        items: The items, each as (item, amount) or (item, amount, options),
+            options is a dict with the optional arguments of give_item(): name, inventory_slot and unbreakable
+        fetch_inventory: (optional, keyword argument) set to False if you don't need the inventory afterward,
+            then no reply has to be awaited
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
+
+    Returns:
+        The inventory of the player after the items were given, None if fetch_inventory is False
+    """
+    # build all commands before sending, so an invalid item can't leave us with a half given kit
+    commands = []
+    for entry in items:
+        if len(entry) not in (2, 3):
+            raise TypeError(f"Expected (item, amount) or (item, amount, options). You said '{entry!r}'.")
+        item, amount, *options = entry
+        commands.append(_give_item_command(player, item, amount, **(options[0] if options else {})))
+    _send_commands(commands, session)
+
+    if not fetch_inventory:
+        return None
+    return get_inventory(player, session=session)
+
+
+def _give_item_command(
+    player: Player,
+    item: MaterialCollection,
+    amount: int,
+    name: str | None = None,
+    inventory_slot: int | None = None,
+    unbreakable: bool = False,
+) -> str:
+    # needed internally
+    if isinstance(item, (Item, FastItem)):
+        item = item.type
 
     args = ["addInv", player.id, item.value, amount]
 
@@ -304,47 +502,71 @@ def give_item(
     if unbreakable:
         args.append("unbreakable")
 
-    command = _build_command(*args)
-    _send_command(command)
-
-    return get_inventory(player)
+    return _build_command(*args)
 
 
-def get_inventory(player: Player) -> Inventory:
+def get_inventory(player: Player, *, session: Session | None = None) -> Inventory:
     """
     Retrieve the inventory of a player.
     Args:
         player: Player from whom you want to query the inventory
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
 
     Returns:
         You get an inventory object (like a dict) back"""
     command = _build_command("getInv", player.id)
-    _send_command(command)
-    data = _receive()
+    data = _query(command, session)
+    return _parse_inventory(data)
+
 
+def get_inventories(players: Iterable[Player], *, session: Session | None = None) -> list[Inventory]:
+    """
+    Retrieve the inventories of many players at once.
+    This is a lot faster than calling get_inventory() for each player, because all queries are sent together.
+    Args:
+        players: Players from whom you want to query the inventory
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
+
+    Returns:
+        The inventories in the same order as the players
+    """
+    replies = _query_many([_build_command("getInv", player.id) for player in players], session)
+    return [_parse_inventory(data) for data in replies]
+
+
+def _parse_inventory(data: bytes) -> Inventory:
+    # needed internally
     # example for (simple) received data:
     # (index,name;optional;infos:amount)
     # 0:LILY_OF_THE_VALLEY:1𝇉4:STONE_PRESSURE_PLATE:1𝇉25:DISPENSER:1𝇉29:TARGET:1
+    models = _get_models()
     inventory_info = _bytes_to_text(data)
     if not inventory_info:
-        return Inventory()
+        return models.inventory()
 
     item_infos = inventory_info.split(ARG_SEPARATOR)
 
     # build inventory dict together
-    inventory = Inventory()
+    inventory = models.inventory()
     for item in item_infos:
         # catch empty strings
         if not item:
             continue
-        field = InventoryField.from_api_format(item)
+        field = models.inventory_field(item)
         inventory[field.index] = field
 
     return inventory
 
 
 def set_player_position(
-    player: Player, x: int, y: int, z: int, *, rotation: int = None, dimension: Dimension = Dimension.World
+    player: Player,
+    x: int,
+    y: int,
+    z: int,
+    *,
+    rotation: int = None,
+    dimension: Dimension = Dimension.World,
+    session: Session | None = None,
 ) -> Player:
     """
     Change the position in x-, y-, z-direction and rotation
@@ -355,6 +577,7 @@ def set_player_position(
         z: new z coordinate
         rotation: (optional, keyword argument) rotation of the player (from -180 to 180), if you don't specify it, it won't be changed.
         dimension: (optional, keyword argument) dimension to put the player in (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
 
     If you want to modify the rotation or dimension you have to do so as keyword argument.
 
@@ -376,12 +599,14 @@ def set_player_position(
         args.append(f"rotation:{rotation}")
 
     command = _build_command(*args)
-    _send_command(command)
+    _send_command(command, session)
 
-    return get_player(index=player.id)
+    return get_player(index=player.id, session=session)
 
 
-def set_player_velocity(player: Player, direction: DirectionCollection, value: float) -> Player:
+def set_player_velocity(
+    player: Player, direction: DirectionCollection, value: float, *, session: Session | None = None
+) -> Player:
     """
     Change the movement speed of a player in different directions.
     All directions you can influence can be found in RichtungSammlung
@@ -390,36 +615,40 @@ def set_player_velocity(player: Player, direction: DirectionCollection, value: f
         player: Player object that should be influenced
         direction: Direction that should be changed, as an element of RichtungSammlung, e.g. RichtungSammlung.Vorwärts
         value: 1 is normal speed, 0 is freeze, the number can be arbitrarily large (and thus arbitrarily fast)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get an updated version of the player back (state after the speed was changed)
 
     """
     command = _build_command("setPlayerVelocity", direction.value, player.id, value)
-    _send_command(command)
-    return get_player(index=player.id)
+    _send_command(command, session)
+    return get_player(index=player.id, session=session)
 
 
-def set_player_max_health(player: Player, value: float) -> Player:
+def set_player_max_health(player: Player, value: float, *, session: Session | None = None) -> Player:
     """Set the maximum health of a player"""
-    _set_player_property("MAX_HEALTH", player, value)
-    return get_player(index=player.id)
+    _set_player_property("MAX_HEALTH", player, value, session)
+    return get_player(index=player.id, session=session)
 
 
-def set_player_health(player: Player, value: float) -> Player:
+def set_player_health(player: Player, value: float, *, session: Session | None = None) -> Player:
     """
     Set the current health of a player
     If the value is greater than the set maximum, all excess health is ignored
     Args:
         player: Player object that should be influenced
         value: Amount of health as a decimal number.
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get an updated version of the player back (state after the health was changed)
     """
-    _set_player_property("HEALTH", player, value)
-    return get_player(index=player.id)
+    _set_player_property("HEALTH", player, value, session)
+    return get_player(index=player.id, session=session)
 
 
-def set_player_hunger(player: Player, value: float, saturation: float | None = None) -> Player:
+def set_player_hunger(
+    player: Player, value: float, saturation: float | None = None, *, session: Session | None = None
+) -> Player:
     """
     Set the hunger of a player.
     You can optionally also set the saturation.
@@ -428,64 +657,70 @@ def set_player_hunger(player: Player, value: float, saturation: float | None = N
         player: Player object that should be influenced
         value: Amount of hunger as a decimal number.
         saturation: (optional) You can set the saturation. If you leave it empty, it won't be changed.
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get an updated version of the player back (state after the hunger was changed)
     """
-    _set_player_property("FOOD_LEVEL", player, value)
+    _set_player_property("FOOD_LEVEL", player, value, session)
     if saturation is not None:
-        _set_player_property("SATURATION", player, saturation)
+        _set_player_property("SATURATION", player, saturation, session)
 
-    return get_player(index=player.id)
+    return get_player(index=player.id, session=session)
 
 
-def set_player_xp_level(player: Player, value: float) -> Player:
+def set_player_xp_level(player: Player, value: float, *, session: Session | None = None) -> Player:
     """
     Set the current level of a player
 
     Args:
         player: Player object that should be influenced
         value: Level as a decimal number
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get an updated version of the player back (state after the level was changed)
     """
-    _set_player_property("XP_LEVEL", player, value)
-    return get_player(index=player.id)
+    _set_player_property("XP_LEVEL", player, value, session)
+    return get_player(index=player.id, session=session)
 
 
-def set_player_xp_progress(player: Player, value: float) -> Player:
+def set_player_xp_progress(player: Player, value: float, *, session: Session | None = None) -> Player:
     """
     Set the progress within a player's level
     Args:
         player: Player object that should be influenced
         value: Progress as a decimal number
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         You get an updated version of the player back (state after the progress was changed)
     """
-    _set_player_property("XP_PROGRESS", player, value)
-    return get_player(index=player.id)
+    _set_player_property("XP_PROGRESS", player, value, session)
+    return get_player(index=player.id, session=session)
 
 
-def _set_player_property(type: str, player: Player, value: float):
+def _set_player_property(type: str, player: Player, value: float, session: Session | None = None):
     """internal function for changing health, hunger and xp"""
     command = _build_command("setPlayerStat", type, player.id, value)
-    _send_command(command)
+    _send_command(command, session)
 
 
-def set_entity_name(entity: Entity, name: str) -> Entity:
+def set_entity_name(entity: Entity, name: str, *, session: Session | None = None) -> Entity:
     """
     Set the name of an entity
     Args:
         entity: The entity to be edited, not EntitySammlung!
         name: The new name of the entity
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         An updated version of the entity (state after the change)
     """
     command = _build_command("editEntity", entity.id, f"name:{name}")
-    _send_command(command)
-    return get_entity(entity)
+    _send_command(command, session)
+    return get_entity(entity, session=session)
 
 
-def set_entity_position(entity: Entity, x: int, y: int, z: int, dimension: Dimension = Dimension.World) -> Entity:
+def set_entity_position(
+    entity: Entity, x: int, y: int, z: int, dimension: Dimension = Dimension.World, *, session: Session | None = None
+) -> Entity:
     """
     Set the position of an entity
 
@@ -495,47 +730,49 @@ def set_entity_position(entity: Entity, x: int, y: int, z: int, dimension: Dimen
         y (int): new Y coordinate
         z (int): new Z coordinate
         dimension (Dimension): dimension to look for the block (default.: Dimension.World)
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     Returns:
         An updated version of the entity (state after the change)
     """
     command = _build_command("editEntity", entity.id, f"position:{x};{y};{z};{dimension.value}")
-    _send_command(command)
-    return get_entity(entity)
+    _send_command(command, session)
+    return get_entity(entity, session=session)
 
 
-def set_entity_ai(entity: Entity, status: bool) -> Entity:
+def set_entity_ai(entity: Entity, status: bool, *, session: Session | None = None) -> Entity:
     """
     Set the AI of an entity. If it has no AI (False), it doesn't move.
 
     Args:
         entity: The entity to be edited, not EntitySammlung!
         status: True (if it should move), otherwise False
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
 
     Returns:
         An updated version of the entity (state after the change)
     """
     command = _build_command("editEntity", entity.id, f"ai:{status}")
-    _send_command(command)
-    return get_entity(entity)
+    _send_command(command, session)
+    return get_entity(entity, session=session)
 
 
-def set_entity_health(entity: Entity, health: float) -> Entity:
+def set_entity_health(entity: Entity, health: float, *, session: Session | None = None) -> Entity:
     """
     Set the health of an entity. If health is set to 0, it dies.
 
     Args:
         entity: The entity to be edited, not EntitySammlung!
         health: How many health points the entity should have (0=dead).
+        session: (optional, keyword argument) Session to use (default: the connection opened with connect())
     """
     command = _build_command("editEntity", entity.id, f"health:{health}")
-    _send_command(command)
-    return get_entity(entity)
+    _send_command(command, session)
+    return get_entity(entity, session=session)
 
 
-def _validate_id(id: str, type: Literal["MATERIAL", "ENTITY"]):
+def _validate_id(id: str, type: Literal["MATERIAL", "ENTITY"], session: Session | None = None):
     """only for internal use"""
     command = _build_command("validate", type, id)
-    _send_command(command)
-    data = _receive()
+    data = _query(command, session)
 
     return _bytes_to_text(data)
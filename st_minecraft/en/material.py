@@ -1,1346 +1,251 @@
 """This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
 
-from enum import Enum
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.core.compact_enum import to_ordinal  # noqa: unused-import
 
+_NAMES = (
+    "Acacia_Button Acacia_Door Acacia_Fence Acacia_Fence_Gate Acacia_Hanging_Sign Acacia_Leaves "
+    "Acacia_Log Acacia_Planks Acacia_Pressure_Plate Acacia_Sapling Acacia_Sign Acacia_Slab Acacia_Stairs "
+    "Acacia_Trapdoor Acacia_Wall_Hanging_Sign Acacia_Wall_Sign Acacia_Wood Activator_Rail Air Allium "
+    "Amethyst_Block Amethyst_Cluster Ancient_Debris Andesite Andesite_Slab Andesite_Stairs Andesite_Wall "
+    "Anvil Attached_Melon_Stem Attached_Pumpkin_Stem Azalea Azalea_Leaves Azure_Bluet Bamboo "
+    "Bamboo_Block Bamboo_Button Bamboo_Door Bamboo_Fence Bamboo_Fence_Gate Bamboo_Hanging_Sign "
+    "Bamboo_Mosaic Bamboo_Mosaic_Slab Bamboo_Mosaic_Stairs Bamboo_Planks Bamboo_Pressure_Plate "
+    "Bamboo_Sapling Bamboo_Sign Bamboo_Slab Bamboo_Stairs Bamboo_Trapdoor Bamboo_Wall_Hanging_Sign "
+    "Bamboo_Wall_Sign Barrel Barrier Basalt Beacon Bedrock Bee_Nest Beehive Beetroots Bell Big_Dripleaf "
+    "Big_Dripleaf_Stem Birch_Button Birch_Door Birch_Fence Birch_Fence_Gate Birch_Hanging_Sign "
+    "Birch_Leaves Birch_Log Birch_Planks Birch_Pressure_Plate Birch_Sapling Birch_Sign Birch_Slab "
+    "Birch_Stairs Birch_Trapdoor Birch_Wall_Hanging_Sign Birch_Wall_Sign Birch_Wood Black_Banner "
+    "Black_Bed Black_Candle Black_Candle_Cake Black_Carpet Black_Concrete Black_Concrete_Powder "
+    "Black_Glazed_Terracotta Black_Shulker_Box Black_Stained_Glass Black_Stained_Glass_Pane "
+    "Black_Terracotta Black_Wool Blackstone Blackstone_Slab Blackstone_Stairs Blackstone_Wall "
+    "Blast_Furnace Blue_Banner Blue_Bed Blue_Candle Blue_Candle_Cake Blue_Carpet Blue_Concrete "
+    "Blue_Concrete_Powder Blue_Glazed_Terracotta Blue_Ice Blue_Orchid Blue_Shulker_Box "
+    "Blue_Stained_Glass Blue_Stained_Glass_Pane Blue_Terracotta Blue_Wool Bone_Block Bookshelf "
+    "Brain_Coral Brain_Coral_Block Brain_Coral_Fan Brain_Coral_Wall_Fan Brewing_Stand Brick_Slab "
+    "Brick_Stairs Brick_Wall Bricks Brown_Banner Brown_Bed Brown_Candle Brown_Candle_Cake Brown_Carpet "
+    "Brown_Concrete Brown_Concrete_Powder Brown_Glazed_Terracotta Brown_Mushroom Brown_Mushroom_Block "
+    "Brown_Shulker_Box Brown_Stained_Glass Brown_Stained_Glass_Pane Brown_Terracotta Brown_Wool "
+    "Bubble_Column Bubble_Coral Bubble_Coral_Block Bubble_Coral_Fan Bubble_Coral_Wall_Fan "
+    "Budding_Amethyst Cactus Cake Calcite Campfire Candle Candle_Cake Carrots Cartography_Table "
+    "Carved_Pumpkin Cauldron Cave_Air Cave_Vines Cave_Vines_Plant Chain Chain_Command_Block "
+    "Cherry_Button Cherry_Door Cherry_Fence Cherry_Fence_Gate Cherry_Hanging_Sign Cherry_Leaves "
+    "Cherry_Log Cherry_Planks Cherry_Pressure_Plate Cherry_Sapling Cherry_Sign Cherry_Slab Cherry_Stairs "
+    "Cherry_Trapdoor Cherry_Wall_Hanging_Sign Cherry_Wall_Sign Cherry_Wood Chest Chipped_Anvil "
+    "Chiseled_Bookshelf Chiseled_Deepslate Chiseled_Nether_Bricks Chiseled_Polished_Blackstone "
+    "Chiseled_Quartz_Block Chiseled_Red_Sandstone Chiseled_Sandstone Chiseled_Stone_Bricks Chorus_Flower "
+    "Chorus_Plant Clay Coal_Block Coal_Ore Coarse_Dirt Cobbled_Deepslate Cobbled_Deepslate_Slab "
+    "Cobbled_Deepslate_Stairs Cobbled_Deepslate_Wall Cobblestone Cobblestone_Slab Cobblestone_Stairs "
+    "Cobblestone_Wall Cobweb Cocoa Command_Block Comparator Composter Conduit Copper_Block Copper_Ore "
+    "Cornflower Cracked_Deepslate_Bricks Cracked_Deepslate_Tiles Cracked_Nether_Bricks "
+    "Cracked_Polished_Blackstone_Bricks Cracked_Stone_Bricks Crafting_Table Creeper_Head "
+    "Creeper_Wall_Head Crimson_Button Crimson_Door Crimson_Fence Crimson_Fence_Gate Crimson_Fungus "
+    "Crimson_Hanging_Sign Crimson_Hyphae Crimson_Nylium Crimson_Planks Crimson_Pressure_Plate "
+    "Crimson_Roots Crimson_Sign Crimson_Slab Crimson_Stairs Crimson_Stem Crimson_Trapdoor "
+    "Crimson_Wall_Hanging_Sign Crimson_Wall_Sign Crying_Obsidian Cut_Copper Cut_Copper_Slab "
+    "Cut_Copper_Stairs Cut_Red_Sandstone Cut_Red_Sandstone_Slab Cut_Sandstone Cut_Sandstone_Slab "
+    "Cyan_Banner Cyan_Bed Cyan_Candle Cyan_Candle_Cake Cyan_Carpet Cyan_Concrete Cyan_Concrete_Powder "
+    "Cyan_Glazed_Terracotta Cyan_Shulker_Box Cyan_Stained_Glass Cyan_Stained_Glass_Pane Cyan_Terracotta "
+    "Cyan_Wool Damaged_Anvil Dandelion Dark_Oak_Button Dark_Oak_Door Dark_Oak_Fence Dark_Oak_Fence_Gate "
+    "Dark_Oak_Hanging_Sign Dark_Oak_Leaves Dark_Oak_Log Dark_Oak_Planks Dark_Oak_Pressure_Plate "
+    "Dark_Oak_Sapling Dark_Oak_Sign Dark_Oak_Slab Dark_Oak_Stairs Dark_Oak_Trapdoor "
+    "Dark_Oak_Wall_Hanging_Sign Dark_Oak_Wall_Sign Dark_Oak_Wood Dark_Prismarine Dark_Prismarine_Slab "
+    "Dark_Prismarine_Stairs Daylight_Detector Dead_Brain_Coral Dead_Brain_Coral_Block "
+    "Dead_Brain_Coral_Fan Dead_Brain_Coral_Wall_Fan Dead_Bubble_Coral Dead_Bubble_Coral_Block "
+    "Dead_Bubble_Coral_Fan Dead_Bubble_Coral_Wall_Fan Dead_Bush Dead_Fire_Coral Dead_Fire_Coral_Block "
+    "Dead_Fire_Coral_Fan Dead_Fire_Coral_Wall_Fan Dead_Horn_Coral Dead_Horn_Coral_Block "
+    "Dead_Horn_Coral_Fan Dead_Horn_Coral_Wall_Fan Dead_Tube_Coral Dead_Tube_Coral_Block "
+    "Dead_Tube_Coral_Fan Dead_Tube_Coral_Wall_Fan Decorated_Pot Deepslate Deepslate_Brick_Slab "
+    "Deepslate_Brick_Stairs Deepslate_Brick_Wall Deepslate_Bricks Deepslate_Coal_Ore "
+    "Deepslate_Copper_Ore Deepslate_Diamond_Ore Deepslate_Emerald_Ore Deepslate_Gold_Ore "
+    "Deepslate_Iron_Ore Deepslate_Lapis_Ore Deepslate_Redstone_Ore Deepslate_Tile_Slab "
+    "Deepslate_Tile_Stairs Deepslate_Tile_Wall Deepslate_Tiles Detector_Rail Diamond_Block Diamond_Ore "
+    "Diorite Diorite_Slab Diorite_Stairs Diorite_Wall Dirt Dirt_Path Dispenser Dragon_Egg Dragon_Head "
+    "Dragon_Wall_Head Dried_Kelp_Block Dripstone_Block Dropper Emerald_Block Emerald_Ore "
+    "Enchanting_Table End_Gateway End_Portal End_Portal_Frame End_Rod End_Stone End_Stone_Brick_Slab "
+    "End_Stone_Brick_Stairs End_Stone_Brick_Wall End_Stone_Bricks Ender_Chest Exposed_Copper "
+    "Exposed_Cut_Copper Exposed_Cut_Copper_Slab Exposed_Cut_Copper_Stairs Farmland Fern Fire Fire_Coral "
+    "Fire_Coral_Block Fire_Coral_Fan Fire_Coral_Wall_Fan Fletching_Table Flower_Pot Flowering_Azalea "
+    "Flowering_Azalea_Leaves Frogspawn Frosted_Ice Furnace Gilded_Blackstone Glass Glass_Pane "
+    "Glow_Lichen Glowstone Gold_Block Gold_Ore Granite Granite_Slab Granite_Stairs Granite_Wall "
+    "Grass_Block Gravel Gray_Banner Gray_Bed Gray_Candle Gray_Candle_Cake Gray_Carpet Gray_Concrete "
+    "Gray_Concrete_Powder Gray_Glazed_Terracotta Gray_Shulker_Box Gray_Stained_Glass "
+    "Gray_Stained_Glass_Pane Gray_Terracotta Gray_Wool Green_Banner Green_Bed Green_Candle "
+    "Green_Candle_Cake Green_Carpet Green_Concrete Green_Concrete_Powder Green_Glazed_Terracotta "
+    "Green_Shulker_Box Green_Stained_Glass Green_Stained_Glass_Pane Green_Terracotta Green_Wool "
+    "Grindstone Hanging_Roots Hay_Block Heavy_Weighted_Pressure_Plate Honey_Block Honeycomb_Block Hopper "
+    "Horn_Coral Horn_Coral_Block Horn_Coral_Fan Horn_Coral_Wall_Fan Ice Infested_Chiseled_Stone_Bricks "
+    "Infested_Cobblestone Infested_Cracked_Stone_Bricks Infested_Deepslate Infested_Mossy_Stone_Bricks "
+    "Infested_Stone Infested_Stone_Bricks Iron_Bars Iron_Block Iron_Door Iron_Ore Iron_Trapdoor "
+    "Jack_O_Lantern Jigsaw Jukebox Jungle_Button Jungle_Door Jungle_Fence Jungle_Fence_Gate "
+    "Jungle_Hanging_Sign Jungle_Leaves Jungle_Log Jungle_Planks Jungle_Pressure_Plate Jungle_Sapling "
+    "Jungle_Sign Jungle_Slab Jungle_Stairs Jungle_Trapdoor Jungle_Wall_Hanging_Sign Jungle_Wall_Sign "
+    "Jungle_Wood Kelp Kelp_Plant Ladder Lantern Lapis_Block Lapis_Ore Large_Amethyst_Bud Large_Fern Lava "
+    "Lava_Cauldron Lectern Lever Light Light_Blue_Banner Light_Blue_Bed Light_Blue_Candle "
+    "Light_Blue_Candle_Cake Light_Blue_Carpet Light_Blue_Concrete Light_Blue_Concrete_Powder "
+    "Light_Blue_Glazed_Terracotta Light_Blue_Shulker_Box Light_Blue_Stained_Glass "
+    "Light_Blue_Stained_Glass_Pane Light_Blue_Terracotta Light_Blue_Wool Light_Gray_Banner "
+    "Light_Gray_Bed Light_Gray_Candle Light_Gray_Candle_Cake Light_Gray_Carpet Light_Gray_Concrete "
+    "Light_Gray_Concrete_Powder Light_Gray_Glazed_Terracotta Light_Gray_Shulker_Box "
+    "Light_Gray_Stained_Glass Light_Gray_Stained_Glass_Pane Light_Gray_Terracotta Light_Gray_Wool "
+    "Light_Weighted_Pressure_Plate Lightning_Rod Lilac Lily_Of_The_Valley Lily_Pad Lime_Banner Lime_Bed "
+    "Lime_Candle Lime_Candle_Cake Lime_Carpet Lime_Concrete Lime_Concrete_Powder Lime_Glazed_Terracotta "
+    "Lime_Shulker_Box Lime_Stained_Glass Lime_Stained_Glass_Pane Lime_Terracotta Lime_Wool Lodestone "
+    "Loom Magenta_Banner Magenta_Bed Magenta_Candle Magenta_Candle_Cake Magenta_Carpet Magenta_Concrete "
+    "Magenta_Concrete_Powder Magenta_Glazed_Terracotta Magenta_Shulker_Box Magenta_Stained_Glass "
+    "Magenta_Stained_Glass_Pane Magenta_Terracotta Magenta_Wool Magma_Block Mangrove_Button "
+    "Mangrove_Door Mangrove_Fence Mangrove_Fence_Gate Mangrove_Hanging_Sign Mangrove_Leaves Mangrove_Log "
+    "Mangrove_Planks Mangrove_Pressure_Plate Mangrove_Propagule Mangrove_Roots Mangrove_Sign "
+    "Mangrove_Slab Mangrove_Stairs Mangrove_Trapdoor Mangrove_Wall_Hanging_Sign Mangrove_Wall_Sign "
+    "Mangrove_Wood Medium_Amethyst_Bud Melon Melon_Stem Moss_Block Moss_Carpet Mossy_Cobblestone "
+    "Mossy_Cobblestone_Slab Mossy_Cobblestone_Stairs Mossy_Cobblestone_Wall Mossy_Stone_Brick_Slab "
+    "Mossy_Stone_Brick_Stairs Mossy_Stone_Brick_Wall Mossy_Stone_Bricks Moving_Piston Mud Mud_Brick_Slab "
+    "Mud_Brick_Stairs Mud_Brick_Wall Mud_Bricks Muddy_Mangrove_Roots Mushroom_Stem Mycelium "
+    "Nether_Brick_Fence Nether_Brick_Slab Nether_Brick_Stairs Nether_Brick_Wall Nether_Bricks "
+    "Nether_Gold_Ore Nether_Portal Nether_Quartz_Ore Nether_Sprouts Nether_Wart Nether_Wart_Block "
+    "Netherite_Block Netherrack Note_Block Oak_Button Oak_Door Oak_Fence Oak_Fence_Gate Oak_Hanging_Sign "
+    "Oak_Leaves Oak_Log Oak_Planks Oak_Pressure_Plate Oak_Sapling Oak_Sign Oak_Slab Oak_Stairs "
+    "Oak_Trapdoor Oak_Wall_Hanging_Sign Oak_Wall_Sign Oak_Wood Observer Obsidian Ochre_Froglight "
+    "Orange_Banner Orange_Bed Orange_Candle Orange_Candle_Cake Orange_Carpet Orange_Concrete "
+    "Orange_Concrete_Powder Orange_Glazed_Terracotta Orange_Shulker_Box Orange_Stained_Glass "
+    "Orange_Stained_Glass_Pane Orange_Terracotta Orange_Tulip Orange_Wool Oxeye_Daisy Oxidized_Copper "
+    "Oxidized_Cut_Copper Oxidized_Cut_Copper_Slab Oxidized_Cut_Copper_Stairs Packed_Ice Packed_Mud "
+    "Pearlescent_Froglight Peony Petrified_Oak_Slab Piglin_Head Piglin_Wall_Head Pink_Banner Pink_Bed "
+    "Pink_Candle Pink_Candle_Cake Pink_Carpet Pink_Concrete Pink_Concrete_Powder Pink_Glazed_Terracotta "
+    "Pink_Petals Pink_Shulker_Box Pink_Stained_Glass Pink_Stained_Glass_Pane Pink_Terracotta Pink_Tulip "
+    "Pink_Wool Piston Piston_Head Player_Head Player_Wall_Head Podzol Pointed_Dripstone "
+    "Polished_Andesite Polished_Andesite_Slab Polished_Andesite_Stairs Polished_Basalt "
+    "Polished_Blackstone Polished_Blackstone_Brick_Slab Polished_Blackstone_Brick_Stairs "
+    "Polished_Blackstone_Brick_Wall Polished_Blackstone_Bricks Polished_Blackstone_Button "
+    "Polished_Blackstone_Pressure_Plate Polished_Blackstone_Slab Polished_Blackstone_Stairs "
+    "Polished_Blackstone_Wall Polished_Deepslate Polished_Deepslate_Slab Polished_Deepslate_Stairs "
+    "Polished_Deepslate_Wall Polished_Diorite Polished_Diorite_Slab Polished_Diorite_Stairs "
+    "Polished_Granite Polished_Granite_Slab Polished_Granite_Stairs Poppy Potatoes Potted_Acacia_Sapling "
+    "Potted_Allium Potted_Azalea_Bush Potted_Azure_Bluet Potted_Bamboo Potted_Birch_Sapling "
+    "Potted_Blue_Orchid Potted_Brown_Mushroom Potted_Cactus Potted_Cherry_Sapling Potted_Cornflower "
+    "Potted_Crimson_Fungus Potted_Crimson_Roots Potted_Dandelion Potted_Dark_Oak_Sapling "
+    "Potted_Dead_Bush Potted_Fern Potted_Flowering_Azalea_Bush Potted_Jungle_Sapling "
+    "Potted_Lily_Of_The_Valley Potted_Mangrove_Propagule Potted_Oak_Sapling Potted_Orange_Tulip "
+    "Potted_Oxeye_Daisy Potted_Pink_Tulip Potted_Poppy Potted_Red_Mushroom Potted_Red_Tulip "
+    "Potted_Spruce_Sapling Potted_Torchflower Potted_Warped_Fungus Potted_Warped_Roots "
+    "Potted_White_Tulip Potted_Wither_Rose Powder_Snow Powder_Snow_Cauldron Powered_Rail Prismarine "
+    "Prismarine_Brick_Slab Prismarine_Brick_Stairs Prismarine_Bricks Prismarine_Slab Prismarine_Stairs "
+    "Prismarine_Wall Pumpkin Pumpkin_Stem Purple_Banner Purple_Bed Purple_Candle Purple_Candle_Cake "
+    "Purple_Carpet Purple_Concrete Purple_Concrete_Powder Purple_Glazed_Terracotta Purple_Shulker_Box "
+    "Purple_Stained_Glass Purple_Stained_Glass_Pane Purple_Terracotta Purple_Wool Purpur_Block "
+    "Purpur_Pillar Purpur_Slab Purpur_Stairs Quartz_Block Quartz_Bricks Quartz_Pillar Quartz_Slab "
+    "Quartz_Stairs Rail Raw_Copper_Block Raw_Gold_Block Raw_Iron_Block Red_Banner Red_Bed Red_Candle "
+    "Red_Candle_Cake Red_Carpet Red_Concrete Red_Concrete_Powder Red_Glazed_Terracotta Red_Mushroom "
+    "Red_Mushroom_Block Red_Nether_Brick_Slab Red_Nether_Brick_Stairs Red_Nether_Brick_Wall "
+    "Red_Nether_Bricks Red_Sand Red_Sandstone Red_Sandstone_Slab Red_Sandstone_Stairs Red_Sandstone_Wall "
+    "Red_Shulker_Box Red_Stained_Glass Red_Stained_Glass_Pane Red_Terracotta Red_Tulip Red_Wool "
+    "Redstone_Block Redstone_Lamp Redstone_Ore Redstone_Torch Redstone_Wall_Torch Redstone_Wire "
+    "Reinforced_Deepslate Repeater Repeating_Command_Block Respawn_Anchor Rooted_Dirt Rose_Bush Sand "
+    "Sandstone Sandstone_Slab Sandstone_Stairs Sandstone_Wall Scaffolding Sculk Sculk_Catalyst "
+    "Sculk_Sensor Sculk_Shrieker Sculk_Vein Sea_Lantern Sea_Pickle Seagrass Shroomlight Shulker_Box "
+    "Skeleton_Skull Skeleton_Wall_Skull Slime_Block Small_Amethyst_Bud Small_Dripleaf Smithing_Table "
+    "Smoker Smooth_Basalt Smooth_Quartz Smooth_Quartz_Slab Smooth_Quartz_Stairs Smooth_Red_Sandstone "
+    "Smooth_Red_Sandstone_Slab Smooth_Red_Sandstone_Stairs Smooth_Sandstone Smooth_Sandstone_Slab "
+    "Smooth_Sandstone_Stairs Smooth_Stone Smooth_Stone_Slab Snow Snow_Block Soul_Campfire Soul_Fire "
+    "Soul_Lantern Soul_Sand Soul_Soil Soul_Torch Soul_Wall_Torch Spawner Sponge Spore_Blossom "
+    "Spruce_Button Spruce_Door Spruce_Fence Spruce_Fence_Gate Spruce_Hanging_Sign Spruce_Leaves "
+    "Spruce_Log Spruce_Planks Spruce_Pressure_Plate Spruce_Sapling Spruce_Sign Spruce_Slab Spruce_Stairs "
+    "Spruce_Trapdoor Spruce_Wall_Hanging_Sign Spruce_Wall_Sign Spruce_Wood Sticky_Piston Stone "
+    "Stone_Brick_Slab Stone_Brick_Stairs Stone_Brick_Wall Stone_Bricks Stone_Button Stone_Pressure_Plate "
+    "Stone_Slab Stone_Stairs Stonecutter Stripped_Acacia_Log Stripped_Acacia_Wood Stripped_Bamboo_Block "
+    "Stripped_Birch_Log Stripped_Birch_Wood Stripped_Cherry_Log Stripped_Cherry_Wood "
+    "Stripped_Crimson_Hyphae Stripped_Crimson_Stem Stripped_Dark_Oak_Log Stripped_Dark_Oak_Wood "
+    "Stripped_Jungle_Log Stripped_Jungle_Wood Stripped_Mangrove_Log Stripped_Mangrove_Wood "
+    "Stripped_Oak_Log Stripped_Oak_Wood Stripped_Spruce_Log Stripped_Spruce_Wood Stripped_Warped_Hyphae "
+    "Stripped_Warped_Stem Structure_Block Structure_Void Sugar_Cane Sunflower Suspicious_Sand "
+    "Sweet_Berry_Bush Tall_Grass Tall_Seagrass Target Terracotta Tinted_Glass Tnt Torch Torchflower "
+    "Torchflower_Crop Trapped_Chest Tripwire Tripwire_Hook Tube_Coral Tube_Coral_Block Tube_Coral_Fan "
+    "Tube_Coral_Wall_Fan Tuff Turtle_Egg Twisting_Vines Twisting_Vines_Plant Verdant_Froglight Vine "
+    "Void_Air Wall_Torch Warped_Button Warped_Door Warped_Fence Warped_Fence_Gate Warped_Fungus "
+    "Warped_Hanging_Sign Warped_Hyphae Warped_Nylium Warped_Planks Warped_Pressure_Plate Warped_Roots "
+    "Warped_Sign Warped_Slab Warped_Stairs Warped_Stem Warped_Trapdoor Warped_Wall_Hanging_Sign "
+    "Warped_Wall_Sign Warped_Wart_Block Water Water_Cauldron Waxed_Copper_Block Waxed_Cut_Copper "
+    "Waxed_Cut_Copper_Slab Waxed_Cut_Copper_Stairs Waxed_Exposed_Copper Waxed_Exposed_Cut_Copper "
+    "Waxed_Exposed_Cut_Copper_Slab Waxed_Exposed_Cut_Copper_Stairs Waxed_Oxidized_Copper "
+    "Waxed_Oxidized_Cut_Copper Waxed_Oxidized_Cut_Copper_Slab Waxed_Oxidized_Cut_Copper_Stairs "
+    "Waxed_Weathered_Copper Waxed_Weathered_Cut_Copper Waxed_Weathered_Cut_Copper_Slab "
+    "Waxed_Weathered_Cut_Copper_Stairs Weathered_Copper Weathered_Cut_Copper Weathered_Cut_Copper_Slab "
+    "Weathered_Cut_Copper_Stairs Weeping_Vines Weeping_Vines_Plant Wet_Sponge Wheat White_Banner "
+    "White_Bed White_Candle White_Candle_Cake White_Carpet White_Concrete White_Concrete_Powder "
+    "White_Glazed_Terracotta White_Shulker_Box White_Stained_Glass White_Stained_Glass_Pane "
+    "White_Terracotta White_Tulip White_Wool Wither_Rose Wither_Skeleton_Skull "
+    "Wither_Skeleton_Wall_Skull Yellow_Banner Yellow_Bed Yellow_Candle Yellow_Candle_Cake Yellow_Carpet "
+    "Yellow_Concrete Yellow_Concrete_Powder Yellow_Glazed_Terracotta Yellow_Shulker_Box "
+    "Yellow_Stained_Glass Yellow_Stained_Glass_Pane Yellow_Terracotta Yellow_Wool Zombie_Head "
+    "Zombie_Wall_Head Acacia_Boat Acacia_Chest_Boat Allay_Spawn_Egg Amethyst_Shard Apple Armor_Stand "
+    "Arrow Axolotl_Bucket Axolotl_Spawn_Egg Baked_Potato Bamboo_Chest_Raft Bamboo_Raft Bat_Spawn_Egg "
+    "Bee_Spawn_Egg Beef Beetroot Beetroot_Seeds Beetroot_Soup Birch_Boat Birch_Chest_Boat Black_Dye "
+    "Blaze_Powder Blaze_Rod Blaze_Spawn_Egg Blue_Dye Bone Bone_Meal Book Bow Bowl Bread Brick Brown_Dye "
+    "Brush Bucket Bundle Camel_Spawn_Egg Carrot Carrot_On_A_Stick Cat_Spawn_Egg Cave_Spider_Spawn_Egg "
+    "Chainmail_Boots Chainmail_Chestplate Chainmail_Helmet Chainmail_Leggings Charcoal Cherry_Boat "
+    "Cherry_Chest_Boat Chest_Minecart Chicken Chicken_Spawn_Egg Chorus_Fruit Clay_Ball Clock Coal "
+    "Cocoa_Beans Cod Cod_Bucket Cod_Spawn_Egg Command_Block_Minecart Compass Cooked_Beef Cooked_Chicken "
+    "Cooked_Cod Cooked_Mutton Cooked_Porkchop Cooked_Rabbit Cooked_Salmon Cookie Copper_Ingot "
+    "Cow_Spawn_Egg Creeper_Banner_Pattern Creeper_Spawn_Egg Crossbow Cyan_Dye Dark_Oak_Boat "
+    "Dark_Oak_Chest_Boat Debug_Stick Diamond Diamond_Axe Diamond_Boots Diamond_Chestplate Diamond_Helmet "
+    "Diamond_Hoe Diamond_Horse_Armor Diamond_Leggings Diamond_Pickaxe Diamond_Shovel Diamond_Sword "
+    "Disc_Fragment_5 Dolphin_Spawn_Egg Donkey_Spawn_Egg Dragon_Breath Dried_Kelp Drowned_Spawn_Egg "
+    "Echo_Shard Egg Elder_Guardian_Spawn_Egg Elytra Emerald Enchanted_Book Enchanted_Golden_Apple "
+    "End_Crystal Ender_Dragon_Spawn_Egg Ender_Eye Ender_Pearl Enderman_Spawn_Egg Endermite_Spawn_Egg "
+    "Evoker_Spawn_Egg Experience_Bottle Feather Fermented_Spider_Eye Filled_Map Fire_Charge "
+    "Firework_Rocket Firework_Star Fishing_Rod Flint Flint_And_Steel Flower_Banner_Pattern Fox_Spawn_Egg "
+    "Frog_Spawn_Egg Furnace_Minecart Ghast_Spawn_Egg Ghast_Tear Glass_Bottle Glistering_Melon_Slice "
+    "Globe_Banner_Pattern Glow_Berries Glow_Ink_Sac Glow_Item_Frame Glow_Squid_Spawn_Egg Glowstone_Dust "
+    "Goat_Horn Goat_Spawn_Egg Gold_Ingot Gold_Nugget Golden_Apple Golden_Axe Golden_Boots Golden_Carrot "
+    "Golden_Chestplate Golden_Helmet Golden_Hoe Golden_Horse_Armor Golden_Leggings Golden_Pickaxe "
+    "Golden_Shovel Golden_Sword Gray_Dye Green_Dye Guardian_Spawn_Egg Gunpowder Heart_Of_The_Sea "
+    "Hoglin_Spawn_Egg Honey_Bottle Honeycomb Hopper_Minecart Horse_Spawn_Egg Husk_Spawn_Egg Ink_Sac "
+    "Iron_Axe Iron_Boots Iron_Chestplate Iron_Golem_Spawn_Egg Iron_Helmet Iron_Hoe Iron_Horse_Armor "
+    "Iron_Ingot Iron_Leggings Iron_Nugget Iron_Pickaxe Iron_Shovel Iron_Sword Item_Frame Jungle_Boat "
+    "Jungle_Chest_Boat Knowledge_Book Lapis_Lazuli Lava_Bucket Lead Leather Leather_Boots "
+    "Leather_Chestplate Leather_Helmet Leather_Horse_Armor Leather_Leggings Light_Blue_Dye "
+    "Light_Gray_Dye Lime_Dye Lingering_Potion Llama_Spawn_Egg Magenta_Dye Magma_Cream "
+    "Magma_Cube_Spawn_Egg Mangrove_Boat Mangrove_Chest_Boat Map Melon_Seeds Melon_Slice Milk_Bucket "
+    "Minecart Mojang_Banner_Pattern Mooshroom_Spawn_Egg Mule_Spawn_Egg Mushroom_Stew Music_Disc_11 "
+    "Music_Disc_13 Music_Disc_5 Music_Disc_Blocks Music_Disc_Cat Music_Disc_Chirp Music_Disc_Far "
+    "Music_Disc_Mall Music_Disc_Mellohi Music_Disc_Otherside Music_Disc_Pigstep Music_Disc_Stal "
+    "Music_Disc_Strad Music_Disc_Wait Music_Disc_Ward Mutton Name_Tag Nautilus_Shell Nether_Brick "
+    "Nether_Star Netherite_Axe Netherite_Boots Netherite_Chestplate Netherite_Helmet Netherite_Hoe "
+    "Netherite_Ingot Netherite_Leggings Netherite_Pickaxe Netherite_Scrap Netherite_Shovel "
+    "Netherite_Sword Oak_Boat Oak_Chest_Boat Ocelot_Spawn_Egg Orange_Dye Painting Panda_Spawn_Egg Paper "
+    "Parrot_Spawn_Egg Phantom_Membrane Phantom_Spawn_Egg Pig_Spawn_Egg Piglin_Banner_Pattern "
+    "Piglin_Brute_Spawn_Egg Piglin_Spawn_Egg Pillager_Spawn_Egg Pink_Dye Poisonous_Potato "
+    "Polar_Bear_Spawn_Egg Popped_Chorus_Fruit Porkchop Potato Potion Powder_Snow_Bucket "
+    "Prismarine_Crystals Prismarine_Shard Pufferfish Pufferfish_Bucket Pufferfish_Spawn_Egg Pumpkin_Pie "
+    "Pumpkin_Seeds Purple_Dye Quartz Rabbit Rabbit_Foot Rabbit_Hide Rabbit_Spawn_Egg Rabbit_Stew "
+    "Ravager_Spawn_Egg Raw_Copper Raw_Gold Raw_Iron Recovery_Compass Red_Dye Redstone Rotten_Flesh "
+    "Saddle Salmon Salmon_Bucket Salmon_Spawn_Egg Shears Sheep_Spawn_Egg Shield Shulker_Shell "
+    "Shulker_Spawn_Egg Silverfish_Spawn_Egg Skeleton_Horse_Spawn_Egg Skeleton_Spawn_Egg "
+    "Skull_Banner_Pattern Slime_Ball Slime_Spawn_Egg Sniffer_Spawn_Egg Snow_Golem_Spawn_Egg Snowball "
+    "Spectral_Arrow Spider_Eye Spider_Spawn_Egg Splash_Potion Spruce_Boat Spruce_Chest_Boat Spyglass "
+    "Squid_Spawn_Egg Stick Stone_Axe Stone_Hoe Stone_Pickaxe Stone_Shovel Stone_Sword Stray_Spawn_Egg "
+    "Strider_Spawn_Egg String Sugar Suspicious_Stew Sweet_Berries Tadpole_Bucket Tadpole_Spawn_Egg "
+    "Tipped_Arrow Tnt_Minecart Torchflower_Seeds Totem_Of_Undying Trader_Llama_Spawn_Egg Trident "
+    "Tropical_Fish Tropical_Fish_Bucket Tropical_Fish_Spawn_Egg Turtle_Helmet Turtle_Spawn_Egg "
+    "Vex_Spawn_Egg Villager_Spawn_Egg Vindicator_Spawn_Egg Wandering_Trader_Spawn_Egg Warden_Spawn_Egg "
+    "Warped_Fungus_On_A_Stick Water_Bucket Wheat_Seeds White_Dye Witch_Spawn_Egg "
+    "Wither_Skeleton_Spawn_Egg Wither_Spawn_Egg Wolf_Spawn_Egg Wooden_Axe Wooden_Hoe Wooden_Pickaxe "
+    "Wooden_Shovel Wooden_Sword Writable_Book Written_Book Yellow_Dye Zoglin_Spawn_Egg "
+    "Zombie_Horse_Spawn_Egg Zombie_Spawn_Egg Zombie_Villager_Spawn_Egg Zombified_Piglin_Spawn_Egg "
+).split()
+""" the ordinal of a member is its position in this table """
 
-class MaterialCollection(Enum):
-    Acacia_Button = "ACACIA_BUTTON"
-    Acacia_Door = "ACACIA_DOOR"
-    Acacia_Fence = "ACACIA_FENCE"
-    Acacia_Fence_Gate = "ACACIA_FENCE_GATE"
-    Acacia_Hanging_Sign = "ACACIA_HANGING_SIGN"
-    Acacia_Leaves = "ACACIA_LEAVES"
-    Acacia_Log = "ACACIA_LOG"
-    Acacia_Planks = "ACACIA_PLANKS"
-    Acacia_Pressure_Plate = "ACACIA_PRESSURE_PLATE"
-    Acacia_Sapling = "ACACIA_SAPLING"
-    Acacia_Sign = "ACACIA_SIGN"
-    Acacia_Slab = "ACACIA_SLAB"
-    Acacia_Stairs = "ACACIA_STAIRS"
-    Acacia_Trapdoor = "ACACIA_TRAPDOOR"
-    Acacia_Wall_Hanging_Sign = "ACACIA_WALL_HANGING_SIGN"
-    Acacia_Wall_Sign = "ACACIA_WALL_SIGN"
-    Acacia_Wood = "ACACIA_WOOD"
-    Activator_Rail = "ACTIVATOR_RAIL"
-    Air = "AIR"
-    Allium = "ALLIUM"
-    Amethyst_Block = "AMETHYST_BLOCK"
-    Amethyst_Cluster = "AMETHYST_CLUSTER"
-    Ancient_Debris = "ANCIENT_DEBRIS"
-    Andesite = "ANDESITE"
-    Andesite_Slab = "ANDESITE_SLAB"
-    Andesite_Stairs = "ANDESITE_STAIRS"
-    Andesite_Wall = "ANDESITE_WALL"
-    Anvil = "ANVIL"
-    Attached_Melon_Stem = "ATTACHED_MELON_STEM"
-    Attached_Pumpkin_Stem = "ATTACHED_PUMPKIN_STEM"
-    Azalea = "AZALEA"
-    Azalea_Leaves = "AZALEA_LEAVES"
-    Azure_Bluet = "AZURE_BLUET"
-    Bamboo = "BAMBOO"
-    Bamboo_Block = "BAMBOO_BLOCK"
-    Bamboo_Button = "BAMBOO_BUTTON"
-    Bamboo_Door = "BAMBOO_DOOR"
-    Bamboo_Fence = "BAMBOO_FENCE"
-    Bamboo_Fence_Gate = "BAMBOO_FENCE_GATE"
-    Bamboo_Hanging_Sign = "BAMBOO_HANGING_SIGN"
-    Bamboo_Mosaic = "BAMBOO_MOSAIC"
-    Bamboo_Mosaic_Slab = "BAMBOO_MOSAIC_SLAB"
-    Bamboo_Mosaic_Stairs = "BAMBOO_MOSAIC_STAIRS"
-    Bamboo_Planks = "BAMBOO_PLANKS"
-    Bamboo_Pressure_Plate = "BAMBOO_PRESSURE_PLATE"
-    Bamboo_Sapling = "BAMBOO_SAPLING"
-    Bamboo_Sign = "BAMBOO_SIGN"
-    Bamboo_Slab = "BAMBOO_SLAB"
-    Bamboo_Stairs = "BAMBOO_STAIRS"
-    Bamboo_Trapdoor = "BAMBOO_TRAPDOOR"
-    Bamboo_Wall_Hanging_Sign = "BAMBOO_WALL_HANGING_SIGN"
-    Bamboo_Wall_Sign = "BAMBOO_WALL_SIGN"
-    Barrel = "BARREL"
-    Barrier = "BARRIER"
-    Basalt = "BASALT"
-    Beacon = "BEACON"
-    Bedrock = "BEDROCK"
-    Bee_Nest = "BEE_NEST"
-    Beehive = "BEEHIVE"
-    Beetroots = "BEETROOTS"
-    Bell = "BELL"
-    Big_Dripleaf = "BIG_DRIPLEAF"
-    Big_Dripleaf_Stem = "BIG_DRIPLEAF_STEM"
-    Birch_Button = "BIRCH_BUTTON"
-    Birch_Door = "BIRCH_DOOR"
-    Birch_Fence = "BIRCH_FENCE"
-    Birch_Fence_Gate = "BIRCH_FENCE_GATE"
-    Birch_Hanging_Sign = "BIRCH_HANGING_SIGN"
-    Birch_Leaves = "BIRCH_LEAVES"
-    Birch_Log = "BIRCH_LOG"
-    Birch_Planks = "BIRCH_PLANKS"
-    Birch_Pressure_Plate = "BIRCH_PRESSURE_PLATE"
-    Birch_Sapling = "BIRCH_SAPLING"
-    Birch_Sign = "BIRCH_SIGN"
-    Birch_Slab = "BIRCH_SLAB"
-    Birch_Stairs = "BIRCH_STAIRS"
-    Birch_Trapdoor = "BIRCH_TRAPDOOR"
-    Birch_Wall_Hanging_Sign = "BIRCH_WALL_HANGING_SIGN"
-    Birch_Wall_Sign = "BIRCH_WALL_SIGN"
-    Birch_Wood = "BIRCH_WOOD"
-    Black_Banner = "BLACK_BANNER"
-    Black_Bed = "BLACK_BED"
-    Black_Candle = "BLACK_CANDLE"
-    Black_Candle_Cake = "BLACK_CANDLE_CAKE"
-    Black_Carpet = "BLACK_CARPET"
-    Black_Concrete = "BLACK_CONCRETE"
-    Black_Concrete_Powder = "BLACK_CONCRETE_POWDER"
-    Black_Glazed_Terracotta = "BLACK_GLAZED_TERRACOTTA"
-    Black_Shulker_Box = "BLACK_SHULKER_BOX"
-    Black_Stained_Glass = "BLACK_STAINED_GLASS"
-    Black_Stained_Glass_Pane = "BLACK_STAINED_GLASS_PANE"
-    Black_Terracotta = "BLACK_TERRACOTTA"
-    Black_Wool = "BLACK_WOOL"
-    Blackstone = "BLACKSTONE"
-    Blackstone_Slab = "BLACKSTONE_SLAB"
-    Blackstone_Stairs = "BLACKSTONE_STAIRS"
-    Blackstone_Wall = "BLACKSTONE_WALL"
-    Blast_Furnace = "BLAST_FURNACE"
-    Blue_Banner = "BLUE_BANNER"
-    Blue_Bed = "BLUE_BED"
-    Blue_Candle = "BLUE_CANDLE"
-    Blue_Candle_Cake = "BLUE_CANDLE_CAKE"
-    Blue_Carpet = "BLUE_CARPET"
-    Blue_Concrete = "BLUE_CONCRETE"
-    Blue_Concrete_Powder = "BLUE_CONCRETE_POWDER"
-    Blue_Glazed_Terracotta = "BLUE_GLAZED_TERRACOTTA"
-    Blue_Ice = "BLUE_ICE"
-    Blue_Orchid = "BLUE_ORCHID"
-    Blue_Shulker_Box = "BLUE_SHULKER_BOX"
-    Blue_Stained_Glass = "BLUE_STAINED_GLASS"
-    Blue_Stained_Glass_Pane = "BLUE_STAINED_GLASS_PANE"
-    Blue_Terracotta = "BLUE_TERRACOTTA"
-    Blue_Wool = "BLUE_WOOL"
-    Bone_Block = "BONE_BLOCK"
-    Bookshelf = "BOOKSHELF"
-    Brain_Coral = "BRAIN_CORAL"
-    Brain_Coral_Block = "BRAIN_CORAL_BLOCK"
-    Brain_Coral_Fan = "BRAIN_CORAL_FAN"
-    Brain_Coral_Wall_Fan = "BRAIN_CORAL_WALL_FAN"
-    Brewing_Stand = "BREWING_STAND"
-    Brick_Slab = "BRICK_SLAB"
-    Brick_Stairs = "BRICK_STAIRS"
-    Brick_Wall = "BRICK_WALL"
-    Bricks = "BRICKS"
-    Brown_Banner = "BROWN_BANNER"
-    Brown_Bed = "BROWN_BED"
-    Brown_Candle = "BROWN_CANDLE"
-    Brown_Candle_Cake = "BROWN_CANDLE_CAKE"
-    Brown_Carpet = "BROWN_CARPET"
-    Brown_Concrete = "BROWN_CONCRETE"
-    Brown_Concrete_Powder = "BROWN_CONCRETE_POWDER"
-    Brown_Glazed_Terracotta = "BROWN_GLAZED_TERRACOTTA"
-    Brown_Mushroom = "BROWN_MUSHROOM"
-    Brown_Mushroom_Block = "BROWN_MUSHROOM_BLOCK"
-    Brown_Shulker_Box = "BROWN_SHULKER_BOX"
-    Brown_Stained_Glass = "BROWN_STAINED_GLASS"
-    Brown_Stained_Glass_Pane = "BROWN_STAINED_GLASS_PANE"
-    Brown_Terracotta = "BROWN_TERRACOTTA"
-    Brown_Wool = "BROWN_WOOL"
-    Bubble_Column = "BUBBLE_COLUMN"
-    Bubble_Coral = "BUBBLE_CORAL"
-    Bubble_Coral_Block = "BUBBLE_CORAL_BLOCK"
-    Bubble_Coral_Fan = "BUBBLE_CORAL_FAN"
-    Bubble_Coral_Wall_Fan = "BUBBLE_CORAL_WALL_FAN"
-    Budding_Amethyst = "BUDDING_AMETHYST"
-    Cactus = "CACTUS"
-    Cake = "CAKE"
-    Calcite = "CALCITE"
-    Campfire = "CAMPFIRE"
-    Candle = "CANDLE"
-    Candle_Cake = "CANDLE_CAKE"
-    Carrots = "CARROTS"
-    Cartography_Table = "CARTOGRAPHY_TABLE"
-    Carved_Pumpkin = "CARVED_PUMPKIN"
-    Cauldron = "CAULDRON"
-    Cave_Air = "CAVE_AIR"
-    Cave_Vines = "CAVE_VINES"
-    Cave_Vines_Plant = "CAVE_VINES_PLANT"
-    Chain = "CHAIN"
-    Chain_Command_Block = "CHAIN_COMMAND_BLOCK"
-    Cherry_Button = "CHERRY_BUTTON"
-    Cherry_Door = "CHERRY_DOOR"
-    Cherry_Fence = "CHERRY_FENCE"
-    Cherry_Fence_Gate = "CHERRY_FENCE_GATE"
-    Cherry_Hanging_Sign = "CHERRY_HANGING_SIGN"
-    Cherry_Leaves = "CHERRY_LEAVES"
-    Cherry_Log = "CHERRY_LOG"
-    Cherry_Planks = "CHERRY_PLANKS"
-    Cherry_Pressure_Plate = "CHERRY_PRESSURE_PLATE"
-    Cherry_Sapling = "CHERRY_SAPLING"
-    Cherry_Sign = "CHERRY_SIGN"
-    Cherry_Slab = "CHERRY_SLAB"
-    Cherry_Stairs = "CHERRY_STAIRS"
-    Cherry_Trapdoor = "CHERRY_TRAPDOOR"
-    Cherry_Wall_Hanging_Sign = "CHERRY_WALL_HANGING_SIGN"
-    Cherry_Wall_Sign = "CHERRY_WALL_SIGN"
-    Cherry_Wood = "CHERRY_WOOD"
-    Chest = "CHEST"
-    Chipped_Anvil = "CHIPPED_ANVIL"
-    Chiseled_Bookshelf = "CHISELED_BOOKSHELF"
-    Chiseled_Deepslate = "CHISELED_DEEPSLATE"
-    Chiseled_Nether_Bricks = "CHISELED_NETHER_BRICKS"
-    Chiseled_Polished_Blackstone = "CHISELED_POLISHED_BLACKSTONE"
-    Chiseled_Quartz_Block = "CHISELED_QUARTZ_BLOCK"
-    Chiseled_Red_Sandstone = "CHISELED_RED_SANDSTONE"
-    Chiseled_Sandstone = "CHISELED_SANDSTONE"
-    Chiseled_Stone_Bricks = "CHISELED_STONE_BRICKS"
-    Chorus_Flower = "CHORUS_FLOWER"
-    Chorus_Plant = "CHORUS_PLANT"
-    Clay = "CLAY"
-    Coal_Block = "COAL_BLOCK"
-    Coal_Ore = "COAL_ORE"
-    Coarse_Dirt = "COARSE_DIRT"
-    Cobbled_Deepslate = "COBBLED_DEEPSLATE"
-    Cobbled_Deepslate_Slab = "COBBLED_DEEPSLATE_SLAB"
-    Cobbled_Deepslate_Stairs = "COBBLED_DEEPSLATE_STAIRS"
-    Cobbled_Deepslate_Wall = "COBBLED_DEEPSLATE_WALL"
-    Cobblestone = "COBBLESTONE"
-    Cobblestone_Slab = "COBBLESTONE_SLAB"
-    Cobblestone_Stairs = "COBBLESTONE_STAIRS"
-    Cobblestone_Wall = "COBBLESTONE_WALL"
-    Cobweb = "COBWEB"
-    Cocoa = "COCOA"
-    Command_Block = "COMMAND_BLOCK"
-    Comparator = "COMPARATOR"
-    Composter = "COMPOSTER"
-    Conduit = "CONDUIT"
-    Copper_Block = "COPPER_BLOCK"
-    Copper_Ore = "COPPER_ORE"
-    Cornflower = "CORNFLOWER"
-    Cracked_Deepslate_Bricks = "CRACKED_DEEPSLATE_BRICKS"
-    Cracked_Deepslate_Tiles = "CRACKED_DEEPSLATE_TILES"
-    Cracked_Nether_Bricks = "CRACKED_NETHER_BRICKS"
-    Cracked_Polished_Blackstone_Bricks = "CRACKED_POLISHED_BLACKSTONE_BRICKS"
-    Cracked_Stone_Bricks = "CRACKED_STONE_BRICKS"
-    Crafting_Table = "CRAFTING_TABLE"
-    Creeper_Head = "CREEPER_HEAD"
-    Creeper_Wall_Head = "CREEPER_WALL_HEAD"
-    Crimson_Button = "CRIMSON_BUTTON"
-    Crimson_Door = "CRIMSON_DOOR"
-    Crimson_Fence = "CRIMSON_FENCE"
-    Crimson_Fence_Gate = "CRIMSON_FENCE_GATE"
-    Crimson_Fungus = "CRIMSON_FUNGUS"
-    Crimson_Hanging_Sign = "CRIMSON_HANGING_SIGN"
-    Crimson_Hyphae = "CRIMSON_HYPHAE"
-    Crimson_Nylium = "CRIMSON_NYLIUM"
-    Crimson_Planks = "CRIMSON_PLANKS"
-    Crimson_Pressure_Plate = "CRIMSON_PRESSURE_PLATE"
-    Crimson_Roots = "CRIMSON_ROOTS"
-    Crimson_Sign = "CRIMSON_SIGN"
-    Crimson_Slab = "CRIMSON_SLAB"
-    Crimson_Stairs = "CRIMSON_STAIRS"
-    Crimson_Stem = "CRIMSON_STEM"
-    Crimson_Trapdoor = "CRIMSON_TRAPDOOR"
-    Crimson_Wall_Hanging_Sign = "CRIMSON_WALL_HANGING_SIGN"
-    Crimson_Wall_Sign = "CRIMSON_WALL_SIGN"
-    Crying_Obsidian = "CRYING_OBSIDIAN"
-    Cut_Copper = "CUT_COPPER"
-    Cut_Copper_Slab = "CUT_COPPER_SLAB"
-    Cut_Copper_Stairs = "CUT_COPPER_STAIRS"
-    Cut_Red_Sandstone = "CUT_RED_SANDSTONE"
-    Cut_Red_Sandstone_Slab = "CUT_RED_SANDSTONE_SLAB"
-    Cut_Sandstone = "CUT_SANDSTONE"
-    Cut_Sandstone_Slab = "CUT_SANDSTONE_SLAB"
-    Cyan_Banner = "CYAN_BANNER"
-    Cyan_Bed = "CYAN_BED"
-    Cyan_Candle = "CYAN_CANDLE"
-    Cyan_Candle_Cake = "CYAN_CANDLE_CAKE"
-    Cyan_Carpet = "CYAN_CARPET"
-    Cyan_Concrete = "CYAN_CONCRETE"
-    Cyan_Concrete_Powder = "CYAN_CONCRETE_POWDER"
-    Cyan_Glazed_Terracotta = "CYAN_GLAZED_TERRACOTTA"
-    Cyan_Shulker_Box = "CYAN_SHULKER_BOX"
-    Cyan_Stained_Glass = "CYAN_STAINED_GLASS"
-    Cyan_Stained_Glass_Pane = "CYAN_STAINED_GLASS_PANE"
-    Cyan_Terracotta = "CYAN_TERRACOTTA"
-    Cyan_Wool = "CYAN_WOOL"
-    Damaged_Anvil = "DAMAGED_ANVIL"
-    Dandelion = "DANDELION"
-    Dark_Oak_Button = "DARK_OAK_BUTTON"
-    Dark_Oak_Door = "DARK_OAK_DOOR"
-    Dark_Oak_Fence = "DARK_OAK_FENCE"
-    Dark_Oak_Fence_Gate = "DARK_OAK_FENCE_GATE"
-    Dark_Oak_Hanging_Sign = "DARK_OAK_HANGING_SIGN"
-    Dark_Oak_Leaves = "DARK_OAK_LEAVES"
-    Dark_Oak_Log = "DARK_OAK_LOG"
-    Dark_Oak_Planks = "DARK_OAK_PLANKS"
-    Dark_Oak_Pressure_Plate = "DARK_OAK_PRESSURE_PLATE"
-    Dark_Oak_Sapling = "DARK_OAK_SAPLING"
-    Dark_Oak_Sign = "DARK_OAK_SIGN"
-    Dark_Oak_Slab = "DARK_OAK_SLAB"
-    Dark_Oak_Stairs = "DARK_OAK_STAIRS"
-    Dark_Oak_Trapdoor = "DARK_OAK_TRAPDOOR"
-    Dark_Oak_Wall_Hanging_Sign = "DARK_OAK_WALL_HANGING_SIGN"
-    Dark_Oak_Wall_Sign = "DARK_OAK_WALL_SIGN"
-    Dark_Oak_Wood = "DARK_OAK_WOOD"
-    Dark_Prismarine = "DARK_PRISMARINE"
-    Dark_Prismarine_Slab = "DARK_PRISMARINE_SLAB"
-    Dark_Prismarine_Stairs = "DARK_PRISMARINE_STAIRS"
-    Daylight_Detector = "DAYLIGHT_DETECTOR"
-    Dead_Brain_Coral = "DEAD_BRAIN_CORAL"
-    Dead_Brain_Coral_Block = "DEAD_BRAIN_CORAL_BLOCK"
-    Dead_Brain_Coral_Fan = "DEAD_BRAIN_CORAL_FAN"
-    Dead_Brain_Coral_Wall_Fan = "DEAD_BRAIN_CORAL_WALL_FAN"
-    Dead_Bubble_Coral = "DEAD_BUBBLE_CORAL"
-    Dead_Bubble_Coral_Block = "DEAD_BUBBLE_CORAL_BLOCK"
-    Dead_Bubble_Coral_Fan = "DEAD_BUBBLE_CORAL_FAN"
-    Dead_Bubble_Coral_Wall_Fan = "DEAD_BUBBLE_CORAL_WALL_FAN"
-    Dead_Bush = "DEAD_BUSH"
-    Dead_Fire_Coral = "DEAD_FIRE_CORAL"
-    Dead_Fire_Coral_Block = "DEAD_FIRE_CORAL_BLOCK"
-    Dead_Fire_Coral_Fan = "DEAD_FIRE_CORAL_FAN"
-    Dead_Fire_Coral_Wall_Fan = "DEAD_FIRE_CORAL_WALL_FAN"
-    Dead_Horn_Coral = "DEAD_HORN_CORAL"
-    Dead_Horn_Coral_Block = "DEAD_HORN_CORAL_BLOCK"
-    Dead_Horn_Coral_Fan = "DEAD_HORN_CORAL_FAN"
-    Dead_Horn_Coral_Wall_Fan = "DEAD_HORN_CORAL_WALL_FAN"
-    Dead_Tube_Coral = "DEAD_TUBE_CORAL"
-    Dead_Tube_Coral_Block = "DEAD_TUBE_CORAL_BLOCK"
-    Dead_Tube_Coral_Fan = "DEAD_TUBE_CORAL_FAN"
-    Dead_Tube_Coral_Wall_Fan = "DEAD_TUBE_CORAL_WALL_FAN"
-    Decorated_Pot = "DECORATED_POT"
-    Deepslate = "DEEPSLATE"
-    Deepslate_Brick_Slab = "DEEPSLATE_BRICK_SLAB"
-    Deepslate_Brick_Stairs = "DEEPSLATE_BRICK_STAIRS"
-    Deepslate_Brick_Wall = "DEEPSLATE_BRICK_WALL"
-    Deepslate_Bricks = "DEEPSLATE_BRICKS"
-    Deepslate_Coal_Ore = "DEEPSLATE_COAL_ORE"
-    Deepslate_Copper_Ore = "DEEPSLATE_COPPER_ORE"
-    Deepslate_Diamond_Ore = "DEEPSLATE_DIAMOND_ORE"
-    Deepslate_Emerald_Ore = "DEEPSLATE_EMERALD_ORE"
-    Deepslate_Gold_Ore = "DEEPSLATE_GOLD_ORE"
-    Deepslate_Iron_Ore = "DEEPSLATE_IRON_ORE"
-    Deepslate_Lapis_Ore = "DEEPSLATE_LAPIS_ORE"
-    Deepslate_Redstone_Ore = "DEEPSLATE_REDSTONE_ORE"
-    Deepslate_Tile_Slab = "DEEPSLATE_TILE_SLAB"
-    Deepslate_Tile_Stairs = "DEEPSLATE_TILE_STAIRS"
-    Deepslate_Tile_Wall = "DEEPSLATE_TILE_WALL"
-    Deepslate_Tiles = "DEEPSLATE_TILES"
-    Detector_Rail = "DETECTOR_RAIL"
-    Diamond_Block = "DIAMOND_BLOCK"
-    Diamond_Ore = "DIAMOND_ORE"
-    Diorite = "DIORITE"
-    Diorite_Slab = "DIORITE_SLAB"
-    Diorite_Stairs = "DIORITE_STAIRS"
-    Diorite_Wall = "DIORITE_WALL"
-    Dirt = "DIRT"
-    Dirt_Path = "DIRT_PATH"
-    Dispenser = "DISPENSER"
-    Dragon_Egg = "DRAGON_EGG"
-    Dragon_Head = "DRAGON_HEAD"
-    Dragon_Wall_Head = "DRAGON_WALL_HEAD"
-    Dried_Kelp_Block = "DRIED_KELP_BLOCK"
-    Dripstone_Block = "DRIPSTONE_BLOCK"
-    Dropper = "DROPPER"
-    Emerald_Block = "EMERALD_BLOCK"
-    Emerald_Ore = "EMERALD_ORE"
-    Enchanting_Table = "ENCHANTING_TABLE"
-    End_Gateway = "END_GATEWAY"
-    End_Portal = "END_PORTAL"
-    End_Portal_Frame = "END_PORTAL_FRAME"
-    End_Rod = "END_ROD"
-    End_Stone = "END_STONE"
-    End_Stone_Brick_Slab = "END_STONE_BRICK_SLAB"
-    End_Stone_Brick_Stairs = "END_STONE_BRICK_STAIRS"
-    End_Stone_Brick_Wall = "END_STONE_BRICK_WALL"
-    End_Stone_Bricks = "END_STONE_BRICKS"
-    Ender_Chest = "ENDER_CHEST"
-    Exposed_Copper = "EXPOSED_COPPER"
-    Exposed_Cut_Copper = "EXPOSED_CUT_COPPER"
-    Exposed_Cut_Copper_Slab = "EXPOSED_CUT_COPPER_SLAB"
-    Exposed_Cut_Copper_Stairs = "EXPOSED_CUT_COPPER_STAIRS"
-    Farmland = "FARMLAND"
-    Fern = "FERN"
-    Fire = "FIRE"
-    Fire_Coral = "FIRE_CORAL"
-    Fire_Coral_Block = "FIRE_CORAL_BLOCK"
-    Fire_Coral_Fan = "FIRE_CORAL_FAN"
-    Fire_Coral_Wall_Fan = "FIRE_CORAL_WALL_FAN"
-    Fletching_Table = "FLETCHING_TABLE"
-    Flower_Pot = "FLOWER_POT"
-    Flowering_Azalea = "FLOWERING_AZALEA"
-    Flowering_Azalea_Leaves = "FLOWERING_AZALEA_LEAVES"
-    Frogspawn = "FROGSPAWN"
-    Frosted_Ice = "FROSTED_ICE"
-    Furnace = "FURNACE"
-    Gilded_Blackstone = "GILDED_BLACKSTONE"
-    Glass = "GLASS"
-    Glass_Pane = "GLASS_PANE"
-    Glow_Lichen = "GLOW_LICHEN"
-    Glowstone = "GLOWSTONE"
-    Gold_Block = "GOLD_BLOCK"
-    Gold_Ore = "GOLD_ORE"
-    Granite = "GRANITE"
-    Granite_Slab = "GRANITE_SLAB"
-    Granite_Stairs = "GRANITE_STAIRS"
-    Granite_Wall = "GRANITE_WALL"
-    Grass_Block = "GRASS_BLOCK"
-    Gravel = "GRAVEL"
-    Gray_Banner = "GRAY_BANNER"
-    Gray_Bed = "GRAY_BED"
-    Gray_Candle = "GRAY_CANDLE"
-    Gray_Candle_Cake = "GRAY_CANDLE_CAKE"
-    Gray_Carpet = "GRAY_CARPET"
-    Gray_Concrete = "GRAY_CONCRETE"
-    Gray_Concrete_Powder = "GRAY_CONCRETE_POWDER"
-    Gray_Glazed_Terracotta = "GRAY_GLAZED_TERRACOTTA"
-    Gray_Shulker_Box = "GRAY_SHULKER_BOX"
-    Gray_Stained_Glass = "GRAY_STAINED_GLASS"
-    Gray_Stained_Glass_Pane = "GRAY_STAINED_GLASS_PANE"
-    Gray_Terracotta = "GRAY_TERRACOTTA"
-    Gray_Wool = "GRAY_WOOL"
-    Green_Banner = "GREEN_BANNER"
-    Green_Bed = "GREEN_BED"
-    Green_Candle = "GREEN_CANDLE"
-    Green_Candle_Cake = "GREEN_CANDLE_CAKE"
-    Green_Carpet = "GREEN_CARPET"
-    Green_Concrete = "GREEN_CONCRETE"
-    Green_Concrete_Powder = "GREEN_CONCRETE_POWDER"
-    Green_Glazed_Terracotta = "GREEN_GLAZED_TERRACOTTA"
-    Green_Shulker_Box = "GREEN_SHULKER_BOX"
-    Green_Stained_Glass = "GREEN_STAINED_GLASS"
-    Green_Stained_Glass_Pane = "GREEN_STAINED_GLASS_PANE"
-    Green_Terracotta = "GREEN_TERRACOTTA"
-    Green_Wool = "GREEN_WOOL"
-    Grindstone = "GRINDSTONE"
-    Hanging_Roots = "HANGING_ROOTS"
-    Hay_Block = "HAY_BLOCK"
-    Heavy_Weighted_Pressure_Plate = "HEAVY_WEIGHTED_PRESSURE_PLATE"
-    Honey_Block = "HONEY_BLOCK"
-    Honeycomb_Block = "HONEYCOMB_BLOCK"
-    Hopper = "HOPPER"
-    Horn_Coral = "HORN_CORAL"
-    Horn_Coral_Block = "HORN_CORAL_BLOCK"
-    Horn_Coral_Fan = "HORN_CORAL_FAN"
-    Horn_Coral_Wall_Fan = "HORN_CORAL_WALL_FAN"
-    Ice = "ICE"
-    Infested_Chiseled_Stone_Bricks = "INFESTED_CHISELED_STONE_BRICKS"
-    Infested_Cobblestone = "INFESTED_COBBLESTONE"
-    Infested_Cracked_Stone_Bricks = "INFESTED_CRACKED_STONE_BRICKS"
-    Infested_Deepslate = "INFESTED_DEEPSLATE"
-    Infested_Mossy_Stone_Bricks = "INFESTED_MOSSY_STONE_BRICKS"
-    Infested_Stone = "INFESTED_STONE"
-    Infested_Stone_Bricks = "INFESTED_STONE_BRICKS"
-    Iron_Bars = "IRON_BARS"
-    Iron_Block = "IRON_BLOCK"
-    Iron_Door = "IRON_DOOR"
-    Iron_Ore = "IRON_ORE"
-    Iron_Trapdoor = "IRON_TRAPDOOR"
-    Jack_O_Lantern = "JACK_O_LANTERN"
-    Jigsaw = "JIGSAW"
-    Jukebox = "JUKEBOX"
-    Jungle_Button = "JUNGLE_BUTTON"
-    Jungle_Door = "JUNGLE_DOOR"
-    Jungle_Fence = "JUNGLE_FENCE"
-    Jungle_Fence_Gate = "JUNGLE_FENCE_GATE"
-    Jungle_Hanging_Sign = "JUNGLE_HANGING_SIGN"
-    Jungle_Leaves = "JUNGLE_LEAVES"
-    Jungle_Log = "JUNGLE_LOG"
-    Jungle_Planks = "JUNGLE_PLANKS"
-    Jungle_Pressure_Plate = "JUNGLE_PRESSURE_PLATE"
-    Jungle_Sapling = "JUNGLE_SAPLING"
-    Jungle_Sign = "JUNGLE_SIGN"
-    Jungle_Slab = "JUNGLE_SLAB"
-    Jungle_Stairs = "JUNGLE_STAIRS"
-    Jungle_Trapdoor = "JUNGLE_TRAPDOOR"
-    Jungle_Wall_Hanging_Sign = "JUNGLE_WALL_HANGING_SIGN"
-    Jungle_Wall_Sign = "JUNGLE_WALL_SIGN"
-    Jungle_Wood = "JUNGLE_WOOD"
-    Kelp = "KELP"
-    Kelp_Plant = "KELP_PLANT"
-    Ladder = "LADDER"
-    Lantern = "LANTERN"
-    Lapis_Block = "LAPIS_BLOCK"
-    Lapis_Ore = "LAPIS_ORE"
-    Large_Amethyst_Bud = "LARGE_AMETHYST_BUD"
-    Large_Fern = "LARGE_FERN"
-    Lava = "LAVA"
-    Lava_Cauldron = "LAVA_CAULDRON"
-    Lectern = "LECTERN"
-    Lever = "LEVER"
-    Light = "LIGHT"
-    Light_Blue_Banner = "LIGHT_BLUE_BANNER"
-    Light_Blue_Bed = "LIGHT_BLUE_BED"
-    Light_Blue_Candle = "LIGHT_BLUE_CANDLE"
-    Light_Blue_Candle_Cake = "LIGHT_BLUE_CANDLE_CAKE"
-    Light_Blue_Carpet = "LIGHT_BLUE_CARPET"
-    Light_Blue_Concrete = "LIGHT_BLUE_CONCRETE"
-    Light_Blue_Concrete_Powder = "LIGHT_BLUE_CONCRETE_POWDER"
-    Light_Blue_Glazed_Terracotta = "LIGHT_BLUE_GLAZED_TERRACOTTA"
-    Light_Blue_Shulker_Box = "LIGHT_BLUE_SHULKER_BOX"
-    Light_Blue_Stained_Glass = "LIGHT_BLUE_STAINED_GLASS"
-    Light_Blue_Stained_Glass_Pane = "LIGHT_BLUE_STAINED_GLASS_PANE"
-    Light_Blue_Terracotta = "LIGHT_BLUE_TERRACOTTA"
-    Light_Blue_Wool = "LIGHT_BLUE_WOOL"
-    Light_Gray_Banner = "LIGHT_GRAY_BANNER"
-    Light_Gray_Bed = "LIGHT_GRAY_BED"
-    Light_Gray_Candle = "LIGHT_GRAY_CANDLE"
-    Light_Gray_Candle_Cake = "LIGHT_GRAY_CANDLE_CAKE"
-    Light_Gray_Carpet = "LIGHT_GRAY_CARPET"
-    Light_Gray_Concrete = "LIGHT_GRAY_CONCRETE"
-    Light_Gray_Concrete_Powder = "LIGHT_GRAY_CONCRETE_POWDER"
-    Light_Gray_Glazed_Terracotta = "LIGHT_GRAY_GLAZED_TERRACOTTA"
-    Light_Gray_Shulker_Box = "LIGHT_GRAY_SHULKER_BOX"
-    Light_Gray_Stained_Glass = "LIGHT_GRAY_STAINED_GLASS"
-    Light_Gray_Stained_Glass_Pane = "LIGHT_GRAY_STAINED_GLASS_PANE"
-    Light_Gray_Terracotta = "LIGHT_GRAY_TERRACOTTA"
-    Light_Gray_Wool = "LIGHT_GRAY_WOOL"
-    Light_Weighted_Pressure_Plate = "LIGHT_WEIGHTED_PRESSURE_PLATE"
-    Lightning_Rod = "LIGHTNING_ROD"
-    Lilac = "LILAC"
-    Lily_Of_The_Valley = "LILY_OF_THE_VALLEY"
-    Lily_Pad = "LILY_PAD"
-    Lime_Banner = "LIME_BANNER"
-    Lime_Bed = "LIME_BED"
-    Lime_Candle = "LIME_CANDLE"
-    Lime_Candle_Cake = "LIME_CANDLE_CAKE"
-    Lime_Carpet = "LIME_CARPET"
-    Lime_Concrete = "LIME_CONCRETE"
-    Lime_Concrete_Powder = "LIME_CONCRETE_POWDER"
-    Lime_Glazed_Terracotta = "LIME_GLAZED_TERRACOTTA"
-    Lime_Shulker_Box = "LIME_SHULKER_BOX"
-    Lime_Stained_Glass = "LIME_STAINED_GLASS"
-    Lime_Stained_Glass_Pane = "LIME_STAINED_GLASS_PANE"
-    Lime_Terracotta = "LIME_TERRACOTTA"
-    Lime_Wool = "LIME_WOOL"
-    Lodestone = "LODESTONE"
-    Loom = "LOOM"
-    Magenta_Banner = "MAGENTA_BANNER"
-    Magenta_Bed = "MAGENTA_BED"
-    Magenta_Candle = "MAGENTA_CANDLE"
-    Magenta_Candle_Cake = "MAGENTA_CANDLE_CAKE"
-    Magenta_Carpet = "MAGENTA_CARPET"
-    Magenta_Concrete = "MAGENTA_CONCRETE"
-    Magenta_Concrete_Powder = "MAGENTA_CONCRETE_POWDER"
-    Magenta_Glazed_Terracotta = "MAGENTA_GLAZED_TERRACOTTA"
-    Magenta_Shulker_Box = "MAGENTA_SHULKER_BOX"
-    Magenta_Stained_Glass = "MAGENTA_STAINED_GLASS"
-    Magenta_Stained_Glass_Pane = "MAGENTA_STAINED_GLASS_PANE"
-    Magenta_Terracotta = "MAGENTA_TERRACOTTA"
-    Magenta_Wool = "MAGENTA_WOOL"
-    Magma_Block = "MAGMA_BLOCK"
-    Mangrove_Button = "MANGROVE_BUTTON"
-    Mangrove_Door = "MANGROVE_DOOR"
-    Mangrove_Fence = "MANGROVE_FENCE"
-    Mangrove_Fence_Gate = "MANGROVE_FENCE_GATE"
-    Mangrove_Hanging_Sign = "MANGROVE_HANGING_SIGN"
-    Mangrove_Leaves = "MANGROVE_LEAVES"
-    Mangrove_Log = "MANGROVE_LOG"
-    Mangrove_Planks = "MANGROVE_PLANKS"
-    Mangrove_Pressure_Plate = "MANGROVE_PRESSURE_PLATE"
-    Mangrove_Propagule = "MANGROVE_PROPAGULE"
-    Mangrove_Roots = "MANGROVE_ROOTS"
-    Mangrove_Sign = "MANGROVE_SIGN"
-    Mangrove_Slab = "MANGROVE_SLAB"
-    Mangrove_Stairs = "MANGROVE_STAIRS"
-    Mangrove_Trapdoor = "MANGROVE_TRAPDOOR"
-    Mangrove_Wall_Hanging_Sign = "MANGROVE_WALL_HANGING_SIGN"
-    Mangrove_Wall_Sign = "MANGROVE_WALL_SIGN"
-    Mangrove_Wood = "MANGROVE_WOOD"
-    Medium_Amethyst_Bud = "MEDIUM_AMETHYST_BUD"
-    Melon = "MELON"
-    Melon_Stem = "MELON_STEM"
-    Moss_Block = "MOSS_BLOCK"
-    Moss_Carpet = "MOSS_CARPET"
-    Mossy_Cobblestone = "MOSSY_COBBLESTONE"
-    Mossy_Cobblestone_Slab = "MOSSY_COBBLESTONE_SLAB"
-    Mossy_Cobblestone_Stairs = "MOSSY_COBBLESTONE_STAIRS"
-    Mossy_Cobblestone_Wall = "MOSSY_COBBLESTONE_WALL"
-    Mossy_Stone_Brick_Slab = "MOSSY_STONE_BRICK_SLAB"
-    Mossy_Stone_Brick_Stairs = "MOSSY_STONE_BRICK_STAIRS"
-    Mossy_Stone_Brick_Wall = "MOSSY_STONE_BRICK_WALL"
-    Mossy_Stone_Bricks = "MOSSY_STONE_BRICKS"
-    Moving_Piston = "MOVING_PISTON"
-    Mud = "MUD"
-    Mud_Brick_Slab = "MUD_BRICK_SLAB"
-    Mud_Brick_Stairs = "MUD_BRICK_STAIRS"
-    Mud_Brick_Wall = "MUD_BRICK_WALL"
-    Mud_Bricks = "MUD_BRICKS"
-    Muddy_Mangrove_Roots = "MUDDY_MANGROVE_ROOTS"
-    Mushroom_Stem = "MUSHROOM_STEM"
-    Mycelium = "MYCELIUM"
-    Nether_Brick_Fence = "NETHER_BRICK_FENCE"
-    Nether_Brick_Slab = "NETHER_BRICK_SLAB"
-    Nether_Brick_Stairs = "NETHER_BRICK_STAIRS"
-    Nether_Brick_Wall = "NETHER_BRICK_WALL"
-    Nether_Bricks = "NETHER_BRICKS"
-    Nether_Gold_Ore = "NETHER_GOLD_ORE"
-    Nether_Portal = "NETHER_PORTAL"
-    Nether_Quartz_Ore = "NETHER_QUARTZ_ORE"
-    Nether_Sprouts = "NETHER_SPROUTS"
-    Nether_Wart = "NETHER_WART"
-    Nether_Wart_Block = "NETHER_WART_BLOCK"
-    Netherite_Block = "NETHERITE_BLOCK"
-    Netherrack = "NETHERRACK"
-    Note_Block = "NOTE_BLOCK"
-    Oak_Button = "OAK_BUTTON"
-    Oak_Door = "OAK_DOOR"
-    Oak_Fence = "OAK_FENCE"
-    Oak_Fence_Gate = "OAK_FENCE_GATE"
-    Oak_Hanging_Sign = "OAK_HANGING_SIGN"
-    Oak_Leaves = "OAK_LEAVES"
-    Oak_Log = "OAK_LOG"
-    Oak_Planks = "OAK_PLANKS"
-    Oak_Pressure_Plate = "OAK_PRESSURE_PLATE"
-    Oak_Sapling = "OAK_SAPLING"
-    Oak_Sign = "OAK_SIGN"
-    Oak_Slab = "OAK_SLAB"
-    Oak_Stairs = "OAK_STAIRS"
-    Oak_Trapdoor = "OAK_TRAPDOOR"
-    Oak_Wall_Hanging_Sign = "OAK_WALL_HANGING_SIGN"
-    Oak_Wall_Sign = "OAK_WALL_SIGN"
-    Oak_Wood = "OAK_WOOD"
-    Observer = "OBSERVER"
-    Obsidian = "OBSIDIAN"
-    Ochre_Froglight = "OCHRE_FROGLIGHT"
-    Orange_Banner = "ORANGE_BANNER"
-    Orange_Bed = "ORANGE_BED"
-    Orange_Candle = "ORANGE_CANDLE"
-    Orange_Candle_Cake = "ORANGE_CANDLE_CAKE"
-    Orange_Carpet = "ORANGE_CARPET"
-    Orange_Concrete = "ORANGE_CONCRETE"
-    Orange_Concrete_Powder = "ORANGE_CONCRETE_POWDER"
-    Orange_Glazed_Terracotta = "ORANGE_GLAZED_TERRACOTTA"
-    Orange_Shulker_Box = "ORANGE_SHULKER_BOX"
-    Orange_Stained_Glass = "ORANGE_STAINED_GLASS"
-    Orange_Stained_Glass_Pane = "ORANGE_STAINED_GLASS_PANE"
-    Orange_Terracotta = "ORANGE_TERRACOTTA"
-    Orange_Tulip = "ORANGE_TULIP"
-    Orange_Wool = "ORANGE_WOOL"
-    Oxeye_Daisy = "OXEYE_DAISY"
-    Oxidized_Copper = "OXIDIZED_COPPER"
-    Oxidized_Cut_Copper = "OXIDIZED_CUT_COPPER"
-    Oxidized_Cut_Copper_Slab = "OXIDIZED_CUT_COPPER_SLAB"
-    Oxidized_Cut_Copper_Stairs = "OXIDIZED_CUT_COPPER_STAIRS"
-    Packed_Ice = "PACKED_ICE"
-    Packed_Mud = "PACKED_MUD"
-    Pearlescent_Froglight = "PEARLESCENT_FROGLIGHT"
-    Peony = "PEONY"
-    Petrified_Oak_Slab = "PETRIFIED_OAK_SLAB"
-    Piglin_Head = "PIGLIN_HEAD"
-    Piglin_Wall_Head = "PIGLIN_WALL_HEAD"
-    Pink_Banner = "PINK_BANNER"
-    Pink_Bed = "PINK_BED"
-    Pink_Candle = "PINK_CANDLE"
-    Pink_Candle_Cake = "PINK_CANDLE_CAKE"
-    Pink_Carpet = "PINK_CARPET"
-    Pink_Concrete = "PINK_CONCRETE"
-    Pink_Concrete_Powder = "PINK_CONCRETE_POWDER"
-    Pink_Glazed_Terracotta = "PINK_GLAZED_TERRACOTTA"
-    Pink_Petals = "PINK_PETALS"
-    Pink_Shulker_Box = "PINK_SHULKER_BOX"
-    Pink_Stained_Glass = "PINK_STAINED_GLASS"
-    Pink_Stained_Glass_Pane = "PINK_STAINED_GLASS_PANE"
-    Pink_Terracotta = "PINK_TERRACOTTA"
-    Pink_Tulip = "PINK_TULIP"
-    Pink_Wool = "PINK_WOOL"
-    Piston = "PISTON"
-    Piston_Head = "PISTON_HEAD"
-    Player_Head = "PLAYER_HEAD"
-    Player_Wall_Head = "PLAYER_WALL_HEAD"
-    Podzol = "PODZOL"
-    Pointed_Dripstone = "POINTED_DRIPSTONE"
-    Polished_Andesite = "POLISHED_ANDESITE"
-    Polished_Andesite_Slab = "POLISHED_ANDESITE_SLAB"
-    Polished_Andesite_Stairs = "POLISHED_ANDESITE_STAIRS"
-    Polished_Basalt = "POLISHED_BASALT"
-    Polished_Blackstone = "POLISHED_BLACKSTONE"
-    Polished_Blackstone_Brick_Slab = "POLISHED_BLACKSTONE_BRICK_SLAB"
-    Polished_Blackstone_Brick_Stairs = "POLISHED_BLACKSTONE_BRICK_STAIRS"
-    Polished_Blackstone_Brick_Wall = "POLISHED_BLACKSTONE_BRICK_WALL"
-    Polished_Blackstone_Bricks = "POLISHED_BLACKSTONE_BRICKS"
-    Polished_Blackstone_Button = "POLISHED_BLACKSTONE_BUTTON"
-    Polished_Blackstone_Pressure_Plate = "POLISHED_BLACKSTONE_PRESSURE_PLATE"
-    Polished_Blackstone_Slab = "POLISHED_BLACKSTONE_SLAB"
-    Polished_Blackstone_Stairs = "POLISHED_BLACKSTONE_STAIRS"
-    Polished_Blackstone_Wall = "POLISHED_BLACKSTONE_WALL"
-    Polished_Deepslate = "POLISHED_DEEPSLATE"
-    Polished_Deepslate_Slab = "POLISHED_DEEPSLATE_SLAB"
-    Polished_Deepslate_Stairs = "POLISHED_DEEPSLATE_STAIRS"
-    Polished_Deepslate_Wall = "POLISHED_DEEPSLATE_WALL"
-    Polished_Diorite = "POLISHED_DIORITE"
-    Polished_Diorite_Slab = "POLISHED_DIORITE_SLAB"
-    Polished_Diorite_Stairs = "POLISHED_DIORITE_STAIRS"
-    Polished_Granite = "POLISHED_GRANITE"
-    Polished_Granite_Slab = "POLISHED_GRANITE_SLAB"
-    Polished_Granite_Stairs = "POLISHED_GRANITE_STAIRS"
-    Poppy = "POPPY"
-    Potatoes = "POTATOES"
-    Potted_Acacia_Sapling = "POTTED_ACACIA_SAPLING"
-    Potted_Allium = "POTTED_ALLIUM"
-    Potted_Azalea_Bush = "POTTED_AZALEA_BUSH"
-    Potted_Azure_Bluet = "POTTED_AZURE_BLUET"
-    Potted_Bamboo = "POTTED_BAMBOO"
-    Potted_Birch_Sapling = "POTTED_BIRCH_SAPLING"
-    Potted_Blue_Orchid = "POTTED_BLUE_ORCHID"
-    Potted_Brown_Mushroom = "POTTED_BROWN_MUSHROOM"
-    Potted_Cactus = "POTTED_CACTUS"
-    Potted_Cherry_Sapling = "POTTED_CHERRY_SAPLING"
-    Potted_Cornflower = "POTTED_CORNFLOWER"
-    Potted_Crimson_Fungus = "POTTED_CRIMSON_FUNGUS"
-    Potted_Crimson_Roots = "POTTED_CRIMSON_ROOTS"
-    Potted_Dandelion = "POTTED_DANDELION"
-    Potted_Dark_Oak_Sapling = "POTTED_DARK_OAK_SAPLING"
-    Potted_Dead_Bush = "POTTED_DEAD_BUSH"
-    Potted_Fern = "POTTED_FERN"
-    Potted_Flowering_Azalea_Bush = "POTTED_FLOWERING_AZALEA_BUSH"
-    Potted_Jungle_Sapling = "POTTED_JUNGLE_SAPLING"
-    Potted_Lily_Of_The_Valley = "POTTED_LILY_OF_THE_VALLEY"
-    Potted_Mangrove_Propagule = "POTTED_MANGROVE_PROPAGULE"
-    Potted_Oak_Sapling = "POTTED_OAK_SAPLING"
-    Potted_Orange_Tulip = "POTTED_ORANGE_TULIP"
-    Potted_Oxeye_Daisy = "POTTED_OXEYE_DAISY"
-    Potted_Pink_Tulip = "POTTED_PINK_TULIP"
-    Potted_Poppy = "POTTED_POPPY"
-    Potted_Red_Mushroom = "POTTED_RED_MUSHROOM"
-    Potted_Red_Tulip = "POTTED_RED_TULIP"
-    Potted_Spruce_Sapling = "POTTED_SPRUCE_SAPLING"
-    Potted_Torchflower = "POTTED_TORCHFLOWER"
-    Potted_Warped_Fungus = "POTTED_WARPED_FUNGUS"
-    Potted_Warped_Roots = "POTTED_WARPED_ROOTS"
-    Potted_White_Tulip = "POTTED_WHITE_TULIP"
-    Potted_Wither_Rose = "POTTED_WITHER_ROSE"
-    Powder_Snow = "POWDER_SNOW"
-    Powder_Snow_Cauldron = "POWDER_SNOW_CAULDRON"
-    Powered_Rail = "POWERED_RAIL"
-    Prismarine = "PRISMARINE"
-    Prismarine_Brick_Slab = "PRISMARINE_BRICK_SLAB"
-    Prismarine_Brick_Stairs = "PRISMARINE_BRICK_STAIRS"
-    Prismarine_Bricks = "PRISMARINE_BRICKS"
-    Prismarine_Slab = "PRISMARINE_SLAB"
-    Prismarine_Stairs = "PRISMARINE_STAIRS"
-    Prismarine_Wall = "PRISMARINE_WALL"
-    Pumpkin = "PUMPKIN"
-    Pumpkin_Stem = "PUMPKIN_STEM"
-    Purple_Banner = "PURPLE_BANNER"
-    Purple_Bed = "PURPLE_BED"
-    Purple_Candle = "PURPLE_CANDLE"
-    Purple_Candle_Cake = "PURPLE_CANDLE_CAKE"
-    Purple_Carpet = "PURPLE_CARPET"
-    Purple_Concrete = "PURPLE_CONCRETE"
-    Purple_Concrete_Powder = "PURPLE_CONCRETE_POWDER"
-    Purple_Glazed_Terracotta = "PURPLE_GLAZED_TERRACOTTA"
-    Purple_Shulker_Box = "PURPLE_SHULKER_BOX"
-    Purple_Stained_Glass = "PURPLE_STAINED_GLASS"
-    Purple_Stained_Glass_Pane = "PURPLE_STAINED_GLASS_PANE"
-    Purple_Terracotta = "PURPLE_TERRACOTTA"
-    Purple_Wool = "PURPLE_WOOL"
-    Purpur_Block = "PURPUR_BLOCK"
-    Purpur_Pillar = "PURPUR_PILLAR"
-    Purpur_Slab = "PURPUR_SLAB"
-    Purpur_Stairs = "PURPUR_STAIRS"
-    Quartz_Block = "QUARTZ_BLOCK"
-    Quartz_Bricks = "QUARTZ_BRICKS"
-    Quartz_Pillar = "QUARTZ_PILLAR"
-    Quartz_Slab = "QUARTZ_SLAB"
-    Quartz_Stairs = "QUARTZ_STAIRS"
-    Rail = "RAIL"
-    Raw_Copper_Block = "RAW_COPPER_BLOCK"
-    Raw_Gold_Block = "RAW_GOLD_BLOCK"
-    Raw_Iron_Block = "RAW_IRON_BLOCK"
-    Red_Banner = "RED_BANNER"
-    Red_Bed = "RED_BED"
-    Red_Candle = "RED_CANDLE"
-    Red_Candle_Cake = "RED_CANDLE_CAKE"
-    Red_Carpet = "RED_CARPET"
-    Red_Concrete = "RED_CONCRETE"
-    Red_Concrete_Powder = "RED_CONCRETE_POWDER"
-    Red_Glazed_Terracotta = "RED_GLAZED_TERRACOTTA"
-    Red_Mushroom = "RED_MUSHROOM"
-    Red_Mushroom_Block = "RED_MUSHROOM_BLOCK"
-    Red_Nether_Brick_Slab = "RED_NETHER_BRICK_SLAB"
-    Red_Nether_Brick_Stairs = "RED_NETHER_BRICK_STAIRS"
-    Red_Nether_Brick_Wall = "RED_NETHER_BRICK_WALL"
-    Red_Nether_Bricks = "RED_NETHER_BRICKS"
-    Red_Sand = "RED_SAND"
-    Red_Sandstone = "RED_SANDSTONE"
-    Red_Sandstone_Slab = "RED_SANDSTONE_SLAB"
-    Red_Sandstone_Stairs = "RED_SANDSTONE_STAIRS"
-    Red_Sandstone_Wall = "RED_SANDSTONE_WALL"
-    Red_Shulker_Box = "RED_SHULKER_BOX"
-    Red_Stained_Glass = "RED_STAINED_GLASS"
-    Red_Stained_Glass_Pane = "RED_STAINED_GLASS_PANE"
-    Red_Terracotta = "RED_TERRACOTTA"
-    Red_Tulip = "RED_TULIP"
-    Red_Wool = "RED_WOOL"
-    Redstone_Block = "REDSTONE_BLOCK"
-    Redstone_Lamp = "REDSTONE_LAMP"
-    Redstone_Ore = "REDSTONE_ORE"
-    Redstone_Torch = "REDSTONE_TORCH"
-    Redstone_Wall_Torch = "REDSTONE_WALL_TORCH"
-    Redstone_Wire = "REDSTONE_WIRE"
-    Reinforced_Deepslate = "REINFORCED_DEEPSLATE"
-    Repeater = "REPEATER"
-    Repeating_Command_Block = "REPEATING_COMMAND_BLOCK"
-    Respawn_Anchor = "RESPAWN_ANCHOR"
-    Rooted_Dirt = "ROOTED_DIRT"
-    Rose_Bush = "ROSE_BUSH"
-    Sand = "SAND"
-    Sandstone = "SANDSTONE"
-    Sandstone_Slab = "SANDSTONE_SLAB"
-    Sandstone_Stairs = "SANDSTONE_STAIRS"
-    Sandstone_Wall = "SANDSTONE_WALL"
-    Scaffolding = "SCAFFOLDING"
-    Sculk = "SCULK"
-    Sculk_Catalyst = "SCULK_CATALYST"
-    Sculk_Sensor = "SCULK_SENSOR"
-    Sculk_Shrieker = "SCULK_SHRIEKER"
-    Sculk_Vein = "SCULK_VEIN"
-    Sea_Lantern = "SEA_LANTERN"
-    Sea_Pickle = "SEA_PICKLE"
-    Seagrass = "SEAGRASS"
-    Shroomlight = "SHROOMLIGHT"
-    Shulker_Box = "SHULKER_BOX"
-    Skeleton_Skull = "SKELETON_SKULL"
-    Skeleton_Wall_Skull = "SKELETON_WALL_SKULL"
-    Slime_Block = "SLIME_BLOCK"
-    Small_Amethyst_Bud = "SMALL_AMETHYST_BUD"
-    Small_Dripleaf = "SMALL_DRIPLEAF"
-    Smithing_Table = "SMITHING_TABLE"
-    Smoker = "SMOKER"
-    Smooth_Basalt = "SMOOTH_BASALT"
-    Smooth_Quartz = "SMOOTH_QUARTZ"
-    Smooth_Quartz_Slab = "SMOOTH_QUARTZ_SLAB"
-    Smooth_Quartz_Stairs = "SMOOTH_QUARTZ_STAIRS"
-    Smooth_Red_Sandstone = "SMOOTH_RED_SANDSTONE"
-    Smooth_Red_Sandstone_Slab = "SMOOTH_RED_SANDSTONE_SLAB"
-    Smooth_Red_Sandstone_Stairs = "SMOOTH_RED_SANDSTONE_STAIRS"
-    Smooth_Sandstone = "SMOOTH_SANDSTONE"
-    Smooth_Sandstone_Slab = "SMOOTH_SANDSTONE_SLAB"
-    Smooth_Sandstone_Stairs = "SMOOTH_SANDSTONE_STAIRS"
-    Smooth_Stone = "SMOOTH_STONE"
-    Smooth_Stone_Slab = "SMOOTH_STONE_SLAB"
-    Snow = "SNOW"
-    Snow_Block = "SNOW_BLOCK"
-    Soul_Campfire = "SOUL_CAMPFIRE"
-    Soul_Fire = "SOUL_FIRE"
-    Soul_Lantern = "SOUL_LANTERN"
-    Soul_Sand = "SOUL_SAND"
-    Soul_Soil = "SOUL_SOIL"
-    Soul_Torch = "SOUL_TORCH"
-    Soul_Wall_Torch = "SOUL_WALL_TORCH"
-    Spawner = "SPAWNER"
-    Sponge = "SPONGE"
-    Spore_Blossom = "SPORE_BLOSSOM"
-    Spruce_Button = "SPRUCE_BUTTON"
-    Spruce_Door = "SPRUCE_DOOR"
-    Spruce_Fence = "SPRUCE_FENCE"
-    Spruce_Fence_Gate = "SPRUCE_FENCE_GATE"
-    Spruce_Hanging_Sign = "SPRUCE_HANGING_SIGN"
-    Spruce_Leaves = "SPRUCE_LEAVES"
-    Spruce_Log = "SPRUCE_LOG"
-    Spruce_Planks = "SPRUCE_PLANKS"
-    Spruce_Pressure_Plate = "SPRUCE_PRESSURE_PLATE"
-    Spruce_Sapling = "SPRUCE_SAPLING"
-    Spruce_Sign = "SPRUCE_SIGN"
-    Spruce_Slab = "SPRUCE_SLAB"
-    Spruce_Stairs = "SPRUCE_STAIRS"
-    Spruce_Trapdoor = "SPRUCE_TRAPDOOR"
-    Spruce_Wall_Hanging_Sign = "SPRUCE_WALL_HANGING_SIGN"
-    Spruce_Wall_Sign = "SPRUCE_WALL_SIGN"
-    Spruce_Wood = "SPRUCE_WOOD"
-    Sticky_Piston = "STICKY_PISTON"
-    Stone = "STONE"
-    Stone_Brick_Slab = "STONE_BRICK_SLAB"
-    Stone_Brick_Stairs = "STONE_BRICK_STAIRS"
-    Stone_Brick_Wall = "STONE_BRICK_WALL"
-    Stone_Bricks = "STONE_BRICKS"
-    Stone_Button = "STONE_BUTTON"
-    Stone_Pressure_Plate = "STONE_PRESSURE_PLATE"
-    Stone_Slab = "STONE_SLAB"
-    Stone_Stairs = "STONE_STAIRS"
-    Stonecutter = "STONECUTTER"
-    Stripped_Acacia_Log = "STRIPPED_ACACIA_LOG"
-    Stripped_Acacia_Wood = "STRIPPED_ACACIA_WOOD"
-    Stripped_Bamboo_Block = "STRIPPED_BAMBOO_BLOCK"
-    Stripped_Birch_Log = "STRIPPED_BIRCH_LOG"
-    Stripped_Birch_Wood = "STRIPPED_BIRCH_WOOD"
-    Stripped_Cherry_Log = "STRIPPED_CHERRY_LOG"
-    Stripped_Cherry_Wood = "STRIPPED_CHERRY_WOOD"
-    Stripped_Crimson_Hyphae = "STRIPPED_CRIMSON_HYPHAE"
-    Stripped_Crimson_Stem = "STRIPPED_CRIMSON_STEM"
-    Stripped_Dark_Oak_Log = "STRIPPED_DARK_OAK_LOG"
-    Stripped_Dark_Oak_Wood = "STRIPPED_DARK_OAK_WOOD"
-    Stripped_Jungle_Log = "STRIPPED_JUNGLE_LOG"
-    Stripped_Jungle_Wood = "STRIPPED_JUNGLE_WOOD"
-    Stripped_Mangrove_Log = "STRIPPED_MANGROVE_LOG"
-    Stripped_Mangrove_Wood = "STRIPPED_MANGROVE_WOOD"
-    Stripped_Oak_Log = "STRIPPED_OAK_LOG"
-    Stripped_Oak_Wood = "STRIPPED_OAK_WOOD"
-    Stripped_Spruce_Log = "STRIPPED_SPRUCE_LOG"
-    Stripped_Spruce_Wood = "STRIPPED_SPRUCE_WOOD"
-    Stripped_Warped_Hyphae = "STRIPPED_WARPED_HYPHAE"
-    Stripped_Warped_Stem = "STRIPPED_WARPED_STEM"
-    Structure_Block = "STRUCTURE_BLOCK"
-    Structure_Void = "STRUCTURE_VOID"
-    Sugar_Cane = "SUGAR_CANE"
-    Sunflower = "SUNFLOWER"
-    Suspicious_Sand = "SUSPICIOUS_SAND"
-    Sweet_Berry_Bush = "SWEET_BERRY_BUSH"
-    Tall_Grass = "TALL_GRASS"
-    Tall_Seagrass = "TALL_SEAGRASS"
-    Target = "TARGET"
-    Terracotta = "TERRACOTTA"
-    Tinted_Glass = "TINTED_GLASS"
-    Tnt = "TNT"
-    Torch = "TORCH"
-    Torchflower = "TORCHFLOWER"
-    Torchflower_Crop = "TORCHFLOWER_CROP"
-    Trapped_Chest = "TRAPPED_CHEST"
-    Tripwire = "TRIPWIRE"
-    Tripwire_Hook = "TRIPWIRE_HOOK"
-    Tube_Coral = "TUBE_CORAL"
-    Tube_Coral_Block = "TUBE_CORAL_BLOCK"
-    Tube_Coral_Fan = "TUBE_CORAL_FAN"
-    Tube_Coral_Wall_Fan = "TUBE_CORAL_WALL_FAN"
-    Tuff = "TUFF"
-    Turtle_Egg = "TURTLE_EGG"
-    Twisting_Vines = "TWISTING_VINES"
-    Twisting_Vines_Plant = "TWISTING_VINES_PLANT"
-    Verdant_Froglight = "VERDANT_FROGLIGHT"
-    Vine = "VINE"
-    Void_Air = "VOID_AIR"
-    Wall_Torch = "WALL_TORCH"
-    Warped_Button = "WARPED_BUTTON"
-    Warped_Door = "WARPED_DOOR"
-    Warped_Fence = "WARPED_FENCE"
-    Warped_Fence_Gate = "WARPED_FENCE_GATE"
-    Warped_Fungus = "WARPED_FUNGUS"
-    Warped_Hanging_Sign = "WARPED_HANGING_SIGN"
-    Warped_Hyphae = "WARPED_HYPHAE"
-    Warped_Nylium = "WARPED_NYLIUM"
-    Warped_Planks = "WARPED_PLANKS"
-    Warped_Pressure_Plate = "WARPED_PRESSURE_PLATE"
-    Warped_Roots = "WARPED_ROOTS"
-    Warped_Sign = "WARPED_SIGN"
-    Warped_Slab = "WARPED_SLAB"
-    Warped_Stairs = "WARPED_STAIRS"
-    Warped_Stem = "WARPED_STEM"
-    Warped_Trapdoor = "WARPED_TRAPDOOR"
-    Warped_Wall_Hanging_Sign = "WARPED_WALL_HANGING_SIGN"
-    Warped_Wall_Sign = "WARPED_WALL_SIGN"
-    Warped_Wart_Block = "WARPED_WART_BLOCK"
-    Water = "WATER"
-    Water_Cauldron = "WATER_CAULDRON"
-    Waxed_Copper_Block = "WAXED_COPPER_BLOCK"
-    Waxed_Cut_Copper = "WAXED_CUT_COPPER"
-    Waxed_Cut_Copper_Slab = "WAXED_CUT_COPPER_SLAB"
-    Waxed_Cut_Copper_Stairs = "WAXED_CUT_COPPER_STAIRS"
-    Waxed_Exposed_Copper = "WAXED_EXPOSED_COPPER"
-    Waxed_Exposed_Cut_Copper = "WAXED_EXPOSED_CUT_COPPER"
-    Waxed_Exposed_Cut_Copper_Slab = "WAXED_EXPOSED_CUT_COPPER_SLAB"
-    Waxed_Exposed_Cut_Copper_Stairs = "WAXED_EXPOSED_CUT_COPPER_STAIRS"
-    Waxed_Oxidized_Copper = "WAXED_OXIDIZED_COPPER"
-    Waxed_Oxidized_Cut_Copper = "WAXED_OXIDIZED_CUT_COPPER"
-    Waxed_Oxidized_Cut_Copper_Slab = "WAXED_OXIDIZED_CUT_COPPER_SLAB"
-    Waxed_Oxidized_Cut_Copper_Stairs = "WAXED_OXIDIZED_CUT_COPPER_STAIRS"
-    Waxed_Weathered_Copper = "WAXED_WEATHERED_COPPER"
-    Waxed_Weathered_Cut_Copper = "WAXED_WEATHERED_CUT_COPPER"
-    Waxed_Weathered_Cut_Copper_Slab = "WAXED_WEATHERED_CUT_COPPER_SLAB"
-    Waxed_Weathered_Cut_Copper_Stairs = "WAXED_WEATHERED_CUT_COPPER_STAIRS"
-    Weathered_Copper = "WEATHERED_COPPER"
-    Weathered_Cut_Copper = "WEATHERED_CUT_COPPER"
-    Weathered_Cut_Copper_Slab = "WEATHERED_CUT_COPPER_SLAB"
-    Weathered_Cut_Copper_Stairs = "WEATHERED_CUT_COPPER_STAIRS"
-    Weeping_Vines = "WEEPING_VINES"
-    Weeping_Vines_Plant = "WEEPING_VINES_PLANT"
-    Wet_Sponge = "WET_SPONGE"
-    Wheat = "WHEAT"
-    White_Banner = "WHITE_BANNER"
-    White_Bed = "WHITE_BED"
-    White_Candle = "WHITE_CANDLE"
-    White_Candle_Cake = "WHITE_CANDLE_CAKE"
-    White_Carpet = "WHITE_CARPET"
-    White_Concrete = "WHITE_CONCRETE"
-    White_Concrete_Powder = "WHITE_CONCRETE_POWDER"
-    White_Glazed_Terracotta = "WHITE_GLAZED_TERRACOTTA"
-    White_Shulker_Box = "WHITE_SHULKER_BOX"
-    White_Stained_Glass = "WHITE_STAINED_GLASS"
-    White_Stained_Glass_Pane = "WHITE_STAINED_GLASS_PANE"
-    White_Terracotta = "WHITE_TERRACOTTA"
-    White_Tulip = "WHITE_TULIP"
-    White_Wool = "WHITE_WOOL"
-    Wither_Rose = "WITHER_ROSE"
-    Wither_Skeleton_Skull = "WITHER_SKELETON_SKULL"
-    Wither_Skeleton_Wall_Skull = "WITHER_SKELETON_WALL_SKULL"
-    Yellow_Banner = "YELLOW_BANNER"
-    Yellow_Bed = "YELLOW_BED"
-    Yellow_Candle = "YELLOW_CANDLE"
-    Yellow_Candle_Cake = "YELLOW_CANDLE_CAKE"
-    Yellow_Carpet = "YELLOW_CARPET"
-    Yellow_Concrete = "YELLOW_CONCRETE"
-    Yellow_Concrete_Powder = "YELLOW_CONCRETE_POWDER"
-    Yellow_Glazed_Terracotta = "YELLOW_GLAZED_TERRACOTTA"
-    Yellow_Shulker_Box = "YELLOW_SHULKER_BOX"
-    Yellow_Stained_Glass = "YELLOW_STAINED_GLASS"
-    Yellow_Stained_Glass_Pane = "YELLOW_STAINED_GLASS_PANE"
-    Yellow_Terracotta = "YELLOW_TERRACOTTA"
-    Yellow_Wool = "YELLOW_WOOL"
-    Zombie_Head = "ZOMBIE_HEAD"
-    Zombie_Wall_Head = "ZOMBIE_WALL_HEAD"
-    Acacia_Boat = "ACACIA_BOAT"
-    Acacia_Chest_Boat = "ACACIA_CHEST_BOAT"
-    Allay_Spawn_Egg = "ALLAY_SPAWN_EGG"
-    Amethyst_Shard = "AMETHYST_SHARD"
-    Apple = "APPLE"
-    Armor_Stand = "ARMOR_STAND"
-    Arrow = "ARROW"
-    Axolotl_Bucket = "AXOLOTL_BUCKET"
-    Axolotl_Spawn_Egg = "AXOLOTL_SPAWN_EGG"
-    Baked_Potato = "BAKED_POTATO"
-    Bamboo_Chest_Raft = "BAMBOO_CHEST_RAFT"
-    Bamboo_Raft = "BAMBOO_RAFT"
-    Bat_Spawn_Egg = "BAT_SPAWN_EGG"
-    Bee_Spawn_Egg = "BEE_SPAWN_EGG"
-    Beef = "BEEF"
-    Beetroot = "BEETROOT"
-    Beetroot_Seeds = "BEETROOT_SEEDS"
-    Beetroot_Soup = "BEETROOT_SOUP"
-    Birch_Boat = "BIRCH_BOAT"
-    Birch_Chest_Boat = "BIRCH_CHEST_BOAT"
-    Black_Dye = "BLACK_DYE"
-    Blaze_Powder = "BLAZE_POWDER"
-    Blaze_Rod = "BLAZE_ROD"
-    Blaze_Spawn_Egg = "BLAZE_SPAWN_EGG"
-    Blue_Dye = "BLUE_DYE"
-    Bone = "BONE"
-    Bone_Meal = "BONE_MEAL"
-    Book = "BOOK"
-    Bow = "BOW"
-    Bowl = "BOWL"
-    Bread = "BREAD"
-    Brick = "BRICK"
-    Brown_Dye = "BROWN_DYE"
-    Brush = "BRUSH"
-    Bucket = "BUCKET"
-    Bundle = "BUNDLE"
-    Camel_Spawn_Egg = "CAMEL_SPAWN_EGG"
-    Carrot = "CARROT"
-    Carrot_On_A_Stick = "CARROT_ON_A_STICK"
-    Cat_Spawn_Egg = "CAT_SPAWN_EGG"
-    Cave_Spider_Spawn_Egg = "CAVE_SPIDER_SPAWN_EGG"
-    Chainmail_Boots = "CHAINMAIL_BOOTS"
-    Chainmail_Chestplate = "CHAINMAIL_CHESTPLATE"
-    Chainmail_Helmet = "CHAINMAIL_HELMET"
-    Chainmail_Leggings = "CHAINMAIL_LEGGINGS"
-    Charcoal = "CHARCOAL"
-    Cherry_Boat = "CHERRY_BOAT"
-    Cherry_Chest_Boat = "CHERRY_CHEST_BOAT"
-    Chest_Minecart = "CHEST_MINECART"
-    Chicken = "CHICKEN"
-    Chicken_Spawn_Egg = "CHICKEN_SPAWN_EGG"
-    Chorus_Fruit = "CHORUS_FRUIT"
-    Clay_Ball = "CLAY_BALL"
-    Clock = "CLOCK"
-    Coal = "COAL"
-    Cocoa_Beans = "COCOA_BEANS"
-    Cod = "COD"
-    Cod_Bucket = "COD_BUCKET"
-    Cod_Spawn_Egg = "COD_SPAWN_EGG"
-    Command_Block_Minecart = "COMMAND_BLOCK_MINECART"
-    Compass = "COMPASS"
-    Cooked_Beef = "COOKED_BEEF"
-    Cooked_Chicken = "COOKED_CHICKEN"
-    Cooked_Cod = "COOKED_COD"
-    Cooked_Mutton = "COOKED_MUTTON"
-    Cooked_Porkchop = "COOKED_PORKCHOP"
-    Cooked_Rabbit = "COOKED_RABBIT"
-    Cooked_Salmon = "COOKED_SALMON"
-    Cookie = "COOKIE"
-    Copper_Ingot = "COPPER_INGOT"
-    Cow_Spawn_Egg = "COW_SPAWN_EGG"
-    Creeper_Banner_Pattern = "CREEPER_BANNER_PATTERN"
-    Creeper_Spawn_Egg = "CREEPER_SPAWN_EGG"
-    Crossbow = "CROSSBOW"
-    Cyan_Dye = "CYAN_DYE"
-    Dark_Oak_Boat = "DARK_OAK_BOAT"
-    Dark_Oak_Chest_Boat = "DARK_OAK_CHEST_BOAT"
-    Debug_Stick = "DEBUG_STICK"
-    Diamond = "DIAMOND"
-    Diamond_Axe = "DIAMOND_AXE"
-    Diamond_Boots = "DIAMOND_BOOTS"
-    Diamond_Chestplate = "DIAMOND_CHESTPLATE"
-    Diamond_Helmet = "DIAMOND_HELMET"
-    Diamond_Hoe = "DIAMOND_HOE"
-    Diamond_Horse_Armor = "DIAMOND_HORSE_ARMOR"
-    Diamond_Leggings = "DIAMOND_LEGGINGS"
-    Diamond_Pickaxe = "DIAMOND_PICKAXE"
-    Diamond_Shovel = "DIAMOND_SHOVEL"
-    Diamond_Sword = "DIAMOND_SWORD"
-    Disc_Fragment_5 = "DISC_FRAGMENT_5"
-    Dolphin_Spawn_Egg = "DOLPHIN_SPAWN_EGG"
-    Donkey_Spawn_Egg = "DONKEY_SPAWN_EGG"
-    Dragon_Breath = "DRAGON_BREATH"
-    Dried_Kelp = "DRIED_KELP"
-    Drowned_Spawn_Egg = "DROWNED_SPAWN_EGG"
-    Echo_Shard = "ECHO_SHARD"
-    Egg = "EGG"
-    Elder_Guardian_Spawn_Egg = "ELDER_GUARDIAN_SPAWN_EGG"
-    Elytra = "ELYTRA"
-    Emerald = "EMERALD"
-    Enchanted_Book = "ENCHANTED_BOOK"
-    Enchanted_Golden_Apple = "ENCHANTED_GOLDEN_APPLE"
-    End_Crystal = "END_CRYSTAL"
-    Ender_Dragon_Spawn_Egg = "ENDER_DRAGON_SPAWN_EGG"
-    Ender_Eye = "ENDER_EYE"
-    Ender_Pearl = "ENDER_PEARL"
-    Enderman_Spawn_Egg = "ENDERMAN_SPAWN_EGG"
-    Endermite_Spawn_Egg = "ENDERMITE_SPAWN_EGG"
-    Evoker_Spawn_Egg = "EVOKER_SPAWN_EGG"
-    Experience_Bottle = "EXPERIENCE_BOTTLE"
-    Feather = "FEATHER"
-    Fermented_Spider_Eye = "FERMENTED_SPIDER_EYE"
-    Filled_Map = "FILLED_MAP"
-    Fire_Charge = "FIRE_CHARGE"
-    Firework_Rocket = "FIREWORK_ROCKET"
-    Firework_Star = "FIREWORK_STAR"
-    Fishing_Rod = "FISHING_ROD"
-    Flint = "FLINT"
-    Flint_And_Steel = "FLINT_AND_STEEL"
-    Flower_Banner_Pattern = "FLOWER_BANNER_PATTERN"
-    Fox_Spawn_Egg = "FOX_SPAWN_EGG"
-    Frog_Spawn_Egg = "FROG_SPAWN_EGG"
-    Furnace_Minecart = "FURNACE_MINECART"
-    Ghast_Spawn_Egg = "GHAST_SPAWN_EGG"
-    Ghast_Tear = "GHAST_TEAR"
-    Glass_Bottle = "GLASS_BOTTLE"
-    Glistering_Melon_Slice = "GLISTERING_MELON_SLICE"
-    Globe_Banner_Pattern = "GLOBE_BANNER_PATTERN"
-    Glow_Berries = "GLOW_BERRIES"
-    Glow_Ink_Sac = "GLOW_INK_SAC"
-    Glow_Item_Frame = "GLOW_ITEM_FRAME"
-    Glow_Squid_Spawn_Egg = "GLOW_SQUID_SPAWN_EGG"
-    Glowstone_Dust = "GLOWSTONE_DUST"
-    Goat_Horn = "GOAT_HORN"
-    Goat_Spawn_Egg = "GOAT_SPAWN_EGG"
-    Gold_Ingot = "GOLD_INGOT"
-    Gold_Nugget = "GOLD_NUGGET"
-    Golden_Apple = "GOLDEN_APPLE"
-    Golden_Axe = "GOLDEN_AXE"
-    Golden_Boots = "GOLDEN_BOOTS"
-    Golden_Carrot = "GOLDEN_CARROT"
-    Golden_Chestplate = "GOLDEN_CHESTPLATE"
-    Golden_Helmet = "GOLDEN_HELMET"
-    Golden_Hoe = "GOLDEN_HOE"
-    Golden_Horse_Armor = "GOLDEN_HORSE_ARMOR"
-    Golden_Leggings = "GOLDEN_LEGGINGS"
-    Golden_Pickaxe = "GOLDEN_PICKAXE"
-    Golden_Shovel = "GOLDEN_SHOVEL"
-    Golden_Sword = "GOLDEN_SWORD"
-    Gray_Dye = "GRAY_DYE"
-    Green_Dye = "GREEN_DYE"
-    Guardian_Spawn_Egg = "GUARDIAN_SPAWN_EGG"
-    Gunpowder = "GUNPOWDER"
-    Heart_Of_The_Sea = "HEART_OF_THE_SEA"
-    Hoglin_Spawn_Egg = "HOGLIN_SPAWN_EGG"
-    Honey_Bottle = "HONEY_BOTTLE"
-    Honeycomb = "HONEYCOMB"
-    Hopper_Minecart = "HOPPER_MINECART"
-    Horse_Spawn_Egg = "HORSE_SPAWN_EGG"
-    Husk_Spawn_Egg = "HUSK_SPAWN_EGG"
-    Ink_Sac = "INK_SAC"
-    Iron_Axe = "IRON_AXE"
-    Iron_Boots = "IRON_BOOTS"
-    Iron_Chestplate = "IRON_CHESTPLATE"
-    Iron_Golem_Spawn_Egg = "IRON_GOLEM_SPAWN_EGG"
-    Iron_Helmet = "IRON_HELMET"
-    Iron_Hoe = "IRON_HOE"
-    Iron_Horse_Armor = "IRON_HORSE_ARMOR"
-    Iron_Ingot = "IRON_INGOT"
-    Iron_Leggings = "IRON_LEGGINGS"
-    Iron_Nugget = "IRON_NUGGET"
-    Iron_Pickaxe = "IRON_PICKAXE"
-    Iron_Shovel = "IRON_SHOVEL"
-    Iron_Sword = "IRON_SWORD"
-    Item_Frame = "ITEM_FRAME"
-    Jungle_Boat = "JUNGLE_BOAT"
-    Jungle_Chest_Boat = "JUNGLE_CHEST_BOAT"
-    Knowledge_Book = "KNOWLEDGE_BOOK"
-    Lapis_Lazuli = "LAPIS_LAZULI"
-    Lava_Bucket = "LAVA_BUCKET"
-    Lead = "LEAD"
-    Leather = "LEATHER"
-    Leather_Boots = "LEATHER_BOOTS"
-    Leather_Chestplate = "LEATHER_CHESTPLATE"
-    Leather_Helmet = "LEATHER_HELMET"
-    Leather_Horse_Armor = "LEATHER_HORSE_ARMOR"
-    Leather_Leggings = "LEATHER_LEGGINGS"
-    Light_Blue_Dye = "LIGHT_BLUE_DYE"
-    Light_Gray_Dye = "LIGHT_GRAY_DYE"
-    Lime_Dye = "LIME_DYE"
-    Lingering_Potion = "LINGERING_POTION"
-    Llama_Spawn_Egg = "LLAMA_SPAWN_EGG"
-    Magenta_Dye = "MAGENTA_DYE"
-    Magma_Cream = "MAGMA_CREAM"
-    Magma_Cube_Spawn_Egg = "MAGMA_CUBE_SPAWN_EGG"
-    Mangrove_Boat = "MANGROVE_BOAT"
-    Mangrove_Chest_Boat = "MANGROVE_CHEST_BOAT"
-    Map = "MAP"
-    Melon_Seeds = "MELON_SEEDS"
-    Melon_Slice = "MELON_SLICE"
-    Milk_Bucket = "MILK_BUCKET"
-    Minecart = "MINECART"
-    Mojang_Banner_Pattern = "MOJANG_BANNER_PATTERN"
-    Mooshroom_Spawn_Egg = "MOOSHROOM_SPAWN_EGG"
-    Mule_Spawn_Egg = "MULE_SPAWN_EGG"
-    Mushroom_Stew = "MUSHROOM_STEW"
-    Music_Disc_11 = "MUSIC_DISC_11"
-    Music_Disc_13 = "MUSIC_DISC_13"
-    Music_Disc_5 = "MUSIC_DISC_5"
-    Music_Disc_Blocks = "MUSIC_DISC_BLOCKS"
-    Music_Disc_Cat = "MUSIC_DISC_CAT"
-    Music_Disc_Chirp = "MUSIC_DISC_CHIRP"
-    Music_Disc_Far = "MUSIC_DISC_FAR"
-    Music_Disc_Mall = "MUSIC_DISC_MALL"
-    Music_Disc_Mellohi = "MUSIC_DISC_MELLOHI"
-    Music_Disc_Otherside = "MUSIC_DISC_OTHERSIDE"
-    Music_Disc_Pigstep = "MUSIC_DISC_PIGSTEP"
-    Music_Disc_Stal = "MUSIC_DISC_STAL"
-    Music_Disc_Strad = "MUSIC_DISC_STRAD"
-    Music_Disc_Wait = "MUSIC_DISC_WAIT"
-    Music_Disc_Ward = "MUSIC_DISC_WARD"
-    Mutton = "MUTTON"
-    Name_Tag = "NAME_TAG"
-    Nautilus_Shell = "NAUTILUS_SHELL"
-    Nether_Brick = "NETHER_BRICK"
-    Nether_Star = "NETHER_STAR"
-    Netherite_Axe = "NETHERITE_AXE"
-    Netherite_Boots = "NETHERITE_BOOTS"
-    Netherite_Chestplate = "NETHERITE_CHESTPLATE"
-    Netherite_Helmet = "NETHERITE_HELMET"
-    Netherite_Hoe = "NETHERITE_HOE"
-    Netherite_Ingot = "NETHERITE_INGOT"
-    Netherite_Leggings = "NETHERITE_LEGGINGS"
-    Netherite_Pickaxe = "NETHERITE_PICKAXE"
-    Netherite_Scrap = "NETHERITE_SCRAP"
-    Netherite_Shovel = "NETHERITE_SHOVEL"
-    Netherite_Sword = "NETHERITE_SWORD"
-    Oak_Boat = "OAK_BOAT"
-    Oak_Chest_Boat = "OAK_CHEST_BOAT"
-    Ocelot_Spawn_Egg = "OCELOT_SPAWN_EGG"
-    Orange_Dye = "ORANGE_DYE"
-    Painting = "PAINTING"
-    Panda_Spawn_Egg = "PANDA_SPAWN_EGG"
-    Paper = "PAPER"
-    Parrot_Spawn_Egg = "PARROT_SPAWN_EGG"
-    Phantom_Membrane = "PHANTOM_MEMBRANE"
-    Phantom_Spawn_Egg = "PHANTOM_SPAWN_EGG"
-    Pig_Spawn_Egg = "PIG_SPAWN_EGG"
-    Piglin_Banner_Pattern = "PIGLIN_BANNER_PATTERN"
-    Piglin_Brute_Spawn_Egg = "PIGLIN_BRUTE_SPAWN_EGG"
-    Piglin_Spawn_Egg = "PIGLIN_SPAWN_EGG"
-    Pillager_Spawn_Egg = "PILLAGER_SPAWN_EGG"
-    Pink_Dye = "PINK_DYE"
-    Poisonous_Potato = "POISONOUS_POTATO"
-    Polar_Bear_Spawn_Egg = "POLAR_BEAR_SPAWN_EGG"
-    Popped_Chorus_Fruit = "POPPED_CHORUS_FRUIT"
-    Porkchop = "PORKCHOP"
-    Potato = "POTATO"
-    Potion = "POTION"
-    Powder_Snow_Bucket = "POWDER_SNOW_BUCKET"
-    Prismarine_Crystals = "PRISMARINE_CRYSTALS"
-    Prismarine_Shard = "PRISMARINE_SHARD"
-    Pufferfish = "PUFFERFISH"
-    Pufferfish_Bucket = "PUFFERFISH_BUCKET"
-    Pufferfish_Spawn_Egg = "PUFFERFISH_SPAWN_EGG"
-    Pumpkin_Pie = "PUMPKIN_PIE"
-    Pumpkin_Seeds = "PUMPKIN_SEEDS"
-    Purple_Dye = "PURPLE_DYE"
-    Quartz = "QUARTZ"
-    Rabbit = "RABBIT"
-    Rabbit_Foot = "RABBIT_FOOT"
-    Rabbit_Hide = "RABBIT_HIDE"
-    Rabbit_Spawn_Egg = "RABBIT_SPAWN_EGG"
-    Rabbit_Stew = "RABBIT_STEW"
-    Ravager_Spawn_Egg = "RAVAGER_SPAWN_EGG"
-    Raw_Copper = "RAW_COPPER"
-    Raw_Gold = "RAW_GOLD"
-    Raw_Iron = "RAW_IRON"
-    Recovery_Compass = "RECOVERY_COMPASS"
-    Red_Dye = "RED_DYE"
-    Redstone = "REDSTONE"
-    Rotten_Flesh = "ROTTEN_FLESH"
-    Saddle = "SADDLE"
-    Salmon = "SALMON"
-    Salmon_Bucket = "SALMON_BUCKET"
-    Salmon_Spawn_Egg = "SALMON_SPAWN_EGG"
-    Shears = "SHEARS"
-    Sheep_Spawn_Egg = "SHEEP_SPAWN_EGG"
-    Shield = "SHIELD"
-    Shulker_Shell = "SHULKER_SHELL"
-    Shulker_Spawn_Egg = "SHULKER_SPAWN_EGG"
-    Silverfish_Spawn_Egg = "SILVERFISH_SPAWN_EGG"
-    Skeleton_Horse_Spawn_Egg = "SKELETON_HORSE_SPAWN_EGG"
-    Skeleton_Spawn_Egg = "SKELETON_SPAWN_EGG"
-    Skull_Banner_Pattern = "SKULL_BANNER_PATTERN"
-    Slime_Ball = "SLIME_BALL"
-    Slime_Spawn_Egg = "SLIME_SPAWN_EGG"
-    Sniffer_Spawn_Egg = "SNIFFER_SPAWN_EGG"
-    Snow_Golem_Spawn_Egg = "SNOW_GOLEM_SPAWN_EGG"
-    Snowball = "SNOWBALL"
-    Spectral_Arrow = "SPECTRAL_ARROW"
-    Spider_Eye = "SPIDER_EYE"
-    Spider_Spawn_Egg = "SPIDER_SPAWN_EGG"
-    Splash_Potion = "SPLASH_POTION"
-    Spruce_Boat = "SPRUCE_BOAT"
-    Spruce_Chest_Boat = "SPRUCE_CHEST_BOAT"
-    Spyglass = "SPYGLASS"
-    Squid_Spawn_Egg = "SQUID_SPAWN_EGG"
-    Stick = "STICK"
-    Stone_Axe = "STONE_AXE"
-    Stone_Hoe = "STONE_HOE"
-    Stone_Pickaxe = "STONE_PICKAXE"
-    Stone_Shovel = "STONE_SHOVEL"
-    Stone_Sword = "STONE_SWORD"
-    Stray_Spawn_Egg = "STRAY_SPAWN_EGG"
-    Strider_Spawn_Egg = "STRIDER_SPAWN_EGG"
-    String = "STRING"
-    Sugar = "SUGAR"
-    Suspicious_Stew = "SUSPICIOUS_STEW"
-    Sweet_Berries = "SWEET_BERRIES"
-    Tadpole_Bucket = "TADPOLE_BUCKET"
-    Tadpole_Spawn_Egg = "TADPOLE_SPAWN_EGG"
-    Tipped_Arrow = "TIPPED_ARROW"
-    Tnt_Minecart = "TNT_MINECART"
-    Torchflower_Seeds = "TORCHFLOWER_SEEDS"
-    Totem_Of_Undying = "TOTEM_OF_UNDYING"
-    Trader_Llama_Spawn_Egg = "TRADER_LLAMA_SPAWN_EGG"
-    Trident = "TRIDENT"
-    Tropical_Fish = "TROPICAL_FISH"
-    Tropical_Fish_Bucket = "TROPICAL_FISH_BUCKET"
-    Tropical_Fish_Spawn_Egg = "TROPICAL_FISH_SPAWN_EGG"
-    Turtle_Helmet = "TURTLE_HELMET"
-    Turtle_Spawn_Egg = "TURTLE_SPAWN_EGG"
-    Vex_Spawn_Egg = "VEX_SPAWN_EGG"
-    Villager_Spawn_Egg = "VILLAGER_SPAWN_EGG"
-    Vindicator_Spawn_Egg = "VINDICATOR_SPAWN_EGG"
-    Wandering_Trader_Spawn_Egg = "WANDERING_TRADER_SPAWN_EGG"
-    Warden_Spawn_Egg = "WARDEN_SPAWN_EGG"
-    Warped_Fungus_On_A_Stick = "WARPED_FUNGUS_ON_A_STICK"
-    Water_Bucket = "WATER_BUCKET"
-    Wheat_Seeds = "WHEAT_SEEDS"
-    White_Dye = "WHITE_DYE"
-    Witch_Spawn_Egg = "WITCH_SPAWN_EGG"
-    Wither_Skeleton_Spawn_Egg = "WITHER_SKELETON_SPAWN_EGG"
-    Wither_Spawn_Egg = "WITHER_SPAWN_EGG"
-    Wolf_Spawn_Egg = "WOLF_SPAWN_EGG"
-    Wooden_Axe = "WOODEN_AXE"
-    Wooden_Hoe = "WOODEN_HOE"
-    Wooden_Pickaxe = "WOODEN_PICKAXE"
-    Wooden_Shovel = "WOODEN_SHOVEL"
-    Wooden_Sword = "WOODEN_SWORD"
-    Writable_Book = "WRITABLE_BOOK"
-    Written_Book = "WRITTEN_BOOK"
-    Yellow_Dye = "YELLOW_DYE"
-    Zoglin_Spawn_Egg = "ZOGLIN_SPAWN_EGG"
-    Zombie_Horse_Spawn_Egg = "ZOMBIE_HORSE_SPAWN_EGG"
-    Zombie_Spawn_Egg = "ZOMBIE_SPAWN_EGG"
-    Zombie_Villager_Spawn_Egg = "ZOMBIE_VILLAGER_SPAWN_EGG"
-    Zombified_Piglin_Spawn_Egg = "ZOMBIFIED_PIGLIN_SPAWN_EGG"
+
+class MaterialCollection(CompactEnum, names=_NAMES, values=[name.upper() for name in _NAMES]):
+    pass
+
+
+def material_from_ordinal(ordinal: int) -> MaterialCollection:
+    """
+    The material with the given ordinal (see to_ordinal())
+    Args:
+        ordinal (int): e.g. MaterialCollection.Acacia_Button.ordinal
+    Returns:
+        the material, raises a ValueError if no material has that ordinal
+    """
+    return MaterialCollection.from_ordinal(ordinal)
@@ -0,0 +1,1348 @@
+"""This file is auto-generated! See ressourcen/generate_enums.py in the git repo! """
+
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.core.compact_enum import to_ordinal  # noqa: unused-import
+
+class MaterialCollection(CompactEnum):
+    Acacia_Button: MaterialCollection
+    Acacia_Door: MaterialCollection
+    Acacia_Fence: MaterialCollection
+    Acacia_Fence_Gate: MaterialCollection
+    Acacia_Hanging_Sign: MaterialCollection
+    Acacia_Leaves: MaterialCollection
+    Acacia_Log: MaterialCollection
+    Acacia_Planks: MaterialCollection
+    Acacia_Pressure_Plate: MaterialCollection
+    Acacia_Sapling: MaterialCollection
+    Acacia_Sign: MaterialCollection
+    Acacia_Slab: MaterialCollection
+    Acacia_Stairs: MaterialCollection
+    Acacia_Trapdoor: MaterialCollection
+    Acacia_Wall_Hanging_Sign: MaterialCollection
+    Acacia_Wall_Sign: MaterialCollection
+    Acacia_Wood: MaterialCollection
+    Activator_Rail: MaterialCollection
+    Air: MaterialCollection
+    Allium: MaterialCollection
+    Amethyst_Block: MaterialCollection
+    Amethyst_Cluster: MaterialCollection
+    Ancient_Debris: MaterialCollection
+    Andesite: MaterialCollection
+    Andesite_Slab: MaterialCollection
+    Andesite_Stairs: MaterialCollection
+    Andesite_Wall: MaterialCollection
+    Anvil: MaterialCollection
+    Attached_Melon_Stem: MaterialCollection
+    Attached_Pumpkin_Stem: MaterialCollection
+    Azalea: MaterialCollection
+    Azalea_Leaves: MaterialCollection
+    Azure_Bluet: MaterialCollection
+    Bamboo: MaterialCollection
+    Bamboo_Block: MaterialCollection
+    Bamboo_Button: MaterialCollection
+    Bamboo_Door: MaterialCollection
+    Bamboo_Fence: MaterialCollection
+    Bamboo_Fence_Gate: MaterialCollection
+    Bamboo_Hanging_Sign: MaterialCollection
+    Bamboo_Mosaic: MaterialCollection
+    Bamboo_Mosaic_Slab: MaterialCollection
+    Bamboo_Mosaic_Stairs: MaterialCollection
+    Bamboo_Planks: MaterialCollection
+    Bamboo_Pressure_Plate: MaterialCollection
+    Bamboo_Sapling: MaterialCollection
+    Bamboo_Sign: MaterialCollection
+    Bamboo_Slab: MaterialCollection
+    Bamboo_Stairs: MaterialCollection
+    Bamboo_Trapdoor: MaterialCollection
+    Bamboo_Wall_Hanging_Sign: MaterialCollection
+    Bamboo_Wall_Sign: MaterialCollection
+    Barrel: MaterialCollection
+    Barrier: MaterialCollection
+    Basalt: MaterialCollection
+    Beacon: MaterialCollection
+    Bedrock: MaterialCollection
+    Bee_Nest: MaterialCollection
+    Beehive: MaterialCollection
+    Beetroots: MaterialCollection
+    Bell: MaterialCollection
+    Big_Dripleaf: MaterialCollection
+    Big_Dripleaf_Stem: MaterialCollection
+    Birch_Button: MaterialCollection
+    Birch_Door: MaterialCollection
+    Birch_Fence: MaterialCollection
+    Birch_Fence_Gate: MaterialCollection
+    Birch_Hanging_Sign: MaterialCollection
+    Birch_Leaves: MaterialCollection
+    Birch_Log: MaterialCollection
+    Birch_Planks: MaterialCollection
+    Birch_Pressure_Plate: MaterialCollection
+    Birch_Sapling: MaterialCollection
+    Birch_Sign: MaterialCollection
+    Birch_Slab: MaterialCollection
+    Birch_Stairs: MaterialCollection
+    Birch_Trapdoor: MaterialCollection
+    Birch_Wall_Hanging_Sign: MaterialCollection
+    Birch_Wall_Sign: MaterialCollection
+    Birch_Wood: MaterialCollection
+    Black_Banner: MaterialCollection
+    Black_Bed: MaterialCollection
+    Black_Candle: MaterialCollection
+    Black_Candle_Cake: MaterialCollection
+    Black_Carpet: MaterialCollection
+    Black_Concrete: MaterialCollection
+    Black_Concrete_Powder: MaterialCollection
+    Black_Glazed_Terracotta: MaterialCollection
+    Black_Shulker_Box: MaterialCollection
+    Black_Stained_Glass: MaterialCollection
+    Black_Stained_Glass_Pane: MaterialCollection
+    Black_Terracotta: MaterialCollection
+    Black_Wool: MaterialCollection
+    Blackstone: MaterialCollection
+    Blackstone_Slab: MaterialCollection
+    Blackstone_Stairs: MaterialCollection
+    Blackstone_Wall: MaterialCollection
+    Blast_Furnace: MaterialCollection
+    Blue_Banner: MaterialCollection
+    Blue_Bed: MaterialCollection
+    Blue_Candle: MaterialCollection
+    Blue_Candle_Cake: MaterialCollection
+    Blue_Carpet: MaterialCollection
+    Blue_Concrete: MaterialCollection
+    Blue_Concrete_Powder: MaterialCollection
+    Blue_Glazed_Terracotta: MaterialCollection
+    Blue_Ice: MaterialCollection
+    Blue_Orchid: MaterialCollection
+    Blue_Shulker_Box: MaterialCollection
+    Blue_Stained_Glass: MaterialCollection
+    Blue_Stained_Glass_Pane: MaterialCollection
+    Blue_Terracotta: MaterialCollection
+    Blue_Wool: MaterialCollection
+    Bone_Block: MaterialCollection
+    Bookshelf: MaterialCollection
+    Brain_Coral: MaterialCollection
+    Brain_Coral_Block: MaterialCollection
+    Brain_Coral_Fan: MaterialCollection
+    Brain_Coral_Wall_Fan: MaterialCollection
+    Brewing_Stand: MaterialCollection
+    Brick_Slab: MaterialCollection
+    Brick_Stairs: MaterialCollection
+    Brick_Wall: MaterialCollection
+    Bricks: MaterialCollection
+    Brown_Banner: MaterialCollection
+    Brown_Bed: MaterialCollection
+    Brown_Candle: MaterialCollection
+    Brown_Candle_Cake: MaterialCollection
+    Brown_Carpet: MaterialCollection
+    Brown_Concrete: MaterialCollection
+    Brown_Concrete_Powder: MaterialCollection
+    Brown_Glazed_Terracotta: MaterialCollection
+    Brown_Mushroom: MaterialCollection
+    Brown_Mushroom_Block: MaterialCollection
+    Brown_Shulker_Box: MaterialCollection
+    Brown_Stained_Glass: MaterialCollection
+    Brown_Stained_Glass_Pane: MaterialCollection
+    Brown_Terracotta: MaterialCollection
+    Brown_Wool: MaterialCollection
+    Bubble_Column: MaterialCollection
+    Bubble_Coral: MaterialCollection
+    Bubble_Coral_Block: MaterialCollection
+    Bubble_Coral_Fan: MaterialCollection
+    Bubble_Coral_Wall_Fan: MaterialCollection
+    Budding_Amethyst: MaterialCollection
+    Cactus: MaterialCollection
+    Cake: MaterialCollection
+    Calcite: MaterialCollection
+    Campfire: MaterialCollection
+    Candle: MaterialCollection
+    Candle_Cake: MaterialCollection
+    Carrots: MaterialCollection
+    Cartography_Table: MaterialCollection
+    Carved_Pumpkin: MaterialCollection
+    Cauldron: MaterialCollection
+    Cave_Air: MaterialCollection
+    Cave_Vines: MaterialCollection
+    Cave_Vines_Plant: MaterialCollection
+    Chain: MaterialCollection
+    Chain_Command_Block: MaterialCollection
+    Cherry_Button: MaterialCollection
+    Cherry_Door: MaterialCollection
+    Cherry_Fence: MaterialCollection
+    Cherry_Fence_Gate: MaterialCollection
+    Cherry_Hanging_Sign: MaterialCollection
+    Cherry_Leaves: MaterialCollection
+    Cherry_Log: MaterialCollection
+    Cherry_Planks: MaterialCollection
+    Cherry_Pressure_Plate: MaterialCollection
+    Cherry_Sapling: MaterialCollection
+    Cherry_Sign: MaterialCollection
+    Cherry_Slab: MaterialCollection
+    Cherry_Stairs: MaterialCollection
+    Cherry_Trapdoor: MaterialCollection
+    Cherry_Wall_Hanging_Sign: MaterialCollection
+    Cherry_Wall_Sign: MaterialCollection
+    Cherry_Wood: MaterialCollection
+    Chest: MaterialCollection
+    Chipped_Anvil: MaterialCollection
+    Chiseled_Bookshelf: MaterialCollection
+    Chiseled_Deepslate: MaterialCollection
+    Chiseled_Nether_Bricks: MaterialCollection
+    Chiseled_Polished_Blackstone: MaterialCollection
+    Chiseled_Quartz_Block: MaterialCollection
+    Chiseled_Red_Sandstone: MaterialCollection
+    Chiseled_Sandstone: MaterialCollection
+    Chiseled_Stone_Bricks: MaterialCollection
+    Chorus_Flower: MaterialCollection
+    Chorus_Plant: MaterialCollection
+    Clay: MaterialCollection
+    Coal_Block: MaterialCollection
+    Coal_Ore: MaterialCollection
+    Coarse_Dirt: MaterialCollection
+    Cobbled_Deepslate: MaterialCollection
+    Cobbled_Deepslate_Slab: MaterialCollection
+    Cobbled_Deepslate_Stairs: MaterialCollection
+    Cobbled_Deepslate_Wall: MaterialCollection
+    Cobblestone: MaterialCollection
+    Cobblestone_Slab: MaterialCollection
+    Cobblestone_Stairs: MaterialCollection
+    Cobblestone_Wall: MaterialCollection
+    Cobweb: MaterialCollection
+    Cocoa: MaterialCollection
+    Command_Block: MaterialCollection
+    Comparator: MaterialCollection
+    Composter: MaterialCollection
+    Conduit: MaterialCollection
+    Copper_Block: MaterialCollection
+    Copper_Ore: MaterialCollection
+    Cornflower: MaterialCollection
+    Cracked_Deepslate_Bricks: MaterialCollection
+    Cracked_Deepslate_Tiles: MaterialCollection
+    Cracked_Nether_Bricks: MaterialCollection
+    Cracked_Polished_Blackstone_Bricks: MaterialCollection
+    Cracked_Stone_Bricks: MaterialCollection
+    Crafting_Table: MaterialCollection
+    Creeper_Head: MaterialCollection
+    Creeper_Wall_Head: MaterialCollection
+    Crimson_Button: MaterialCollection
+    Crimson_Door: MaterialCollection
+    Crimson_Fence: MaterialCollection
+    Crimson_Fence_Gate: MaterialCollection
+    Crimson_Fungus: MaterialCollection
+    Crimson_Hanging_Sign: MaterialCollection
+    Crimson_Hyphae: MaterialCollection
+    Crimson_Nylium: MaterialCollection
+    Crimson_Planks: MaterialCollection
+    Crimson_Pressure_Plate: MaterialCollection
+    Crimson_Roots: MaterialCollection
+    Crimson_Sign: MaterialCollection
+    Crimson_Slab: MaterialCollection
+    Crimson_Stairs: MaterialCollection
+    Crimson_Stem: MaterialCollection
+    Crimson_Trapdoor: MaterialCollection
+    Crimson_Wall_Hanging_Sign: MaterialCollection
+    Crimson_Wall_Sign: MaterialCollection
+    Crying_Obsidian: MaterialCollection
+    Cut_Copper: MaterialCollection
+    Cut_Copper_Slab: MaterialCollection
+    Cut_Copper_Stairs: MaterialCollection
+    Cut_Red_Sandstone: MaterialCollection
+    Cut_Red_Sandstone_Slab: MaterialCollection
+    Cut_Sandstone: MaterialCollection
+    Cut_Sandstone_Slab: MaterialCollection
+    Cyan_Banner: MaterialCollection
+    Cyan_Bed: MaterialCollection
+    Cyan_Candle: MaterialCollection
+    Cyan_Candle_Cake: MaterialCollection
+    Cyan_Carpet: MaterialCollection
+    Cyan_Concrete: MaterialCollection
+    Cyan_Concrete_Powder: MaterialCollection
+    Cyan_Glazed_Terracotta: MaterialCollection
+    Cyan_Shulker_Box: MaterialCollection
+    Cyan_Stained_Glass: MaterialCollection
+    Cyan_Stained_Glass_Pane: MaterialCollection
+    Cyan_Terracotta: MaterialCollection
+    Cyan_Wool: MaterialCollection
+    Damaged_Anvil: MaterialCollection
+    Dandelion: MaterialCollection
+    Dark_Oak_Button: MaterialCollection
+    Dark_Oak_Door: MaterialCollection
+    Dark_Oak_Fence: MaterialCollection
+    Dark_Oak_Fence_Gate: MaterialCollection
+    Dark_Oak_Hanging_Sign: MaterialCollection
+    Dark_Oak_Leaves: MaterialCollection
+    Dark_Oak_Log: MaterialCollection
+    Dark_Oak_Planks: MaterialCollection
+    Dark_Oak_Pressure_Plate: MaterialCollection
+    Dark_Oak_Sapling: MaterialCollection
+    Dark_Oak_Sign: MaterialCollection
+    Dark_Oak_Slab: MaterialCollection
+    Dark_Oak_Stairs: MaterialCollection
+    Dark_Oak_Trapdoor: MaterialCollection
+    Dark_Oak_Wall_Hanging_Sign: MaterialCollection
+    Dark_Oak_Wall_Sign: MaterialCollection
+    Dark_Oak_Wood: MaterialCollection
+    Dark_Prismarine: MaterialCollection
+    Dark_Prismarine_Slab: MaterialCollection
+    Dark_Prismarine_Stairs: MaterialCollection
+    Daylight_Detector: MaterialCollection
+    Dead_Brain_Coral: MaterialCollection
+    Dead_Brain_Coral_Block: MaterialCollection
+    Dead_Brain_Coral_Fan: MaterialCollection
+    Dead_Brain_Coral_Wall_Fan: MaterialCollection
+    Dead_Bubble_Coral: MaterialCollection
+    Dead_Bubble_Coral_Block: MaterialCollection
+    Dead_Bubble_Coral_Fan: MaterialCollection
+    Dead_Bubble_Coral_Wall_Fan: MaterialCollection
+    Dead_Bush: MaterialCollection
+    Dead_Fire_Coral: MaterialCollection
+    Dead_Fire_Coral_Block: MaterialCollection
+    Dead_Fire_Coral_Fan: MaterialCollection
+    Dead_Fire_Coral_Wall_Fan: MaterialCollection
+    Dead_Horn_Coral: MaterialCollection
+    Dead_Horn_Coral_Block: MaterialCollection
+    Dead_Horn_Coral_Fan: MaterialCollection
+    Dead_Horn_Coral_Wall_Fan: MaterialCollection
+    Dead_Tube_Coral: MaterialCollection
+    Dead_Tube_Coral_Block: MaterialCollection
+    Dead_Tube_Coral_Fan: MaterialCollection
+    Dead_Tube_Coral_Wall_Fan: MaterialCollection
+    Decorated_Pot: MaterialCollection
+    Deepslate: MaterialCollection
+    Deepslate_Brick_Slab: MaterialCollection
+    Deepslate_Brick_Stairs: MaterialCollection
+    Deepslate_Brick_Wall: MaterialCollection
+    Deepslate_Bricks: MaterialCollection
+    Deepslate_Coal_Ore: MaterialCollection
+    Deepslate_Copper_Ore: MaterialCollection
+    Deepslate_Diamond_Ore: MaterialCollection
+    Deepslate_Emerald_Ore: MaterialCollection
+    Deepslate_Gold_Ore: MaterialCollection
+    Deepslate_Iron_Ore: MaterialCollection
+    Deepslate_Lapis_Ore: MaterialCollection
+    Deepslate_Redstone_Ore: MaterialCollection
+    Deepslate_Tile_Slab: MaterialCollection
+    Deepslate_Tile_Stairs: MaterialCollection
+    Deepslate_Tile_Wall: MaterialCollection
+    Deepslate_Tiles: MaterialCollection
+    Detector_Rail: MaterialCollection
+    Diamond_Block: MaterialCollection
+    Diamond_Ore: MaterialCollection
+    Diorite: MaterialCollection
+    Diorite_Slab: MaterialCollection
+    Diorite_Stairs: MaterialCollection
+    Diorite_Wall: MaterialCollection
+    Dirt: MaterialCollection
+    Dirt_Path: MaterialCollection
+    Dispenser: MaterialCollection
+    Dragon_Egg: MaterialCollection
+    Dragon_Head: MaterialCollection
+    Dragon_Wall_Head: MaterialCollection
+    Dried_Kelp_Block: MaterialCollection
+    Dripstone_Block: MaterialCollection
+    Dropper: MaterialCollection
+    Emerald_Block: MaterialCollection
+    Emerald_Ore: MaterialCollection
+    Enchanting_Table: MaterialCollection
+    End_Gateway: MaterialCollection
+    End_Portal: MaterialCollection
+    End_Portal_Frame: MaterialCollection
+    End_Rod: MaterialCollection
+    End_Stone: MaterialCollection
+    End_Stone_Brick_Slab: MaterialCollection
+    End_Stone_Brick_Stairs: MaterialCollection
+    End_Stone_Brick_Wall: MaterialCollection
+    End_Stone_Bricks: MaterialCollection
+    Ender_Chest: MaterialCollection
+    Exposed_Copper: MaterialCollection
+    Exposed_Cut_Copper: MaterialCollection
+    Exposed_Cut_Copper_Slab: MaterialCollection
+    Exposed_Cut_Copper_Stairs: MaterialCollection
+    Farmland: MaterialCollection
+    Fern: MaterialCollection
+    Fire: MaterialCollection
+    Fire_Coral: MaterialCollection
+    Fire_Coral_Block: MaterialCollection
+    Fire_Coral_Fan: MaterialCollection
+    Fire_Coral_Wall_Fan: MaterialCollection
+    Fletching_Table: MaterialCollection
+    Flower_Pot: MaterialCollection
+    Flowering_Azalea: MaterialCollection
+    Flowering_Azalea_Leaves: MaterialCollection
+    Frogspawn: MaterialCollection
+    Frosted_Ice: MaterialCollection
+    Furnace: MaterialCollection
+    Gilded_Blackstone: MaterialCollection
+    Glass: MaterialCollection
+    Glass_Pane: MaterialCollection
+    Glow_Lichen: MaterialCollection
+    Glowstone: MaterialCollection
+    Gold_Block: MaterialCollection
+    Gold_Ore: MaterialCollection
+    Granite: MaterialCollection
+    Granite_Slab: MaterialCollection
+    Granite_Stairs: MaterialCollection
+    Granite_Wall: MaterialCollection
+    Grass_Block: MaterialCollection
+    Gravel: MaterialCollection
+    Gray_Banner: MaterialCollection
+    Gray_Bed: MaterialCollection
+    Gray_Candle: MaterialCollection
+    Gray_Candle_Cake: MaterialCollection
+    Gray_Carpet: MaterialCollection
+    Gray_Concrete: MaterialCollection
+    Gray_Concrete_Powder: MaterialCollection
+    Gray_Glazed_Terracotta: MaterialCollection
+    Gray_Shulker_Box: MaterialCollection
+    Gray_Stained_Glass: MaterialCollection
+    Gray_Stained_Glass_Pane: MaterialCollection
+    Gray_Terracotta: MaterialCollection
+    Gray_Wool: MaterialCollection
+    Green_Banner: MaterialCollection
+    Green_Bed: MaterialCollection
+    Green_Candle: MaterialCollection
+    Green_Candle_Cake: MaterialCollection
+    Green_Carpet: MaterialCollection
+    Green_Concrete: MaterialCollection
+    Green_Concrete_Powder: MaterialCollection
+    Green_Glazed_Terracotta: MaterialCollection
+    Green_Shulker_Box: MaterialCollection
+    Green_Stained_Glass: MaterialCollection
+    Green_Stained_Glass_Pane: MaterialCollection
+    Green_Terracotta: MaterialCollection
+    Green_Wool: MaterialCollection
+    Grindstone: MaterialCollection
+    Hanging_Roots: MaterialCollection
+    Hay_Block: MaterialCollection
+    Heavy_Weighted_Pressure_Plate: MaterialCollection
+    Honey_Block: MaterialCollection
+    Honeycomb_Block: MaterialCollection
+    Hopper: MaterialCollection
+    Horn_Coral: MaterialCollection
+    Horn_Coral_Block: MaterialCollection
+    Horn_Coral_Fan: MaterialCollection
+    Horn_Coral_Wall_Fan: MaterialCollection
+    Ice: MaterialCollection
+    Infested_Chiseled_Stone_Bricks: MaterialCollection
+    Infested_Cobblestone: MaterialCollection
+    Infested_Cracked_Stone_Bricks: MaterialCollection
+    Infested_Deepslate: MaterialCollection
+    Infested_Mossy_Stone_Bricks: MaterialCollection
+    Infested_Stone: MaterialCollection
+    Infested_Stone_Bricks: MaterialCollection
+    Iron_Bars: MaterialCollection
+    Iron_Block: MaterialCollection
+    Iron_Door: MaterialCollection
+    Iron_Ore: MaterialCollection
+    Iron_Trapdoor: MaterialCollection
+    Jack_O_Lantern: MaterialCollection
+    Jigsaw: MaterialCollection
+    Jukebox: MaterialCollection
+    Jungle_Button: MaterialCollection
+    Jungle_Door: MaterialCollection
+    Jungle_Fence: MaterialCollection
+    Jungle_Fence_Gate: MaterialCollection
+    Jungle_Hanging_Sign: MaterialCollection
+    Jungle_Leaves: MaterialCollection
+    Jungle_Log: MaterialCollection
+    Jungle_Planks: MaterialCollection
+    Jungle_Pressure_Plate: MaterialCollection
+    Jungle_Sapling: MaterialCollection
+    Jungle_Sign: MaterialCollection
+    Jungle_Slab: MaterialCollection
+    Jungle_Stairs: MaterialCollection
+    Jungle_Trapdoor: MaterialCollection
+    Jungle_Wall_Hanging_Sign: MaterialCollection
+    Jungle_Wall_Sign: MaterialCollection
+    Jungle_Wood: MaterialCollection
+    Kelp: MaterialCollection
+    Kelp_Plant: MaterialCollection
+    Ladder: MaterialCollection
+    Lantern: MaterialCollection
+    Lapis_Block: MaterialCollection
+    Lapis_Ore: MaterialCollection
+    Large_Amethyst_Bud: MaterialCollection
+    Large_Fern: MaterialCollection
+    Lava: MaterialCollection
+    Lava_Cauldron: MaterialCollection
+    Lectern: MaterialCollection
+    Lever: MaterialCollection
+    Light: MaterialCollection
+    Light_Blue_Banner: MaterialCollection
+    Light_Blue_Bed: MaterialCollection
+    Light_Blue_Candle: MaterialCollection
+    Light_Blue_Candle_Cake: MaterialCollection
+    Light_Blue_Carpet: MaterialCollection
+    Light_Blue_Concrete: MaterialCollection
+    Light_Blue_Concrete_Powder: MaterialCollection
+    Light_Blue_Glazed_Terracotta: MaterialCollection
+    Light_Blue_Shulker_Box: MaterialCollection
+    Light_Blue_Stained_Glass: MaterialCollection
+    Light_Blue_Stained_Glass_Pane: MaterialCollection
+    Light_Blue_Terracotta: MaterialCollection
+    Light_Blue_Wool: MaterialCollection
+    Light_Gray_Banner: MaterialCollection
+    Light_Gray_Bed: MaterialCollection
+    Light_Gray_Candle: MaterialCollection
+    Light_Gray_Candle_Cake: MaterialCollection
+    Light_Gray_Carpet: MaterialCollection
+    Light_Gray_Concrete: MaterialCollection
+    Light_Gray_Concrete_Powder: MaterialCollection
+    Light_Gray_Glazed_Terracotta: MaterialCollection
+    Light_Gray_Shulker_Box: MaterialCollection
+    Light_Gray_Stained_Glass: MaterialCollection
+    Light_Gray_Stained_Glass_Pane: MaterialCollection
+    Light_Gray_Terracotta: MaterialCollection
+    Light_Gray_Wool: MaterialCollection
+    Light_Weighted_Pressure_Plate: MaterialCollection
+    Lightning_Rod: MaterialCollection
+    Lilac: MaterialCollection
+    Lily_Of_The_Valley: MaterialCollection
+    Lily_Pad: MaterialCollection
+    Lime_Banner: MaterialCollection
+    Lime_Bed: MaterialCollection
+    Lime_Candle: MaterialCollection
+    Lime_Candle_Cake: MaterialCollection
+    Lime_Carpet: MaterialCollection
+    Lime_Concrete: MaterialCollection
+    Lime_Concrete_Powder: MaterialCollection
+    Lime_Glazed_Terracotta: MaterialCollection
+    Lime_Shulker_Box: MaterialCollection
+    Lime_Stained_Glass: MaterialCollection
+    Lime_Stained_Glass_Pane: MaterialCollection
+    Lime_Terracotta: MaterialCollection
+    Lime_Wool: MaterialCollection
+    Lodestone: MaterialCollection
+    Loom: MaterialCollection
+    Magenta_Banner: MaterialCollection
+    Magenta_Bed: MaterialCollection
+    Magenta_Candle: MaterialCollection
+    Magenta_Candle_Cake: MaterialCollection
+    Magenta_Carpet: MaterialCollection
+    Magenta_Concrete: MaterialCollection
+    Magenta_Concrete_Powder: MaterialCollection
+    Magenta_Glazed_Terracotta: MaterialCollection
+    Magenta_Shulker_Box: MaterialCollection
+    Magenta_Stained_Glass: MaterialCollection
+    Magenta_Stained_Glass_Pane: MaterialCollection
+    Magenta_Terracotta: MaterialCollection
+    Magenta_Wool: MaterialCollection
+    Magma_Block: MaterialCollection
+    Mangrove_Button: MaterialCollection
+    Mangrove_Door: MaterialCollection
+    Mangrove_Fence: MaterialCollection
+    Mangrove_Fence_Gate: MaterialCollection
+    Mangrove_Hanging_Sign: MaterialCollection
+    Mangrove_Leaves: MaterialCollection
+    Mangrove_Log: MaterialCollection
+    Mangrove_Planks: MaterialCollection
+    Mangrove_Pressure_Plate: MaterialCollection
+    Mangrove_Propagule: MaterialCollection
+    Mangrove_Roots: MaterialCollection
+    Mangrove_Sign: MaterialCollection
+    Mangrove_Slab: MaterialCollection
+    Mangrove_Stairs: MaterialCollection
+    Mangrove_Trapdoor: MaterialCollection
+    Mangrove_Wall_Hanging_Sign: MaterialCollection
+    Mangrove_Wall_Sign: MaterialCollection
+    Mangrove_Wood: MaterialCollection
+    Medium_Amethyst_Bud: MaterialCollection
+    Melon: MaterialCollection
+    Melon_Stem: MaterialCollection
+    Moss_Block: MaterialCollection
+    Moss_Carpet: MaterialCollection
+    Mossy_Cobblestone: MaterialCollection
+    Mossy_Cobblestone_Slab: MaterialCollection
+    Mossy_Cobblestone_Stairs: MaterialCollection
+    Mossy_Cobblestone_Wall: MaterialCollection
+    Mossy_Stone_Brick_Slab: MaterialCollection
+    Mossy_Stone_Brick_Stairs: MaterialCollection
+    Mossy_Stone_Brick_Wall: MaterialCollection
+    Mossy_Stone_Bricks: MaterialCollection
+    Moving_Piston: MaterialCollection
+    Mud: MaterialCollection
+    Mud_Brick_Slab: MaterialCollection
+    Mud_Brick_Stairs: MaterialCollection
+    Mud_Brick_Wall: MaterialCollection
+    Mud_Bricks: MaterialCollection
+    Muddy_Mangrove_Roots: MaterialCollection
+    Mushroom_Stem: MaterialCollection
+    Mycelium: MaterialCollection
+    Nether_Brick_Fence: MaterialCollection
+    Nether_Brick_Slab: MaterialCollection
+    Nether_Brick_Stairs: MaterialCollection
+    Nether_Brick_Wall: MaterialCollection
+    Nether_Bricks: MaterialCollection
+    Nether_Gold_Ore: MaterialCollection
+    Nether_Portal: MaterialCollection
+    Nether_Quartz_Ore: MaterialCollection
+    Nether_Sprouts: MaterialCollection
+    Nether_Wart: MaterialCollection
+    Nether_Wart_Block: MaterialCollection
+    Netherite_Block: MaterialCollection
+    Netherrack: MaterialCollection
+    Note_Block: MaterialCollection
+    Oak_Button: MaterialCollection
+    Oak_Door: MaterialCollection
+    Oak_Fence: MaterialCollection
+    Oak_Fence_Gate: MaterialCollection
+    Oak_Hanging_Sign: MaterialCollection
+    Oak_Leaves: MaterialCollection
+    Oak_Log: MaterialCollection
+    Oak_Planks: MaterialCollection
+    Oak_Pressure_Plate: MaterialCollection
+    Oak_Sapling: MaterialCollection
+    Oak_Sign: MaterialCollection
+    Oak_Slab: MaterialCollection
+    Oak_Stairs: MaterialCollection
+    Oak_Trapdoor: MaterialCollection
+    Oak_Wall_Hanging_Sign: MaterialCollection
+    Oak_Wall_Sign: MaterialCollection
+    Oak_Wood: MaterialCollection
+    Observer: MaterialCollection
+    Obsidian: MaterialCollection
+    Ochre_Froglight: MaterialCollection
+    Orange_Banner: MaterialCollection
+    Orange_Bed: MaterialCollection
+    Orange_Candle: MaterialCollection
+    Orange_Candle_Cake: MaterialCollection
+    Orange_Carpet: MaterialCollection
+    Orange_Concrete: MaterialCollection
+    Orange_Concrete_Powder: MaterialCollection
+    Orange_Glazed_Terracotta: MaterialCollection
+    Orange_Shulker_Box: MaterialCollection
+    Orange_Stained_Glass: MaterialCollection
+    Orange_Stained_Glass_Pane: MaterialCollection
+    Orange_Terracotta: MaterialCollection
+    Orange_Tulip: MaterialCollection
+    Orange_Wool: MaterialCollection
+    Oxeye_Daisy: MaterialCollection
+    Oxidized_Copper: MaterialCollection
+    Oxidized_Cut_Copper: MaterialCollection
+    Oxidized_Cut_Copper_Slab: MaterialCollection
+    Oxidized_Cut_Copper_Stairs: MaterialCollection
+    Packed_Ice: MaterialCollection
+    Packed_Mud: MaterialCollection
+    Pearlescent_Froglight: MaterialCollection
+    Peony: MaterialCollection
+    Petrified_Oak_Slab: MaterialCollection
+    Piglin_Head: MaterialCollection
+    Piglin_Wall_Head: MaterialCollection
+    Pink_Banner: MaterialCollection
+    Pink_Bed: MaterialCollection
+    Pink_Candle: MaterialCollection
+    Pink_Candle_Cake: MaterialCollection
+    Pink_Carpet: MaterialCollection
+    Pink_Concrete: MaterialCollection
+    Pink_Concrete_Powder: MaterialCollection
+    Pink_Glazed_Terracotta: MaterialCollection
+    Pink_Petals: MaterialCollection
+    Pink_Shulker_Box: MaterialCollection
+    Pink_Stained_Glass: MaterialCollection
+    Pink_Stained_Glass_Pane: MaterialCollection
+    Pink_Terracotta: MaterialCollection
+    Pink_Tulip: MaterialCollection
+    Pink_Wool: MaterialCollection
+    Piston: MaterialCollection
+    Piston_Head: MaterialCollection
+    Player_Head: MaterialCollection
+    Player_Wall_Head: MaterialCollection
+    Podzol: MaterialCollection
+    Pointed_Dripstone: MaterialCollection
+    Polished_Andesite: MaterialCollection
+    Polished_Andesite_Slab: MaterialCollection
+    Polished_Andesite_Stairs: MaterialCollection
+    Polished_Basalt: MaterialCollection
+    Polished_Blackstone: MaterialCollection
+    Polished_Blackstone_Brick_Slab: MaterialCollection
+    Polished_Blackstone_Brick_Stairs: MaterialCollection
+    Polished_Blackstone_Brick_Wall: MaterialCollection
+    Polished_Blackstone_Bricks: MaterialCollection
+    Polished_Blackstone_Button: MaterialCollection
+    Polished_Blackstone_Pressure_Plate: MaterialCollection
+    Polished_Blackstone_Slab: MaterialCollection
+    Polished_Blackstone_Stairs: MaterialCollection
+    Polished_Blackstone_Wall: MaterialCollection
+    Polished_Deepslate: MaterialCollection
+    Polished_Deepslate_Slab: MaterialCollection
+    Polished_Deepslate_Stairs: MaterialCollection
+    Polished_Deepslate_Wall: MaterialCollection
+    Polished_Diorite: MaterialCollection
+    Polished_Diorite_Slab: MaterialCollection
+    Polished_Diorite_Stairs: MaterialCollection
+    Polished_Granite: MaterialCollection
+    Polished_Granite_Slab: MaterialCollection
+    Polished_Granite_Stairs: MaterialCollection
+    Poppy: MaterialCollection
+    Potatoes: MaterialCollection
+    Potted_Acacia_Sapling: MaterialCollection
+    Potted_Allium: MaterialCollection
+    Potted_Azalea_Bush: MaterialCollection
+    Potted_Azure_Bluet: MaterialCollection
+    Potted_Bamboo: MaterialCollection
+    Potted_Birch_Sapling: MaterialCollection
+    Potted_Blue_Orchid: MaterialCollection
+    Potted_Brown_Mushroom: MaterialCollection
+    Potted_Cactus: MaterialCollection
+    Potted_Cherry_Sapling: MaterialCollection
+    Potted_Cornflower: MaterialCollection
+    Potted_Crimson_Fungus: MaterialCollection
+    Potted_Crimson_Roots: MaterialCollection
+    Potted_Dandelion: MaterialCollection
+    Potted_Dark_Oak_Sapling: MaterialCollection
+    Potted_Dead_Bush: MaterialCollection
+    Potted_Fern: MaterialCollection
+    Potted_Flowering_Azalea_Bush: MaterialCollection
+    Potted_Jungle_Sapling: MaterialCollection
+    Potted_Lily_Of_The_Valley: MaterialCollection
+    Potted_Mangrove_Propagule: MaterialCollection
+    Potted_Oak_Sapling: MaterialCollection
+    Potted_Orange_Tulip: MaterialCollection
+    Potted_Oxeye_Daisy: MaterialCollection
+    Potted_Pink_Tulip: MaterialCollection
+    Potted_Poppy: MaterialCollection
+    Potted_Red_Mushroom: MaterialCollection
+    Potted_Red_Tulip: MaterialCollection
+    Potted_Spruce_Sapling: MaterialCollection
+    Potted_Torchflower: MaterialCollection
+    Potted_Warped_Fungus: MaterialCollection
+    Potted_Warped_Roots: MaterialCollection
+    Potted_White_Tulip: MaterialCollection
+    Potted_Wither_Rose: MaterialCollection
+    Powder_Snow: MaterialCollection
+    Powder_Snow_Cauldron: MaterialCollection
+    Powered_Rail: MaterialCollection
+    Prismarine: MaterialCollection
+    Prismarine_Brick_Slab: MaterialCollection
+    Prismarine_Brick_Stairs: MaterialCollection
+    Prismarine_Bricks: MaterialCollection
+    Prismarine_Slab: MaterialCollection
+    Prismarine_Stairs: MaterialCollection
+    Prismarine_Wall: MaterialCollection
+    Pumpkin: MaterialCollection
+    Pumpkin_Stem: MaterialCollection
+    Purple_Banner: MaterialCollection
+    Purple_Bed: MaterialCollection
+    Purple_Candle: MaterialCollection
+    Purple_Candle_Cake: MaterialCollection
+    Purple_Carpet: MaterialCollection
+    Purple_Concrete: MaterialCollection
+    Purple_Concrete_Powder: MaterialCollection
+    Purple_Glazed_Terracotta: MaterialCollection
+    Purple_Shulker_Box: MaterialCollection
+    Purple_Stained_Glass: MaterialCollection
+    Purple_Stained_Glass_Pane: MaterialCollection
+    Purple_Terracotta: MaterialCollection
+    Purple_Wool: MaterialCollection
+    Purpur_Block: MaterialCollection
+    Purpur_Pillar: MaterialCollection
+    Purpur_Slab: MaterialCollection
+    Purpur_Stairs: MaterialCollection
+    Quartz_Block: MaterialCollection
+    Quartz_Bricks: MaterialCollection
+    Quartz_Pillar: MaterialCollection
+    Quartz_Slab: MaterialCollection
+    Quartz_Stairs: MaterialCollection
+    Rail: MaterialCollection
+    Raw_Copper_Block: MaterialCollection
+    Raw_Gold_Block: MaterialCollection
+    Raw_Iron_Block: MaterialCollection
+    Red_Banner: MaterialCollection
+    Red_Bed: MaterialCollection
+    Red_Candle: MaterialCollection
+    Red_Candle_Cake: MaterialCollection
+    Red_Carpet: MaterialCollection
+    Red_Concrete: MaterialCollection
+    Red_Concrete_Powder: MaterialCollection
+    Red_Glazed_Terracotta: MaterialCollection
+    Red_Mushroom: MaterialCollection
+    Red_Mushroom_Block: MaterialCollection
+    Red_Nether_Brick_Slab: MaterialCollection
+    Red_Nether_Brick_Stairs: MaterialCollection
+    Red_Nether_Brick_Wall: MaterialCollection
+    Red_Nether_Bricks: MaterialCollection
+    Red_Sand: MaterialCollection
+    Red_Sandstone: MaterialCollection
+    Red_Sandstone_Slab: MaterialCollection
+    Red_Sandstone_Stairs: MaterialCollection
+    Red_Sandstone_Wall: MaterialCollection
+    Red_Shulker_Box: MaterialCollection
+    Red_Stained_Glass: MaterialCollection
+    Red_Stained_Glass_Pane: MaterialCollection
+    Red_Terracotta: MaterialCollection
+    Red_Tulip: MaterialCollection
+    Red_Wool: MaterialCollection
+    Redstone_Block: MaterialCollection
+    Redstone_Lamp: MaterialCollection
+    Redstone_Ore: MaterialCollection
+    Redstone_Torch: MaterialCollection
+    Redstone_Wall_Torch: MaterialCollection
+    Redstone_Wire: MaterialCollection
+    Reinforced_Deepslate: MaterialCollection
+    Repeater: MaterialCollection
+    Repeating_Command_Block: MaterialCollection
+    Respawn_Anchor: MaterialCollection
+    Rooted_Dirt: MaterialCollection
+    Rose_Bush: MaterialCollection
+    Sand: MaterialCollection
+    Sandstone: MaterialCollection
+    Sandstone_Slab: MaterialCollection
+    Sandstone_Stairs: MaterialCollection
+    Sandstone_Wall: MaterialCollection
+    Scaffolding: MaterialCollection
+    Sculk: MaterialCollection
+    Sculk_Catalyst: MaterialCollection
+    Sculk_Sensor: MaterialCollection
+    Sculk_Shrieker: MaterialCollection
+    Sculk_Vein: MaterialCollection
+    Sea_Lantern: MaterialCollection
+    Sea_Pickle: MaterialCollection
+    Seagrass: MaterialCollection
+    Shroomlight: MaterialCollection
+    Shulker_Box: MaterialCollection
+    Skeleton_Skull: MaterialCollection
+    Skeleton_Wall_Skull: MaterialCollection
+    Slime_Block: MaterialCollection
+    Small_Amethyst_Bud: MaterialCollection
+    Small_Dripleaf: MaterialCollection
+    Smithing_Table: MaterialCollection
+    Smoker: MaterialCollection
+    Smooth_Basalt: MaterialCollection
+    Smooth_Quartz: MaterialCollection
+    Smooth_Quartz_Slab: MaterialCollection
+    Smooth_Quartz_Stairs: MaterialCollection
+    Smooth_Red_Sandstone: MaterialCollection
+    Smooth_Red_Sandstone_Slab: MaterialCollection
+    Smooth_Red_Sandstone_Stairs: MaterialCollection
+    Smooth_Sandstone: MaterialCollection
+    Smooth_Sandstone_Slab: MaterialCollection
+    Smooth_Sandstone_Stairs: MaterialCollection
+    Smooth_Stone: MaterialCollection
+    Smooth_Stone_Slab: MaterialCollection
+    Snow: MaterialCollection
+    Snow_Block: MaterialCollection
+    Soul_Campfire: MaterialCollection
+    Soul_Fire: MaterialCollection
+    Soul_Lantern: MaterialCollection
+    Soul_Sand: MaterialCollection
+    Soul_Soil: MaterialCollection
+    Soul_Torch: MaterialCollection
+    Soul_Wall_Torch: MaterialCollection
+    Spawner: MaterialCollection
+    Sponge: MaterialCollection
+    Spore_Blossom: MaterialCollection
+    Spruce_Button: MaterialCollection
+    Spruce_Door: MaterialCollection
+    Spruce_Fence: MaterialCollection
+    Spruce_Fence_Gate: MaterialCollection
+    Spruce_Hanging_Sign: MaterialCollection
+    Spruce_Leaves: MaterialCollection
+    Spruce_Log: MaterialCollection
+    Spruce_Planks: MaterialCollection
+    Spruce_Pressure_Plate: MaterialCollection
+    Spruce_Sapling: MaterialCollection
+    Spruce_Sign: MaterialCollection
+    Spruce_Slab: MaterialCollection
+    Spruce_Stairs: MaterialCollection
+    Spruce_Trapdoor: MaterialCollection
+    Spruce_Wall_Hanging_Sign: MaterialCollection
+    Spruce_Wall_Sign: MaterialCollection
+    Spruce_Wood: MaterialCollection
+    Sticky_Piston: MaterialCollection
+    Stone: MaterialCollection
+    Stone_Brick_Slab: MaterialCollection
+    Stone_Brick_Stairs: MaterialCollection
+    Stone_Brick_Wall: MaterialCollection
+    Stone_Bricks: MaterialCollection
+    Stone_Button: MaterialCollection
+    Stone_Pressure_Plate: MaterialCollection
+    Stone_Slab: MaterialCollection
+    Stone_Stairs: MaterialCollection
+    Stonecutter: MaterialCollection
+    Stripped_Acacia_Log: MaterialCollection
+    Stripped_Acacia_Wood: MaterialCollection
+    Stripped_Bamboo_Block: MaterialCollection
+    Stripped_Birch_Log: MaterialCollection
+    Stripped_Birch_Wood: MaterialCollection
+    Stripped_Cherry_Log: MaterialCollection
+    Stripped_Cherry_Wood: MaterialCollection
+    Stripped_Crimson_Hyphae: MaterialCollection
+    Stripped_Crimson_Stem: MaterialCollection
+    Stripped_Dark_Oak_Log: MaterialCollection
+    Stripped_Dark_Oak_Wood: MaterialCollection
+    Stripped_Jungle_Log: MaterialCollection
+    Stripped_Jungle_Wood: MaterialCollection
+    Stripped_Mangrove_Log: MaterialCollection
+    Stripped_Mangrove_Wood: MaterialCollection
+    Stripped_Oak_Log: MaterialCollection
+    Stripped_Oak_Wood: MaterialCollection
+    Stripped_Spruce_Log: MaterialCollection
+    Stripped_Spruce_Wood: MaterialCollection
+    Stripped_Warped_Hyphae: MaterialCollection
+    Stripped_Warped_Stem: MaterialCollection
+    Structure_Block: MaterialCollection
+    Structure_Void: MaterialCollection
+    Sugar_Cane: MaterialCollection
+    Sunflower: MaterialCollection
+    Suspicious_Sand: MaterialCollection
+    Sweet_Berry_Bush: MaterialCollection
+    Tall_Grass: MaterialCollection
+    Tall_Seagrass: MaterialCollection
+    Target: MaterialCollection
+    Terracotta: MaterialCollection
+    Tinted_Glass: MaterialCollection
+    Tnt: MaterialCollection
+    Torch: MaterialCollection
+    Torchflower: MaterialCollection
+    Torchflower_Crop: MaterialCollection
+    Trapped_Chest: MaterialCollection
+    Tripwire: MaterialCollection
+    Tripwire_Hook: MaterialCollection
+    Tube_Coral: MaterialCollection
+    Tube_Coral_Block: MaterialCollection
+    Tube_Coral_Fan: MaterialCollection
+    Tube_Coral_Wall_Fan: MaterialCollection
+    Tuff: MaterialCollection
+    Turtle_Egg: MaterialCollection
+    Twisting_Vines: MaterialCollection
+    Twisting_Vines_Plant: MaterialCollection
+    Verdant_Froglight: MaterialCollection
+    Vine: MaterialCollection
+    Void_Air: MaterialCollection
+    Wall_Torch: MaterialCollection
+    Warped_Button: MaterialCollection
+    Warped_Door: MaterialCollection
+    Warped_Fence: MaterialCollection
+    Warped_Fence_Gate: MaterialCollection
+    Warped_Fungus: MaterialCollection
+    Warped_Hanging_Sign: MaterialCollection
+    Warped_Hyphae: MaterialCollection
+    Warped_Nylium: MaterialCollection
+    Warped_Planks: MaterialCollection
+    Warped_Pressure_Plate: MaterialCollection
+    Warped_Roots: MaterialCollection
+    Warped_Sign: MaterialCollection
+    Warped_Slab: MaterialCollection
+    Warped_Stairs: MaterialCollection
+    Warped_Stem: MaterialCollection
+    Warped_Trapdoor: MaterialCollection
+    Warped_Wall_Hanging_Sign: MaterialCollection
+    Warped_Wall_Sign: MaterialCollection
+    Warped_Wart_Block: MaterialCollection
+    Water: MaterialCollection
+    Water_Cauldron: MaterialCollection
+    Waxed_Copper_Block: MaterialCollection
+    Waxed_Cut_Copper: MaterialCollection
+    Waxed_Cut_Copper_Slab: MaterialCollection
+    Waxed_Cut_Copper_Stairs: MaterialCollection
+    Waxed_Exposed_Copper: MaterialCollection
+    Waxed_Exposed_Cut_Copper: MaterialCollection
+    Waxed_Exposed_Cut_Copper_Slab: MaterialCollection
+    Waxed_Exposed_Cut_Copper_Stairs: MaterialCollection
+    Waxed_Oxidized_Copper: MaterialCollection
+    Waxed_Oxidized_Cut_Copper: MaterialCollection
+    Waxed_Oxidized_Cut_Copper_Slab: MaterialCollection
+    Waxed_Oxidized_Cut_Copper_Stairs: MaterialCollection
+    Waxed_Weathered_Copper: MaterialCollection
+    Waxed_Weathered_Cut_Copper: MaterialCollection
+    Waxed_Weathered_Cut_Copper_Slab: MaterialCollection
+    Waxed_Weathered_Cut_Copper_Stairs: MaterialCollection
+    Weathered_Copper: MaterialCollection
+    Weathered_Cut_Copper: MaterialCollection
+    Weathered_Cut_Copper_Slab: MaterialCollection
+    Weathered_Cut_Copper_Stairs: MaterialCollection
+    Weeping_Vines: MaterialCollection
+    Weeping_Vines_Plant: MaterialCollection
+    Wet_Sponge: MaterialCollection
+    Wheat: MaterialCollection
+    White_Banner: MaterialCollection
+    White_Bed: MaterialCollection
+    White_Candle: MaterialCollection
+    White_Candle_Cake: MaterialCollection
+    White_Carpet: MaterialCollection
+    White_Concrete: MaterialCollection
+    White_Concrete_Powder: MaterialCollection
+    White_Glazed_Terracotta: MaterialCollection
+    White_Shulker_Box: MaterialCollection
+    White_Stained_Glass: MaterialCollection
+    White_Stained_Glass_Pane: MaterialCollection
+    White_Terracotta: MaterialCollection
+    White_Tulip: MaterialCollection
+    White_Wool: MaterialCollection
+    Wither_Rose: MaterialCollection
+    Wither_Skeleton_Skull: MaterialCollection
+    Wither_Skeleton_Wall_Skull: MaterialCollection
+    Yellow_Banner: MaterialCollection
+    Yellow_Bed: MaterialCollection
+    Yellow_Candle: MaterialCollection
+    Yellow_Candle_Cake: MaterialCollection
+    Yellow_Carpet: MaterialCollection
+    Yellow_Concrete: MaterialCollection
+    Yellow_Concrete_Powder: MaterialCollection
+    Yellow_Glazed_Terracotta: MaterialCollection
+    Yellow_Shulker_Box: MaterialCollection
+    Yellow_Stained_Glass: MaterialCollection
+    Yellow_Stained_Glass_Pane: MaterialCollection
+    Yellow_Terracotta: MaterialCollection
+    Yellow_Wool: MaterialCollection
+    Zombie_Head: MaterialCollection
+    Zombie_Wall_Head: MaterialCollection
+    Acacia_Boat: MaterialCollection
+    Acacia_Chest_Boat: MaterialCollection
+    Allay_Spawn_Egg: MaterialCollection
+    Amethyst_Shard: MaterialCollection
+    Apple: MaterialCollection
+    Armor_Stand: MaterialCollection
+    Arrow: MaterialCollection
+    Axolotl_Bucket: MaterialCollection
+    Axolotl_Spawn_Egg: MaterialCollection
+    Baked_Potato: MaterialCollection
+    Bamboo_Chest_Raft: MaterialCollection
+    Bamboo_Raft: MaterialCollection
+    Bat_Spawn_Egg: MaterialCollection
+    Bee_Spawn_Egg: MaterialCollection
+    Beef: MaterialCollection
+    Beetroot: MaterialCollection
+    Beetroot_Seeds: MaterialCollection
+    Beetroot_Soup: MaterialCollection
+    Birch_Boat: MaterialCollection
+    Birch_Chest_Boat: MaterialCollection
+    Black_Dye: MaterialCollection
+    Blaze_Powder: MaterialCollection
+    Blaze_Rod: MaterialCollection
+    Blaze_Spawn_Egg: MaterialCollection
+    Blue_Dye: MaterialCollection
+    Bone: MaterialCollection
+    Bone_Meal: MaterialCollection
+    Book: MaterialCollection
+    Bow: MaterialCollection
+    Bowl: MaterialCollection
+    Bread: MaterialCollection
+    Brick: MaterialCollection
+    Brown_Dye: MaterialCollection
+    Brush: MaterialCollection
+    Bucket: MaterialCollection
+    Bundle: MaterialCollection
+    Camel_Spawn_Egg: MaterialCollection
+    Carrot: MaterialCollection
+    Carrot_On_A_Stick: MaterialCollection
+    Cat_Spawn_Egg: MaterialCollection
+    Cave_Spider_Spawn_Egg: MaterialCollection
+    Chainmail_Boots: MaterialCollection
+    Chainmail_Chestplate: MaterialCollection
+    Chainmail_Helmet: MaterialCollection
+    Chainmail_Leggings: MaterialCollection
+    Charcoal: MaterialCollection
+    Cherry_Boat: MaterialCollection
+    Cherry_Chest_Boat: MaterialCollection
+    Chest_Minecart: MaterialCollection
+    Chicken: MaterialCollection
+    Chicken_Spawn_Egg: MaterialCollection
+    Chorus_Fruit: MaterialCollection
+    Clay_Ball: MaterialCollection
+    Clock: MaterialCollection
+    Coal: MaterialCollection
+    Cocoa_Beans: MaterialCollection
+    Cod: MaterialCollection
+    Cod_Bucket: MaterialCollection
+    Cod_Spawn_Egg: MaterialCollection
+    Command_Block_Minecart: MaterialCollection
+    Compass: MaterialCollection
+    Cooked_Beef: MaterialCollection
+    Cooked_Chicken: MaterialCollection
+    Cooked_Cod: MaterialCollection
+    Cooked_Mutton: MaterialCollection
+    Cooked_Porkchop: MaterialCollection
+    Cooked_Rabbit: MaterialCollection
+    Cooked_Salmon: MaterialCollection
+    Cookie: MaterialCollection
+    Copper_Ingot: MaterialCollection
+    Cow_Spawn_Egg: MaterialCollection
+    Creeper_Banner_Pattern: MaterialCollection
+    Creeper_Spawn_Egg: MaterialCollection
+    Crossbow: MaterialCollection
+    Cyan_Dye: MaterialCollection
+    Dark_Oak_Boat: MaterialCollection
+    Dark_Oak_Chest_Boat: MaterialCollection
+    Debug_Stick: MaterialCollection
+    Diamond: MaterialCollection
+    Diamond_Axe: MaterialCollection
+    Diamond_Boots: MaterialCollection
+    Diamond_Chestplate: MaterialCollection
+    Diamond_Helmet: MaterialCollection
+    Diamond_Hoe: MaterialCollection
+    Diamond_Horse_Armor: MaterialCollection
+    Diamond_Leggings: MaterialCollection
+    Diamond_Pickaxe: MaterialCollection
+    Diamond_Shovel: MaterialCollection
+    Diamond_Sword: MaterialCollection
+    Disc_Fragment_5: MaterialCollection
+    Dolphin_Spawn_Egg: MaterialCollection
+    Donkey_Spawn_Egg: MaterialCollection
+    Dragon_Breath: MaterialCollection
+    Dried_Kelp: MaterialCollection
+    Drowned_Spawn_Egg: MaterialCollection
+    Echo_Shard: MaterialCollection
+    Egg: MaterialCollection
+    Elder_Guardian_Spawn_Egg: MaterialCollection
+    Elytra: MaterialCollection
+    Emerald: MaterialCollection
+    Enchanted_Book: MaterialCollection
+    Enchanted_Golden_Apple: MaterialCollection
+    End_Crystal: MaterialCollection
+    Ender_Dragon_Spawn_Egg: MaterialCollection
+    Ender_Eye: MaterialCollection
+    Ender_Pearl: MaterialCollection
+    Enderman_Spawn_Egg: MaterialCollection
+    Endermite_Spawn_Egg: MaterialCollection
+    Evoker_Spawn_Egg: MaterialCollection
+    Experience_Bottle: MaterialCollection
+    Feather: MaterialCollection
+    Fermented_Spider_Eye: MaterialCollection
+    Filled_Map: MaterialCollection
+    Fire_Charge: MaterialCollection
+    Firework_Rocket: MaterialCollection
+    Firework_Star: MaterialCollection
+    Fishing_Rod: MaterialCollection
+    Flint: MaterialCollection
+    Flint_And_Steel: MaterialCollection
+    Flower_Banner_Pattern: MaterialCollection
+    Fox_Spawn_Egg: MaterialCollection
+    Frog_Spawn_Egg: MaterialCollection
+    Furnace_Minecart: MaterialCollection
+    Ghast_Spawn_Egg: MaterialCollection
+    Ghast_Tear: MaterialCollection
+    Glass_Bottle: MaterialCollection
+    Glistering_Melon_Slice: MaterialCollection
+    Globe_Banner_Pattern: MaterialCollection
+    Glow_Berries: MaterialCollection
+    Glow_Ink_Sac: MaterialCollection
+    Glow_Item_Frame: MaterialCollection
+    Glow_Squid_Spawn_Egg: MaterialCollection
+    Glowstone_Dust: MaterialCollection
+    Goat_Horn: MaterialCollection
+    Goat_Spawn_Egg: MaterialCollection
+    Gold_Ingot: MaterialCollection
+    Gold_Nugget: MaterialCollection
+    Golden_Apple: MaterialCollection
+    Golden_Axe: MaterialCollection
+    Golden_Boots: MaterialCollection
+    Golden_Carrot: MaterialCollection
+    Golden_Chestplate: MaterialCollection
+    Golden_Helmet: MaterialCollection
+    Golden_Hoe: MaterialCollection
+    Golden_Horse_Armor: MaterialCollection
+    Golden_Leggings: MaterialCollection
+    Golden_Pickaxe: MaterialCollection
+    Golden_Shovel: MaterialCollection
+    Golden_Sword: MaterialCollection
+    Gray_Dye: MaterialCollection
+    Green_Dye: MaterialCollection
+    Guardian_Spawn_Egg: MaterialCollection
+    Gunpowder: MaterialCollection
+    Heart_Of_The_Sea: MaterialCollection
+    Hoglin_Spawn_Egg: MaterialCollection
+    Honey_Bottle: MaterialCollection
+    Honeycomb: MaterialCollection
+    Hopper_Minecart: MaterialCollection
+    Horse_Spawn_Egg: MaterialCollection
+    Husk_Spawn_Egg: MaterialCollection
+    Ink_Sac: MaterialCollection
+    Iron_Axe: MaterialCollection
+    Iron_Boots: MaterialCollection
+    Iron_Chestplate: MaterialCollection
+    Iron_Golem_Spawn_Egg: MaterialCollection
+    Iron_Helmet: MaterialCollection
+    Iron_Hoe: MaterialCollection
+    Iron_Horse_Armor: MaterialCollection
+    Iron_Ingot: MaterialCollection
+    Iron_Leggings: MaterialCollection
+    Iron_Nugget: MaterialCollection
+    Iron_Pickaxe: MaterialCollection
+    Iron_Shovel: MaterialCollection
+    Iron_Sword: MaterialCollection
+    Item_Frame: MaterialCollection
+    Jungle_Boat: MaterialCollection
+    Jungle_Chest_Boat: MaterialCollection
+    Knowledge_Book: MaterialCollection
+    Lapis_Lazuli: MaterialCollection
+    Lava_Bucket: MaterialCollection
+    Lead: MaterialCollection
+    Leather: MaterialCollection
+    Leather_Boots: MaterialCollection
+    Leather_Chestplate: MaterialCollection
+    Leather_Helmet: MaterialCollection
+    Leather_Horse_Armor: MaterialCollection
+    Leather_Leggings: MaterialCollection
+    Light_Blue_Dye: MaterialCollection
+    Light_Gray_Dye: MaterialCollection
+    Lime_Dye: MaterialCollection
+    Lingering_Potion: MaterialCollection
+    Llama_Spawn_Egg: MaterialCollection
+    Magenta_Dye: MaterialCollection
+    Magma_Cream: MaterialCollection
+    Magma_Cube_Spawn_Egg: MaterialCollection
+    Mangrove_Boat: MaterialCollection
+    Mangrove_Chest_Boat: MaterialCollection
+    Map: MaterialCollection
+    Melon_Seeds: MaterialCollection
+    Melon_Slice: MaterialCollection
+    Milk_Bucket: MaterialCollection
+    Minecart: MaterialCollection
+    Mojang_Banner_Pattern: MaterialCollection
+    Mooshroom_Spawn_Egg: MaterialCollection
+    Mule_Spawn_Egg: MaterialCollection
+    Mushroom_Stew: MaterialCollection
+    Music_Disc_11: MaterialCollection
+    Music_Disc_13: MaterialCollection
+    Music_Disc_5: MaterialCollection
+    Music_Disc_Blocks: MaterialCollection
+    Music_Disc_Cat: MaterialCollection
+    Music_Disc_Chirp: MaterialCollection
+    Music_Disc_Far: MaterialCollection
+    Music_Disc_Mall: MaterialCollection
+    Music_Disc_Mellohi: MaterialCollection
+    Music_Disc_Otherside: MaterialCollection
+    Music_Disc_Pigstep: MaterialCollection
+    Music_Disc_Stal: MaterialCollection
+    Music_Disc_Strad: MaterialCollection
+    Music_Disc_Wait: MaterialCollection
+    Music_Disc_Ward: MaterialCollection
+    Mutton: MaterialCollection
+    Name_Tag: MaterialCollection
+    Nautilus_Shell: MaterialCollection
+    Nether_Brick: MaterialCollection
+    Nether_Star: MaterialCollection
+    Netherite_Axe: MaterialCollection
+    Netherite_Boots: MaterialCollection
+    Netherite_Chestplate: MaterialCollection
+    Netherite_Helmet: MaterialCollection
+    Netherite_Hoe: MaterialCollection
+    Netherite_Ingot: MaterialCollection
+    Netherite_Leggings: MaterialCollection
+    Netherite_Pickaxe: MaterialCollection
+    Netherite_Scrap: MaterialCollection
+    Netherite_Shovel: MaterialCollection
+    Netherite_Sword: MaterialCollection
+    Oak_Boat: MaterialCollection
+    Oak_Chest_Boat: MaterialCollection
+    Ocelot_Spawn_Egg: MaterialCollection
+    Orange_Dye: MaterialCollection
+    Painting: MaterialCollection
+    Panda_Spawn_Egg: MaterialCollection
+    Paper: MaterialCollection
+    Parrot_Spawn_Egg: MaterialCollection
+    Phantom_Membrane: MaterialCollection
+    Phantom_Spawn_Egg: MaterialCollection
+    Pig_Spawn_Egg: MaterialCollection
+    Piglin_Banner_Pattern: MaterialCollection
+    Piglin_Brute_Spawn_Egg: MaterialCollection
+    Piglin_Spawn_Egg: MaterialCollection
+    Pillager_Spawn_Egg: MaterialCollection
+    Pink_Dye: MaterialCollection
+    Poisonous_Potato: MaterialCollection
+    Polar_Bear_Spawn_Egg: MaterialCollection
+    Popped_Chorus_Fruit: MaterialCollection
+    Porkchop: MaterialCollection
+    Potato: MaterialCollection
+    Potion: MaterialCollection
+    Powder_Snow_Bucket: MaterialCollection
+    Prismarine_Crystals: MaterialCollection
+    Prismarine_Shard: MaterialCollection
+    Pufferfish: MaterialCollection
+    Pufferfish_Bucket: MaterialCollection
+    Pufferfish_Spawn_Egg: MaterialCollection
+    Pumpkin_Pie: MaterialCollection
+    Pumpkin_Seeds: MaterialCollection
+    Purple_Dye: MaterialCollection
+    Quartz: MaterialCollection
+    Rabbit: MaterialCollection
+    Rabbit_Foot: MaterialCollection
+    Rabbit_Hide: MaterialCollection
+    Rabbit_Spawn_Egg: MaterialCollection
+    Rabbit_Stew: MaterialCollection
+    Ravager_Spawn_Egg: MaterialCollection
+    Raw_Copper: MaterialCollection
+    Raw_Gold: MaterialCollection
+    Raw_Iron: MaterialCollection
+    Recovery_Compass: MaterialCollection
+    Red_Dye: MaterialCollection
+    Redstone: MaterialCollection
+    Rotten_Flesh: MaterialCollection
+    Saddle: MaterialCollection
+    Salmon: MaterialCollection
+    Salmon_Bucket: MaterialCollection
+    Salmon_Spawn_Egg: MaterialCollection
+    Shears: MaterialCollection
+    Sheep_Spawn_Egg: MaterialCollection
+    Shield: MaterialCollection
+    Shulker_Shell: MaterialCollection
+    Shulker_Spawn_Egg: MaterialCollection
+    Silverfish_Spawn_Egg: MaterialCollection
+    Skeleton_Horse_Spawn_Egg: MaterialCollection
+    Skeleton_Spawn_Egg: MaterialCollection
+    Skull_Banner_Pattern: MaterialCollection
+    Slime_Ball: MaterialCollection
+    Slime_Spawn_Egg: MaterialCollection
+    Sniffer_Spawn_Egg: MaterialCollection
+    Snow_Golem_Spawn_Egg: MaterialCollection
+    Snowball: MaterialCollection
+    Spectral_Arrow: MaterialCollection
+    Spider_Eye: MaterialCollection
+    Spider_Spawn_Egg: MaterialCollection
+    Splash_Potion: MaterialCollection
+    Spruce_Boat: MaterialCollection
+    Spruce_Chest_Boat: MaterialCollection
+    Spyglass: MaterialCollection
+    Squid_Spawn_Egg: MaterialCollection
+    Stick: MaterialCollection
+    Stone_Axe: MaterialCollection
+    Stone_Hoe: MaterialCollection
+    Stone_Pickaxe: MaterialCollection
+    Stone_Shovel: MaterialCollection
+    Stone_Sword: MaterialCollection
+    Stray_Spawn_Egg: MaterialCollection
+    Strider_Spawn_Egg: MaterialCollection
+    String: MaterialCollection
+    Sugar: MaterialCollection
+    Suspicious_Stew: MaterialCollection
+    Sweet_Berries: MaterialCollection
+    Tadpole_Bucket: MaterialCollection
+    Tadpole_Spawn_Egg: MaterialCollection
+    Tipped_Arrow: MaterialCollection
+    Tnt_Minecart: MaterialCollection
+    Torchflower_Seeds: MaterialCollection
+    Totem_Of_Undying: MaterialCollection
+    Trader_Llama_Spawn_Egg: MaterialCollection
+    Trident: MaterialCollection
+    Tropical_Fish: MaterialCollection
+    Tropical_Fish_Bucket: MaterialCollection
+    Tropical_Fish_Spawn_Egg: MaterialCollection
+    Turtle_Helmet: MaterialCollection
+    Turtle_Spawn_Egg: MaterialCollection
+    Vex_Spawn_Egg: MaterialCollection
+    Villager_Spawn_Egg: MaterialCollection
+    Vindicator_Spawn_Egg: MaterialCollection
+    Wandering_Trader_Spawn_Egg: MaterialCollection
+    Warden_Spawn_Egg: MaterialCollection
+    Warped_Fungus_On_A_Stick: MaterialCollection
+    Water_Bucket: MaterialCollection
+    Wheat_Seeds: MaterialCollection
+    White_Dye: MaterialCollection
+    Witch_Spawn_Egg: MaterialCollection
+    Wither_Skeleton_Spawn_Egg: MaterialCollection
+    Wither_Spawn_Egg: MaterialCollection
+    Wolf_Spawn_Egg: MaterialCollection
+    Wooden_Axe: MaterialCollection
+    Wooden_Hoe: MaterialCollection
+    Wooden_Pickaxe: MaterialCollection
+    Wooden_Shovel: MaterialCollection
+    Wooden_Sword: MaterialCollection
+    Writable_Book: MaterialCollection
+    Written_Book: MaterialCollection
+    Yellow_Dye: MaterialCollection
+    Zoglin_Spawn_Egg: MaterialCollection
+    Zombie_Horse_Spawn_Egg: MaterialCollection
+    Zombie_Spawn_Egg: MaterialCollection
+    Zombie_Villager_Spawn_Egg: MaterialCollection
+    Zombified_Piglin_Spawn_Egg: MaterialCollection
+
+def material_from_ordinal(ordinal: int) -> MaterialCollection: ...
@@ -0,0 +1,95 @@
+"""
+Properties of the materials: solid, liquid, transparent, falls down, emits light and the average color.
+All functions take a MaterialCollection (or MaterialSammlung), e.g. is_solid(get_block(x, y, z).type)
+A block the library doesn't know has the type None, for it all properties are False (light_level() 0).
+
+The properties are stored in tables indexed by the ordinal of the material (see to_ordinal()).
+To check whole regions at once, numpy_tables() returns them as NumPy arrays (pip install numpy),
+e.g. with the ordinals of a region in an array: numpy_tables()["solid"][ordinals] is a mask of the solid blocks.
+"""
+
+from typing import Any
+
+from st_minecraft.core import material_table as _table
+from st_minecraft.en.material import MaterialCollection
+
+
+def is_block(material: MaterialCollection | None) -> bool:
+    """True if the material can be placed as block, False for items like MaterialCollection.Diamond_Sword"""
+    return bool(_flags(material) & _table.BLOCK)
+
+
+def is_solid(material: MaterialCollection | None) -> bool:
+    """True if players and entities can't move through the block (e.g. stone, glass, leaves but not air, water, grass)"""
+    return bool(_flags(material) & _table.SOLID)
+
+
+def is_liquid(material: MaterialCollection | None) -> bool:
+    """True for water and lava"""
+    return bool(_flags(material) & _table.LIQUID)
+
+
+def is_transparent(material: MaterialCollection | None) -> bool:
+    """True if light shines through the block (e.g. air, glass, leaves)"""
+    return bool(_flags(material) & _table.TRANSPARENT)
+
+
+def has_gravity(material: MaterialCollection | None) -> bool:
+    """True if the block falls down when there is nothing below it (e.g. sand, gravel, anvil)"""
+    return bool(_flags(material) & _table.GRAVITY)
+
+
+def emits_light(material: MaterialCollection | None) -> bool:
+    """True if the block is a light source (e.g. torch, glowstone, lava)"""
+    return bool(_flags(material) & _table.LIGHT_EMITTING)
+
+
+def light_level(material: MaterialCollection | None) -> int:
+    """
+    How bright the light of the block is
+    Returns:
+        The light level from 0 (no light) to 15 (e.g. glowstone)
+    """
+    if material is None:
+        return 0
+    return _table.LIGHT[material.ordinal]
+
+
+def average_color(material: MaterialCollection | None) -> tuple[int, int, int] | None:
+    """
+    The average color of the texture, approximated per kind of material, useful for pixel art
+    Returns:
+        (red, green, blue), each from 0 to 255, None for an unknown block (None)
+    """
+    if material is None:
+        return None
+    start = 3 * material.ordinal
+    return tuple(_table.COLORS[start : start + 3])
+
+
+def _flags(material: MaterialCollection | None) -> int:
+    # needed internally
+    return 0 if material is None else _table.FLAGS[material.ordinal]
+
+
+def numpy_tables() -> dict[str, Any]:
+    """
+    All properties as NumPy arrays, indexed by ordinal. NumPy must be installed (pip install numpy).
+    Returns:
+        A dict with the arrays "block", "solid", "liquid", "transparent", "gravity", "light_emitting" (bool),
+        "light" (uint8, light level) and "color" (uint8, one row (red, green, blue) per material)
+    """
+    # imported here, NumPy is only needed for this function
+    import numpy
+
+    flags = numpy.frombuffer(_table.FLAGS, dtype=numpy.uint8)
+    return {
+        "block": flags & _table.BLOCK != 0,
+        "solid": flags & _table.SOLID != 0,
+        "liquid": flags & _table.LIQUID != 0,
+        "transparent": flags & _table.TRANSPARENT != 0,
+        "gravity": flags & _table.GRAVITY != 0,
+        "light_emitting": flags & _table.LIGHT_EMITTING != 0,
+        "light": numpy.frombuffer(_table.LIGHT, dtype=numpy.uint8),
+        "color": numpy.frombuffer(_table.COLORS, dtype=numpy.uint8).reshape(-1, 3),
+    }
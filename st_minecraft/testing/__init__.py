@@ -0,0 +1,5 @@
+from st_minecraft.testing.mock_server import MockEntity  # noqa: unused-import
+from st_minecraft.testing.mock_server import MockPlayer  # noqa: unused-import
+from st_minecraft.testing.mock_server import MockServer  # noqa: unused-import
+from st_minecraft.testing.mock_server import MockWorld  # noqa: unused-import
+from st_minecraft.testing.shaping import ShapingProxy  # noqa: unused-import
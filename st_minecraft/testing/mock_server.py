@@ -0,0 +1,444 @@
+"""
+A stand-in for the Minecraft server with the plugin, that runs in the same process.
+
+It speaks the same text protocol as the plugin, but the world only exists in memory:
+blocks, players, entities, inventories, the chat and boss bars.
+Use it to try out programs, to benchmark the library or to test it without a Paper server.
+
+Example:
+    with MockServer() as server:
+        connect("127.0.0.1", server.port)
+        set_block(0, 70, 0, MaterialCollection.Stone)
+        # set_block() doesn't wait for the server, a query does (the server handles commands in order)
+        assert get_block(0, 70, 0).type == MaterialCollection.Stone
+        assert server.world.get_block(0, 70, 0) == "STONE"
+"""
+
+import itertools
+import socket
+import socketserver
+import threading
+import uuid
+from dataclasses import dataclass
+from dataclasses import field
+
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import QUERY_COMMANDS
+from st_minecraft.core.core import REQUEST_ID_MARKER
+from st_minecraft.en.entity import EntityCollection
+from st_minecraft.en.material import MaterialCollection
+
+_MATERIAL_IDS = frozenset(m.value for m in MaterialCollection)
+_ENTITY_IDS = frozenset(e.value for e in EntityCollection)
+
+_SEPARATOR_BYTES = ARG_SEPARATOR.encode("utf-8")
+
+
+class MockWorld:
+    """
+    The blocks of the stand-in server, every dimension is a dict from (x, y, z) to the minecraft ID of the block.
+    Blocks that were never set are generated: stone below ground_level, air from there on.
+    """
+
+    def __init__(self, ground_level: int = 64):
+        self.ground_level = ground_level
+        """ Blocks below this height are stone, unless they were changed """
+        self.blocks: dict[str, dict[tuple[int, int, int], str]] = {}
+        """ Blocks that were set, per dimension """
+
+    def get_block(self, x: int, y: int, z: int, dimension: str = "world") -> str:
+        """Returns the minecraft ID of the block, e.g. 'STONE'"""
+        block = self.blocks.get(dimension, {}).get((x, y, z))
+        if block is not None:
+            return block
+        return "STONE" if y < self.ground_level else "AIR"
+
+    def set_block(self, x: int, y: int, z: int, block: str, dimension: str = "world") -> None:
+        """Sets the block with the minecraft ID, e.g. 'STONE'"""
+        self.blocks.setdefault(dimension, {})[(x, y, z)] = block
+
+
+@dataclass
+class MockPlayer:
+    """A player that is 'online' on the stand-in server"""
+
+    id: int
+    name: str
+    x: int = 0
+    y: int = 64
+    z: int = 0
+    dimension: str = "world"
+    rotation: int = 0
+    looking_at: str = "STONE"
+    sneaked: bool = False
+    max_health: float = 20.0
+    health: float = 20.0
+    hunger: float = 20.0
+    saturation: float = 5.0
+    xp_level: float = 0.0
+    xp_progress: float = 0.0
+    inventory: dict[int, tuple[str, str, int]] = field(default_factory=dict)
+    """ slot -> (minecraft ID, display name, amount) """
+
+    def to_api_format(self) -> str:
+        return ARG_SEPARATOR.join(
+            str(v)
+            for v in (
+                self.id,
+                self.name,
+                self.x,
+                self.y,
+                self.z,
+                self.dimension,
+                self.rotation,
+                self.looking_at,
+                str(self.sneaked).lower(),
+                self.max_health,
+                self.health,
+                self.hunger,
+                self.saturation,
+                self.xp_level,
+                self.xp_progress,
+            )
+        )
+
+    def inventory_to_api_format(self) -> str:
+        return ARG_SEPARATOR.join(
+            f"{slot}:{item};{name}:{amount}" for slot, (item, name, amount) in sorted(self.inventory.items())
+        )
+
+
+@dataclass
+class MockEntity:
+    """An entity that was spawned on the stand-in server"""
+
+    id: str
+    type: str
+    x: float
+    y: float
+    z: float
+    dimension: str = "world"
+    name: str | None = None
+    health: float = 20.0
+    ai: bool = True
+
+    def to_api_format(self) -> str:
+        return ARG_SEPARATOR.join(
+            str(v)
+            for v in (
+                self.id,
+                self.type,
+                "null" if self.name is None else self.name,
+                float(self.x),
+                float(self.y),
+                float(self.z),
+                self.dimension,
+                float(self.health),
+                str(self.ai).lower(),
+            )
+        )
+
+
+class MockServer:
+    """
+    TCP server that answers like the plugin, every connection is handled by its own thread.
+    Request IDs (see st_minecraft.core.REQUEST_ID_MARKER) are supported: tagged queries get tagged replies.
+
+    The state is public, so tests can prepare and check it:
+    world, players, entities, boss_bars, chat (messages players "wrote", returned by pollChat),
+    posted_chat (messages sent with postChat), titles, commands and errors.
+
+    Commands the server can't execute are noted in errors. A query among them is answered with
+    "error invalid_arguments", so the client doesn't wait for a reply until its timeout. All other commands
+    (unknown ones included) get no reply, like from the plugin: the client doesn't read one for them.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, players: int = 1, ground_level: int = 64):
+        """
+        Args:
+            host (str): Address to listen on
+            port (int): Port to listen on, 0 picks a free one (see self.port after start())
+            players (int): How many players are online, they are called player0, player1, ...
+            ground_level (int): Blocks below this height are stone
+        """
+        self.host = host
+        self.port = port
+        self.world = MockWorld(ground_level)
+        self.players: list[MockPlayer] = [MockPlayer(id=i, name=f"player{i}") for i in range(players)]
+        self.entities: dict[str, MockEntity] = {}
+        self.boss_bars: dict[str, dict[str, str]] = {}
+        self.chat: list[tuple[str, str]] = []
+        """ (sender name, text) of messages that players wrote, pollChat returns and empties it """
+        self.posted_chat: list[str] = []
+        self.titles: list[tuple[str, ...]] = []
+        self.commands: list[str] = []
+        self.errors: list[str] = []
+        """ commands the server couldn't execute, with the reason """
+        self.lock = threading.RLock()
+        """ held while a command changes or reads the state, hold it as well when you change the state from outside """
+        self._server: socketserver.ThreadingTCPServer | None = None
+        self._thread: threading.Thread | None = None
+        self._handlers = {
+            "setBlock": self._set_block,
+            "getBlock": self._get_block,
+            "getPlayer": self._get_player,
+            "getPlayerByName": self._get_player_by_name,
+            "setPlayerPos": self._set_player_pos,
+            "setPlayerVelocity": self._set_player_velocity,
+            "setPlayerStat": self._set_player_stat,
+            "getInv": self._get_inventory,
+            "addInv": self._add_inventory,
+            "postChat": self._post_chat,
+            "pollChat": self._poll_chat,
+            "showTitle": self._show_title,
+            "chatCommand": self._chat_command,
+            "spawnEntity": self._spawn_entity,
+            "getEntity": self._get_entity,
+            "editEntity": self._edit_entity,
+            "spawnBossBar": self._spawn_boss_bar,
+            "editBossBar": self._edit_boss_bar,
+            "deleteBossBar": self._delete_boss_bar,
+            "validate": self._validate,
+        }
+
+    def start(self) -> "MockServer":
+        """Starts listening in a background thread, returns the server itself"""
+        server = socketserver.ThreadingTCPServer((self.host, self.port), self._make_handler(), bind_and_activate=False)
+        server.daemon_threads = True
+        server.allow_reuse_address = True
+        server.server_bind()
+        server.server_activate()
+
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, name="st_minecraft-mock-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops listening, open connections end once their client closes them"""
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, command: str) -> str | None:
+        """Executes one command (without the trailing newline) and returns the reply, None if there is none"""
+        request_id = None
+        if command.startswith(REQUEST_ID_MARKER):
+            request_id, _, command = command.partition(ARG_SEPARATOR)
+
+        name, *args = command.split(ARG_SEPARATOR)
+        handler = self._handlers.get(name)
+        try:
+            if handler is None:
+                raise ValueError(f"unknown command {name!r}")
+            with self.lock:
+                reply = handler(*args)
+        except Exception as e:
+            with self.lock:
+                self.errors.append(f"{command}: {e}")
+            # the client doesn't read replies to commands that aren't queries,
+            # one would be taken as the reply to its next query
+            if name not in QUERY_COMMANDS:
+                return None
+            reply = "error invalid_arguments"
+
+        if reply is None or request_id is None:
+            return reply
+        return f"{request_id}{ARG_SEPARATOR}{reply}"
+
+    def _make_handler(self) -> type[socketserver.BaseRequestHandler]:
+        # needed internally
+        mock_server = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                sock: socket.socket = self.request
+                # like the client: tiny replies shouldn't wait for ACKs
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                mock_server._serve(sock)
+
+        return _Handler
+
+    def _serve(self, sock: socket.socket) -> None:
+        # needed internally
+        pending = b""
+        while True:
+            try:
+                data = sock.recv(64 * 1024)
+            except OSError:
+                return
+            if not data:
+                return
+
+            *lines, pending = (pending + data).split(b"\n")
+
+            # everything the client sent at once is answered at once
+            replies = []
+            for line in lines:
+                reply = self.handle(line.decode("utf-8"))
+                if reply is not None:
+                    replies.append(f"{reply}\n")
+
+            if replies:
+                try:
+                    sock.sendall("".join(replies).encode("utf-8"))
+                except OSError:
+                    return
+
+    def _find_player(self, player_id: str) -> MockPlayer | None:
+        # needed internally
+        index = int(player_id)
+        if 0 <= index < len(self.players):
+            return self.players[index]
+        return None
+
+    def _set_block(self, x: str, y: str, z: str, dimension: str, block: str) -> None:
+        self.world.set_block(int(x), int(y), int(z), block, dimension)
+
+    def _get_block(self, x: str, y: str, z: str, dimension: str) -> str:
+        return self.world.get_block(int(x), int(y), int(z), dimension)
+
+    def _get_player(self, index: str) -> str:
+        player = self._find_player(index)
+        if player is None:
+            return "error invalid_index"
+        return player.to_api_format()
+
+    def _get_player_by_name(self, name: str) -> str:
+        for player in self.players:
+            if player.name == name:
+                return player.to_api_format()
+        return "error invalid_index"
+
+    def _set_player_pos(self, player_id: str, x: str, y: str, z: str, dimension: str, *options: str) -> None:
+        player = self._find_player(player_id)
+        if player is None:
+            return
+
+        player.x, player.y, player.z, player.dimension = int(x), int(y), int(z), dimension
+        for option in options:
+            key, _, value = option.partition(":")
+            if key == "rotation":
+                player.rotation = int(value)
+
+    def _set_player_velocity(self, direction: str, player_id: str, value: str) -> None:
+        # there is no physics in the mock, the velocity doesn't change anything we could query
+        pass
+
+    def _set_player_stat(self, stat: str, player_id: str, value: str) -> None:
+        player = self._find_player(player_id)
+        if player is None:
+            return
+
+        attribute = {
+            "MAX_HEALTH": "max_health",
+            "HEALTH": "health",
+            "FOOD_LEVEL": "hunger",
+            "SATURATION": "saturation",
+            "XP_LEVEL": "xp_level",
+            "XP_PROGRESS": "xp_progress",
+        }.get(stat)
+        if attribute is not None:
+            setattr(player, attribute, float(value))
+        if stat == "HEALTH":
+            player.health = min(player.health, player.max_health)
+
+    def _get_inventory(self, player_id: str) -> str:
+        player = self._find_player(player_id)
+        if player is None:
+            return ""
+        return player.inventory_to_api_format()
+
+    def _add_inventory(self, player_id: str, item: str, amount: str, *options: str) -> None:
+        player = self._find_player(player_id)
+        if player is None:
+            return
+
+        name = ""
+        slot = None
+        for option in options:
+            key, _, value = option.partition(":")
+            if key == "name":
+                name = value
+            elif key == "slot":
+                slot = int(value)
+
+        if slot is None:
+            # like minecraft: stack onto the same item, otherwise the first free slot
+            slot = next(
+                (s for s, (i, n, _) in sorted(player.inventory.items()) if i == item and n == name),
+                next(s for s in itertools.count() if s not in player.inventory),
+            )
+
+        _, _, current = player.inventory.get(slot, (item, name, 0))
+        player.inventory[slot] = (item, name, current + int(amount))
+
+    def _post_chat(self, message: str) -> None:
+        self.posted_chat.append(message)
+
+    def _poll_chat(self) -> str:
+        messages, self.chat = self.chat, []
+        return ARG_SEPARATOR.join(f"{sender}:{text}" for sender, text in messages)
+
+    def _show_title(self, *args: str) -> None:
+        self.titles.append(args)
+
+    def _chat_command(self, command: str) -> None:
+        self.commands.append(command)
+
+    def _spawn_entity(self, x: str, y: str, z: str, dimension: str, entity_type: str) -> str:
+        entity = MockEntity(id=str(uuid.uuid4()), type=entity_type, x=int(x), y=int(y), z=int(z), dimension=dimension)
+        self.entities[entity.id] = entity
+        return entity.to_api_format()
+
+    def _get_entity(self, entity_id: str) -> str:
+        entity = self.entities.get(entity_id)
+        if entity is None:
+            return "error invalid_id"
+        return entity.to_api_format()
+
+    def _edit_entity(self, entity_id: str, change: str) -> None:
+        entity = self.entities.get(entity_id)
+        if entity is None:
+            return
+
+        key, _, value = change.partition(":")
+        if key == "name":
+            entity.name = value
+        elif key == "position":
+            x, y, z, dimension = value.split(";")
+            entity.x, entity.y, entity.z, entity.dimension = float(x), float(y), float(z), dimension
+        elif key == "ai":
+            entity.ai = value == "True"
+        elif key == "health":
+            entity.health = float(value)
+
+    def _spawn_boss_bar(self, name: str, text: str) -> None:
+        self.boss_bars[name] = {"text": text, "value": "0.0", "style": "SOLID", "color": "PURPLE"}
+
+    def _edit_boss_bar(self, sub_command: str, name: str, change: str) -> None:
+        boss_bar = self.boss_bars.get(name)
+        if boss_bar is None:
+            return
+
+        key, _, value = change.partition(":")
+        boss_bar[key] = value
+
+    def _delete_boss_bar(self, name: str) -> None:
+        self.boss_bars.pop(name, None)
+
+    def _validate(self, id_type: str, minecraft_id: str) -> str:
+        known = _MATERIAL_IDS if id_type == "MATERIAL" else _ENTITY_IDS
+        return "Yes" if minecraft_id in known else "No"
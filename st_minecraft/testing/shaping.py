@@ -0,0 +1,174 @@
+"""
+A TCP proxy that makes a local connection behave like a slow network.
+
+On localhost a round trip takes microseconds, so a program that is fast there can still be slow over Wi-Fi.
+Put the proxy between the library and the (mock) server to add delay, jitter, a bandwidth cap
+and to split the data into small segments, like a real network would.
+
+Example:
+    with MockServer() as server, ShapingProxy(server.port, delay=0.005, jitter=0.002) as proxy:
+        connect("127.0.0.1", proxy.port)
+"""
+
+import queue
+import random
+import socket
+import threading
+import time
+
+
+class ShapingProxy:
+    """
+    Forwards every connection to host:target_port and shapes the data in both directions.
+
+    Everything read from one side is split into segments of at most max_segment bytes.
+    Every segment arrives delay (+- jitter) seconds after it was read, the order is kept.
+    With a bandwidth cap a segment of n bytes additionally occupies the link for n / bandwidth seconds.
+    """
+
+    def __init__(
+        self,
+        target_port: int,
+        *,
+        host: str = "127.0.0.1",
+        delay: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: float | None = None,
+        max_segment: int | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            target_port (int): Port of the server the proxy forwards to
+            host (str): Address of the server, the proxy listens on the same address
+            delay (float): Seconds every segment is held back, in each direction (half the added round trip time)
+            jitter (float): Up to this many seconds are randomly added to or removed from the delay
+            bandwidth (float): Bytes per second per direction, None for no cap
+            max_segment (int): Largest segment in bytes, None to forward what was read as is
+            seed (int): Seed for the jitter, so runs can be repeated
+        """
+        if delay < 0 or jitter < 0:
+            raise ValueError(f"Delay and jitter can't be negative. You said delay={delay}, jitter={jitter}.")
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError(f"The bandwidth has to be positive. You said '{bandwidth}'.")
+        if max_segment is not None and max_segment < 1:
+            raise ValueError(f"A segment needs at least one byte. You said '{max_segment}'.")
+
+        self.host = host
+        self.target_port = target_port
+        self.port = 0
+        """ Port the proxy listens on, connect to this one, known after start() """
+        self.delay = delay
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.max_segment = max_segment
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._listener: socket.socket | None = None
+        self._sockets: list[socket.socket] = []
+        self._closed = threading.Event()
+
+    def start(self) -> "ShapingProxy":
+        """Starts listening in a background thread, returns the proxy itself"""
+        self._closed.clear()
+        self._listener = socket.create_server((self.host, 0))
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._accept, name="st_minecraft-shaping-proxy", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stops listening and closes all connections"""
+        self._closed.set()
+        for sock in [self._listener, *self._sockets]:
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        self._listener = None
+        self._sockets = []
+
+    def __enter__(self) -> "ShapingProxy":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _accept(self) -> None:
+        # needed internally
+        while not self._closed.is_set():
+            try:
+                client, _ = self._listener.accept()
+                server = socket.create_connection((self.host, self.target_port))
+            except OSError:
+                return
+
+            for sock in (client, server):
+                # the proxy decides how the data is split, not Nagle's algorithm
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._sockets.append(sock)
+
+            self._forward(client, server)
+            self._forward(server, client)
+
+    def _forward(self, source: socket.socket, destination: socket.socket) -> None:
+        # needed internally
+        # one thread reads and timestamps, the other one waits and sends. this way reading isn't held up by the delay
+        segments: queue.SimpleQueue[tuple[float, bytes] | None] = queue.SimpleQueue()
+        threading.Thread(target=self._read, args=(source, segments), daemon=True).start()
+        threading.Thread(target=self._send, args=(destination, segments), daemon=True).start()
+
+    def _read(self, source: socket.socket, segments: queue.SimpleQueue) -> None:
+        # needed internally
+        last_due = 0.0
+        while True:
+            try:
+                data = source.recv(64 * 1024)
+            except OSError:
+                data = b""
+            if not data:
+                segments.put(None)
+                return
+
+            size = self.max_segment or len(data)
+            for start in range(0, len(data), size):
+                # with jitter a later segment could overtake an earlier one, TCP doesn't allow that
+                last_due = max(last_due, time.monotonic() + self._next_delay())
+                segments.put((last_due, data[start : start + size]))
+
+    def _send(self, destination: socket.socket, segments: queue.SimpleQueue) -> None:
+        # needed internally
+        link_free = 0.0
+        while True:
+            segment = segments.get()
+            if segment is None:
+                # the other side closed, pass it on
+                try:
+                    destination.shutdown(socket.SHUT_WR)
+                except OSError:
+                    pass
+                return
+
+            due, data = segment
+            if self.bandwidth is not None:
+                # the segment can only start once the previous one is through
+                due = max(due, link_free) + len(data) / self.bandwidth
+                link_free = due
+
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            try:
+                destination.sendall(data)
+            except OSError:
+                return
+
+    def _next_delay(self) -> float:
+        # needed internally
+        if not self.jitter:
+            return self.delay
+        with self._random_lock:
+            return max(0.0, self.delay + self._random.uniform(-self.jitter, self.jitter))
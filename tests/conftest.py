@@ -0,0 +1,17 @@
+import pytest
+
+from st_minecraft.core import Session
+from st_minecraft.testing import MockServer
+
+
+@pytest.fixture
+def server():
+    with MockServer(players=2) as server:
+        yield server
+
+
+@pytest.fixture
+def session(server):
+    session = Session().connect("127.0.0.1", server.port)
+    yield session
+    session.close()
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+import st_minecraft.aio as aio
+import st_minecraft.aio.core as aio_core
+from st_minecraft.core import NoDataError
+from st_minecraft.core import TimeoutPolicy
+from st_minecraft.testing import ShapingProxy
+
+
+def run(coroutine):
+    try:
+        return asyncio.run(coroutine)
+    finally:
+        # the connection belongs to the event loop that is gone now
+        aio_core._connection = None
+
+
+def test_blocks_and_players(server):
+    async def main():
+        await aio.connect("127.0.0.1", server.port)
+        await aio.set_block(3, 100, 3, aio.MaterialCollection.Glass)
+        block = await aio.get_block(3, 100, 3)
+        players = [await aio.get_player_by_index(1), await aio.get_player_by_name("player0")]
+        await aio.close()
+        return block, players
+
+    block, players = run(main())
+
+    assert block.type == aio.MaterialCollection.Glass
+    assert [player.name for player in players] == ["player1", "player0"]
+    assert aio_core._connection is None
+
+
+def test_concurrent_tasks_get_their_own_replies(server):
+    for x in range(20):
+        server.world.set_block(x, 100, 0, "GLASS" if x % 2 else "STONE")
+
+    async def main():
+        # small segments and a delay, so the tasks really wait for their replies at the same time
+        with ShapingProxy(server.port, delay=0.002, max_segment=3) as proxy:
+            await aio.connect("127.0.0.1", proxy.port)
+            blocks = await asyncio.gather(*(aio.get_block(x, 100, 0) for x in range(20)))
+            await aio.close()
+        return blocks
+
+    blocks = run(main())
+
+    assert [block.x for block in blocks] == list(range(20))
+    assert [block.type.name for block in blocks] == ["Stone", "Glass"] * 10
+
+
+def test_a_timeout_closes_the_connection(server):
+    async def main():
+        with ShapingProxy(server.port, delay=0.3) as proxy:
+            await aio.connect("127.0.0.1", proxy.port, TimeoutPolicy(0.05))
+            with pytest.raises(NoDataError, match="connect again"):
+                await aio.get_block(0, 0, 0)
+            assert aio_core._connection is None
+            # the late reply can't be taken for the reply of the next query
+            with pytest.raises(RuntimeError, match="connect first"):
+                await aio.get_block(0, 0, 0)
+
+    run(main())
+
+
+def test_set_block_checks_the_block_type(server):
+    async def main():
+        await aio.connect("127.0.0.1", server.port)
+        with pytest.raises(TypeError, match="MaterialCollection"):
+            await aio.set_block(0, 100, 0, "STONE")
+        block = await aio.get_block(0, 100, 0)
+        await aio.close()
+        return block
+
+    assert run(main()).type == aio.MaterialCollection.Air
+    assert server.errors == []
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+from st_minecraft.core import Session
+from st_minecraft.core import drain
+from st_minecraft.core import flush
+from st_minecraft.core import start_background_writer
+from st_minecraft.core import stop_background_writer
+from st_minecraft.core.core import _BackgroundWriter
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import set_block
+from st_minecraft.en.material import MaterialCollection
+
+
+class SlowWrites:
+    """write_commands for a _BackgroundWriter that only writes while it is allowed to"""
+
+    def __init__(self):
+        self.written: list[str] = []
+        self.allowed = threading.Event()
+        self.error: Exception | None = None
+
+    def __call__(self, commands: list[str]) -> int:
+        self.allowed.wait()
+        if self.error is not None:
+            raise self.error
+        self.written.extend(commands)
+        return len(commands)
+
+
+@pytest.fixture
+def writes():
+    writes = SlowWrites()
+    yield writes
+    writes.allowed.set()
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_queries_see_the_queued_commands(server):
+    with Session(background_writes=True).connect("127.0.0.1", server.port) as session:
+        for x in range(200):
+            set_block(x, 100, 0, MaterialCollection.Glass, session=session)
+
+        assert get_block(199, 100, 0, session=session).type == MaterialCollection.Glass
+    assert all(server.world.get_block(x, 100, 0) == "GLASS" for x in range(200))
+
+
+def test_close_sends_what_is_queued(server):
+    session = Session(background_writes=True).connect("127.0.0.1", server.port)
+    for x in range(200):
+        set_block(x, 100, 0, MaterialCollection.Glass, session=session)
+    session.close()
+
+    wait_until(lambda: server.world.get_block(199, 100, 0) == "GLASS")
+
+
+def test_switch_on_and_off(server, session):
+    start_background_writer(max_queued=4, session=session)
+    assert session.background_writes
+    for x in range(20):
+        set_block(x, 100, 0, MaterialCollection.Stone, session=session)
+        drain(session)
+    flush(session)
+    stop_background_writer(session)
+
+    assert not session.background_writes
+    assert session._background_writer is None
+    assert get_block(19, 100, 0, session=session).type == MaterialCollection.Stone
+
+
+def test_flush_waits_for_the_writes(writes):
+    writer = _BackgroundWriter(writes, max_queued=10)
+    for i in range(5):
+        writer.put(str(i))
+
+    flushed = threading.Event()
+    threading.Thread(target=lambda: (writer.flush(), flushed.set()), daemon=True).start()
+    assert not flushed.wait(0.1)
+
+    writes.allowed.set()
+    assert flushed.wait(1.0)
+    assert writes.written == ["0", "1", "2", "3", "4"]
+    writer.close()
+
+
+def test_put_waits_while_the_queue_is_full(writes):
+    writer = _BackgroundWriter(writes, max_queued=2)
+    # the thread takes the first command and waits, two more fill the queue
+    writer.put("0")
+    wait_until(lambda: writer._in_flight == 1)
+    writer.put("1")
+    writer.put("2")
+
+    third = threading.Thread(target=writer.put, args=("3",), daemon=True)
+    third.start()
+    third.join(0.1)
+    assert third.is_alive()
+
+    writes.allowed.set()
+    third.join(1.0)
+    assert not third.is_alive()
+    writer.close()
+    assert writes.written == ["0", "1", "2", "3"]
+
+
+def test_drain_waits_until_half_the_queue_is_left(writes):
+    writer = _BackgroundWriter(writes, max_queued=4)
+    writer.put("0")
+    wait_until(lambda: writer._in_flight == 1)
+    for i in range(1, 4):
+        writer.put(str(i))
+
+    drained = threading.Event()
+    threading.Thread(target=lambda: (writer.drain(), drained.set()), daemon=True).start()
+    assert not drained.wait(0.1)
+
+    writes.allowed.set()
+    assert drained.wait(1.0)
+    writer.close()
+
+
+def test_a_failed_write_is_raised_on_the_next_call(writes):
+    writer = _BackgroundWriter(writes, max_queued=10)
+    writes.error = BrokenPipeError("gone")
+    writes.allowed.set()
+    writer.put("0")
+
+    wait_until(lambda: writer._error is not None)
+    with pytest.raises(ConnectionError, match="gone"):
+        writer.put("1")
+    with pytest.raises(ConnectionError, match="gone"):
+        writer.flush()
+    writer.close()
+
+
+def test_at_least_one_command_has_to_fit():
+    with pytest.raises(ValueError, match="at least one"):
+        _BackgroundWriter(lambda commands: len(commands), max_queued=0)
@@ -0,0 +1,70 @@
+from st_minecraft.core import HOOK_PRE_SEND
+from st_minecraft.core import add_hook
+from st_minecraft.core import remove_hook
+from st_minecraft.de.daten_modelle import Inventar
+from st_minecraft.de.main import hole_bloecke
+from st_minecraft.de.main import hole_inventare
+from st_minecraft.de.main import hole_mehrere_spieler
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en.data_models import Inventory
+from st_minecraft.en.entity import EntityCollection
+from st_minecraft.en.main import get_blocks
+from st_minecraft.en.main import get_entities
+from st_minecraft.en.main import get_inventories
+from st_minecraft.en.main import get_players
+from st_minecraft.en.main import give_item
+from st_minecraft.en.main import spawn_entity
+from st_minecraft.en.material import MaterialCollection
+
+
+def test_get_blocks_in_order(server, session):
+    server.world.set_block(1, 100, 0, "STONE")
+    server.world.set_block(3, 100, 0, "GLASS")
+
+    blocks = get_blocks([(x, 100, 0) for x in range(4)], session=session)
+
+    assert [block.type for block in blocks] == [
+        MaterialCollection.Air,
+        MaterialCollection.Stone,
+        MaterialCollection.Air,
+        MaterialCollection.Glass,
+    ]
+    assert [block.x for block in blocks] == [0, 1, 2, 3]
+    assert [block.typ for block in hole_bloecke([(3, 100, 0), (1, 100, 0)], sitzung=session)] == [
+        MaterialSammlung.Glas,
+        MaterialSammlung.Stein,
+    ]
+
+
+def test_get_players_and_entities_in_order(session):
+    assert [player.name for player in get_players(indices=[1, 0], session=session)] == ["player1", "player0"]
+    assert [player.name for player in get_players(names=["player0", "player1"], session=session)] == [
+        "player0",
+        "player1",
+    ]
+    assert [spieler.id for spieler in hole_mehrere_spieler(indizes=[1, 0], sitzung=session)] == [1, 0]
+
+    cow = spawn_entity(0, 100, 0, EntityCollection.Cow, session=session)
+    pig = spawn_entity(1, 100, 0, EntityCollection.Pig, session=session)
+    assert [entity.id for entity in get_entities([pig, cow, pig], session=session)] == [pig.id, cow.id, pig.id]
+
+
+def test_get_inventories_sends_all_queries_together(session):
+    first, second = get_players(indices=[0, 1], session=session)
+    give_item(first, MaterialCollection.Bread, 3, session=session)
+    give_item(second, MaterialCollection.Stone, 5, session=session)
+    sent = []
+    hook = add_hook(HOOK_PRE_SEND, lambda event: sent.append(event.name))
+    try:
+        inventories = get_inventories([second, first], session=session)
+    finally:
+        remove_hook(HOOK_PRE_SEND, hook)
+
+    assert sent == ["getInv", "getInv"]
+    assert all(type(inventory) is Inventory for inventory in inventories)
+    assert inventories[0].count(MaterialCollection.Stone) == 5
+    assert inventories[1].count(MaterialCollection.Bread) == 3
+
+    inventare = hole_inventare(hole_mehrere_spieler(indizes=[0, 1], sitzung=session), sitzung=session)
+    assert all(type(inventar) is Inventar for inventar in inventare)
+    assert inventare[0].anzahl(MaterialSammlung.Brot) == 3
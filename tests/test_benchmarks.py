@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+import st_minecraft.core.core as core
+from benchmarks import bench_api
+from benchmarks import bench_import
+from benchmarks import bench_models
+from benchmarks.harness import Result
+from benchmarks.harness import load_results
+from benchmarks.harness import measure
+from benchmarks.harness import print_results
+from benchmarks.harness import regressions
+from benchmarks.harness import save_results
+
+
+@pytest.fixture
+def default_session():
+    yield
+    # bench_api connects the default session
+    core._default_session.close()
+    core.connection = None
+
+
+def result(name: str, ops_per_sec: float) -> Result:
+    return Result(name=name, calls=10, ops_per_sec=ops_per_sec, p50_us=1.0, p99_us=2.0, alloc_bytes_per_call=0.0)
+
+
+def test_measure():
+    calls = []
+    measured = measure("append", lambda: calls.append(1), min_time=0.01, alloc_calls=5)
+
+    assert measured.name == "append"
+    # the warm up and the allocation pass aren't counted
+    assert measured.calls == len(calls) - 5 - 5
+    assert measured.ops_per_sec > 0
+    assert measured.p50_us <= measured.p99_us
+
+
+def test_measure_stops_after_max_calls():
+    assert measure("nothing", lambda: None, min_time=10.0, max_calls=100, alloc_calls=1).calls == 100
+
+
+def test_save_load_and_compare(tmp_path, capsys):
+    path = str(tmp_path / "results.json")
+    old = [result("fast", 1000.0), result("slow", 1000.0)]
+    save_results(path, old, {"min_time": 0.5})
+
+    baseline = load_results(path)
+    assert baseline["fast"]["ops_per_sec"] == 1000.0
+    assert json.loads((tmp_path / "results.json").read_text())["meta"]["settings"] == {"min_time": 0.5}
+
+    new = [result("fast", 950.0), result("slow", 800.0), result("added", 1.0)]
+    assert regressions(new, baseline, 0.1) == ["slow"]
+
+    print_results(new, baseline)
+    table = capsys.readouterr().out
+    assert "-20.0%" in table
+    assert "new" in table
+
+
+def test_every_api_case_runs(tmp_path, default_session, capsys):
+    path = str(tmp_path / "api.json")
+
+    assert bench_api.main(["--min-time", "0.001", "--output", path]) == 0
+    assert list(load_results(path)) == list(bench_api.CASES)
+    # compared with itself nothing got slower by 100%
+    assert bench_api.main(["-k", "en.get_block", "--min-time", "0.001", "--compare", path, "--threshold", "1"]) == 0
+
+
+def test_model_cases_run(capsys):
+    assert bench_models.main(["--min-time", "0.001"]) == 0
+
+
+def test_import_measures_a_fresh_interpreter():
+    measured = bench_import.measure_import("st_minecraft.en", "lazy", runs=2)
+
+    assert measured.name == "lazy.import st_minecraft.en"
+    assert measured.calls == 2
+    assert measured.p50_us > 0
@@ -0,0 +1,78 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from st_minecraft.core.compact_enum import CompactEnum
+from st_minecraft.de.entity import EntitySammlung
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en.data_models import Material
+from st_minecraft.en.entity import EntityCollection
+from st_minecraft.en.material import MaterialCollection
+
+PACKAGE = Path(__file__).parent.parent / "st_minecraft"
+
+
+class Colour(CompactEnum, names=["Red", "Green", "Rot"], values=["RED", "GREEN", "RED"]):
+    pass
+
+
+def stub_members(path: Path, class_name: str) -> set[str]:
+    """Names the stub declares as members of the class"""
+    (node,) = [
+        node for node in ast.parse(path.read_text(encoding="utf-8")).body if getattr(node, "name", None) == class_name
+    ]
+    return {statement.target.id for statement in node.body if isinstance(statement, ast.AnnAssign)}
+
+
+@pytest.mark.parametrize(
+    "collection, stub",
+    [
+        (MaterialCollection, "en/material.pyi"),
+        (EntityCollection, "en/entity.pyi"),
+        (MaterialSammlung, "de/material.pyi"),
+        (EntitySammlung, "de/entity.pyi"),
+    ],
+)
+def test_stubs_declare_every_member(collection, stub):
+    assert stub_members(PACKAGE / stub, collection.__name__) == set(collection.__members__)
+
+
+def test_aliases():
+    assert Colour.Rot is Colour.Red
+    assert list(Colour) == [Colour.Red, Colour.Green]
+    assert len(Colour) == 2
+    assert set(Colour.__members__) == {"Red", "Green", "Rot"}
+    assert Colour.Rot.name == "Red"
+
+
+def test_members_are_neither_their_value_nor_their_name():
+    assert MaterialCollection.Stone != "STONE"
+    assert {MaterialCollection.Stone: 1}[MaterialCollection("STONE")] == 1
+    assert MaterialSammlung.Stein != MaterialCollection.Stone
+    assert isinstance(MaterialCollection.Stone, MaterialCollection)
+    assert not isinstance(MaterialCollection.Stone, EntityCollection)
+
+
+def test_repr():
+    assert repr(MaterialCollection.Stone) == "<MaterialCollection.Stone: 'STONE'>"
+    assert str(MaterialCollection.Stone) == "MaterialCollection.Stone"
+    assert repr(MaterialCollection) == "<enum 'MaterialCollection'>"
+
+
+def test_members_cant_be_reassigned():
+    with pytest.raises(AttributeError):
+        EntityCollection.Cow = EntityCollection.Pig
+
+
+def test_as_field_of_the_models():
+    pytest.importorskip("pydantic")
+
+    assert Material.model_validate({"type": "STONE"}).type is MaterialCollection.Stone
+    assert Material.model_validate({"type": MaterialCollection.Stone}).type is MaterialCollection.Stone
+    with pytest.raises(ValueError):
+        Material.model_validate({"type": "NOT_A_BLOCK"})
+
+    (member_schema, _) = Material.model_json_schema()["properties"]["type"]["anyOf"]
+    assert member_schema["type"] == "string"
+    assert member_schema["enum"] == [material.value for material in MaterialCollection]
@@ -0,0 +1,111 @@
+import socket
+import time
+
+import pytest
+
+import st_minecraft.core.core as core
+from st_minecraft.core import Session
+from st_minecraft.en.main import get_block
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def discovery(monkeypatch, tmp_path):
+    """Path of the endpoint cache, with nothing found by earlier tests"""
+    path = tmp_path / "endpoint"
+    monkeypatch.delenv("SK_SERVER_OVERWRITE", raising=False)
+    monkeypatch.setenv("SK_ENDPOINT_CACHE", str(path))
+    monkeypatch.setattr(core, "_default_ip", None)
+    return path
+
+
+@pytest.fixture
+def listener():
+    """A socket that accepts connections on 127.0.0.1 but never answers"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(8)
+    yield sock
+    sock.close()
+
+
+def accepted(listener: socket.socket) -> int:
+    listener.settimeout(0.3)
+    count = 0
+    try:
+        while True:
+            listener.accept()[0].close()
+            count += 1
+    except socket.timeout:
+        return count
+
+
+def test_race_opens_one_connection(listener):
+    port = listener.getsockname()[1]
+
+    connection, option = core._race_connect(("127.0.0.1", "localhost", "127.0.0.1"), port)
+    connection.close()
+
+    assert option == "127.0.0.1"
+    assert accepted(listener) == 1
+
+
+def test_race_skips_refused_options_right_away(listener):
+    port = listener.getsockname()[1]
+
+    started = time.monotonic()
+    # 127.0.0.2 is loopback too, but nothing listens there
+    connection, option = core._race_connect(("127.0.0.2", "127.0.0.1"), port)
+    connection.close()
+
+    assert option == "127.0.0.1"
+    assert time.monotonic() - started < core._CONNECT_ATTEMPT_DELAY
+
+
+def test_names_of_the_same_address_are_tried_once():
+    assert core._resolve_options(("127.0.0.1", "localhost", "127.0.0.1"), 25570) == [
+        ("127.0.0.1", ("127.0.0.1", 25570))
+    ]
+
+
+def test_nothing_to_connect_to(discovery, listener):
+    port = listener.getsockname()[1]
+    listener.close()
+
+    with pytest.raises(ConnectionError, match="Can't connect"):
+        Session().connect(None, port)
+    assert not discovery.exists()
+
+
+def test_discovery_writes_and_uses_the_endpoint_cache(discovery, server):
+    session = Session().connect(None, server.port)
+    assert get_block(0, 63, 0, session=session).type == MaterialCollection.Stone
+    session.close()
+
+    found = core._default_ip
+    assert found in core._default_ip_options
+    assert discovery.read_text() == f"{found}:{server.port}\n"
+    assert core._read_endpoint_cache(server.port) == found
+
+
+@pytest.mark.parametrize("content", ["127.0.0.1:1", "10.1.2.3:{port}", "garbage"])
+def test_endpoint_cache_is_only_trusted_for_the_defaults(discovery, server, content):
+    discovery.write_text(content.format(port=server.port))
+
+    assert core._read_endpoint_cache(server.port) is None
+
+
+def test_a_stale_cache_falls_back_to_the_race(discovery, server, monkeypatch):
+    discovery.write_text(f"127.0.0.1:{server.port}")
+    tried = []
+
+    def refuse(ip, port):
+        tried.append(ip)
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(core, "_connect_nodelay", refuse)
+    session = Session().connect(None, server.port)
+    session.close()
+
+    assert tried == ["127.0.0.1"]
+    assert core._default_ip in core._default_ip_options
@@ -0,0 +1,115 @@
+import socket
+import threading
+
+import pytest
+
+from st_minecraft.core import Session
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import _CommandWriter
+from st_minecraft.core.core import _FrameReader
+
+
+@pytest.fixture
+def socket_pair():
+    left, right = socket.socketpair()
+    left.settimeout(1.0)
+    right.settimeout(1.0)
+    yield left, right
+    left.close()
+    right.close()
+
+
+def test_frames_split_over_several_segments(socket_pair):
+    client, server = socket_pair
+    reader = _FrameReader()
+
+    server.sendall(b"STO")
+    server.sendall(b"NE\nDI")
+    server.sendall(b"RT\n")
+    assert reader.read_frame(client) == b"STONE\n"
+    assert reader.read_frame(client) == b"DIRT\n"
+
+
+def test_several_frames_in_one_segment(socket_pair):
+    client, server = socket_pair
+    reader = _FrameReader()
+
+    server.sendall(b"a\nbb\nccc\n")
+    assert [reader.read_frame(client) for _ in range(3)] == [b"a\n", b"bb\n", b"ccc\n"]
+
+
+def test_frame_bigger_than_the_buffer(socket_pair):
+    client, server = socket_pair
+    reader = _FrameReader(size=4)
+
+    server.sendall(b"ab\n" + b"x" * 100 + b"\nc\n")
+    assert reader.read_frame(client) == b"ab\n"
+    assert reader.read_frame(client) == b"x" * 100 + b"\n"
+    assert reader.read_frame(client) == b"c\n"
+
+
+def test_closed_connection(socket_pair):
+    client, server = socket_pair
+    reader = _FrameReader()
+
+    server.sendall(b"incomplete")
+    server.close()
+    with pytest.raises(ConnectionError):
+        reader.read_frame(client)
+
+
+def test_command_writer_keeps_order_across_chunks(socket_pair):
+    client, server = socket_pair
+    writer = _CommandWriter(size=16)
+    commands = ["a", "bbbbbbbbbb", "c" * 40, "dd", "e"]
+
+    assert writer.write(client, commands) == len(commands)
+    client.shutdown(socket.SHUT_WR)
+    received = b""
+    while data := server.recv(1024):
+        received += data
+    assert received == b"".join(f"{command}\n".encode("utf-8") for command in commands)
+
+
+@pytest.mark.parametrize("request_ids", [False, True])
+def test_pipelined_queries_keep_their_order(server, request_ids):
+    for x, block in enumerate(["STONE", "DIRT", "GLASS", "SAND"]):
+        server.world.set_block(x, 100, 0, block)
+    session = Session(request_ids=request_ids).connect("127.0.0.1", server.port)
+    try:
+        commands = [ARG_SEPARATOR.join(("getBlock", str(x), "100", "0", "world")) for x in range(4)]
+        assert session._query_many(commands) == [b"STONE\n", b"DIRT\n", b"GLASS\n", b"SAND\n"]
+    finally:
+        session.close()
+
+
+def test_replies_out_of_order_are_matched_by_request_id():
+    listener = socket.create_server(("127.0.0.1", 0))
+
+    def answer_backwards():
+        connection, _ = listener.accept()
+        with connection:
+            lines = []
+            pending = b""
+            while len(lines) < 3:
+                *complete, pending = (pending + connection.recv(1024)).split(b"\n")
+                lines.extend(line.decode("utf-8") for line in complete)
+            for line in reversed(lines):
+                request_id, _, command = line.partition(ARG_SEPARATOR)
+                connection.sendall(f"{request_id}{ARG_SEPARATOR}reply to {command}\n".encode("utf-8"))
+            # keep the connection open until the client closes it
+            connection.recv(1024)
+
+    thread = threading.Thread(target=answer_backwards, daemon=True)
+    thread.start()
+    session = Session(request_ids=True).connect("127.0.0.1", listener.getsockname()[1])
+    try:
+        assert session._query_many(["first", "second", "third"]) == [
+            b"reply to first\n",
+            b"reply to second\n",
+            b"reply to third\n",
+        ]
+    finally:
+        session.close()
+        listener.close()
+        thread.join(1.0)
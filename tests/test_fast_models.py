@@ -0,0 +1,98 @@
+import pytest
+
+import st_minecraft.en.data_models as data_models
+from st_minecraft.en.data_models import Entity
+from st_minecraft.en.data_models import FastEntity
+from st_minecraft.en.data_models import FastInventoryField
+from st_minecraft.en.data_models import FastItem
+from st_minecraft.en.data_models import FastMaterial
+from st_minecraft.en.data_models import FastMessage
+from st_minecraft.en.data_models import FastPlayer
+from st_minecraft.en.data_models import Inventory
+from st_minecraft.en.data_models import Material
+from st_minecraft.en.data_models import use_fast_models
+from st_minecraft.en.entity import EntityCollection
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_chat
+from st_minecraft.en.main import get_entity
+from st_minecraft.en.main import get_inventory
+from st_minecraft.en.main import get_player
+from st_minecraft.en.main import give_item
+from st_minecraft.en.main import spawn_entity
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def models(monkeypatch):
+    """Switches between the models, the ones chosen by the environment are restored afterward"""
+    monkeypatch.setattr(data_models, "_models", data_models._models)
+    return use_fast_models
+
+
+def both(models, call):
+    """The result of call with the pydantic models and with the fast models"""
+    models(False)
+    validated = call()
+    models(True)
+    return validated, call()
+
+
+def test_fast_models_hold_the_same_values(server, session, models, capsys):
+    player = get_player(session=session)
+    give_item(player, MaterialCollection.Iron_Sword, 1, name="Sting", session=session)
+    entity = spawn_entity(0, 100, 0, EntityCollection.Cow, session=session)
+    server.world.set_block(0, 100, 0, "GLASS")
+
+    cases = {
+        FastMaterial: lambda: get_block(0, 100, 0, session=session),
+        FastPlayer: lambda: get_player(session=session),
+        FastEntity: lambda: get_entity(entity, session=session),
+    }
+    for fast_type, call in cases.items():
+        validated, fast = both(models, call)
+
+        assert type(fast) is fast_type
+        assert fast == validated
+        assert repr(fast) == repr(validated)
+        assert str(fast) == str(validated)
+        assert fast.model_dump() == validated.model_dump()
+        assert fast.to_pydantic() == validated
+
+
+def test_fast_inventory(session, models):
+    player = get_player(session=session)
+    give_item(player, MaterialCollection.Bread, 5, inventory_slot=3, session=session)
+    validated, fast = both(models, lambda: get_inventory(player, session=session))
+
+    assert type(fast) is Inventory
+    assert type(fast[3]) is FastInventoryField
+    assert type(fast[3].item) is FastItem
+    assert fast[3] == validated[3]
+    assert fast.count(MaterialCollection.Bread) == 5
+
+
+def test_fast_messages(server, session, models):
+    models(True)
+    server.chat.append(("player1", "hi"))
+
+    (message,) = get_chat(session=session)
+    assert type(message) is FastMessage
+    assert (message.sender_name, message.text) == ("player1", "hi")
+
+
+def test_fast_models_are_slotted():
+    material = FastMaterial(MaterialCollection.Stone, 1, 2, 3)
+
+    with pytest.raises(AttributeError):
+        material.colour = "grey"
+    assert material == Material(type=MaterialCollection.Stone, x=1, y=2, z=3)
+    assert material != FastEntity(EntityCollection.Cow)
+    assert material.to_pydantic() == Material(type=MaterialCollection.Stone, x=1, y=2, z=3)
+
+
+def test_to_pydantic_validates():
+    broken = FastEntity("not an entity", id="1")
+
+    with pytest.raises(ValueError):
+        broken.to_pydantic()
+    assert isinstance(FastEntity(EntityCollection.Cow, id="1").to_pydantic(), Entity)
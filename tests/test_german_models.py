@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import st_minecraft.en.data_models as data_models
+from st_minecraft.core import Session
+from st_minecraft.de.daten_modelle import Entity
+from st_minecraft.de.daten_modelle import Inventar
+from st_minecraft.de.daten_modelle import InventarFeld
+from st_minecraft.de.daten_modelle import Material
+from st_minecraft.de.daten_modelle import Nachricht
+from st_minecraft.de.daten_modelle import Spieler
+from st_minecraft.de.entity import EntitySammlung
+from st_minecraft.de.main import erzeuge_entity
+from st_minecraft.de.main import hole_block
+from st_minecraft.de.main import hole_chat
+from st_minecraft.de.main import hole_entity
+from st_minecraft.de.main import hole_inventar
+from st_minecraft.de.main import hole_spieler
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en.data_models import FastPlayer
+from st_minecraft.en.data_models import Player
+from st_minecraft.en.data_models import use_fast_models
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_entity
+from st_minecraft.en.main import get_inventory
+from st_minecraft.en.main import get_player
+from st_minecraft.en.main import give_item
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def models(monkeypatch):
+    """Switches between the models, the ones chosen by the environment are restored afterward"""
+    monkeypatch.setattr(data_models, "_models", data_models._models)
+    return use_fast_models
+
+
+def test_replies_are_read_into_the_german_models(server, session, capsys):
+    give_item(get_player(session=session), MaterialCollection.Bread, 3, inventory_slot=1, session=session)
+    server.chat.append(("player1", "hallo"))
+
+    spieler = hole_spieler(sitzung=session)
+    block = hole_block(0, 63, 0, sitzung=session)
+    entity = erzeuge_entity(0, 100, 0, EntitySammlung.Kuh, sitzung=session)
+    inventar = hole_inventar(spieler, sitzung=session)
+    (nachricht,) = hole_chat(sitzung=session)
+
+    assert type(spieler) is Spieler
+    assert spieler == Spieler.von_englisch(get_player(session=session))
+    assert type(block) is Material
+    assert block.typ == MaterialSammlung.Stein
+    assert type(entity) is Entity
+    assert hole_entity(entity, sitzung=session) == Entity.von_englisch(
+        get_entity(entity.zu_englisch(), session=session)
+    )
+    assert type(inventar) is Inventar
+    assert type(inventar[1]) is InventarFeld
+    assert inventar == Inventar.von_englisch(get_inventory(get_player(session=session), session=session))
+    assert type(nachricht) is Nachricht
+
+
+def test_the_english_models_are_back_afterward(session, models):
+    models(False)
+    hole_spieler(sitzung=session)
+    assert isinstance(get_player(session=session), Player)
+
+    # also if the German call failed
+    with pytest.raises(ConnectionError):
+        hole_spieler(index=5, sitzung=session)
+    assert isinstance(get_player(session=session), Player)
+
+
+def test_fast_models_dont_change_the_german_ones(session, models):
+    models(True)
+
+    assert type(hole_spieler(sitzung=session)) is Spieler
+    assert type(hole_block(0, 63, 0, sitzung=session)) is Material
+    assert type(get_player(session=session)) is FastPlayer
+
+
+def test_threads_keep_their_models(server, models):
+    models(False)
+    sessions = [Session().connect("127.0.0.1", server.port) for _ in range(2)]
+
+    def german(_):
+        return type(hole_spieler(sitzung=sessions[0]))
+
+    def english(_):
+        return type(get_block(0, 63, 0, session=sessions[1]))
+
+    with ThreadPoolExecutor(2) as executor:
+        german_types = executor.map(german, range(100))
+        english_types = executor.map(english, range(100))
+        german_types, english_types = set(german_types), set(english_types)
+
+    for session in sessions:
+        session.close()
+    assert german_types == {Spieler}
+    assert english_types == {data_models.Material}
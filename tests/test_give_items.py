@@ -0,0 +1,101 @@
+import pytest
+
+from st_minecraft.core import HOOK_PRE_SEND
+from st_minecraft.core import add_hook
+from st_minecraft.core import remove_hook
+from st_minecraft.de.daten_modelle import Item as GermanItem
+from st_minecraft.de.main import gebe_items
+from st_minecraft.de.main import hole_spieler
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en.main import get_inventory
+from st_minecraft.en.main import get_player
+from st_minecraft.en.main import give_items
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def sent():
+    """Names of the commands sent while the test runs"""
+    names = []
+
+    def record(event):
+        names.append(event.name)
+
+    add_hook(HOOK_PRE_SEND, record)
+    yield names
+    remove_hook(HOOK_PRE_SEND, record)
+
+
+def test_give_items_fetches_the_inventory_once(session, sent):
+    player = get_player(session=session)
+    sent.clear()
+
+    inventory = give_items(
+        player,
+        [
+            (MaterialCollection.Bread, 16),
+            (MaterialCollection.Iron_Sword, 1, {"name": "Sting", "unbreakable": True}),
+            (MaterialCollection.Stone, 5, {"inventory_slot": 8}),
+        ],
+        session=session,
+    )
+
+    assert sent == ["addInv", "addInv", "addInv", "getInv"]
+    assert inventory.count(MaterialCollection.Bread) == 16
+    assert inventory.slots_of(MaterialCollection.Stone) == [8]
+    sword = inventory[inventory.slots_of(MaterialCollection.Iron_Sword)[0]]
+    assert sword.item.display_name == "Sting"
+
+
+def test_give_items_without_fetching_the_inventory(session, sent):
+    player = get_player(session=session)
+    sent.clear()
+
+    assert give_items(player, [(MaterialCollection.Bread, 4)], fetch_inventory=False, session=session) is None
+    assert sent == ["addInv"]
+    # the items were given all the same
+    assert get_inventory(player, session=session).count(MaterialCollection.Bread) == 4
+
+
+def test_give_items_checks_all_items_before_sending(session, sent):
+    player = get_player(session=session)
+    sent.clear()
+
+    with pytest.raises(TypeError):
+        give_items(player, [(MaterialCollection.Bread, 4), (MaterialCollection.Stone, 1, {"colour": "red"})])
+    assert sent == []
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        (MaterialCollection.Bread,),
+        (MaterialCollection.Bread, 4, {}, "extra"),
+        (MaterialCollection.Bread, 4, {}, {"name": "Lost"}),
+    ],
+)
+def test_give_items_rejects_entries_of_the_wrong_length(session, sent, entry):
+    player = get_player(session=session)
+    sent.clear()
+
+    with pytest.raises(TypeError, match="item, amount"):
+        give_items(player, [(MaterialCollection.Stone, 1), entry], session=session)
+    with pytest.raises(TypeError, match="item, anzahl"):
+        gebe_items(hole_spieler(sitzung=session), [(MaterialSammlung.Stein, 1), entry], sitzung=session)
+    assert sent == ["getPlayer"]
+
+
+def test_gebe_items(session):
+    spieler = hole_spieler(sitzung=session)
+    stein = GermanItem(typ=MaterialSammlung.Stein, anzeige_name=None)
+
+    inventar = gebe_items(
+        spieler,
+        [(MaterialSammlung.Brot, 2), (stein, 3, {"inventar_feld": 20, "unzerstörbar": True})],
+        sitzung=session,
+    )
+
+    assert inventar.anzahl(MaterialSammlung.Brot) == 2
+    assert inventar.felder_von(MaterialSammlung.Stein) == [20]
+    assert gebe_items(spieler, [(stein, 1)], inventar_holen=False, sitzung=session) is None
+    assert get_inventory(get_player(session=session), session=session).count(MaterialCollection.Stone) == 4
@@ -0,0 +1,117 @@
+import collections
+import traceback
+
+import pytest
+
+from st_minecraft.core import HOOK_ON_ERROR
+from st_minecraft.core import HOOK_POST_RECEIVE
+from st_minecraft.core import HOOK_PRE_SEND
+from st_minecraft.core import NoDataError
+from st_minecraft.core import Session
+from st_minecraft.core import add_hook
+from st_minecraft.core import remove_hook
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_blocks
+from st_minecraft.en.main import set_block
+from st_minecraft.en.material import MaterialCollection
+from st_minecraft.testing import ShapingProxy
+
+
+_KINDS = (HOOK_PRE_SEND, HOOK_POST_RECEIVE, HOOK_ON_ERROR)
+
+
+@pytest.fixture
+def events():
+    """(kind, event) of every hook call while the test runs"""
+    seen = []
+    hooks = {kind: add_hook(kind, lambda event, kind=kind: seen.append((kind, event))) for kind in _KINDS}
+    yield seen
+    for kind, hook in hooks.items():
+        remove_hook(kind, hook)
+
+
+def test_events_of_a_command_and_a_query(session, events):
+    set_block(0, 100, 0, MaterialCollection.Stone, session=session)
+    get_block(0, 100, 0, session=session)
+
+    assert [(kind, event.name) for kind, event in events] == [
+        (HOOK_PRE_SEND, "setBlock"),
+        (HOOK_PRE_SEND, "getBlock"),
+        (HOOK_POST_RECEIVE, "getBlock"),
+    ]
+    _, reply = events[-1]
+    assert reply.args == ("0", "100", "0", "world")
+    assert reply.raw == b"STONE\n"
+    assert reply.elapsed_ns > 0
+    assert reply.session is session
+
+
+def test_every_query_of_a_batch_gets_its_reply(session, events):
+    get_blocks([(0, 100, 0), (0, 0, 0)], session=session)
+
+    replies = [event.raw for kind, event in events if kind == HOOK_POST_RECEIVE]
+    assert replies == [b"AIR\n", b"STONE\n"]
+
+
+def test_request_ids_are_not_part_of_the_event(server, events):
+    session = Session(request_ids=True).connect("127.0.0.1", server.port)
+    try:
+        get_block(0, 0, 0, session=session)
+    finally:
+        session.close()
+
+    assert [(kind, event.name, event.args[0]) for kind, event in events] == [
+        (HOOK_PRE_SEND, "getBlock", "0"),
+        (HOOK_POST_RECEIVE, "getBlock", "0"),
+    ]
+
+
+def test_on_error_gets_the_timeout(server, events):
+    with ShapingProxy(server.port, delay=0.5) as proxy:
+        session = Session(timeout=0.05).connect("127.0.0.1", proxy.port)
+        try:
+            with pytest.raises(NoDataError):
+                get_blocks([(0, 0, 0), (1, 0, 0)], session=session)
+        finally:
+            session.close()
+
+    errors = [event for kind, event in events if kind == HOOK_ON_ERROR]
+    assert [event.name for event in errors] == ["getBlock", "getBlock"]
+    assert all(isinstance(event.error, NoDataError) for event in errors)
+
+
+def test_errors_of_hooks_are_not_caught(session):
+    def broken(event):
+        raise RuntimeError("broken hook")
+
+    add_hook(HOOK_PRE_SEND, broken)
+    try:
+        with pytest.raises(RuntimeError, match="broken hook"):
+            get_block(0, 0, 0, session=session)
+    finally:
+        remove_hook(HOOK_PRE_SEND, broken)
+    # removed hooks aren't called anymore
+    get_block(0, 0, 0, session=session)
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        add_hook("post_send", print)
+
+
+def test_the_docstring_example_finds_the_calling_line(session):
+    round_trips = collections.Counter()
+
+    def count_caller(event):
+        frames = traceback.extract_stack()[:-1]
+        caller = next(frame for frame in reversed(frames) if "st_minecraft" not in frame.filename)
+        round_trips[caller.lineno] += 1
+
+    add_hook(HOOK_POST_RECEIVE, count_caller)
+    try:
+        line = traceback.extract_stack()[-1].lineno + 1
+        get_block(0, 0, 0, session=session)
+    finally:
+        remove_hook(HOOK_POST_RECEIVE, count_caller)
+
+    assert round_trips == {line: 1}
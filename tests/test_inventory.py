@@ -0,0 +1,121 @@
+import copy
+import pickle
+
+import pytest
+
+from st_minecraft.de.daten_modelle import Inventar
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en.data_models import Inventory
+from st_minecraft.en.data_models import InventoryField
+from st_minecraft.en.data_models import Item
+from st_minecraft.en.material import MaterialCollection
+
+
+def field(index: int, material: MaterialCollection, amount: int) -> InventoryField:
+    return InventoryField(index=index, item=Item(type=material, display_name=None), amount=amount)
+
+
+@pytest.fixture
+def inventory() -> Inventory:
+    return Inventory(
+        {
+            0: field(0, MaterialCollection.Bread, 16),
+            3: field(3, MaterialCollection.Stone, 64),
+            5: field(5, MaterialCollection.Bread, 4),
+        }
+    )
+
+
+def test_counts_after_parsing(inventory):
+    assert inventory.count(MaterialCollection.Bread) == 20
+    assert inventory.slots_of(MaterialCollection.Bread) == [0, 5]
+    assert inventory.has_at_least(MaterialCollection.Bread, 20)
+    assert not inventory.has_at_least(MaterialCollection.Bread, 21)
+    assert inventory.count(MaterialCollection.Diamond) == 0
+    assert inventory.slots_of(MaterialCollection.Diamond) == []
+    assert MaterialCollection.Stone in inventory
+    assert MaterialCollection.Diamond not in inventory
+
+
+def test_add(inventory):
+    inventory[7] = field(7, MaterialCollection.Bread, 1)
+    inventory[8] = field(8, MaterialCollection.Diamond, 2)
+
+    assert inventory.count(MaterialCollection.Bread) == 21
+    assert inventory.slots_of(MaterialCollection.Bread) == [0, 5, 7]
+    assert inventory.has_at_least(MaterialCollection.Diamond, 2)
+
+
+def test_remove(inventory):
+    del inventory[0]
+    assert inventory.count(MaterialCollection.Bread) == 4
+    assert inventory.slots_of(MaterialCollection.Bread) == [5]
+
+    inventory.pop(5)
+    assert inventory.count(MaterialCollection.Bread) == 0
+    assert inventory.slots_of(MaterialCollection.Bread) == []
+    assert MaterialCollection.Bread not in inventory
+
+    inventory.clear()
+    assert inventory.count(MaterialCollection.Stone) == 0
+
+
+def test_replace(inventory):
+    inventory[3] = field(3, MaterialCollection.Bread, 2)
+    assert inventory.count(MaterialCollection.Stone) == 0
+    assert MaterialCollection.Stone not in inventory
+    assert inventory.count(MaterialCollection.Bread) == 22
+    assert inventory.slots_of(MaterialCollection.Bread) == [0, 3, 5]
+
+    inventory[0] = field(0, MaterialCollection.Bread, 1)
+    assert inventory.count(MaterialCollection.Bread) == 7
+
+
+def test_copies_have_their_own_index(inventory):
+    for copied in (copy.copy(inventory), pickle.loads(pickle.dumps(inventory))):
+        del copied[0]
+        assert copied.count(MaterialCollection.Bread) == 4
+    assert inventory.count(MaterialCollection.Bread) == 20
+
+
+def test_german_inventory(inventory):
+    inventar = Inventar.von_englisch(inventory)
+    assert inventar.anzahl(MaterialSammlung.Brot) == 20
+    assert inventar.felder_von(MaterialSammlung.Brot) == [0, 5]
+    assert inventar.hat_mindestens(MaterialSammlung.Stein, 64)
+    # materials are compared by ordinal, the English collection works as well
+    assert inventar.anzahl(MaterialCollection.Bread) == 20
+
+    del inventar[5]
+    assert inventar.anzahl(MaterialSammlung.Brot) == 16
+
+
+@pytest.mark.parametrize("not_a_material", ["STONE", 1, object()])
+def test_only_materials_are_counted(inventory, not_a_material):
+    with pytest.raises(TypeError):
+        inventory.count(not_a_material)
+    with pytest.raises(TypeError):
+        inventory.slots_of(not_a_material)
+    with pytest.raises(TypeError):
+        inventory.has_at_least(not_a_material, 1)
+    assert not_a_material not in inventory
+
+
+def test_copy_and_merge_keep_the_index(inventory):
+    copied = inventory.copy()
+    assert type(copied) is Inventory
+    del copied[0]
+    assert copied.count(MaterialCollection.Bread) == 4
+    assert inventory.count(MaterialCollection.Bread) == 20
+
+    extra = {8: field(8, MaterialCollection.Bread, 1), 3: field(3, MaterialCollection.Dirt, 1)}
+    for merged in (inventory | extra, extra | inventory):
+        assert type(merged) is Inventory
+        assert merged.slots_of(MaterialCollection.Bread) == [0, 5, 8]
+    assert (inventory | extra).count(MaterialCollection.Stone) == 0
+    assert (extra | inventory).count(MaterialCollection.Stone) == 64
+    assert inventory.count(MaterialCollection.Stone) == 64
+
+    inventar = Inventar.von_englisch(inventory).copy()
+    assert type(inventar) is Inventar
+    assert inventar.anzahl(MaterialSammlung.Brot) == 20
@@ -0,0 +1,61 @@
+import pytest
+
+import st_minecraft.en.data_models as data_models
+from st_minecraft.core import ARG_SEPARATOR
+from st_minecraft.en.data_models import Dimension
+from st_minecraft.en.data_models import FastMaterial
+from st_minecraft.en.data_models import LazyPlayer
+from st_minecraft.en.data_models import Player
+from st_minecraft.en.data_models import use_fast_models
+from st_minecraft.en.main import get_player
+from st_minecraft.en.main import get_players
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def lazy(monkeypatch):
+    """Players are LazyPlayer objects while the test runs"""
+    monkeypatch.setattr(data_models, "_models", data_models._models)
+    use_fast_models(lazy=True)
+
+
+def test_fields_are_converted_on_first_access(server, session, lazy):
+    server.players[0].x = 12
+    player = get_player(session=session)
+
+    assert type(player) is LazyPlayer
+    assert "x" not in player.__dict__
+    assert player.x == 12
+    assert player.__dict__["x"] == 12
+    # the other fields are still text
+    assert "health" not in player.__dict__
+    assert player._raw[10] == "20.0"
+
+
+def test_lazy_players_hold_the_same_values(session, lazy):
+    player = get_player(session=session)
+    use_fast_models(False)
+    validated = get_player(session=session)
+
+    assert player == validated
+    assert repr(player) == repr(validated)
+    assert player.model_dump() == validated.model_dump()
+    assert isinstance(player.to_pydantic(), Player)
+    assert player.dimension is Dimension.World
+    assert type(player.looking_at) is FastMaterial
+    assert player.looking_at.type == MaterialCollection.Stone
+    assert player.sneaked is False
+
+
+def test_every_player_of_a_batch_is_lazy(session, lazy):
+    players = get_players(indices=[1, 0], session=session)
+
+    assert [type(player) for player in players] == [LazyPlayer, LazyPlayer]
+    assert [player.name for player in players] == ["player1", "player0"]
+
+
+def test_broken_replies():
+    with pytest.raises(ConnectionError, match="connected"):
+        LazyPlayer.from_raw_data(b"error invalid_index\n")
+    with pytest.raises(ValueError, match="15 fields"):
+        LazyPlayer.from_raw_data(f"0{ARG_SEPARATOR}steve\n".encode("utf-8"))
@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from st_minecraft.core.models import PYDANTIC_ENV
+from st_minecraft.core.models import LazyModel
+from st_minecraft.core.models import LazyValidationError
+
+
+class Point(LazyModel):
+    x: int
+    y: int = 0
+
+
+class Line(LazyModel):
+    start: Point
+    end: Point | None = None
+    name: str | None = None
+
+
+def run_lazy(code: str) -> str:
+    """Runs code in a fresh interpreter with SK_PYDANTIC=lazy, returns what it printed"""
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        env={**os.environ, PYDANTIC_ENV: "lazy"},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def test_fields_defaults_and_equality():
+    point = Point(x=1, colour="red")
+
+    assert (point.x, point.y) == (1, 0)
+    assert not hasattr(point, "colour")
+    assert point == Point(x=1, y=0)
+    assert point != Point(x=2)
+    assert repr(point) == "Point(x=1, y=0)"
+    assert str(point) == "x=1 y=0"
+    with pytest.raises(LazyValidationError, match="'x' is required"):
+        Point(y=1)
+
+
+def test_values_are_stored_as_they_are():
+    assert Point(x="1").x == "1"
+
+
+def test_nested_models():
+    line = Line(start=Point(x=1), end=Point(x=2, y=3))
+
+    assert line.model_dump() == {"start": {"x": 1, "y": 0}, "end": {"x": 2, "y": 3}, "name": None}
+
+
+def test_validation_uses_pydantic():
+    pytest.importorskip("pydantic")
+
+    line = Line.model_validate({"start": {"x": "1"}, "end": Point(x="2", y="3")})
+    assert type(line) is Line
+    assert type(line.start) is Point
+    assert line == Line(start=Point(x=1), end=Point(x=2, y=3))
+    assert Point.model_validate(Point(x="4")) == Point(x=4)
+
+    with pytest.raises(LazyValidationError):
+        Point.model_validate({"x": "not a number"})
+    assert set(Line.model_json_schema()["properties"]) == {"start", "end", "name"}
+
+
+def test_the_library_works_without_importing_pydantic():
+    output = run_lazy(
+        """
+        import sys
+
+        import st_minecraft.de
+        import st_minecraft.en
+        from st_minecraft.core.models import LazyModel
+        from st_minecraft.testing import MockServer
+
+        with MockServer() as server:
+            st_minecraft.en.connect("127.0.0.1", server.port)
+            player = st_minecraft.en.get_player()
+            spieler = st_minecraft.de.hole_spieler()
+            block = st_minecraft.en.get_block(0, 63, 0)
+
+        print(isinstance(player, LazyModel), isinstance(spieler, LazyModel))
+        print(player.name, spieler.name, block.type.name)
+        print("pydantic" in sys.modules)
+        """
+    )
+
+    assert output.splitlines() == ["True True", "player0 player0 Stone", "False"]
+
+
+def test_pydantic_is_imported_to_validate():
+    pytest.importorskip("pydantic")
+    output = run_lazy(
+        """
+        import sys
+
+        from st_minecraft.en import Material
+        from st_minecraft.en import MaterialCollection
+
+        print("pydantic" in sys.modules)
+        block = Material.model_validate({"type": MaterialCollection.Stone, "x": "1"})
+        print("pydantic" in sys.modules, type(block).__name__, block.x)
+        """
+    )
+
+    assert output.splitlines() == ["False", "True Material 1"]
@@ -0,0 +1,93 @@
+import pytest
+
+import st_minecraft.de.material_eigenschaften as de
+import st_minecraft.en.material_properties as en
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en.material import MaterialCollection
+
+EN_FUNCTIONS = [en.is_block, en.is_solid, en.is_liquid, en.is_transparent, en.has_gravity, en.emits_light]
+DE_FUNCTIONS = [de.ist_block, de.ist_fest, de.ist_fluessig, de.ist_durchsichtig, de.faellt_herunter, de.leuchtet]
+TABLES = ["block", "solid", "liquid", "transparent", "gravity", "light_emitting"]
+
+
+def properties(material):
+    return tuple(function(material) for function in EN_FUNCTIONS)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        # block, solid, liquid, transparent, gravity, emits light
+        ("Stone", (True, True, False, False, False, False)),
+        ("Glass", (True, True, False, True, False, False)),
+        ("Water", (True, False, True, True, False, False)),
+        ("Lava", (True, False, True, True, False, True)),
+        ("Sand", (True, True, False, False, True, False)),
+        ("Air", (True, False, False, True, False, False)),
+        ("Diamond_Sword", (False, False, False, False, False, False)),
+    ],
+)
+def test_properties(name, expected):
+    assert properties(MaterialCollection[name]) == expected
+
+
+def test_light_and_color():
+    assert en.light_level(MaterialCollection.Glowstone) == 15
+    assert en.light_level(MaterialCollection.Torch) == 14
+    assert en.light_level(MaterialCollection.Stone) == 0
+    assert en.average_color(MaterialCollection.Stone) == (126, 126, 126)
+    for material in MaterialCollection:
+        assert en.emits_light(material) == (en.light_level(material) > 0)
+        assert all(0 <= channel <= 255 for channel in en.average_color(material))
+
+
+def test_unknown_blocks_have_no_properties():
+    assert properties(None) == (False,) * 6
+    assert en.light_level(None) == 0
+    assert en.average_color(None) is None
+    assert de.lichtstaerke(None) == 0
+
+
+def test_german_materials_have_the_same_properties():
+    for material in MaterialSammlung:
+        english = material.zu_englisch()
+        assert tuple(function(material) for function in DE_FUNCTIONS) == properties(english)
+        assert de.lichtstaerke(material) == en.light_level(english)
+        assert de.durchschnittsfarbe(material) == en.average_color(english)
+
+
+def test_numpy_tables_match_the_functions():
+    numpy = pytest.importorskip("numpy")
+    tables = en.numpy_tables()
+    ordinals = numpy.array([material.ordinal for material in MaterialCollection])
+
+    for table, function in zip(TABLES, EN_FUNCTIONS):
+        assert tables[table].dtype == bool
+        assert tables[table][ordinals].tolist() == [function(material) for material in MaterialCollection]
+    assert tables["light"][ordinals].tolist() == [en.light_level(material) for material in MaterialCollection]
+    assert tables["color"].shape == (len(MaterialCollection._by_ordinal_), 3)
+    assert [tuple(row) for row in tables["color"][ordinals].tolist()] == [
+        en.average_color(material) for material in MaterialCollection
+    ]
+
+
+def test_numpy_tabellen():
+    numpy = pytest.importorskip("numpy")
+    tables = en.numpy_tables()
+    tabellen = de.numpy_tabellen()
+
+    assert set(tabellen) == {
+        "block",
+        "fest",
+        "fluessig",
+        "durchsichtig",
+        "faellt_herunter",
+        "leuchtet",
+        "lichtstaerke",
+        "farbe",
+    }
+    assert numpy.array_equal(tabellen["fest"], tables["solid"])
+    assert numpy.array_equal(tabellen["farbe"], tables["color"])
+    # a whole region at once, like in the docs
+    region = numpy.array([[MaterialSammlung.Stein.ordinal, MaterialSammlung.Luft.ordinal]])
+    assert tabellen["fest"][region].tolist() == [[True, False]]
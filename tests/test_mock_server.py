@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from st_minecraft.core import ARG_SEPARATOR
+from st_minecraft.core import Session
+from st_minecraft.en.entity import EntityCollection
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_chat
+from st_minecraft.en.main import get_entity
+from st_minecraft.en.main import get_player
+from st_minecraft.en.main import send_command
+from st_minecraft.en.main import send_to_chat
+from st_minecraft.en.main import set_block
+from st_minecraft.en.main import set_entity_name
+from st_minecraft.en.main import set_player_position
+from st_minecraft.en.main import spawn_entity
+from st_minecraft.en.material import MaterialCollection
+
+
+def command(*parts: str) -> str:
+    return ARG_SEPARATOR.join(parts)
+
+
+def test_world(server, session):
+    assert server.world.get_block(0, 63, 0) == "STONE"
+    assert server.world.get_block(0, 64, 0) == "AIR"
+
+    set_block(5, 100, 5, MaterialCollection.Diamond_Block, session=session)
+
+    assert get_block(5, 100, 5, session=session).type == MaterialCollection.Diamond_Block
+    assert server.world.get_block(5, 100, 5) == "DIAMOND_BLOCK"
+
+
+def test_players_chat_and_commands(server, session):
+    player = get_player(session=session)
+    assert player.name == "player0"
+
+    set_player_position(player, 10, 70, -3, session=session)
+    send_to_chat("hello", session=session)
+    send_command("time set day", session=session)
+    server.chat.append(("player1", "hi"))
+
+    assert [(message.sender_name, message.text) for message in get_chat(session=session)] == [("player1", "hi")]
+    assert (server.players[0].x, server.players[0].y, server.players[0].z) == (10, 70, -3)
+    assert server.posted_chat == ["hello"]
+    assert server.commands == ["time set day"]
+
+
+def test_entities(server, session):
+    cow = spawn_entity(0, 100, 0, EntityCollection.Cow, session=session)
+    set_entity_name(cow, "Berta", session=session)
+
+    assert get_entity(cow, session=session).name == "Berta"
+    assert server.entities[cow.id].type == "COW"
+
+    server.entities.clear()
+    with pytest.raises(ValueError, match="still exists"):
+        get_entity(cow, session=session)
+
+
+def test_a_broken_query_is_answered_with_an_error(server, session):
+    started = time.monotonic()
+    assert session._query(command("getBlock", "1")) == b"error invalid_arguments\n"
+    assert time.monotonic() - started < 1.0
+    assert len(server.errors) == 1
+
+
+def test_unknown_and_broken_commands_get_no_reply(server, session):
+    # a reply to these would be read as the reply of the next query
+    session._send_commands([command("noSuchCommand", "1"), command("setBlock", "x")])
+
+    assert get_block(0, 0, 0, session=session).type == MaterialCollection.Stone
+    assert len(server.errors) == 2
+    assert server.errors[0].startswith("noSuchCommand")
+
+
+def test_request_ids_are_echoed(server):
+    session = Session(request_ids=True).connect("127.0.0.1", server.port)
+    try:
+        assert session._query(command("getBlock", "0", "0", "0", "world")) == b"STONE\n"
+        assert session._query(command("getBlock", "1")) == b"error invalid_arguments\n"
+    finally:
+        session.close()
+    assert server.handle(command("#7", "getBlock", "0", "0", "0", "world")) == command("#7", "STONE")
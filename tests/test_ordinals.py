@@ -0,0 +1,107 @@
+import copy
+import importlib.util
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from st_minecraft.de._exceptions import WertFehler
+from st_minecraft.de.entity import EntitySammlung
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.de.material import material_aus_ordinal
+from st_minecraft.de.material import zu_ordinal
+from st_minecraft.en.entity import EntityCollection
+from st_minecraft.en.entity import entity_from_ordinal
+from st_minecraft.en.material import MaterialCollection
+from st_minecraft.en.material import material_from_ordinal
+from st_minecraft.en.material import to_ordinal
+
+RESSOURCEN = Path(__file__).parent.parent / "ressourcen"
+
+
+@pytest.fixture(scope="module")
+def generate_enums():
+    spec = importlib.util.spec_from_file_location("generate_enums", RESSOURCEN / "generate_enums.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_ordinals_round_trip():
+    for material in MaterialCollection:
+        assert material_from_ordinal(to_ordinal(material)) is material
+    for entity in EntityCollection:
+        assert entity_from_ordinal(entity.ordinal) is entity
+
+
+def test_german_members_share_the_english_ordinals():
+    assert MaterialSammlung.Stein.ordinal == MaterialCollection.Stone.ordinal
+    assert zu_ordinal(MaterialSammlung.Stein) == to_ordinal(MaterialCollection.Stone)
+    assert material_aus_ordinal(MaterialCollection.Stone.ordinal) is MaterialSammlung.Stein
+    assert MaterialSammlung.von_englisch(MaterialCollection.Stone) is MaterialSammlung.Stein
+    assert MaterialSammlung.Stein.zu_englisch() is MaterialCollection.Stone
+    for entity in EntitySammlung:
+        assert entity.zu_englisch().value == entity.value
+
+
+def test_unknown_ordinals():
+    with pytest.raises(ValueError):
+        material_from_ordinal(-1)
+    with pytest.raises(ValueError):
+        material_from_ordinal(len(MaterialCollection._by_ordinal_))
+    with pytest.raises(WertFehler):
+        material_aus_ordinal(10**6)
+
+
+def test_members_behave_like_enum_members():
+    assert MaterialCollection("STONE") is MaterialCollection.Stone
+    assert MaterialCollection["Stone"] is MaterialCollection.Stone
+    assert "STONE" in MaterialCollection
+    assert MaterialCollection.Stone.name == "Stone"
+    assert MaterialCollection.Stone.value == "STONE"
+    with pytest.raises(ValueError):
+        MaterialCollection("NOT_A_BLOCK")
+    with pytest.raises(AttributeError):
+        MaterialCollection.Stone = MaterialCollection.Dirt
+
+
+@pytest.mark.parametrize("member", [MaterialCollection.Stone, MaterialSammlung.Stein, EntitySammlung.Kuh])
+def test_pickle_and_copy_keep_the_member(member):
+    assert pickle.loads(pickle.dumps(member)) is member
+    assert copy.copy(member) is member
+    assert copy.deepcopy(member) is member
+
+
+def test_generated_modules_are_up_to_date(generate_enums, tmp_path, monkeypatch):
+    monkeypatch.chdir(RESSOURCEN)
+    generate_enums.check_ordinals()
+
+
+def test_refused_run_writes_nothing(generate_enums, tmp_path, monkeypatch):
+    monkeypatch.chdir(RESSOURCEN)
+    for language in ("en", "de"):
+        (tmp_path / language).mkdir()
+        for module in ("material.py", "material.pyi", "entity.py", "entity.pyi"):
+            shutil.copy(RESSOURCEN.parent / "st_minecraft" / language / module, tmp_path / language / module)
+    (tmp_path / "core").mkdir()
+    # the entities swap places, that would change their ordinals
+    rows = Path("entities_validated.csv").read_text().splitlines()
+    entities = tmp_path / "entities.csv"
+    entities.write_text("\n".join([rows[1], rows[0], *rows[2:]]) + "\n")
+    # a new material is fine, but would change the material modules if they were written
+    blocks = tmp_path / "blocks.csv"
+    blocks.write_text(Path("blocks_items_validated.csv").read_text().rstrip("\n") + "\nTestblock,test_block\n")
+    before = {path: path.read_text() for path in tmp_path.rglob("*.py*")}
+
+    with pytest.raises(ValueError, match="would lose its ordinal"):
+        generate_enums.build_all(
+            block_source_file=blocks,
+            entity_source_file=entities,
+            english_dir=tmp_path / "en",
+            german_dir=tmp_path / "de",
+            core_dir=tmp_path / "core",
+        )
+
+    assert {path: path.read_text() for path in tmp_path.rglob("*.py*")} == before
+    assert not (tmp_path / "core" / "material_table.py").exists()
@@ -0,0 +1,56 @@
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.core.core import REQUEST_ID_MARKER
+from st_minecraft.core.recording import pair_queries
+from st_minecraft.core.recording import read_recording
+from st_minecraft.core.recording import replay
+
+
+def write_log(path, lines: list[str]) -> str:
+    path.write_text("# st_minecraft wire log 1\n" + "".join(f"{i} {line}\n" for i, line in enumerate(lines)), "utf-8")
+    return str(path)
+
+
+def get_block(x: int) -> str:
+    return ARG_SEPARATOR.join(("getBlock", str(x), "100", "0", "world"))
+
+
+def test_replay_reads_replies_that_were_not_recorded(server, session, tmp_path):
+    server.world.set_block(0, 100, 0, "STONE")
+    server.world.set_block(1, 100, 0, "DIRT")
+    # the first query timed out while recording, its reply is missing from the log
+    path = write_log(
+        tmp_path / "missing_reply.log",
+        [
+            f"> {REQUEST_ID_MARKER}1{ARG_SEPARATOR}{get_block(0)}",
+            f"> {REQUEST_ID_MARKER}2{ARG_SEPARATOR}{get_block(1)}",
+            f"< {REQUEST_ID_MARKER}2{ARG_SEPARATOR}DIRT",
+            f"> {get_block(0)}",
+        ],
+    )
+    assert pair_queries(read_recording(path)) == [(get_block(0), None), (get_block(1), "DIRT"), (get_block(0), None)]
+
+    result = replay(path, session)
+
+    assert result.commands == 3
+    assert result.queries == 3
+    assert result.different_replies == 0
+    # nothing was left behind for the next query
+    assert session._query(get_block(1)) == b"DIRT\n"
+
+
+def test_replay_counts_different_replies(server, session, tmp_path):
+    server.world.set_block(0, 100, 0, "STONE")
+    path = write_log(
+        tmp_path / "changed.log",
+        [
+            f"> {ARG_SEPARATOR.join(('setBlock', '1', '100', '0', 'world', 'GLASS'))}",
+            f"> {get_block(0)}",
+            "< DIRT",
+            f"> {get_block(1)}",
+            "< GLASS",
+        ],
+    )
+
+    result = replay(path, session)
+
+    assert (result.commands, result.queries, result.different_replies) == (3, 2, 1)
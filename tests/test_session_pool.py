@@ -0,0 +1,85 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from st_minecraft.core import SessionPool
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import set_block
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def column(server):
+    """x coordinates 0 to 39 at y=100, glass at odd x, stone at even x"""
+    for x in range(40):
+        server.world.set_block(x, 100, 0, "GLASS" if x % 2 else "STONE")
+    return [MaterialCollection.Glass if x % 2 else MaterialCollection.Stone for x in range(40)]
+
+
+def test_threads_sharing_a_session_get_their_own_replies(session, column):
+    def worker(x):
+        # a command between the queries, its missing reply must not shift the others
+        set_block(x, 101, 0, MaterialCollection.Dirt, session=session)
+        return get_block(x, 100, 0, session=session)
+
+    with ThreadPoolExecutor(8) as executor:
+        blocks = list(executor.map(worker, range(40)))
+
+    assert [block.x for block in blocks] == list(range(40))
+    assert [block.type for block in blocks] == column
+
+
+def test_pool_opens_at_most_size_sessions(server, column):
+    sessions = set()
+    lock = threading.Lock()
+
+    def worker(x):
+        session = pool.session()
+        # a thread keeps its session
+        assert pool.session() is session
+        with lock:
+            sessions.add(session)
+        return get_block(x, 100, 0, session=session)
+
+    with SessionPool("127.0.0.1", server.port, size=3) as pool:
+        with ThreadPoolExecutor(6) as executor:
+            blocks = list(executor.map(worker, range(40)))
+        assert len(pool._sessions) <= 3
+
+    assert [block.type for block in blocks] == column
+    assert 1 <= len(sessions) <= 3
+    assert all(session.socket is None for session in sessions)
+
+
+def test_threads_beyond_size_share_sessions(server):
+    barrier = threading.Barrier(4)
+
+    def worker():
+        session = pool.session()
+        # all four threads ask for a session before any of them is done
+        barrier.wait()
+        return session
+
+    with SessionPool("127.0.0.1", server.port, size=2) as pool:
+        with ThreadPoolExecutor(4) as executor:
+            sessions = [executor.submit(worker) for _ in range(4)]
+            sessions = [future.result() for future in sessions]
+
+    assert len(set(sessions)) == 2
+
+
+def test_closed_pool_connects_again(server):
+    pool = SessionPool("127.0.0.1", server.port, size=1)
+    first = pool.session()
+    pool.close()
+
+    second = pool.session()
+    assert second is not first
+    assert get_block(0, 63, 0, session=second).type == MaterialCollection.Stone
+    pool.close()
+
+
+def test_pool_needs_a_connection():
+    with pytest.raises(ValueError, match="at least one"):
+        SessionPool(size=0)
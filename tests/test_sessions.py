@@ -0,0 +1,63 @@
+import pytest
+
+import st_minecraft.core.core as core
+from st_minecraft.core import Session
+from st_minecraft.core import connect
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_player
+from st_minecraft.en.main import set_block
+from st_minecraft.en.material import MaterialCollection
+from st_minecraft.testing import MockServer
+
+
+@pytest.fixture
+def other_server():
+    with MockServer(players=1) as server:
+        server.players[0].name = "other"
+        yield server
+
+
+def test_sessions_talk_to_their_own_server(server, session, other_server):
+    with Session().connect("127.0.0.1", other_server.port) as other:
+        set_block(0, 100, 0, MaterialCollection.Glass, session=session)
+        set_block(0, 100, 0, MaterialCollection.Stone, session=other)
+
+        assert get_block(0, 100, 0, session=session).type == MaterialCollection.Glass
+        assert get_block(0, 100, 0, session=other).type == MaterialCollection.Stone
+        assert get_player(session=other).name == "other"
+    assert other.socket is None
+
+    # closing one session leaves the other one open
+    assert get_player(session=session).name == "player0"
+
+
+def test_functions_without_session_use_the_default_session(server, other_server):
+    connect("127.0.0.1", other_server.port)
+    try:
+        assert core.connection is core._default_session.socket
+        assert get_player().name == "other"
+    finally:
+        core._default_session.close()
+        core.connection = None
+
+
+def test_closed_sessions_refuse_to_send(server):
+    session = Session().connect("127.0.0.1", server.port)
+    session.close()
+
+    with pytest.raises(RuntimeError, match="connect first"):
+        set_block(0, 100, 0, MaterialCollection.Stone, session=session)
+    with pytest.raises(RuntimeError, match="connect first"):
+        get_block(0, 100, 0, session=session)
+
+    # and can be connected again
+    session.connect("127.0.0.1", server.port)
+    assert get_block(0, 63, 0, session=session).type == MaterialCollection.Stone
+    session.close()
+
+
+def test_connect_again_switches_the_server(server, other_server):
+    with Session().connect("127.0.0.1", server.port) as session:
+        assert get_player(session=session).name == "player0"
+        session.connect("127.0.0.1", other_server.port)
+        assert get_player(session=session).name == "other"
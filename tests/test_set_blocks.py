@@ -0,0 +1,46 @@
+import pytest
+
+from st_minecraft.de.main import setze_block
+from st_minecraft.de.main import setze_bloecke
+from st_minecraft.de.material import MaterialSammlung
+from st_minecraft.en import Dimension
+from st_minecraft.en.main import get_chat
+from st_minecraft.en.main import set_block
+from st_minecraft.en.main import set_blocks
+from st_minecraft.en.material import MaterialCollection
+
+
+def test_set_blocks(server, session):
+    placed = set_blocks(
+        [(x, 100, 0, MaterialCollection.Glass) for x in range(3)] + [(0, 101, 0, MaterialCollection.Stone)],
+        session=session,
+    )
+    assert setze_bloecke([(5, 100, 0, MaterialSammlung.Glas)], Dimension.Nether, sitzung=session) == 1
+    get_chat(session=session)  # a query, its reply comes after everything sent before was handled
+
+    assert placed == 4
+    assert [server.world.get_block(x, 100, 0) for x in range(4)] == ["GLASS", "GLASS", "GLASS", "AIR"]
+    assert server.world.get_block(0, 101, 0) == "STONE"
+    assert server.world.get_block(5, 100, 0, "world_nether") == "GLASS"
+
+
+@pytest.mark.parametrize("block_type", ["STONE", MaterialSammlung.Stein, None])
+def test_set_block_and_set_blocks_check_the_same_way(server, session, block_type):
+    with pytest.raises(TypeError, match="MaterialCollection"):
+        set_block(0, 100, 0, block_type, session=session)
+    with pytest.raises(TypeError, match="MaterialCollection"):
+        set_blocks([(1, 100, 0, MaterialCollection.Stone), (0, 100, 0, block_type)], session=session)
+    get_chat(session=session)
+
+    assert server.world.get_block(1, 100, 0) == "AIR"
+
+
+@pytest.mark.parametrize("block_typ", ["STEIN", MaterialCollection.Stone, None])
+def test_setze_block_and_setze_bloecke_check_the_same_way(server, session, block_typ):
+    with pytest.raises(TypeError, match="MaterialSammlung"):
+        setze_block(0, 100, 0, block_typ, sitzung=session)
+    with pytest.raises(TypeError, match="MaterialSammlung"):
+        setze_bloecke([(1, 100, 0, MaterialSammlung.Stein), (0, 100, 0, block_typ)], sitzung=session)
+    get_chat(session=session)
+
+    assert server.world.get_block(1, 100, 0) == "AIR"
@@ -0,0 +1,86 @@
+import socket
+import time
+
+import pytest
+
+from st_minecraft.core import Session
+from st_minecraft.en.main import get_block
+from st_minecraft.en.material import MaterialCollection
+from st_minecraft.testing import ShapingProxy
+
+
+@pytest.fixture
+def echo():
+    """A server that sends back what it received, one connection at a time"""
+    listener = socket.create_server(("127.0.0.1", 0))
+    yield listener
+    listener.close()
+
+
+def round_trip(proxy: ShapingProxy, echo: socket.socket, data: bytes) -> tuple[bytes, float]:
+    with socket.create_connection(("127.0.0.1", proxy.port)) as client:
+        server, _ = echo.accept()
+        with server:
+            started = time.monotonic()
+            client.sendall(data)
+            received = b""
+            while len(received) < len(data):
+                chunk = server.recv(65536)
+                server.sendall(chunk)
+                received += chunk
+            client.settimeout(2.0)
+            echoed = b""
+            while len(echoed) < len(data):
+                echoed += client.recv(65536)
+        return echoed, time.monotonic() - started
+
+
+def test_delay_is_added_in_both_directions(echo):
+    with ShapingProxy(echo.getsockname()[1], delay=0.05) as proxy:
+        echoed, seconds = round_trip(proxy, echo, b"ping\n")
+
+    assert echoed == b"ping\n"
+    assert seconds >= 0.1
+
+
+def test_jitter_and_small_segments_keep_the_order(echo):
+    data = bytes(range(256)) * 20
+    with ShapingProxy(echo.getsockname()[1], delay=0.002, jitter=0.002, max_segment=7, seed=1) as proxy:
+        echoed, _ = round_trip(proxy, echo, data)
+
+    assert echoed == data
+
+
+def test_bandwidth_cap(echo):
+    with ShapingProxy(echo.getsockname()[1], bandwidth=50_000) as proxy:
+        _, seconds = round_trip(proxy, echo, b"x" * 5_000)
+
+    # 0.1 seconds per direction
+    assert seconds >= 0.2
+
+
+def test_library_through_the_proxy(server):
+    with ShapingProxy(server.port, delay=0.001, max_segment=2) as proxy:
+        with Session().connect("127.0.0.1", proxy.port) as session:
+            blocks = [get_block(0, y, 0, session=session).type for y in (63, 64)]
+
+    assert blocks == [MaterialCollection.Stone, MaterialCollection.Air]
+
+
+def test_stop_closes_the_connections(server):
+    proxy = ShapingProxy(server.port).start()
+    session = Session(timeout=1.0).connect("127.0.0.1", proxy.port)
+    proxy.stop()
+
+    with pytest.raises(ConnectionError):
+        get_block(0, 0, 0, session=session)
+    session.close()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"delay": -1}, {"jitter": -0.1}, {"bandwidth": 0}, {"max_segment": 0}],
+)
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        ShapingProxy(1, **options)
@@ -0,0 +1,77 @@
+import pytest
+
+from st_minecraft.core import enable_stats
+from st_minecraft.core import reset_stats
+from st_minecraft.core import stats
+from st_minecraft.core.command_stats import LatencyHistogram
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_blocks
+from st_minecraft.en.main import set_block
+from st_minecraft.en.material import MaterialCollection
+
+
+@pytest.fixture
+def counting():
+    reset_stats()
+    enable_stats()
+    yield
+    enable_stats(False)
+    reset_stats()
+
+
+def test_histogram_percentiles_are_within_three_percent():
+    histogram = LatencyHistogram()
+    for value in range(1, 10_001):
+        histogram.record(value)
+
+    assert histogram.count == 10_000
+    assert histogram.min_us == 1
+    assert histogram.max_us == 10_000
+    assert histogram.mean_us == pytest.approx(5000.5)
+    for fraction in (0.5, 0.9, 0.99):
+        assert histogram.percentile(fraction) == pytest.approx(fraction * 10_000, rel=1 / 32)
+    assert histogram.percentile(1.0) == 10_000
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.5) is None
+    assert histogram.mean_us is None
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in (0, 3, 3, 31):
+        histogram.record(value)
+    assert histogram.percentile(0.5) == 3
+    assert histogram.percentile(1.0) == 31
+
+
+def test_counts_per_command(session, counting):
+    set_block(0, 100, 0, MaterialCollection.Stone, session=session)
+    get_block(0, 100, 0, session=session)
+    get_blocks([(0, 100, 0), (1, 100, 0)], session=session)
+
+    counted = stats()
+    assert counted["getBlock"].calls == 3
+    assert counted["getBlock"].latency.count == 3
+    assert counted["getBlock"].bytes_received == len(b"STONE\n") * 2 + len(b"AIR\n")
+    assert counted["setBlock"].calls == 1
+    assert counted["setBlock"].latency.count == 0
+
+
+def test_snapshot_doesnt_change_afterward(session, counting):
+    get_block(0, 100, 0, session=session)
+    snapshot = stats()
+
+    get_block(0, 100, 0, session=session)
+
+    assert snapshot["getBlock"].calls == 1
+    assert snapshot["getBlock"].latency.count == 1
+    assert stats()["getBlock"].calls == 2
+
+
+def test_nothing_is_counted_while_switched_off(session):
+    reset_stats()
+    get_block(0, 100, 0, session=session)
+    assert stats() == {}
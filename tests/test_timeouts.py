@@ -0,0 +1,108 @@
+import time
+
+import pytest
+
+from st_minecraft.core import DEFAULT_COMMAND_TIMEOUTS
+from st_minecraft.core import NoDataError
+from st_minecraft.core import Session
+from st_minecraft.core import TimeoutPolicy
+from st_minecraft.core.core import ARG_SEPARATOR
+from st_minecraft.en.main import get_block
+from st_minecraft.en.main import get_blocks
+from st_minecraft.en.material import MaterialCollection
+from st_minecraft.testing import ShapingProxy
+
+
+def command(name: str) -> str:
+    return ARG_SEPARATOR.join((name, "0"))
+
+
+@pytest.fixture(autouse=True)
+def no_overwrite(monkeypatch):
+    monkeypatch.delenv("SK_TIMEOUT_OVERWRITE", raising=False)
+
+
+@pytest.fixture
+def slow_server(server):
+    """The mock server behind a proxy, a round trip takes about 0.1 seconds"""
+    with ShapingProxy(server.port, delay=0.05) as proxy:
+        yield proxy
+
+
+def test_slow_commands_get_more_time():
+    policy = TimeoutPolicy()
+
+    assert policy.for_command("getBlock") == 2.0
+    assert policy.for_command("getInv") == DEFAULT_COMMAND_TIMEOUTS["getInv"]
+    assert policy.for_command("spawnEntity") == DEFAULT_COMMAND_TIMEOUTS["spawnEntity"]
+
+
+def test_a_longer_default_wins():
+    assert TimeoutPolicy(10.0).for_command("getInv") == 10.0
+    assert TimeoutPolicy(None).for_command("getInv") is None
+    assert TimeoutPolicy(0).for_command("getBlock") is None
+
+
+def test_explicit_timeouts_per_command():
+    policy = TimeoutPolicy(1.0, {"getBlock": 0.5, "getInv": None})
+
+    assert policy.for_command("getBlock") == 0.5
+    assert policy.for_command("getInv") is None
+    assert policy.for_command("spawnEntity") == 1.0
+
+
+def test_a_batch_has_one_deadline():
+    policy = TimeoutPolicy(1.0, {"getInv": 3.0}, per_extra_reply=0.1)
+
+    assert policy.for_batch([command("getBlock")]) == 1.0
+    assert policy.for_batch([command("getBlock")] * 5) == pytest.approx(1.4)
+    assert policy.for_batch([command("getBlock"), command("getInv")]) == pytest.approx(3.1)
+    assert TimeoutPolicy(1.0, {"getInv": None}).for_batch([command("getBlock"), command("getInv")]) is None
+
+
+@pytest.mark.parametrize("value, expected", [("0.5", 0.5), ("None", None)])
+def test_the_environment_replaces_all_timeouts(monkeypatch, capsys, value, expected):
+    policy = TimeoutPolicy(1.0, {"getInv": 3.0}, per_extra_reply=0.1)
+    monkeypatch.setenv("SK_TIMEOUT_OVERWRITE", value)
+
+    resolved = policy.resolved()
+
+    assert resolved.for_command("getBlock") == expected
+    assert resolved.for_command("getInv") == expected
+    assert resolved.for_batch([command("getBlock")] * 3) == (None if expected is None else 0.7)
+    # the policy itself is left alone
+    assert policy.for_command("getInv") == 3.0
+
+
+def test_timeouts_are_resolved_when_connecting(server, monkeypatch, capsys):
+    session = Session(timeout=1.0)
+    monkeypatch.setenv("SK_TIMEOUT_OVERWRITE", "0.25")
+    session.connect("127.0.0.1", server.port)
+    monkeypatch.delenv("SK_TIMEOUT_OVERWRITE")
+
+    assert session._get_timeouts().for_command("getInv") == 0.25
+    session.close()
+
+
+def test_a_query_times_out(slow_server):
+    with Session(timeout=0.02).connect("127.0.0.1", slow_server.port) as session:
+        started = time.monotonic()
+        with pytest.raises(NoDataError, match="0.02 seconds"):
+            get_block(0, 63, 0, session=session)
+        assert time.monotonic() - started < 0.1
+
+
+def test_a_batch_waits_for_its_deadline_not_per_reply(slow_server):
+    policy = TimeoutPolicy(0.02, per_extra_reply=0.005)
+    with Session(timeout_policy=policy).connect("127.0.0.1", slow_server.port) as session:
+        started = time.monotonic()
+        with pytest.raises(NoDataError, match="of 10"):
+            get_blocks([(x, 63, 0) for x in range(10)], session=session)
+        assert time.monotonic() - started < 0.1
+
+
+def test_a_batch_within_its_deadline(slow_server):
+    with Session(timeout_policy=TimeoutPolicy(1.0)).connect("127.0.0.1", slow_server.port) as session:
+        blocks = get_blocks([(x, 63, 0) for x in range(10)], session=session)
+
+    assert {block.type for block in blocks} == {MaterialCollection.Stone}